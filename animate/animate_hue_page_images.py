@@ -1,8 +1,12 @@
 import os
 import sys
-from PIL import Image
+
+chip_size = 75
+chip_gap = 10
 
 def replace_transparent_with_color(image, color):
+    from PIL import Image
+
     # Convert the image to RGBA mode (if not already) to handle alpha transparency
     if image.mode != 'RGBA':
         image = image.convert('RGBA')
@@ -19,6 +23,8 @@ def replace_transparent_with_color(image, color):
     return new_image
 
 def create_animated_gif(png_folder, gif_filename, duration=100, bg=-1, scale=100):
+    from PIL import Image
+
     # Get a list of all PNG files in the folder
     png_files = [file for file in os.listdir(png_folder) if file.endswith('.png')]
 
@@ -64,21 +70,42 @@ def create_animated_gif(png_folder, gif_filename, duration=100, bg=-1, scale=100
 
     print(f"Animated GIF '{gif_filename}' created successfully.")
 
+# create an animated gif, apng (.png) or webp file of every hue page
+# rendered straight from a Munsell parquet file, without a png folder
+def create_animation_from_parquet(parquet_file, animation_filename, duration=100, bg=-1, scale=100, num_workers=None, local_palettes=False):
+    from munsell_data_frame import MunsellDataFrame
+    from munsell_data_frame.HuePageRenderer import HuePageRenderer, get_hue_page_arrays
+    from munsell_data_frame.HuePageAnimator import animate_hue_pages
+
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file)
+    page_arrays = get_hue_page_arrays(munsell_df)
+
+    # frames are rendered at the scaled chip size rather than resized
+    background = (bg, bg, bg, 255) if 0 <= bg <= 255 else (0, 0, 0, 0)
+    renderer = HuePageRenderer.from_munsell_data_frame(munsell_df, chip_size=chip_size, chip_gap=chip_gap, background=background).scaled(scale)
+    print(f"Frame size: {renderer.width}x{renderer.height}")
+
+    num_frames = animate_hue_pages(page_arrays, renderer, animation_filename, duration=duration, num_workers=num_workers, local_palettes=local_palettes)
+    print(f"Animation '{animation_filename}' created successfully with {num_frames} frames.")
+
 if __name__ == "__main__":
     # Check if required command-line arguments are provided
     if len(sys.argv) < 3:
         print("Usage: python animate_hue_page_images.py <png_folder> <gif_filename> [--bg <0-255>] [--scale <percentage>]")
+        print("       python animate_hue_page_images.py <parquet_file> <gif|png|webp_filename> [--bg <0-255>] [--scale <percentage>] [--workers <n>] [--local-palettes]")
         print("Example: python animate_hue_page_images.py excel_file_long/hue_page_images excel_file_long/hue_pages_animated.gif --bg 128 --scale 50")
         print("Example: python animate_hue_page_images.py excel_file_macro/hue_page_images excel_file_macro/hue_pages_animated.gif --bg 128 --scale 50")
+        print("Example: python animate_hue_page_images.py excel_file_macro/parquet_file_macro.parquet excel_file_macro/hue_pages_animated.webp --bg 128 --scale 50")
         sys.exit(1)
 
     # Get the command-line arguments
     png_folder = sys.argv[1]
     gif_filename = sys.argv[2]
+    from_parquet = png_folder.lower().endswith('.parquet')
 
-    # Check if the specified folder exists
+    # Check if the specified folder or parquet file exists
     if not os.path.exists(png_folder):
-        print(f"Error: The folder '{png_folder}' does not exist.")
+        print(f"Error: The {'file' if from_parquet else 'folder'} '{png_folder}' does not exist.")
         sys.exit(1)
 
     # Extract optional parameters
@@ -106,5 +133,23 @@ if __name__ == "__main__":
             print("Error: Missing value for --scale option.")
             sys.exit(1)
 
-    create_animated_gif(png_folder, gif_filename, duration=100, bg=bg, scale=scale)
-    print(f"Animated GIF '{gif_filename}' created successfully.")
+    num_workers = None
+    if "--workers" in sys.argv:
+        workers_index = sys.argv.index("--workers") + 1
+        if workers_index < len(sys.argv):
+            num_workers = int(sys.argv[workers_index])
+            if num_workers <= 0:
+                print("Error: The number of workers must be greater than 0.")
+                sys.exit(1)
+        else:
+            print("Error: Missing value for --workers option.")
+            sys.exit(1)
+
+    if from_parquet:
+        if not gif_filename.lower().endswith(('.gif', '.png', '.webp')):
+            print("Error: The output filename must have the '.gif', '.png' or '.webp' extension.")
+            sys.exit(1)
+        create_animation_from_parquet(png_folder, gif_filename, duration=100, bg=bg, scale=scale, num_workers=num_workers, local_palettes="--local-palettes" in sys.argv)
+    else:
+        create_animated_gif(png_folder, gif_filename, duration=100, bg=bg, scale=scale)
+        print(f"Animated GIF '{gif_filename}' created successfully.")
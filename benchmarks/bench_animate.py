@@ -0,0 +1,67 @@
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'animate'))
+
+MODES = ['legacy.gif', 'direct.gif', 'direct.png', 'direct.webp']
+
+# run one mode in this process and print seconds, output file size and the
+# peak memory of this process or its rendering processes
+def run_mode(mode, parquet_file, work_dir, scale, bg, num_workers):
+    import contextlib
+    import io
+    import animate_hue_page_images as animate
+    from munsell_data_frame import MunsellDataFrame
+    from munsell_data_frame.HuePageRenderer import HuePageRenderer, get_hue_page_arrays, render_hue_pages
+
+    animation_file = os.path.join(work_dir, mode)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode.startswith('legacy'):
+            # the png folder round trip: render the pages, then re-open them
+            munsell_df = MunsellDataFrame.from_parquet(parquet_file)
+            page_arrays = get_hue_page_arrays(munsell_df)
+            renderer = HuePageRenderer.from_munsell_data_frame(munsell_df)
+            png_folder = os.path.join(work_dir, 'hue_page_images')
+            render_hue_pages(page_arrays, png_folder, renderer, num_workers=num_workers)
+            animate.create_animated_gif(png_folder, animation_file, bg=bg, scale=scale)
+        else:
+            animate.create_animation_from_parquet(parquet_file, animation_file, bg=bg, scale=scale, num_workers=num_workers)
+    seconds = time.perf_counter() - start
+    peak_rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    print(seconds, os.path.getsize(animation_file), peak_rss)
+
+def main(parquet_file, scale, bg, num_workers):
+    print(f"{'mode':>12} {'seconds':>8} {'size_kb':>8} {'peak_rss_mb':>12}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for mode in MODES:
+            # each mode runs in a fresh process so its peak memory is its own
+            command = [sys.executable, __file__, '--p', parquet_file, '--scale', str(scale), '--bg', str(bg), '--run-mode', mode, '--work-dir', work_dir]
+            if num_workers:
+                command += ['--workers', str(num_workers)]
+            seconds, size, peak_rss = subprocess.run(command, check=True, capture_output=True, text=True).stdout.split()
+            print(f"{mode:>12} {float(seconds):>8.2f} {int(size) // 1024:>8} {int(peak_rss) / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark the png folder and direct from parquet hue page animations.')
+    parser.add_argument('--p', default='excel_file_macro/parquet_file_macro.parquet', help='Input Munsell Parquet file')
+    parser.add_argument('--scale', type=int, default=50, help='frame scale percentage')
+    parser.add_argument('--bg', type=int, default=128, help='grey background 0-255, or -1 for transparent')
+    parser.add_argument('--workers', type=int, default=None, help='number of rendering processes')
+    parser.add_argument('--run-mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--work-dir', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run_mode:
+        run_mode(args.run_mode, args.p, args.work_dir, args.scale, args.bg, args.workers)
+    else:
+        main(args.p, args.scale, args.bg, args.workers)
+        print("done")
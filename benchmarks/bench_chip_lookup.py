@@ -0,0 +1,46 @@
+import argparse
+import time
+import numpy as np
+from munsell_data_frame import MunsellDataFrame
+from munsell_data_frame.ChipLookup import ChipLookup
+
+# return (seconds, color_keys) of one lookup of rgbs
+def time_lookup(lookup, rgbs):
+    start = time.perf_counter()
+    color_keys = lookup.lookup(rgbs)
+    return time.perf_counter() - start, color_keys
+
+def main(parquet_file, num_pixels, num_image_colors, brute_force):
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file).groupby_color_key()
+    rng = np.random.default_rng(0)
+    inputs = {
+        'random': rng.integers(0, 256, (num_pixels, 3), dtype=np.uint8),
+        # an image-like input that repeats a few thousand colours
+        'image': rng.integers(0, 256, (num_image_colors, 3), dtype=np.uint8)[rng.integers(0, num_image_colors, num_pixels)],
+    }
+    print(f"{len(munsell_df.df)} chips, {num_pixels} pixels")
+    print(f"{'input':>8} {'space':>6} {'index':>12} {'build_s':>8} {'lookup_s':>9} {'pixels/s':>12}")
+    for space in ['rgb', 'lab']:
+        for use_kdtree in [True, False] if brute_force else [True]:
+            start = time.perf_counter()
+            lookup = ChipLookup.from_munsell_data_frame(munsell_df, space=space, use_kdtree=use_kdtree)
+            build_seconds = time.perf_counter() - start
+            for input_name, rgbs in inputs.items():
+                seconds, _ = time_lookup(lookup, rgbs)
+                index_name = 'cKDTree' if lookup.kdtree is not None else 'brute force'
+                print(f"{input_name:>8} {space:>6} {index_name:>12} {build_seconds:>8.3f} {seconds:>9.2f} {num_pixels / seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark nearest-chip lookups of RGB colours.')
+    parser.add_argument('--p', default='excel_file_macro/parquet_file_macro.parquet', help='Input Munsell Parquet file')
+    parser.add_argument('--pixels', type=int, default=2_000_000, help='number of colours to look up')
+    parser.add_argument('--image-colors', type=int, default=5000, help='distinct colours of the image-like input')
+    parser.add_argument('--brute-force', action='store_true', help='also time the NumPy fallback used without scipy (slow)')
+
+    args = parser.parse_args()
+
+    main(args.p, args.pixels, args.image_colors, args.brute_force)
+
+    print("done")
@@ -0,0 +1,53 @@
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from munsell_data_frame import MunsellDataFrame
+from munsell_data_frame.ChipLookup import ChipLookup
+from munsell_data_frame.ChipLookupTable import ChipLookupTable
+
+def main(parquet_file, num_pixels, bits, num_workers, table_file):
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file).groupby_color_key()
+
+    start = time.perf_counter()
+    table = ChipLookupTable.from_munsell_data_frame(munsell_df, table_file, bits=bits, num_workers=num_workers)
+    print(f"table of {len(table.table)} entries ready in {time.perf_counter() - start:.2f}s")
+    lookup = ChipLookup.from_munsell_data_frame(munsell_df)
+
+    rng = np.random.default_rng(0)
+    rgbs = rng.integers(0, 256, (num_pixels, 3), dtype=np.uint8)
+
+    start = time.perf_counter()
+    _, search_indices = lookup.query(rgbs)
+    search_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table_indices = table.lookup_indices(rgbs)
+    table_seconds = time.perf_counter() - start
+
+    print(f"{'lookup':>16} {'seconds':>8} {'pixels/s':>12}")
+    print(f"{'cKDTree search':>16} {search_seconds:>8.3f} {num_pixels / search_seconds:>12.0f}")
+    print(f"{'table':>16} {table_seconds:>8.3f} {num_pixels / table_seconds:>12.0f}")
+    if bits == 8:
+        print(f"table agrees with the search for {np.mean(table_indices == search_indices):.4%} of pixels")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark lookup table vs nearest search RGB to chip lookups.')
+    parser.add_argument('--p', default='excel_file_macro/parquet_file_macro.parquet', help='Input Munsell Parquet file')
+    parser.add_argument('--pixels', type=int, default=2_000_000, help='number of colours to look up')
+    parser.add_argument('--bits', type=int, default=8, help='bits per channel of the table')
+    parser.add_argument('--workers', type=int, default=None, help='number of table building processes')
+    parser.add_argument('--table', default=None, help='table file to reuse (default: a temporary file)')
+
+    args = parser.parse_args()
+
+    if args.table:
+        main(args.p, args.pixels, args.bits, args.workers, args.table)
+    else:
+        with tempfile.TemporaryDirectory() as folder:
+            main(args.p, args.pixels, args.bits, args.workers, os.path.join(folder, 'table.npy'))
+
+    print("done")
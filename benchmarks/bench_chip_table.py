@@ -0,0 +1,58 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+JS_SCRIPT = os.path.join(REPO_DIR, 'javascript', 'js_file_from_parquet_file.py')
+
+# return (median seconds, output) of running the js export script in
+# num_runs fresh python processes, startup and imports included
+def time_script(args, num_runs):
+    env = dict(os.environ, PYTHONPATH=REPO_DIR)
+    times = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, JS_SCRIPT] + args, check=True, capture_output=True, text=True, env=env).stdout
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), output
+
+# return True if importing the package and reading the parquet file
+# through the engine imports pandas
+def imports_pandas(parquet_file, engine):
+    name = 'ChipTable' if engine == 'chiptable' else 'MunsellDataFrame'
+    code = f"import sys\nfrom munsell_data_frame import {name}\n{name}.from_parquet({parquet_file!r})\nprint('pandas' in sys.modules)"
+    env = dict(os.environ, PYTHONPATH=REPO_DIR)
+    return subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True, env=env).stdout.strip() == 'True'
+
+def main(parquet_file, num_runs):
+    parquet_file = os.path.abspath(parquet_file)
+    with tempfile.TemporaryDirectory() as work_dir:
+        print(f"{'engine':>10} {'format':>7} {'median_s':>9} {'pandas':>7} {'identical':>10}")
+        for js_format in ['json', 'bin']:
+            js_sources = {}
+            for engine in ['pandas', 'chiptable']:
+                js_name = f"{engine}_{js_format}.js"
+                seconds, _ = time_script(['--dir', os.path.dirname(parquet_file), '--p', os.path.basename(parquet_file),
+                                          '--j', os.path.relpath(os.path.join(work_dir, js_name), os.path.dirname(parquet_file)),
+                                          '--format', js_format, '--engine', engine], num_runs)
+                with open(os.path.join(work_dir, js_name)) as f:
+                    js_sources[engine] = f.read().replace(js_name[:-3], '')
+                identical = js_sources[engine] == js_sources['pandas']
+                print(f"{engine:>10} {js_format:>7} {seconds:>9.3f} {str(imports_pandas(parquet_file, engine)):>7} {str(identical):>10}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark the js export script with the pandas and chiptable engines, in fresh processes.')
+    parser.add_argument('--p', default=os.path.join(REPO_DIR, 'excel_file_long', 'parquet_file_long.parquet'), help='Munsell Parquet file')
+    parser.add_argument('--runs', type=int, default=5, help='runs of each engine, the median is reported')
+
+    args = parser.parse_args()
+
+    main(args.p, args.runs)
+
+    print("done")
@@ -0,0 +1,68 @@
+import argparse
+import time
+import numpy as np
+from munsell_data_frame import MunsellDataFrame
+
+# the row-wise color_key encoding that set_color_key used before encode_color_keys
+def legacy_set_color_key(df):
+    return df.apply(lambda row: f"{row['hue_page_number']:02d}-{row['value_row']:02d}-{row['chroma_column']:02d}", axis=1)
+
+# the str.split color_key decoding that decode_color_key used before decode_color_keys
+def legacy_decode_color_key(df):
+    return df['color_key'].str.split('-', expand=True).astype(int)
+
+# return the best wall time in seconds of num_repeats calls to func
+def best_time(func, num_repeats):
+    times = []
+    for _ in range(num_repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+# return a MunsellDataFrame of num_rows random chips
+def random_chips(num_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return MunsellDataFrame({
+        'hue_page_number': rng.integers(0, 40, num_rows),
+        'value_row': rng.integers(1, 10, num_rows),
+        'chroma_column': rng.integers(1, 20, num_rows) * 2,
+        'r': rng.integers(0, 256, num_rows),
+        'g': rng.integers(0, 256, num_rows),
+        'b': rng.integers(0, 256, num_rows),
+    })
+
+def main(row_counts, num_repeats, legacy_limit):
+    print(f"{'rows':>10} {'op':>8} {'legacy_s':>10} {'vector_s':>10} {'speedup':>8}")
+    for num_rows in row_counts:
+        mdf = random_chips(num_rows)
+        dims = mdf.df[['hue_page_number', 'value_row', 'chroma_column']]
+
+        vector_encode = best_time(lambda: MunsellDataFrame.encode_color_keys(dims['hue_page_number'], dims['value_row'], dims['chroma_column']), num_repeats)
+        mdf.set_color_key()
+        vector_decode = best_time(lambda: MunsellDataFrame.decode_color_keys(mdf.df['color_key']), num_repeats)
+
+        # the row-wise encoder takes minutes on millions of rows
+        if num_rows <= legacy_limit:
+            legacy_encode = best_time(lambda: legacy_set_color_key(mdf.df), num_repeats)
+            assert legacy_set_color_key(mdf.df).tolist() == mdf.df['color_key'].tolist(), "encoded keys differ"
+        else:
+            legacy_encode = float('nan')
+        legacy_decode = best_time(lambda: legacy_decode_color_key(mdf.df), num_repeats)
+
+        for op, legacy, vector in [('encode', legacy_encode, vector_encode), ('decode', legacy_decode, vector_decode)]:
+            print(f"{num_rows:>10} {op:>8} {legacy:>10.4f} {vector:>10.4f} {legacy / vector:>7.1f}x")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark row-wise vs vectorized color_key encoding and decoding.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[2734, 100_000, 1_000_000], help='row counts to benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='repeats per measurement (best is reported)')
+    parser.add_argument('--legacy-limit', type=int, default=1_000_000, help='skip the row-wise encoder above this many rows')
+
+    args = parser.parse_args()
+
+    main(args.rows, args.repeat, args.legacy_limit)
+
+    print("done")
@@ -0,0 +1,56 @@
+import argparse
+import time
+import numpy as np
+from bench_color_key import random_chips
+from munsell_data_frame.color_science import rgb_to_lab, delta_e_2000
+
+# return the best of repeats wall clock seconds of calling fn
+def best_seconds(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(num_rows, num_row_wise, repeats):
+    munsell_df = random_chips(num_rows)
+    other_df = random_chips(num_rows, seed=1)
+    query = np.array([200, 120, 40], dtype=np.uint8)
+
+    # the per row conversion the vectorized columns replace, timed on
+    # num_row_wise rows and scaled up
+    head = munsell_df.df.head(num_row_wise)
+    row_wise = best_seconds(lambda: head.apply(lambda row: rgb_to_lab(np.array([row['r'], row['g'], row['b']], dtype=np.uint8)), axis=1), 1)
+
+    def fresh_lab():
+        munsell_df.invalidate_index()
+        return munsell_df.get_color_space_array('lab')
+
+    timings = [
+        (f"lab per row (scaled from {num_row_wise})", row_wise * num_rows / num_row_wise),
+        ('lab, vectorized', best_seconds(fresh_lab, repeats)),
+        ('lab, cached (crc32 check)', best_seconds(lambda: munsell_df.get_color_space_array('lab'), repeats)),
+        ('delta e 76 against a query', best_seconds(lambda: munsell_df.delta_e(query, method='76'), repeats)),
+        ('delta e 2000 against a query', best_seconds(lambda: munsell_df.delta_e(query), repeats)),
+        ('delta e 2000 between frames', best_seconds(lambda: munsell_df.delta_e(other_df), repeats)),
+        ('delta e 2000 of lab arrays', best_seconds(lambda: delta_e_2000(munsell_df.get_color_space_array('lab'), rgb_to_lab(query)), repeats)),
+    ]
+    print(f"{num_rows} rows")
+    print(f"{'operation':>40} {'seconds':>10}")
+    for name, seconds in timings:
+        print(f"{name:>40} {seconds:>10.4f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark colour space columns and delta e of a MunsellDataFrame.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='number of chips')
+    parser.add_argument('--row-wise-rows', type=int, default=20_000, help='number of chips converted one row at a time')
+    parser.add_argument('--repeats', type=int, default=3, help='repeats of each operation, the best is reported')
+
+    args = parser.parse_args()
+
+    main(args.rows, args.row_wise_rows, args.repeats)
+
+    print("done")
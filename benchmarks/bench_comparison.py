@@ -0,0 +1,58 @@
+import argparse
+import time
+import numpy as np
+from munsell_data_frame import MunsellDataFrame
+from munsell_data_frame.MunsellComparison import MunsellComparison
+
+# return a MunsellDataFrame of num_samples noisy measurements of random
+# reference chips, with 1% of them under keys the reference does not have
+def measured_samples(reference_df, num_samples, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, len(reference_df.df), num_samples)
+    color_keys = reference_df.df['color_key'].to_numpy()[rows]
+    color_keys[rng.random(num_samples) < 0.01] = '39-00-00'
+    rgbs = reference_df.df[['r', 'g', 'b']].to_numpy(dtype=np.int64)[rows] + rng.integers(-4, 5, (num_samples, 3))
+    rgbs = rgbs.clip(0, 255).astype(np.uint8)
+    return MunsellDataFrame({'color_key': color_keys, 'r': rgbs[:, 0], 'g': rgbs[:, 1], 'b': rgbs[:, 2]})
+
+# the merge and per row delta e the vectorized comparison replaces
+def merge_comparison(reference_df, sample_df):
+    from munsell_data_frame.color_science import rgb_to_lab, delta_e_2000
+    merged = sample_df.df.merge(reference_df.df, on='color_key', how='outer', suffixes=('', '_reference'), indicator=True)
+    merged['delta_e_2000'] = merged.apply(
+        lambda row: float(delta_e_2000(rgb_to_lab([row['r'], row['g'], row['b']]), rgb_to_lab([row['r_reference'], row['g_reference'], row['b_reference']])))
+        if row['_merge'] == 'both' else np.nan, axis=1)
+    return merged
+
+def main(reference_file, sample_counts, merge_limit):
+    reference_df = MunsellDataFrame.from_parquet(reference_file)
+    print(f"{'samples':>10} {'compare_s':>10} {'summary_s':>10} {'merge_s':>10}")
+    for num_samples in sample_counts:
+        sample_df = measured_samples(reference_df, num_samples)
+        start = time.perf_counter()
+        comparison = MunsellComparison.compare(reference_df, sample_df)
+        compare_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        comparison.get_summary()
+        comparison.get_hue_page_summary()
+        summary_seconds = time.perf_counter() - start
+        merge_seconds = float('nan')
+        if num_samples <= merge_limit:
+            start = time.perf_counter()
+            merge_comparison(reference_df, sample_df)
+            merge_seconds = time.perf_counter() - start
+        print(f"{num_samples:>10} {compare_seconds:>10.3f} {summary_seconds:>10.3f} {merge_seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark comparing measured sample sets against a reference Munsell parquet file.')
+    parser.add_argument('--ref', default='excel_file_long/parquet_file_long.parquet', help='reference Munsell parquet file')
+    parser.add_argument('--samples', type=int, nargs='+', default=[10_000, 100_000, 1_000_000, 5_000_000], help='numbers of measured samples')
+    parser.add_argument('--merge-limit', type=int, default=100_000, help='largest sample set also compared by merge and per row delta e')
+
+    args = parser.parse_args()
+
+    main(args.ref, args.samples, args.merge_limit)
+
+    print("done")
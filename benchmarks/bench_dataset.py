@@ -0,0 +1,64 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+import pandas as pd
+from bench_color_key import random_chips
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.MunsellDataset import MunsellDataset
+
+# write num_files parquet files of rows_per_file random samples of
+# 'color_key', 'r', 'g', 'b' into directory
+def write_samples(directory, num_files, rows_per_file):
+    for i in range(num_files):
+        munsell_df = random_chips(rows_per_file, seed=i)
+        munsell_df.set_color_key()
+        munsell_df.df[['color_key', 'r', 'g', 'b']].to_parquet(os.path.join(directory, f"samples-{i:03d}.parquet"), row_group_size=1 << 18)
+
+# return (seconds, peak traced MB, result) of one call of fn
+def measured(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1e6, result
+
+# read every file into one frame and reduce it in memory
+def in_memory_reduce(directory, filters):
+    files = sorted(os.path.join(directory, name) for name in os.listdir(directory))
+    munsell_df = MunsellDataFrame.__new__(MunsellDataFrame)
+    munsell_df.df = pd.concat([MunsellDataFrame.from_parquet(name, filters=filters).df for name in files], ignore_index=True)
+    return munsell_df.reduce_by_color_key()
+
+def main(num_files, rows_per_file, batch_size):
+    with tempfile.TemporaryDirectory() as directory:
+        write_samples(directory, num_files, rows_per_file)
+        dataset = MunsellDataset(directory)
+        print(f"{num_files} files of {rows_per_file} rows")
+        print(f"{'operation':>36} {'seconds':>10} {'peak_MB':>10}")
+        for filters in [None, {'hue_page_number': [3, 4]}]:
+            label = 'all rows' if filters is None else 'hue pages 3, 4'
+            seconds, peak, streamed = measured(lambda: dataset.reduce_by_color_key(filters, batch_size=batch_size))
+            print(f"{'streamed, ' + label:>36} {seconds:>10.3f} {peak:>10.1f}")
+            seconds, peak, in_memory = measured(lambda: in_memory_reduce(directory, filters))
+            print(f"{'in memory, ' + label:>36} {seconds:>10.3f} {peak:>10.1f}")
+            assert streamed.df.equals(in_memory.df)
+        accumulator = dataset.accumulate()
+        print(f"accumulator of {accumulator.num_color_keys} keys in {accumulator.nbytes} bytes")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark streamed reduce_by_color_key over a directory of parquet files against reading them into memory.')
+    parser.add_argument('--files', type=int, default=8, help='number of parquet files')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows per file')
+    parser.add_argument('--batch-size', type=int, default=1 << 18, help='rows per streamed batch')
+
+    args = parser.parse_args()
+
+    main(args.files, args.rows, args.batch_size)
+
+    print("done")
@@ -0,0 +1,58 @@
+import argparse
+import time
+import numpy as np
+from munsell_data_frame import MunsellDataFrame
+from munsell_data_frame.GamutBoundary import GamutBoundary
+
+# return the best of repeats wall clock seconds of calling fn
+def best_seconds(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(parquet_file, num_queries, repeats):
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file)
+    munsell_df.decode_color_key()
+    boundary = GamutBoundary.from_munsell_data_frame(munsell_df)
+    print(f"boundary of {len(munsell_df.df)} chips in {boundary.max_chroma_columns.nbytes * 2} bytes")
+
+    rng = np.random.default_rng(0)
+    hue_page_numbers = rng.integers(0, 40, num_queries)
+    value_rows = rng.integers(1, 10, num_queries)
+    chroma_columns = rng.integers(1, 20, num_queries) * 2
+    fractional = rng.uniform(0, 40, num_queries), rng.uniform(1, 9, num_queries), rng.uniform(2, 38, num_queries)
+
+    # the rescan the boundary replaces: max chroma_column of each row by groupby
+    def groupby_max_chroma():
+        max_chromas = munsell_df.df.groupby(['hue_page_number', 'value_row'])['chroma_column'].max()
+        return max_chromas.reindex(list(zip(hue_page_numbers, value_rows))).to_numpy()
+
+    timings = [
+        ('renderer extent, max_column', lambda: (munsell_df.max_column('value_row'), munsell_df.max_column('chroma_column'))),
+        ('renderer extent, boundary', lambda: (boundary.max_value_row, boundary.max_chroma_column)),
+        (f"{num_queries} max chroma, groupby", groupby_max_chroma),
+        (f"{num_queries} max chroma, boundary", lambda: boundary.max_chroma(hue_page_numbers, value_rows)),
+        (f"{num_queries} is_in_gamut", lambda: boundary.is_in_gamut(hue_page_numbers, value_rows, chroma_columns)),
+        (f"{num_queries} fractional is_in_gamut", lambda: boundary.is_in_gamut(*fractional)),
+        (f"{num_queries} fractional clip_to_gamut", lambda: boundary.clip_to_gamut(*fractional)),
+    ]
+    print(f"{'operation':>36} {'seconds':>10}")
+    for name, fn in timings:
+        print(f"{name:>36} {best_seconds(fn, repeats):>10.6f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark GamutBoundary queries against rescanning the frame.')
+    parser.add_argument('--p', default='excel_file_long/parquet_file_long.parquet', help='Munsell parquet file')
+    parser.add_argument('--queries', type=int, default=1_000_000, help='number of chips to query')
+    parser.add_argument('--repeats', type=int, default=3, help='repeats of each operation, the best is reported')
+
+    args = parser.parse_args()
+
+    main(args.p, args.queries, args.repeats)
+
+    print("done")
@@ -0,0 +1,54 @@
+import argparse
+import os
+import tempfile
+import time
+from PIL import Image, ImageDraw
+from munsell_data_frame import MunsellDataFrame
+from munsell_data_frame.HuePageRenderer import HuePageRenderer, get_hue_page_arrays, render_hue_pages, hue_page_image_file_name
+
+# render and save every hue page one ImageDraw.rectangle per chip,
+# the way hue_page_images_from_parquet_file.py did before HuePageRenderer
+def legacy_render_hue_pages(munsell_df, output_image_folder, renderer):
+    for hue_page_number in range(40):
+        image = Image.new('RGBA', (renderer.width, renderer.height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        hue_page_mdf = munsell_df.filter_by_columns({'hue_page_number': hue_page_number})
+        df = hue_page_mdf.df[['value_row','chroma_column','r','g','b']]
+        for value_row, chroma_column, r, g, b in df.itertuples(index=False):
+            draw.rectangle(renderer.get_chip_geometry(value_row, chroma_column), fill=(int(r), int(g), int(b), 255))
+        image.save(os.path.join(output_image_folder, hue_page_image_file_name(hue_page_number)))
+
+def main(parquet_file, chip_sizes, workers_list, compress_level):
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file)
+    page_arrays = get_hue_page_arrays(munsell_df)
+    renderer = HuePageRenderer.from_munsell_data_frame(munsell_df)
+
+    print(f"{'renderer':>20} {'chip_sizes':>14} {'seconds':>8} {'pages/s':>8}")
+    with tempfile.TemporaryDirectory() as folder:
+        for chip_size in chip_sizes:
+            start = time.perf_counter()
+            legacy_render_hue_pages(munsell_df, folder, renderer.with_chip_size(chip_size))
+            seconds = time.perf_counter() - start
+            print(f"{'legacy':>20} {chip_size:>14} {seconds:>8.2f} {40 / seconds:>8.1f}")
+
+        for num_workers in workers_list:
+            start = time.perf_counter()
+            results = render_hue_pages(page_arrays, folder, renderer, chip_sizes=chip_sizes, num_workers=num_workers, compress_level=compress_level)
+            seconds = time.perf_counter() - start
+            label = f"engine workers={num_workers}"
+            print(f"{label:>20} {','.join(map(str, chip_sizes)):>14} {seconds:>8.2f} {len(results) / seconds:>8.1f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark legacy vs NumPy-rasterized hue page rendering.')
+    parser.add_argument('--p', default='excel_file_macro/parquet_file_macro.parquet', help='Input Munsell Parquet file')
+    parser.add_argument('--chip-sizes', type=int, nargs='+', default=[25, 75], help='chip sizes to render')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count()], help='worker counts to benchmark')
+    parser.add_argument('--compress-level', type=int, default=6, help='png compression level of the engine')
+
+    args = parser.parse_args()
+
+    main(args.p, args.chip_sizes, args.workers, args.compress_level)
+
+    print("done")
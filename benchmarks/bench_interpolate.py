@@ -0,0 +1,43 @@
+import argparse
+import time
+import numpy as np
+from munsell_data_frame import MunsellDataFrame
+from munsell_data_frame.MunsellGrid import INTERPOLATED, FALLBACK, OUT_OF_GAMUT
+from munsell_data_frame.munsell_notation import parse_munsell_notation
+
+def main(parquet_file, num_samples, repeats):
+    grid = MunsellDataFrame.from_parquet(parquet_file).to_munsell_grid()
+
+    # uniform fractional chips over every hue, values 1-9 and chromas 2-20
+    rng = np.random.default_rng(0)
+    hue_page_numbers = rng.uniform(0, 40, num_samples)
+    values = rng.uniform(1, 9, num_samples)
+    chromas = rng.uniform(2, 20, num_samples)
+
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        rgbs, status = grid.interpolate(hue_page_numbers, values, chromas)
+        best = min(best, time.perf_counter() - start)
+    counts = np.bincount(status, minlength=3)
+    print(f"{num_samples} samples in {best:.3f}s, {num_samples / best / 1e6:.2f}M samples/s")
+    print(f"interpolated {counts[INTERPOLATED]}, fallback {counts[FALLBACK]}, out of gamut {counts[OUT_OF_GAMUT]}")
+
+    notations = ['3.7YR 5.4/7', '1.25R 5/4', '5.0PB 4/10']
+    rgbs, status = grid.interpolate(*parse_munsell_notation(notations))
+    for notation, rgb, chip_status in zip(notations, rgbs, status):
+        print(f"{notation:>12} {tuple(rgb.tolist())} status {chip_status}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark trilinear interpolation of fractional Munsell chips.')
+    parser.add_argument('--p', default='excel_file_long/parquet_file_long.parquet', help='Munsell parquet file')
+    parser.add_argument('--samples', type=int, default=4_000_000, help='number of fractional chips to interpolate')
+    parser.add_argument('--repeats', type=int, default=3, help='repeats, the best is reported')
+
+    args = parser.parse_args()
+
+    main(args.p, args.samples, args.repeats)
+
+    print("done")
@@ -0,0 +1,64 @@
+import argparse
+import gzip
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'javascript'))
+import js_file_from_parquet_file as js_export
+
+# imports a js module and prints the milliseconds to import it and read flatColorChips
+NODE_TIMER = """
+const start = performance.now();
+const module = await import(process.argv[2]);
+const numChips = module.flatColorChips.length;
+console.log(performance.now() - start, numChips);
+"""
+
+# return (median milliseconds, number of chips) of importing js_file in
+# num_runs fresh node processes
+def time_node_import(node, timer_file, js_file, num_runs):
+    times = []
+    for _ in range(num_runs):
+        output = subprocess.run([node, timer_file, os.path.abspath(js_file)], check=True, capture_output=True, text=True).stdout.split()
+        times.append(float(output[0]))
+    return statistics.median(times), int(output[1])
+
+def main(parquet_file, reference_js_file, node, num_runs):
+    with tempfile.TemporaryDirectory() as work_dir:
+        timer_file = os.path.join(work_dir, 'timer.mjs')
+        with open(timer_file, 'w') as f:
+            f.write(NODE_TIMER)
+
+        js_files = {'reference': os.path.join(work_dir, 'reference.js')}
+        shutil.copy(reference_js_file, js_files['reference'])
+        for js_format in ['json', 'base64', 'bin']:
+            js_files[js_format] = os.path.join(work_dir, f"js_file_{js_format}.js")
+            js_export.main(js_files[js_format], parquet_file, js_format)
+
+        print(f"{'format':>10} {'bytes':>8} {'gzip':>8} {'import_ms':>10} {'chips':>6}")
+        for js_format, js_file in js_files.items():
+            data = open(js_file, 'rb').read()
+            bin_file = os.path.splitext(js_file)[0] + '.bin'
+            if js_format == 'bin':
+                data += open(bin_file, 'rb').read()
+            milliseconds, num_chips = time_node_import(node, timer_file, js_file, num_runs)
+            print(f"{js_format:>10} {len(data):>8} {len(gzip.compress(data)):>8} {milliseconds:>10.2f} {num_chips:>6}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Compare the size and node import time of the JS export formats.')
+    parser.add_argument('--p', default='excel_file_long/parquet_file_long.parquet', help='Input Munsell Parquet file')
+    parser.add_argument('--j', default='excel_file_long/js_file_long.js', help='reference JS file')
+    parser.add_argument('--node', default='node', help='node executable')
+    parser.add_argument('--runs', type=int, default=15, help='node processes per file')
+
+    args = parser.parse_args()
+
+    main(args.p, args.j, args.node, args.runs)
+
+    print("done")
@@ -0,0 +1,59 @@
+import argparse
+import time
+from bench_color_key import random_chips
+from munsell_data_frame.MunsellDataFrame import SortOrder
+
+# return the best of repeats wall clock seconds of calling fn
+def best_seconds(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(num_rows, repeats):
+    munsell_df = random_chips(num_rows)
+    munsell_df.set_color_key()
+    hue_pages = list(range(0, 40, 2))
+
+    # the same five step chain, eager and lazy
+    def eager():
+        filtered = munsell_df.filter_by_columns({'hue_page_number': hue_pages})
+        filtered = filtered.sort_by_columns({'r': SortOrder.DESC})
+        filtered = filtered.filter_by_columns({'value_row': [3, 4, 5, 6]})
+        return filtered.get_color_key_reduced().reduce_by_color_key()
+
+    lazy = (munsell_df.lazy().filter({'hue_page_number': hue_pages}).sort({'r': SortOrder.DESC})
+            .filter({'value_row': [3, 4, 5, 6]}).color_key_reduced().groupby_key())
+    assert eager().df.equals(lazy.collect().df)
+    print(lazy.explain())
+
+    def eager_sorted():
+        filtered = munsell_df.filter_by_columns({'hue_page_number': hue_pages})
+        filtered = filtered.sort_by_columns({'value_row': SortOrder.ASC})
+        filtered = filtered.filter_by_columns({'chroma_column': [2, 4, 6]})
+        return filtered.sort_by_columns({'r': SortOrder.DESC}).df[['color_key', 'r']]
+
+    lazy_sorted = (munsell_df.lazy().filter({'hue_page_number': hue_pages}).sort({'value_row': SortOrder.ASC})
+                   .filter({'chroma_column': [2, 4, 6]}).sort({'r': SortOrder.DESC}).project(['color_key', 'r']))
+
+    print(f"{num_rows} rows")
+    print(f"{'chain':>28} {'eager_s':>10} {'lazy_s':>10} {'speedup':>8}")
+    for name, eager_fn, lazy_fn in [('filter, sort, groupby', eager, lazy.collect), ('filter, sort, project', eager_sorted, lazy_sorted.collect)]:
+        eager_seconds = best_seconds(eager_fn, repeats)
+        lazy_seconds = best_seconds(lazy_fn, repeats)
+        print(f"{name:>28} {eager_seconds:>10.3f} {lazy_seconds:>10.3f} {eager_seconds / lazy_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark chained MunsellDataFrame operations eagerly and as a lazy plan.')
+    parser.add_argument('--rows', type=int, default=2_000_000, help='number of chips')
+    parser.add_argument('--repeats', type=int, default=3, help='repeats of each chain, the best is reported')
+
+    args = parser.parse_args()
+
+    main(args.rows, args.repeats)
+
+    print("done")
@@ -0,0 +1,80 @@
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+MODES = ['legacy', 'full', 'columns', 'filters']
+
+# write a parquet file of num_rows random chips with uint8 dimension and
+# rgb columns and their color_key
+def write_chip_file(parquet_file, num_rows, seed=0):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from munsell_data_frame import MunsellDataFrame
+
+    rng = np.random.default_rng(seed)
+    hue_page_numbers = rng.integers(0, 40, num_rows, dtype=np.uint8)
+    value_rows = rng.integers(1, 10, num_rows, dtype=np.uint8)
+    chroma_columns = rng.integers(1, 20, num_rows, dtype=np.uint8) * 2
+    table = pa.table({
+        'hue_page_number': hue_page_numbers,
+        'value_row': value_rows,
+        'chroma_column': chroma_columns,
+        'color_key': MunsellDataFrame.encode_color_keys(hue_page_numbers, value_rows, chroma_columns),
+        'r': rng.integers(0, 256, num_rows, dtype=np.uint8),
+        'g': rng.integers(0, 256, num_rows, dtype=np.uint8),
+        'b': rng.integers(0, 256, num_rows, dtype=np.uint8),
+    })
+    pq.write_table(table, parquet_file, row_group_size=num_rows // 40 or 1)
+
+# load parquet_file in one mode and print seconds, rows and peak memory
+def run_mode(mode, parquet_file):
+    import pandas as pd
+    from munsell_data_frame import MunsellDataFrame
+
+    start = time.perf_counter()
+    if mode == 'legacy':
+        # the object array round trip of from_parquet before pyarrow loading
+        df = pd.read_parquet(parquet_file, engine='pyarrow')
+        munsell_df = MunsellDataFrame(data=df.values, columns=df.columns)
+    elif mode == 'full':
+        munsell_df = MunsellDataFrame.from_parquet(parquet_file)
+    elif mode == 'columns':
+        munsell_df = MunsellDataFrame.from_parquet(parquet_file, columns=['color_key', 'r', 'g', 'b'])
+    else:
+        munsell_df = MunsellDataFrame.from_parquet(parquet_file, filters={'hue_page_number': 5})
+    seconds = time.perf_counter() - start
+    print(seconds, len(munsell_df.df), resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+def main(num_rows, work_dir):
+    parquet_file = os.path.join(work_dir, f"chips_{num_rows}.parquet")
+    write_chip_file(parquet_file, num_rows)
+    print(f"{parquet_file} {os.path.getsize(parquet_file) // 1024 ** 2} MB")
+
+    print(f"{'mode':>8} {'seconds':>8} {'rows':>10} {'peak_rss_mb':>12}")
+    for mode in MODES:
+        # each mode runs in a fresh process so its peak memory is its own
+        command = [sys.executable, __file__, '--run-mode', mode, '--parquet-file', parquet_file]
+        seconds, rows, peak_rss = subprocess.run(command, check=True, capture_output=True, text=True).stdout.split()
+        print(f"{mode:>8} {float(seconds):>8.2f} {int(rows):>10} {int(peak_rss) / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark loading a large synthetic chip parquet file.')
+    parser.add_argument('--rows', type=int, default=2_000_000, help='number of chips in the synthetic file')
+    parser.add_argument('--run-mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--parquet-file', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run_mode:
+        run_mode(args.run_mode, args.parquet_file)
+    else:
+        with tempfile.TemporaryDirectory() as work_dir:
+            main(args.rows, work_dir)
+        print("done")
@@ -0,0 +1,56 @@
+import argparse
+import time
+import numpy as np
+from munsell_data_frame import MunsellDataFrame, MunsellGrid
+from munsell_data_frame.HuePageRenderer import get_hue_page_arrays
+
+# return the best of repeats wall clock seconds of calling fn
+def best_seconds(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(parquet_file, num_keys, repeats):
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file)
+    munsell_df.decode_color_key()
+    start = time.perf_counter()
+    grid = MunsellGrid.from_munsell_data_frame(munsell_df)
+    print(f"{grid.num_chips} chips in a {grid.rgbs.shape} grid built in {time.perf_counter() - start:.4f}s")
+
+    # random keys of chips that exist
+    rng = np.random.default_rng(0)
+    color_keys = munsell_df.df['color_key'].to_numpy()[rng.integers(0, len(munsell_df.df), num_keys)]
+    packed_color_keys = MunsellDataFrame.color_keys_to_packed(color_keys)
+    chips = munsell_df.df.set_index('color_key')[['r', 'g', 'b']]
+
+    timings = [
+        ('hue page, filter_by_columns', lambda: munsell_df.filter_by_columns({'hue_page_number': 5})),
+        ('hue page, grid view', lambda: grid.get_hue_page(5)),
+        ('value row, filter_by_columns', lambda: munsell_df.filter_by_columns({'value_row': 5})),
+        ('value row, grid view', lambda: grid.get_value_row(5)),
+        (f"{num_keys} keys, pandas reindex", lambda: chips.reindex(color_keys).to_numpy()),
+        (f"{num_keys} keys, grid gather", lambda: grid.gather_color_keys(color_keys)),
+        (f"{num_keys} packed keys, grid gather", lambda: grid.gather_packed_color_keys(packed_color_keys)),
+        ('hue page arrays, index', lambda: (munsell_df.invalidate_index(), get_hue_page_arrays(munsell_df))),
+        ('hue page arrays, grid', lambda: grid.get_hue_page_arrays()),
+    ]
+    print(f"{'operation':>36} {'seconds':>10}")
+    for name, fn in timings:
+        print(f"{name:>36} {best_seconds(fn, repeats):>10.6f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark MunsellGrid slices and gathers against MunsellDataFrame filtering.')
+    parser.add_argument('--p', default='excel_file_long/parquet_file_long.parquet', help='Munsell parquet file')
+    parser.add_argument('--keys', type=int, default=1_000_000, help='number of color_keys to gather')
+    parser.add_argument('--repeats', type=int, default=5, help='repeats of each operation, the best is reported')
+
+    args = parser.parse_args()
+
+    main(args.p, args.keys, args.repeats)
+
+    print("done")
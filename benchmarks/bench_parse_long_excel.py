@@ -0,0 +1,119 @@
+import argparse
+import os
+import re
+import sys
+import time
+import openpyxl
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'excel_file_long'))
+import parquet_file_long_from_excel_file_long as long_parser
+
+# the full-workbook line reader used before the read-only streaming reader
+def legacy_read_lines_from_excel_spreadsheet(excel_file_long, sheet_name='munsell2rgb'):
+    workbook = openpyxl.load_workbook(excel_file_long)
+    sheet_data = workbook[sheet_name]
+    return [cell.value for cell in sheet_data['A'] if cell.value is not None]
+
+def legacy_quintext_to_quindict(quintext):
+    match = re.search(r'(\d+) (\d+) (\d+) (\d+) (\d+)', quintext)
+    if match:
+        return {"V":int(match.group(1)), "C":int(match.group(2)), "R":int(match.group(3)), "G":int(match.group(4)), "B":int(match.group(5))}
+    return None
+
+# the pd.concat-per-quintet parser used before parse_pages was streamed
+def legacy_parse_pages(lines):
+    df_list = []
+    page_dfs = []
+    df = pd.DataFrame()
+    for line in lines:
+        if len(line.strip()) == 0:
+            continue
+        elif line.strip().startswith('CONVERSIONS'):
+            continue
+        elif line.strip().startswith('PAUL CENTORE'):
+            continue
+        elif line.strip().startswith('V C sRGB'):
+            continue
+        elif line.strip().startswith('Table'):
+            match = re.search(r'Table (\d+): Munsell to sRGB Conversions for Hue (.+)', line)
+            if match:
+                if not df.empty:
+                    df['Table Number'] = int(match.group(1))
+                    df['Hue Name'] = match.group(2)
+                    page_dfs.append(df)
+                    df = pd.DataFrame()
+        elif re.search(r'^c (\d+) Paul Centore (\d+)$', line) or re.search(r'^(\d+) c (\d+) Paul Centore$', line):
+            match1 = re.search(r'^c (\d+) Paul Centore (\d+)$', line)
+            match2 = re.search(r'^(\d+) c (\d+) Paul Centore$', line)
+            if match1:
+                copyright_year, page_number = int(match1.group(1)), int(match1.group(2))
+            else:
+                page_number, copyright_year = int(match2.group(1)), int(match2.group(2))
+            for df in page_dfs:
+                df['Author Name'] = "Paul Centore"
+                df['Copyright Year'] = copyright_year
+                df['Page Number'] = page_number
+            df_list.extend(page_dfs)
+            page_dfs = []
+        else:
+            line = line.replace(',', ' ').replace('[', ' ').replace(']', ' ')
+            words = line.split()
+            for i in range(0, len(words), 5):
+                quindict = legacy_quintext_to_quindict(' '.join(words[i:i+5]))
+                if quindict is not None:
+                    df = pd.concat([df, pd.DataFrame([quindict])])
+    return df_list
+
+# write a copy of the sheet with its lines repeated num_copies times
+def write_synthetic_sheet(excel_file_long, synthetic_file, num_copies, sheet_name='munsell2rgb'):
+    lines = list(long_parser.read_lines_from_excel_spreadsheet(excel_file_long, sheet_name))
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    for _ in range(num_copies):
+        for line in lines:
+            sheet.append([line])
+    workbook.save(synthetic_file)
+
+# return (seconds, number of parsed rows) for the legacy reader and parser
+def time_legacy(excel_file):
+    start = time.perf_counter()
+    df_list = legacy_parse_pages(legacy_read_lines_from_excel_spreadsheet(excel_file))
+    return time.perf_counter() - start, sum(len(df) for df in df_list)
+
+# return (seconds, number of parsed rows) for the streaming reader and parser
+def time_streaming(excel_file):
+    start = time.perf_counter()
+    df = long_parser.parse_pages(long_parser.read_lines_from_excel_spreadsheet(excel_file))
+    return time.perf_counter() - start, len(df)
+
+def main(excel_file, copies_list, legacy_limit, work_dir):
+    print(f"{'copies':>7} {'legacy_s':>10} {'legacy_rows':>12} {'stream_s':>10} {'stream_rows':>12}")
+    for num_copies in copies_list:
+        if num_copies == 1:
+            sheet_file = excel_file
+        else:
+            sheet_file = os.path.join(work_dir, f"Munsell_to_RGB_long_x{num_copies}.xlsx")
+            write_synthetic_sheet(excel_file, sheet_file, num_copies)
+        stream_seconds, stream_rows = time_streaming(sheet_file)
+        # the legacy parser is quadratic, so large sheets are skipped
+        if num_copies <= legacy_limit:
+            legacy_seconds, legacy_rows = time_legacy(sheet_file)
+            print(f"{num_copies:>7} {legacy_seconds:>10.2f} {legacy_rows:>12} {stream_seconds:>10.2f} {stream_rows:>12}")
+        else:
+            print(f"{num_copies:>7} {'skipped':>10} {'':>12} {stream_seconds:>10.2f} {stream_rows:>12}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark the legacy and streaming long Excel file parsers.')
+    parser.add_argument('--x', default='excel_file_long/Munsell_to_RGB_long.xlsx', help='Input long Excel file')
+    parser.add_argument('--copies', type=int, nargs='+', default=[1, 5, 100], help='sizes of the synthetic sheets, as copies of the input sheet')
+    parser.add_argument('--legacy-limit', type=int, default=5, help='skip the legacy parser above this many copies')
+    parser.add_argument('--work-dir', default='/tmp', help='folder for the synthetic sheets')
+
+    args = parser.parse_args()
+
+    main(args.x, args.copies, args.legacy_limit, args.work_dir)
+
+    print("done")
@@ -0,0 +1,50 @@
+import argparse
+import time
+import numpy as np
+from bench_color_key import random_chips
+
+# return (seconds, result) of one call of fn
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+def main(row_counts):
+    print(f"{'rows':>10} {'reduction':>14} {'pandas_s':>10} {'reduce_s':>10} {'speedup':>8}")
+    for num_rows in row_counts:
+        munsell_df = random_chips(num_rows)
+        munsell_df.set_color_key()
+        munsell_df.df['weight'] = np.random.default_rng(0).random(num_rows)
+        rgbs = munsell_df.df[['r', 'g', 'b']].astype(float)
+        weighted = rgbs.mul(munsell_df.df['weight'], axis=0).assign(weight=munsell_df.df['weight'])
+        color_keys = munsell_df.df['color_key']
+
+        # the pandas ways to the same dimension-keeping, rounded result
+        pandas_ways = {
+            'mean': lambda: munsell_df.groupby_color_key().get_color_key_expanded(),
+            'median': lambda: rgbs.groupby(color_keys).median().round().astype('UInt8'),
+            'weighted_mean': lambda: (lambda sums: sums[['r', 'g', 'b']].div(sums['weight'], axis=0).round().astype('UInt8'))(weighted.groupby(color_keys).sum()),
+            'count': lambda: color_keys.groupby(color_keys).size(),
+        }
+        for how, pandas_way in pandas_ways.items():
+            pandas_seconds, _ = timed(pandas_way)
+            weights = 'weight' if how == 'weighted_mean' else None
+            reduce_seconds, _ = timed(lambda: munsell_df.reduce_by_color_key(how, weights=weights))
+            print(f"{num_rows:>10} {how:>14} {pandas_seconds:>10.3f} {reduce_seconds:>10.3f} {pandas_seconds / reduce_seconds:>7.1f}x")
+
+        # with the packed keys already in the frame no color_key string is parsed
+        munsell_df.set_packed_color_key()
+        reduce_seconds, _ = timed(lambda: munsell_df.reduce_by_color_key())
+        print(f"{num_rows:>10} {'mean, packed':>14} {'':>10} {reduce_seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark reduce_by_color_key against pandas groupby reductions.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 5_000_000], help='numbers of measured samples')
+
+    args = parser.parse_args()
+
+    main(args.rows)
+
+    print("done")
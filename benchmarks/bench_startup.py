@@ -0,0 +1,133 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# the entry point scripts, relative to the repo
+CLIS = [
+    'animate/animate_hue_page_images.py',
+    'chip_lookup/chip_lookup_table_from_parquet_file.py',
+    'comparison/comparison_report_from_parquet_files.py',
+    'excel_file_long/parquet_file_long_from_excel_file_long.py',
+    'excel_file_macro/parquet_file_macro_from_excel_file_macro.py',
+    'histogram/histograms_from_parquet_file.py',
+    'hue_pages/hue_page_images_from_parquet_file.py',
+    'image_quantization/quantize_image_to_munsell_chips.py',
+    'javascript/js_file_from_parquet_file.py',
+    'pipeline/build_pipeline.py',
+]
+
+# the arguments of each startup path: printing the usage, and failing on
+# an unknown option, which animate reports by its usage message
+PATHS = {
+    'help': ['--help'],
+    'error': ['--no-such-option'],
+}
+
+# the third-party packages none of the startup paths should import
+HEAVY_MODULES = ['pandas', 'numpy', 'pyarrow', 'matplotlib', 'PIL', 'openpyxl', 'scipy']
+
+# return ({top-level module: cumulative microseconds}, set of every
+# imported module name) of the 'import time:' lines that python -X
+# importtime writes to stderr. Nested imports are indented, so a heavy
+# package imported by a munsell_data_frame module is only in the set
+def parse_importtime(stderr):
+    imports = {}
+    module_names = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        module_names.add(name.strip())
+        if not name.startswith('  '):
+            imports[name.strip()] = int(cumulative)
+    return imports, module_names
+
+# return (median wall milliseconds, {top-level module: cumulative
+# milliseconds}, set of every imported module name) of running the
+# script in num_runs fresh processes
+def time_startup(script, args, num_runs):
+    env = dict(os.environ, PYTHONPATH=REPO_DIR)
+    times = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', os.path.join(REPO_DIR, script)] + args,
+                                cwd=REPO_DIR, env=env, capture_output=True, text=True)
+        times.append((time.perf_counter() - start) * 1000)
+    imports, module_names = parse_importtime(result.stderr)
+    return statistics.median(times), {name: cumulative / 1000 for name, cumulative in imports.items()}, module_names
+
+# return the result dicts of every CLI and startup path
+def measure(num_runs):
+    results = []
+    for script in CLIS:
+        for path, args in PATHS.items():
+            wall_ms, imports, module_names = time_startup(script, args, num_runs)
+            results.append({
+                'cli': script,
+                'path': path,
+                'wall_ms': round(wall_ms, 1),
+                'import_ms': round(sum(imports.values()), 1),
+                'heavy_modules': [name for name in HEAVY_MODULES if name in module_names],
+                'slowest_imports': [name for name in sorted(imports, key=imports.get, reverse=True)[:3]],
+            })
+    return results
+
+# return the messages of the results that regressed against the baseline
+# results: slower by more than tolerance plus slack_ms, which keeps the
+# noise of a few ms on a fast path from failing, or importing a new heavy
+# module
+def get_regressions(results, baseline, tolerance, slack_ms):
+    baseline = {(result['cli'], result['path']): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = baseline.get((result['cli'], result['path']))
+        if before is None:
+            continue
+        if result['wall_ms'] > before['wall_ms'] * (1 + tolerance) + slack_ms:
+            regressions.append(f"{result['cli']} {result['path']}: {before['wall_ms']}ms -> {result['wall_ms']}ms")
+        new_modules = sorted(set(result['heavy_modules']) - set(before['heavy_modules']))
+        if new_modules:
+            regressions.append(f"{result['cli']} {result['path']}: now imports {' '.join(new_modules)}")
+    return regressions
+
+def main(num_runs, record_file, baseline_file, tolerance, slack_ms):
+    results = measure(num_runs)
+    print(f"{'cli':>58} {'path':>5} {'wall_ms':>8} {'import_ms':>9}  heavy modules / slowest imports")
+    for result in results:
+        print(f"{result['cli']:>58} {result['path']:>5} {result['wall_ms']:>8.1f} {result['import_ms']:>9.1f}  "
+              f"{' '.join(result['heavy_modules']) or '-'} / {' '.join(result['slowest_imports'])}")
+
+    if record_file:
+        with open(record_file, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"{record_file} written")
+
+    if baseline_file:
+        with open(baseline_file) as f:
+            regressions = get_regressions(results, json.load(f), tolerance, slack_ms)
+        for regression in regressions:
+            print(f"regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark the cold start of every CLI on its --help and argument error paths with python -X importtime.')
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes per CLI and path, the median is reported')
+    parser.add_argument('--record', default=None, help='write the results to this json file, e.g. as a baseline')
+    parser.add_argument('--baseline', default=None, help='json file of recorded results; exit 1 if any CLI is slower or imports a new heavy module')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed wall time slowdown against the baseline (default: 0.25)')
+    parser.add_argument('--slack-ms', type=float, default=20, help='allowed wall time slowdown in ms on top of the tolerance (default: 20)')
+
+    args = parser.parse_args()
+
+    main(args.runs, args.record, args.baseline, args.tolerance, args.slack_ms)
+
+    print("done")
@@ -0,0 +1,58 @@
+import argparse
+import time
+import tracemalloc
+import pandas as pd
+from bench_color_key import random_chips
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame, SortOrder
+
+# return (best seconds of repeats calls, peak traced MB of one call) of fn
+def measured(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, peak / 1e6
+
+def main(num_rows, repeats):
+    munsell_df = random_chips(num_rows)
+    munsell_df.set_color_key()
+    munsell_df.df['hue_page_name'] = munsell_df.df['hue_page_number'].astype(int).map(MunsellDataFrame.get_hue_page_name_from_hue_page_number).astype('str')
+    munsell_df = MunsellDataFrame(munsell_df.df)
+    df = munsell_df.df
+    frame_mb = df.memory_usage(deep=False).sum() / 1e6
+    print(f"{num_rows} rows, {frame_mb:.1f} MB of column buffers, copy_on_write={pd.options.mode.copy_on_write}")
+
+    # each derived result built through __init__, as before, and by _wrap
+    operations = [
+        ('filter_by_columns', lambda: df.iloc[munsell_df._filter_positions({'value_row': [3, 4, 5, 6]})], lambda: munsell_df.filter_by_columns({'value_row': [3, 4, 5, 6]})),
+        ('sort_by_columns', lambda: df.sort_values(by=['value_row'], ascending=[False]), lambda: munsell_df.sort_by_columns({'value_row': SortOrder.DESC})),
+        ('get_color_key_reduced', lambda: df[['color_key', 'r', 'g', 'b']], munsell_df.get_color_key_reduced),
+    ]
+    print(f"{'operation':>22} {'init_s':>8} {'wrap_s':>8} {'init_MB':>8} {'wrap_MB':>8}")
+    for name, derive, wrapped in operations:
+        init_seconds, init_mb = measured(lambda: MunsellDataFrame(derive()), repeats)
+        wrap_seconds, wrap_mb = measured(wrapped, repeats)
+        print(f"{name:>22} {init_seconds:>8.3f} {wrap_seconds:>8.3f} {init_mb:>8.1f} {wrap_mb:>8.1f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Benchmark derived MunsellDataFrames built by __init__ against _wrap.')
+    parser.add_argument('--rows', type=int, default=2_000_000, help='number of chips')
+    parser.add_argument('--repeats', type=int, default=3, help='repeats of each operation, the best is reported')
+    parser.add_argument('--copy-on-write', action='store_true', help='enable pandas copy-on-write, so projections share buffers')
+
+    args = parser.parse_args()
+
+    if args.copy_on_write:
+        pd.options.mode.copy_on_write = True
+
+    main(args.rows, args.repeats)
+
+    print("done")
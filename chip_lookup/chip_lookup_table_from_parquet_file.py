@@ -0,0 +1,41 @@
+import argparse
+import os
+import time
+
+# build, or load if it is up to date, the nearest chip lookup table of
+# the chips of a Munsell parquet file, one chip per color_key
+def main(parquet_file, table_file, space='rgb', bits=8, num_workers=None):
+    from munsell_data_frame import MunsellDataFrame
+    from munsell_data_frame.ChipLookupTable import ChipLookupTable
+
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file).groupby_color_key()
+
+    start = time.perf_counter()
+    table = ChipLookupTable.from_munsell_data_frame(munsell_df, table_file, space=space, bits=bits, num_workers=num_workers)
+    seconds = time.perf_counter() - start
+
+    print(f"{table_file} entries:{len(table.table)} chips:{len(table.color_keys)} space:{space} bits:{bits} seconds:{seconds:.2f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Build the RGB to nearest Munsell chip lookup table of a Munsell Parquet file.')
+    parser.add_argument('--p', required=True, help='Input Munsell Parquet file')
+    parser.add_argument('--o', default=None, help='output .npy table file (default: chip_lookup_table_<space>_<bits>.npy next to the parquet file)')
+    parser.add_argument('--space', choices=['rgb', 'lab'], default='rgb', help='colour space of the nearest chip distance (default: rgb)')
+    parser.add_argument('--bits', type=int, default=8, choices=range(1, 9), metavar='1-8', help='bits per channel of the table (default: 8)')
+    parser.add_argument('--workers', type=int, default=None, help='number of building processes (default: all cores)')
+
+    args = parser.parse_args()
+
+    parquet_file = args.p
+
+    # Check if the parquet_file exists and is readable
+    if not os.path.isfile(parquet_file) or not os.access(parquet_file, os.R_OK):
+        print(f"Error: The file {parquet_file} does not exist or is not readable.")
+        exit(1)
+
+    table_file = args.o or os.path.join(os.path.dirname(parquet_file), f"chip_lookup_table_{args.space}_{args.bits}.npy")
+    main(parquet_file, table_file, space=args.space, bits=args.bits, num_workers=args.workers)
+
+    print("done")
@@ -0,0 +1,50 @@
+import argparse
+import os
+import json
+
+# compare the chips of sample_file against those of reference_file and
+# write the report rows to report_file and the summaries to summary_file
+def main(reference_file, sample_file, report_file, summary_file):
+    from munsell_data_frame import MunsellDataFrame
+    from munsell_data_frame.MunsellComparison import MunsellComparison
+
+    reference_df = MunsellDataFrame.from_parquet(reference_file)
+    sample_df = MunsellDataFrame.from_parquet(sample_file)
+    comparison = MunsellComparison.compare(reference_df, sample_df)
+
+    comparison.to_parquet(report_file)
+    print(f"{report_file} rows:{len(comparison.report)}")
+    comparison.summary_to_json(summary_file)
+    print(f"{summary_file} written")
+
+    summary = comparison.get_summary()
+    print(json.dumps(summary, indent=2))
+    missing_color_keys = comparison.get_missing_color_keys()
+    if len(missing_color_keys):
+        print(f"missing from {sample_file}: {' '.join(missing_color_keys[:10])}{' ...' if len(missing_color_keys) > 10 else ''}")
+    extra_color_keys = comparison.get_extra_color_keys()
+    if len(extra_color_keys):
+        print(f"not in {reference_file}: {' '.join(extra_color_keys[:10])}{' ...' if len(extra_color_keys) > 10 else ''}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Compare the chips of a Munsell parquet file against a reference Munsell parquet file.')
+    parser.add_argument('--ref', default='excel_file_long/parquet_file_long.parquet', help='reference Munsell Parquet file (default: the long parquet file)')
+    parser.add_argument('--p', default='excel_file_macro/parquet_file_macro.parquet', help='Munsell Parquet file of the samples to compare (default: the macro parquet file)')
+    parser.add_argument('--o', default=os.path.dirname(os.path.abspath(__file__)), help='output folder of the report files (default: this folder)')
+    parser.add_argument('--report', default='comparison_report.parquet', help='output report parquet file name in the output folder')
+    parser.add_argument('--summary', default='comparison_summary.json', help='output summary json file name in the output folder')
+
+    args = parser.parse_args()
+
+    # Check if every parquet_file exists and is readable
+    for parquet_file in [args.ref, args.p]:
+        if not os.path.isfile(parquet_file) or not os.access(parquet_file, os.R_OK):
+            print(f"Error: The file {parquet_file} does not exist or is not readable.")
+            exit(1)
+
+    os.makedirs(args.o, exist_ok=True)
+    main(args.ref, args.p, os.path.join(args.o, args.report), os.path.join(args.o, args.summary))
+
+    print("done")
@@ -126,71 +126,71 @@ export const flatColorChips = [
 {"color_key": "01-09-02", "r": 246, "g": 221, "b": 231},
 {"color_key": "01-09-04", "r": 255, "g": 214, "b": 220},
 {"color_key": "01-09-06", "r": 255, "g": 206, "b": 210},
-{"color_key": "02-01-02", "r": 46, "g": 21, "b": 28},
-{"color_key": "02-01-04", "r": 55, "g": 14, "b": 27},
-{"color_key": "02-01-06", "r": 64, "g": 2, "b": 26},
-{"color_key": "02-01-08", "r": 72, "g": 0, "b": 26},
-{"color_key": "02-01-10", "r": 79, "g": 0, "b": 26},
-{"color_key": "02-02-02", "r": 67, "g": 43, "b": 47},
-{"color_key": "02-02-04", "r": 78, "g": 36, "b": 43},
-{"color_key": "02-02-06", "r": 88, "g": 28, "b": 39},
-{"color_key": "02-02-08", "r": 99, "g": 14, "b": 35},
-{"color_key": "02-02-10", "r": 109, "g": 0, "b": 33},
-{"color_key": "02-02-12", "r": 118, "g": 0, "b": 30},
-{"color_key": "02-02-14", "r": 128, "g": 0, "b": 29},
-{"color_key": "02-03-02", "r": 92, "g": 65, "b": 68},
-{"color_key": "02-03-04", "r": 106, "g": 58, "b": 60},
-{"color_key": "02-03-06", "r": 118, "g": 51, "b": 53},
-{"color_key": "02-03-08", "r": 129, "g": 41, "b": 46},
-{"color_key": "02-03-10", "r": 140, "g": 25, "b": 39},
-{"color_key": "02-03-12", "r": 150, "g": 0, "b": 33},
-{"color_key": "02-03-14", "r": 159, "g": 0, "b": 28},
-{"color_key": "02-03-16", "r": 169, "g": 0, "b": 22},
-{"color_key": "02-04-02", "r": 117, "g": 90, "b": 93},
-{"color_key": "02-04-04", "r": 132, "g": 83, "b": 85},
-{"color_key": "02-04-06", "r": 145, "g": 76, "b": 77},
-{"color_key": "02-04-08", "r": 157, "g": 68, "b": 69},
-{"color_key": "02-04-10", "r": 168, "g": 59, "b": 61},
-{"color_key": "02-04-12", "r": 178, "g": 47, "b": 53},
-{"color_key": "02-04-14", "r": 188, "g": 28, "b": 45},
-{"color_key": "02-04-16", "r": 198, "g": 0, "b": 37},
-{"color_key": "02-04-18", "r": 207, "g": 0, "b": 29},
+{"color_key": "02-01-02", "r": 46, "g": 21, "b": 27},
+{"color_key": "02-01-04", "r": 56, "g": 14, "b": 25},
+{"color_key": "02-01-06", "r": 65, "g": 2, "b": 23},
+{"color_key": "02-01-08", "r": 73, "g": 0, "b": 23},
+{"color_key": "02-01-10", "r": 80, "g": 0, "b": 23},
+{"color_key": "02-02-02", "r": 67, "g": 43, "b": 46},
+{"color_key": "02-02-04", "r": 79, "g": 37, "b": 41},
+{"color_key": "02-02-06", "r": 89, "g": 29, "b": 36},
+{"color_key": "02-02-08", "r": 99, "g": 16, "b": 31},
+{"color_key": "02-02-10", "r": 109, "g": 0, "b": 27},
+{"color_key": "02-02-12", "r": 119, "g": 0, "b": 23},
+{"color_key": "02-02-14", "r": 128, "g": 0, "b": 21},
+{"color_key": "02-03-02", "r": 92, "g": 65, "b": 67},
+{"color_key": "02-03-04", "r": 106, "g": 59, "b": 58},
+{"color_key": "02-03-06", "r": 118, "g": 51, "b": 50},
+{"color_key": "02-03-08", "r": 129, "g": 42, "b": 42},
+{"color_key": "02-03-10", "r": 139, "g": 28, "b": 33},
+{"color_key": "02-03-12", "r": 150, "g": 0, "b": 25},
+{"color_key": "02-03-14", "r": 159, "g": 0, "b": 18},
+{"color_key": "02-03-16", "r": 168, "g": 0, "b": 9},
+{"color_key": "02-04-02", "r": 117, "g": 90, "b": 92},
+{"color_key": "02-04-04", "r": 132, "g": 83, "b": 83},
+{"color_key": "02-04-06", "r": 145, "g": 77, "b": 74},
+{"color_key": "02-04-08", "r": 157, "g": 69, "b": 65},
+{"color_key": "02-04-10", "r": 168, "g": 60, "b": 56},
+{"color_key": "02-04-12", "r": 178, "g": 49, "b": 46},
+{"color_key": "02-04-14", "r": 188, "g": 32, "b": 36},
+{"color_key": "02-04-16", "r": 197, "g": 0, "b": 26},
+{"color_key": "02-04-18", "r": 206, "g": 0, "b": 14},
 {"color_key": "02-04-20", "r": 216, "g": 0, "b": 0},
-{"color_key": "02-05-02", "r": 141, "g": 116, "b": 120},
-{"color_key": "02-05-04", "r": 158, "g": 109, "b": 111},
-{"color_key": "02-05-06", "r": 172, "g": 103, "b": 102},
-{"color_key": "02-05-08", "r": 185, "g": 95, "b": 94},
-{"color_key": "02-05-10", "r": 198, "g": 86, "b": 85},
-{"color_key": "02-05-12", "r": 210, "g": 76, "b": 76},
-{"color_key": "02-05-14", "r": 220, "g": 64, "b": 68},
-{"color_key": "02-05-16", "r": 231, "g": 48, "b": 58},
-{"color_key": "02-05-18", "r": 240, "g": 15, "b": 49},
-{"color_key": "02-05-20", "r": 250, "g": 0, "b": 40},
-{"color_key": "02-06-02", "r": 167, "g": 141, "b": 146},
-{"color_key": "02-06-04", "r": 184, "g": 135, "b": 138},
-{"color_key": "02-06-06", "r": 199, "g": 129, "b": 129},
-{"color_key": "02-06-08", "r": 212, "g": 122, "b": 121},
-{"color_key": "02-06-10", "r": 226, "g": 114, "b": 111},
-{"color_key": "02-06-12", "r": 239, "g": 106, "b": 102},
-{"color_key": "02-06-14", "r": 250, "g": 96, "b": 93},
-{"color_key": "02-06-16", "r": 255, "g": 84, "b": 82},
-{"color_key": "02-06-18", "r": 255, "g": 69, "b": 72},
-{"color_key": "02-07-02", "r": 194, "g": 167, "b": 174},
-{"color_key": "02-07-04", "r": 211, "g": 162, "b": 164},
-{"color_key": "02-07-06", "r": 226, "g": 155, "b": 155},
-{"color_key": "02-07-08", "r": 242, "g": 148, "b": 145},
-{"color_key": "02-07-10", "r": 255, "g": 140, "b": 137},
-{"color_key": "02-07-12", "r": 255, "g": 132, "b": 126},
-{"color_key": "02-07-14", "r": 255, "g": 122, "b": 116},
+{"color_key": "02-05-02", "r": 142, "g": 116, "b": 119},
+{"color_key": "02-05-04", "r": 158, "g": 109, "b": 109},
+{"color_key": "02-05-06", "r": 172, "g": 103, "b": 99},
+{"color_key": "02-05-08", "r": 186, "g": 96, "b": 89},
+{"color_key": "02-05-10", "r": 198, "g": 87, "b": 79},
+{"color_key": "02-05-12", "r": 210, "g": 77, "b": 68},
+{"color_key": "02-05-14", "r": 220, "g": 66, "b": 58},
+{"color_key": "02-05-16", "r": 230, "g": 51, "b": 46},
+{"color_key": "02-05-18", "r": 239, "g": 29, "b": 34},
+{"color_key": "02-05-20", "r": 248, "g": 0, "b": 21},
+{"color_key": "02-06-02", "r": 168, "g": 141, "b": 145},
+{"color_key": "02-06-04", "r": 185, "g": 136, "b": 136},
+{"color_key": "02-06-06", "r": 199, "g": 129, "b": 126},
+{"color_key": "02-06-08", "r": 213, "g": 123, "b": 116},
+{"color_key": "02-06-10", "r": 227, "g": 115, "b": 104},
+{"color_key": "02-06-12", "r": 239, "g": 107, "b": 93},
+{"color_key": "02-06-14", "r": 250, "g": 97, "b": 82},
+{"color_key": "02-06-16", "r": 255, "g": 86, "b": 69},
+{"color_key": "02-06-18", "r": 255, "g": 73, "b": 56},
+{"color_key": "02-07-02", "r": 195, "g": 167, "b": 173},
+{"color_key": "02-07-04", "r": 212, "g": 162, "b": 162},
+{"color_key": "02-07-06", "r": 227, "g": 156, "b": 152},
+{"color_key": "02-07-08", "r": 243, "g": 148, "b": 140},
+{"color_key": "02-07-10", "r": 255, "g": 141, "b": 130},
+{"color_key": "02-07-12", "r": 255, "g": 133, "b": 117},
+{"color_key": "02-07-14", "r": 255, "g": 124, "b": 105},
 {"color_key": "02-07-16", "r": 255, "g": 113, "b": 92},
-{"color_key": "02-08-02", "r": 218, "g": 194, "b": 202},
-{"color_key": "02-08-04", "r": 239, "g": 188, "b": 191},
-{"color_key": "02-08-06", "r": 255, "g": 181, "b": 181},
-{"color_key": "02-08-08", "r": 255, "g": 173, "b": 170},
-{"color_key": "02-08-10", "r": 255, "g": 165, "b": 160},
-{"color_key": "02-09-02", "r": 246, "g": 221, "b": 230},
-{"color_key": "02-09-04", "r": 255, "g": 214, "b": 217},
-{"color_key": "02-09-06", "r": 255, "g": 206, "b": 205},
+{"color_key": "02-08-02", "r": 219, "g": 194, "b": 201},
+{"color_key": "02-08-04", "r": 240, "g": 188, "b": 189},
+{"color_key": "02-08-06", "r": 255, "g": 181, "b": 177},
+{"color_key": "02-08-08", "r": 255, "g": 174, "b": 164},
+{"color_key": "02-08-10", "r": 255, "g": 166, "b": 153},
+{"color_key": "02-09-02", "r": 247, "g": 221, "b": 229},
+{"color_key": "02-09-04", "r": 255, "g": 214, "b": 214},
+{"color_key": "02-09-06", "r": 255, "g": 207, "b": 201},
 {"color_key": "03-01-02", "r": 46, "g": 22, "b": 25},
 {"color_key": "03-01-04", "r": 56, "g": 14, "b": 20},
 {"color_key": "03-01-06", "r": 65, "g": 2, "b": 17},
@@ -252,70 +252,61 @@ export const flatColorChips = [
 {"color_key": "03-09-02", "r": 248, "g": 221, "b": 226},
 {"color_key": "03-09-04", "r": 255, "g": 214, "b": 208},
 {"color_key": "03-09-06", "r": 255, "g": 208, "b": 192},
-{"color_key": "04-01-02", "r": 46, "g": 22, "b": 23},
-{"color_key": "04-01-04", "r": 56, "g": 14, "b": 16},
-{"color_key": "04-01-06", "r": 65, "g": 3, "b": 11},
-{"color_key": "04-01-08", "r": 73, "g": 0, "b": 7},
-{"color_key": "04-01-10", "r": 81, "g": 0, "b": 12},
-{"color_key": "04-02-02", "r": 66, "g": 43, "b": 43},
-{"color_key": "04-02-04", "r": 78, "g": 37, "b": 33},
-{"color_key": "04-02-06", "r": 87, "g": 31, "b": 24},
-{"color_key": "04-02-08", "r": 97, "g": 20, "b": 11},
-{"color_key": "04-02-10", "r": 108, "g": 0, "b": 13},
-{"color_key": "04-02-12", "r": 117, "g": 0, "b": 5},
-{"color_key": "04-02-14", "r": 127, "g": 0, "b": 0},
-{"color_key": "04-03-02", "r": 91, "g": 65, "b": 63},
-{"color_key": "04-03-04", "r": 105, "g": 60, "b": 51},
-{"color_key": "04-03-06", "r": 115, "g": 54, "b": 39},
-{"color_key": "04-03-08", "r": 125, "g": 46, "b": 25},
-{"color_key": "04-03-10", "r": 133, "g": 38, "b": 10},
-{"color_key": "04-03-12", "r": 147, "g": 12, "b": 1},
-{"color_key": "04-03-14", "r": 156, "g": 0, "b": 0},
-{"color_key": "04-04-02", "r": 117, "g": 90, "b": 88},
-{"color_key": "04-04-04", "r": 131, "g": 84, "b": 75},
-{"color_key": "04-04-06", "r": 143, "g": 79, "b": 62},
-{"color_key": "04-04-08", "r": 154, "g": 73, "b": 48},
-{"color_key": "04-04-10", "r": 163, "g": 66, "b": 30},
-{"color_key": "04-04-12", "r": 170, "g": 60, "b": 11},
-{"color_key": "04-04-14", "r": 183, "g": 44, "b": 0},
-{"color_key": "04-04-16", "r": 189, "g": 32, "b": 0},
-{"color_key": "04-05-02", "r": 142, "g": 116, "b": 114},
-{"color_key": "04-05-04", "r": 157, "g": 110, "b": 101},
-{"color_key": "04-05-06", "r": 171, "g": 105, "b": 86},
-{"color_key": "04-05-08", "r": 183, "g": 98, "b": 71},
-{"color_key": "04-05-10", "r": 193, "g": 92, "b": 53},
-{"color_key": "04-05-12", "r": 202, "g": 86, "b": 32},
-{"color_key": "04-05-14", "r": 209, "g": 80, "b": 12},
-{"color_key": "04-05-16", "r": 215, "g": 74, "b": 0},
-{"color_key": "04-05-18", "r": 229, "g": 56, "b": 0},
-{"color_key": "04-06-02", "r": 169, "g": 141, "b": 141},
-{"color_key": "04-06-04", "r": 184, "g": 136, "b": 127},
-{"color_key": "04-06-06", "r": 198, "g": 131, "b": 113},
-{"color_key": "04-06-08", "r": 211, "g": 125, "b": 98},
-{"color_key": "04-06-10", "r": 223, "g": 119, "b": 81},
-{"color_key": "04-06-12", "r": 233, "g": 113, "b": 62},
-{"color_key": "04-06-14", "r": 242, "g": 106, "b": 36},
-{"color_key": "04-06-16", "r": 249, "g": 101, "b": 14},
-{"color_key": "04-06-18", "r": 251, "g": 94, "b": 0},
-{"color_key": "04-07-02", "r": 195, "g": 167, "b": 168},
-{"color_key": "04-07-04", "r": 211, "g": 162, "b": 153},
-{"color_key": "04-07-06", "r": 227, "g": 157, "b": 138},
-{"color_key": "04-07-08", "r": 240, "g": 151, "b": 122},
-{"color_key": "04-07-10", "r": 252, "g": 145, "b": 107},
-{"color_key": "04-07-12", "r": 255, "g": 138, "b": 87},
-{"color_key": "04-07-14", "r": 255, "g": 132, "b": 64},
-{"color_key": "04-07-16", "r": 255, "g": 126, "b": 30},
+{"color_key": "04-01-02", "r": 46, "g": 22, "b": 21},
+{"color_key": "04-01-04", "r": 57, "g": 14, "b": 12},
+{"color_key": "04-01-06", "r": 65, "g": 4, "b": 5},
+{"color_key": "04-01-08", "r": 73, "g": 0, "b": 0},
+{"color_key": "04-02-02", "r": 66, "g": 44, "b": 42},
+{"color_key": "04-02-04", "r": 78, "g": 38, "b": 31},
+{"color_key": "04-02-06", "r": 87, "g": 32, "b": 20},
+{"color_key": "04-02-08", "r": 96, "g": 22, "b": 2},
+{"color_key": "04-03-02", "r": 91, "g": 66, "b": 62},
+{"color_key": "04-03-04", "r": 104, "g": 61, "b": 49},
+{"color_key": "04-03-06", "r": 114, "g": 55, "b": 35},
+{"color_key": "04-03-08", "r": 123, "g": 49, "b": 18},
+{"color_key": "04-03-10", "r": 130, "g": 43, "b": 0},
+{"color_key": "04-04-02", "r": 117, "g": 90, "b": 87},
+{"color_key": "04-04-04", "r": 131, "g": 85, "b": 73},
+{"color_key": "04-04-06", "r": 142, "g": 80, "b": 58},
+{"color_key": "04-04-08", "r": 152, "g": 75, "b": 42},
+{"color_key": "04-04-10", "r": 160, "g": 69, "b": 20},
+{"color_key": "04-04-12", "r": 166, "g": 65, "b": 0},
+{"color_key": "04-05-02", "r": 142, "g": 116, "b": 113},
+{"color_key": "04-05-04", "r": 157, "g": 111, "b": 99},
+{"color_key": "04-05-06", "r": 170, "g": 106, "b": 83},
+{"color_key": "04-05-08", "r": 182, "g": 100, "b": 65},
+{"color_key": "04-05-10", "r": 191, "g": 95, "b": 46},
+{"color_key": "04-05-12", "r": 198, "g": 90, "b": 21},
+{"color_key": "04-05-14", "r": 204, "g": 86, "b": 0},
+{"color_key": "04-05-16", "r": 208, "g": 82, "b": 0},
+{"color_key": "04-06-02", "r": 169, "g": 141, "b": 139},
+{"color_key": "04-06-04", "r": 184, "g": 137, "b": 125},
+{"color_key": "04-06-06", "r": 198, "g": 132, "b": 109},
+{"color_key": "04-06-08", "r": 210, "g": 126, "b": 93},
+{"color_key": "04-06-10", "r": 221, "g": 121, "b": 74},
+{"color_key": "04-06-12", "r": 230, "g": 116, "b": 52},
+{"color_key": "04-06-14", "r": 238, "g": 111, "b": 21},
+{"color_key": "04-06-16", "r": 243, "g": 107, "b": 0},
+{"color_key": "04-06-18", "r": 248, "g": 103, "b": 0},
+{"color_key": "04-07-02", "r": 195, "g": 168, "b": 167},
+{"color_key": "04-07-04", "r": 211, "g": 163, "b": 151},
+{"color_key": "04-07-06", "r": 226, "g": 158, "b": 134},
+{"color_key": "04-07-08", "r": 239, "g": 152, "b": 117},
+{"color_key": "04-07-10", "r": 250, "g": 147, "b": 100},
+{"color_key": "04-07-12", "r": 255, "g": 141, "b": 78},
+{"color_key": "04-07-14", "r": 255, "g": 136, "b": 51},
+{"color_key": "04-07-16", "r": 255, "g": 131, "b": 4},
 {"color_key": "04-07-18", "r": 255, "g": 128, "b": 0},
 {"color_key": "04-07-20", "r": 255, "g": 125, "b": 0},
-{"color_key": "04-08-02", "r": 220, "g": 194, "b": 197},
-{"color_key": "04-08-04", "r": 240, "g": 188, "b": 179},
-{"color_key": "04-08-06", "r": 255, "g": 183, "b": 163},
-{"color_key": "04-08-08", "r": 255, "g": 177, "b": 146},
-{"color_key": "04-08-10", "r": 255, "g": 171, "b": 129},
+{"color_key": "04-08-02", "r": 221, "g": 194, "b": 195},
+{"color_key": "04-08-04", "r": 240, "g": 189, "b": 176},
+{"color_key": "04-08-06", "r": 255, "g": 184, "b": 159},
+{"color_key": "04-08-08", "r": 255, "g": 178, "b": 141},
+{"color_key": "04-08-10", "r": 255, "g": 173, "b": 122},
 {"color_key": "04-08-12", "r": 255, "g": 167, "b": 101},
-{"color_key": "04-09-02", "r": 248, "g": 221, "b": 224},
-{"color_key": "04-09-04", "r": 255, "g": 214, "b": 205},
-{"color_key": "04-09-06", "r": 255, "g": 209, "b": 187},
+{"color_key": "04-09-02", "r": 249, "g": 221, "b": 223},
+{"color_key": "04-09-04", "r": 255, "g": 215, "b": 202},
+{"color_key": "04-09-06", "r": 255, "g": 210, "b": 182},
 {"color_key": "05-01-02", "r": 45, "g": 23, "b": 17},
 {"color_key": "05-01-04", "r": 55, "g": 16, "b": 2},
 {"color_key": "05-02-02", "r": 65, "g": 44, "b": 39},
@@ -367,60 +358,56 @@ export const flatColorChips = [
 {"color_key": "05-09-02", "r": 249, "g": 221, "b": 218},
 {"color_key": "05-09-04", "r": 255, "g": 217, "b": 195},
 {"color_key": "05-09-06", "r": 255, "g": 212, "b": 174},
-{"color_key": "06-01-02", "r": 44, "g": 23, "b": 15},
-{"color_key": "06-01-04", "r": 55, "g": 16, "b": 2},
-{"color_key": "06-02-02", "r": 64, "g": 44, "b": 38},
-{"color_key": "06-02-04", "r": 74, "g": 41, "b": 22},
-{"color_key": "06-02-06", "r": 82, "g": 37, "b": 2},
-{"color_key": "06-03-02", "r": 89, "g": 67, "b": 59},
-{"color_key": "06-03-04", "r": 99, "g": 63, "b": 43},
-{"color_key": "06-03-06", "r": 108, "g": 59, "b": 23},
-{"color_key": "06-03-08", "r": 114, "g": 56, "b": 0},
-{"color_key": "06-04-02", "r": 115, "g": 91, "b": 83},
-{"color_key": "06-04-04", "r": 128, "g": 87, "b": 64},
-{"color_key": "06-04-06", "r": 137, "g": 84, "b": 46},
-{"color_key": "06-04-08", "r": 144, "g": 81, "b": 25},
-{"color_key": "06-04-10", "r": 149, "g": 77, "b": 0},
-{"color_key": "06-04-12", "r": 158, "g": 72, "b": 0},
-{"color_key": "06-05-02", "r": 140, "g": 116, "b": 110},
-{"color_key": "06-05-04", "r": 154, "g": 113, "b": 91},
-{"color_key": "06-05-06", "r": 165, "g": 109, "b": 70},
-{"color_key": "06-05-08", "r": 174, "g": 105, "b": 49},
-{"color_key": "06-05-10", "r": 180, "g": 102, "b": 20},
-{"color_key": "06-05-12", "r": 185, "g": 100, "b": 0},
-{"color_key": "06-05-14", "r": 189, "g": 98, "b": 0},
-{"color_key": "06-06-02", "r": 167, "g": 142, "b": 135},
-{"color_key": "06-06-04", "r": 181, "g": 138, "b": 117},
-{"color_key": "06-06-06", "r": 193, "g": 135, "b": 96},
-{"color_key": "06-06-08", "r": 203, "g": 131, "b": 75},
-{"color_key": "06-06-10", "r": 211, "g": 128, "b": 50},
-{"color_key": "06-06-12", "r": 217, "g": 125, "b": 14},
-{"color_key": "06-06-14", "r": 221, "g": 122, "b": 0},
-{"color_key": "06-06-16", "r": 225, "g": 121, "b": 0},
-{"color_key": "06-06-18", "r": 234, "g": 115, "b": 0},
-{"color_key": "06-07-02", "r": 194, "g": 168, "b": 162},
-{"color_key": "06-07-04", "r": 208, "g": 164, "b": 142},
-{"color_key": "06-07-06", "r": 221, "g": 161, "b": 121},
-{"color_key": "06-07-08", "r": 231, "g": 157, "b": 101},
-{"color_key": "06-07-10", "r": 240, "g": 154, "b": 78},
-{"color_key": "06-07-12", "r": 248, "g": 150, "b": 48},
-{"color_key": "06-07-14", "r": 252, "g": 147, "b": 8},
-{"color_key": "06-07-16", "r": 253, "g": 145, "b": 0},
-{"color_key": "06-07-18", "r": 255, "g": 144, "b": 0},
-{"color_key": "06-07-20", "r": 255, "g": 138, "b": 0},
-{"color_key": "06-08-02", "r": 221, "g": 194, "b": 189},
-{"color_key": "06-08-04", "r": 236, "g": 191, "b": 168},
-{"color_key": "06-08-06", "r": 249, "g": 187, "b": 147},
-{"color_key": "06-08-08", "r": 255, "g": 183, "b": 124},
-{"color_key": "06-08-10", "r": 255, "g": 180, "b": 102},
-{"color_key": "06-08-12", "r": 255, "g": 177, "b": 75},
-{"color_key": "06-08-14", "r": 255, "g": 173, "b": 38},
+{"color_key": "06-01-02", "r": 43, "g": 24, "b": 14},
+{"color_key": "06-02-02", "r": 63, "g": 45, "b": 37},
+{"color_key": "06-02-04", "r": 73, "g": 42, "b": 20},
+{"color_key": "06-02-06", "r": 80, "g": 39, "b": 0},
+{"color_key": "06-03-02", "r": 89, "g": 67, "b": 58},
+{"color_key": "06-03-04", "r": 98, "g": 64, "b": 41},
+{"color_key": "06-03-06", "r": 106, "g": 61, "b": 20},
+{"color_key": "06-03-08", "r": 111, "g": 59, "b": 0},
+{"color_key": "06-04-02", "r": 115, "g": 92, "b": 82},
+{"color_key": "06-04-04", "r": 127, "g": 88, "b": 62},
+{"color_key": "06-04-06", "r": 135, "g": 85, "b": 43},
+{"color_key": "06-04-08", "r": 141, "g": 83, "b": 19},
+{"color_key": "06-04-10", "r": 146, "g": 80, "b": 0},
+{"color_key": "06-05-02", "r": 140, "g": 117, "b": 109},
+{"color_key": "06-05-04", "r": 153, "g": 114, "b": 89},
+{"color_key": "06-05-06", "r": 163, "g": 110, "b": 67},
+{"color_key": "06-05-08", "r": 171, "g": 107, "b": 44},
+{"color_key": "06-05-10", "r": 177, "g": 105, "b": 10},
+{"color_key": "06-05-12", "r": 181, "g": 103, "b": 0},
+{"color_key": "06-05-14", "r": 184, "g": 102, "b": 0},
+{"color_key": "06-06-02", "r": 167, "g": 143, "b": 134},
+{"color_key": "06-06-04", "r": 180, "g": 139, "b": 115},
+{"color_key": "06-06-06", "r": 191, "g": 136, "b": 93},
+{"color_key": "06-06-08", "r": 200, "g": 133, "b": 70},
+{"color_key": "06-06-10", "r": 207, "g": 130, "b": 43},
+{"color_key": "06-06-12", "r": 213, "g": 128, "b": 0},
+{"color_key": "06-06-14", "r": 216, "g": 126, "b": 0},
+{"color_key": "06-06-16", "r": 219, "g": 125, "b": 0},
+{"color_key": "06-07-02", "r": 194, "g": 169, "b": 161},
+{"color_key": "06-07-04", "r": 207, "g": 165, "b": 140},
+{"color_key": "06-07-06", "r": 219, "g": 162, "b": 118},
+{"color_key": "06-07-08", "r": 228, "g": 159, "b": 96},
+{"color_key": "06-07-10", "r": 236, "g": 156, "b": 72},
+{"color_key": "06-07-12", "r": 244, "g": 153, "b": 38},
+{"color_key": "06-07-14", "r": 249, "g": 151, "b": 0},
+{"color_key": "06-07-16", "r": 252, "g": 150, "b": 0},
+{"color_key": "06-07-18", "r": 255, "g": 149, "b": 0},
+{"color_key": "06-08-02", "r": 221, "g": 195, "b": 187},
+{"color_key": "06-08-04", "r": 235, "g": 192, "b": 166},
+{"color_key": "06-08-06", "r": 247, "g": 188, "b": 144},
+{"color_key": "06-08-08", "r": 255, "g": 185, "b": 120},
+{"color_key": "06-08-10", "r": 255, "g": 182, "b": 96},
+{"color_key": "06-08-12", "r": 255, "g": 180, "b": 67},
+{"color_key": "06-08-14", "r": 255, "g": 177, "b": 24},
 {"color_key": "06-08-16", "r": 255, "g": 175, "b": 0},
 {"color_key": "06-08-18", "r": 255, "g": 174, "b": 0},
 {"color_key": "06-08-20", "r": 255, "g": 173, "b": 0},
-{"color_key": "06-09-02", "r": 249, "g": 221, "b": 215},
-{"color_key": "06-09-04", "r": 255, "g": 217, "b": 192},
-{"color_key": "06-09-06", "r": 255, "g": 213, "b": 170},
+{"color_key": "06-09-02", "r": 249, "g": 222, "b": 213},
+{"color_key": "06-09-04", "r": 255, "g": 218, "b": 189},
+{"color_key": "06-09-06", "r": 255, "g": 215, "b": 166},
 {"color_key": "06-09-08", "r": 255, "g": 212, "b": 143},
 {"color_key": "07-01-02", "r": 42, "g": 25, "b": 11},
 {"color_key": "07-02-02", "r": 62, "g": 46, "b": 36},
@@ -470,54 +457,52 @@ export const flatColorChips = [
 {"color_key": "07-09-04", "r": 255, "g": 221, "b": 183},
 {"color_key": "07-09-06", "r": 255, "g": 219, "b": 159},
 {"color_key": "07-09-08", "r": 255, "g": 216, "b": 133},
-{"color_key": "08-01-02", "r": 40, "g": 26, "b": 10},
-{"color_key": "08-02-02", "r": 60, "g": 46, "b": 35},
-{"color_key": "08-02-04", "r": 68, "g": 45, "b": 12},
-{"color_key": "08-03-02", "r": 85, "g": 69, "b": 55},
-{"color_key": "08-03-04", "r": 93, "g": 67, "b": 35},
-{"color_key": "08-03-06", "r": 98, "g": 65, "b": 8},
-{"color_key": "08-03-08", "r": 106, "g": 62, "b": 0},
-{"color_key": "08-04-02", "r": 111, "g": 93, "b": 78},
-{"color_key": "08-04-04", "r": 120, "g": 91, "b": 56},
-{"color_key": "08-04-06", "r": 127, "g": 89, "b": 33},
-{"color_key": "08-04-08", "r": 131, "g": 88, "b": 1},
-{"color_key": "08-04-10", "r": 134, "g": 87, "b": 0},
-{"color_key": "08-05-02", "r": 137, "g": 118, "b": 105},
-{"color_key": "08-05-04", "r": 147, "g": 117, "b": 82},
-{"color_key": "08-05-06", "r": 155, "g": 114, "b": 56},
-{"color_key": "08-05-08", "r": 160, "g": 113, "b": 26},
-{"color_key": "08-05-10", "r": 164, "g": 112, "b": 0},
-{"color_key": "08-05-12", "r": 167, "g": 111, "b": 0},
-{"color_key": "08-06-02", "r": 163, "g": 144, "b": 130},
-{"color_key": "08-06-04", "r": 173, "g": 142, "b": 107},
-{"color_key": "08-06-06", "r": 182, "g": 140, "b": 82},
-{"color_key": "08-06-08", "r": 189, "g": 139, "b": 55},
-{"color_key": "08-06-10", "r": 194, "g": 137, "b": 13},
-{"color_key": "08-06-12", "r": 198, "g": 136, "b": 0},
-{"color_key": "08-06-14", "r": 200, "g": 135, "b": 0},
-{"color_key": "08-07-02", "r": 190, "g": 170, "b": 156},
-{"color_key": "08-07-04", "r": 201, "g": 168, "b": 132},
-{"color_key": "08-07-06", "r": 210, "g": 166, "b": 107},
-{"color_key": "08-07-08", "r": 217, "g": 165, "b": 82},
-{"color_key": "08-07-10", "r": 223, "g": 163, "b": 51},
-{"color_key": "08-07-12", "r": 228, "g": 161, "b": 2},
-{"color_key": "08-07-14", "r": 231, "g": 161, "b": 0},
-{"color_key": "08-07-16", "r": 234, "g": 160, "b": 0},
-{"color_key": "08-07-18", "r": 242, "g": 156, "b": 0},
-{"color_key": "08-08-02", "r": 217, "g": 196, "b": 182},
-{"color_key": "08-08-04", "r": 227, "g": 195, "b": 158},
-{"color_key": "08-08-06", "r": 237, "g": 193, "b": 133},
-{"color_key": "08-08-08", "r": 245, "g": 191, "b": 107},
-{"color_key": "08-08-10", "r": 251, "g": 189, "b": 79},
-{"color_key": "08-08-12", "r": 253, "g": 188, "b": 40},
-{"color_key": "08-08-14", "r": 255, "g": 187, "b": 0},
-{"color_key": "08-08-16", "r": 255, "g": 185, "b": 0},
-{"color_key": "08-08-18", "r": 255, "g": 185, "b": 0},
-{"color_key": "08-08-20", "r": 255, "g": 184, "b": 0},
-{"color_key": "08-09-02", "r": 245, "g": 223, "b": 208},
-{"color_key": "08-09-04", "r": 254, "g": 222, "b": 181},
-{"color_key": "08-09-06", "r": 255, "g": 220, "b": 156},
-{"color_key": "08-09-08", "r": 255, "g": 218, "b": 129},
+{"color_key": "08-01-02", "r": 39, "g": 27, "b": 9},
+{"color_key": "08-02-02", "r": 59, "g": 47, "b": 34},
+{"color_key": "08-02-04", "r": 66, "g": 46, "b": 10},
+{"color_key": "08-03-02", "r": 84, "g": 70, "b": 55},
+{"color_key": "08-03-04", "r": 91, "g": 68, "b": 34},
+{"color_key": "08-03-06", "r": 96, "g": 67, "b": 4},
+{"color_key": "08-04-02", "r": 110, "g": 94, "b": 78},
+{"color_key": "08-04-04", "r": 118, "g": 92, "b": 55},
+{"color_key": "08-04-06", "r": 124, "g": 91, "b": 30},
+{"color_key": "08-04-08", "r": 128, "g": 90, "b": 0},
+{"color_key": "08-04-10", "r": 131, "g": 89, "b": 0},
+{"color_key": "08-05-02", "r": 136, "g": 119, "b": 104},
+{"color_key": "08-05-04", "r": 145, "g": 118, "b": 80},
+{"color_key": "08-05-06", "r": 152, "g": 116, "b": 53},
+{"color_key": "08-05-08", "r": 157, "g": 115, "b": 21},
+{"color_key": "08-05-10", "r": 160, "g": 114, "b": 0},
+{"color_key": "08-05-12", "r": 162, "g": 113, "b": 0},
+{"color_key": "08-06-02", "r": 162, "g": 145, "b": 129},
+{"color_key": "08-06-04", "r": 171, "g": 144, "b": 105},
+{"color_key": "08-06-06", "r": 179, "g": 142, "b": 79},
+{"color_key": "08-06-08", "r": 185, "g": 141, "b": 50},
+{"color_key": "08-06-10", "r": 190, "g": 139, "b": 0},
+{"color_key": "08-06-12", "r": 193, "g": 139, "b": 0},
+{"color_key": "08-06-14", "r": 195, "g": 138, "b": 0},
+{"color_key": "08-07-02", "r": 189, "g": 171, "b": 155},
+{"color_key": "08-07-04", "r": 199, "g": 169, "b": 130},
+{"color_key": "08-07-06", "r": 207, "g": 168, "b": 105},
+{"color_key": "08-07-08", "r": 213, "g": 167, "b": 78},
+{"color_key": "08-07-10", "r": 219, "g": 165, "b": 44},
+{"color_key": "08-07-12", "r": 223, "g": 164, "b": 0},
+{"color_key": "08-07-14", "r": 226, "g": 164, "b": 0},
+{"color_key": "08-07-16", "r": 228, "g": 163, "b": 0},
+{"color_key": "08-08-02", "r": 216, "g": 197, "b": 181},
+{"color_key": "08-08-04", "r": 225, "g": 196, "b": 156},
+{"color_key": "08-08-06", "r": 234, "g": 195, "b": 130},
+{"color_key": "08-08-08", "r": 241, "g": 193, "b": 104},
+{"color_key": "08-08-10", "r": 247, "g": 192, "b": 74},
+{"color_key": "08-08-12", "r": 252, "g": 191, "b": 30},
+{"color_key": "08-08-14", "r": 255, "g": 190, "b": 0},
+{"color_key": "08-08-16", "r": 255, "g": 189, "b": 0},
+{"color_key": "08-08-18", "r": 255, "g": 188, "b": 0},
+{"color_key": "08-08-20", "r": 255, "g": 188, "b": 0},
+{"color_key": "08-09-02", "r": 244, "g": 224, "b": 207},
+{"color_key": "08-09-04", "r": 254, "g": 223, "b": 179},
+{"color_key": "08-09-06", "r": 255, "g": 222, "b": 153},
+{"color_key": "08-09-08", "r": 255, "g": 220, "b": 126},
 {"color_key": "08-09-10", "r": 255, "g": 219, "b": 98},
 {"color_key": "08-09-12", "r": 255, "g": 218, "b": 63},
 {"color_key": "09-01-02", "r": 37, "g": 28, "b": 9},
@@ -570,56 +555,55 @@ export const flatColorChips = [
 {"color_key": "09-09-16", "r": 255, "g": 223, "b": 0},
 {"color_key": "09-09-18", "r": 255, "g": 223, "b": 0},
 {"color_key": "09-09-20", "r": 255, "g": 223, "b": 0},
-{"color_key": "10-01-02", "r": 35, "g": 28, "b": 10},
-{"color_key": "10-02-02", "r": 56, "g": 48, "b": 34},
-{"color_key": "10-02-04", "r": 61, "g": 48, "b": 5},
-{"color_key": "10-03-02", "r": 80, "g": 71, "b": 55},
-{"color_key": "10-03-04", "r": 84, "g": 71, "b": 32},
-{"color_key": "10-03-06", "r": 88, "g": 70, "b": 0},
-{"color_key": "10-04-02", "r": 105, "g": 95, "b": 77},
-{"color_key": "10-04-04", "r": 110, "g": 95, "b": 51},
-{"color_key": "10-04-06", "r": 114, "g": 95, "b": 24},
-{"color_key": "10-04-08", "r": 117, "g": 94, "b": 0},
-{"color_key": "10-05-02", "r": 131, "g": 120, "b": 102},
-{"color_key": "10-05-04", "r": 137, "g": 120, "b": 76},
-{"color_key": "10-05-06", "r": 141, "g": 120, "b": 47},
-{"color_key": "10-05-08", "r": 145, "g": 120, "b": 5},
-{"color_key": "10-05-10", "r": 146, "g": 119, "b": 0},
-{"color_key": "10-05-12", "r": 148, "g": 119, "b": 0},
-{"color_key": "10-06-02", "r": 158, "g": 146, "b": 127},
-{"color_key": "10-06-04", "r": 163, "g": 146, "b": 101},
-{"color_key": "10-06-06", "r": 168, "g": 146, "b": 73},
-{"color_key": "10-06-08", "r": 172, "g": 146, "b": 39},
-{"color_key": "10-06-10", "r": 175, "g": 146, "b": 0},
-{"color_key": "10-06-12", "r": 177, "g": 145, "b": 0},
-{"color_key": "10-06-14", "r": 178, "g": 145, "b": 0},
-{"color_key": "10-07-02", "r": 185, "g": 172, "b": 153},
-{"color_key": "10-07-04", "r": 190, "g": 172, "b": 126},
-{"color_key": "10-07-06", "r": 195, "g": 172, "b": 99},
-{"color_key": "10-07-08", "r": 199, "g": 172, "b": 69},
-{"color_key": "10-07-10", "r": 203, "g": 172, "b": 24},
-{"color_key": "10-07-12", "r": 205, "g": 172, "b": 0},
-{"color_key": "10-07-14", "r": 206, "g": 171, "b": 0},
-{"color_key": "10-07-16", "r": 208, "g": 171, "b": 0},
-{"color_key": "10-08-02", "r": 212, "g": 198, "b": 178},
-{"color_key": "10-08-04", "r": 217, "g": 199, "b": 152},
-{"color_key": "10-08-06", "r": 222, "g": 199, "b": 124},
-{"color_key": "10-08-08", "r": 226, "g": 199, "b": 94},
-{"color_key": "10-08-10", "r": 230, "g": 199, "b": 60},
-{"color_key": "10-08-12", "r": 233, "g": 199, "b": 0},
-{"color_key": "10-08-14", "r": 235, "g": 198, "b": 0},
-{"color_key": "10-08-16", "r": 236, "g": 198, "b": 0},
-{"color_key": "10-08-18", "r": 237, "g": 198, "b": 0},
-{"color_key": "10-09-02", "r": 240, "g": 225, "b": 204},
-{"color_key": "10-09-04", "r": 245, "g": 226, "b": 176},
-{"color_key": "10-09-06", "r": 250, "g": 226, "b": 148},
-{"color_key": "10-09-08", "r": 253, "g": 226, "b": 118},
-{"color_key": "10-09-10", "r": 254, "g": 226, "b": 87},
-{"color_key": "10-09-12", "r": 255, "g": 226, "b": 40},
-{"color_key": "10-09-14", "r": 255, "g": 226, "b": 0},
-{"color_key": "10-09-16", "r": 255, "g": 225, "b": 0},
-{"color_key": "10-09-18", "r": 255, "g": 225, "b": 0},
-{"color_key": "10-09-20", "r": 255, "g": 223, "b": 0},
+{"color_key": "10-01-02", "r": 34, "g": 28, "b": 11},
+{"color_key": "10-02-02", "r": 55, "g": 49, "b": 35},
+{"color_key": "10-02-04", "r": 59, "g": 49, "b": 5},
+{"color_key": "10-03-02", "r": 79, "g": 71, "b": 55},
+{"color_key": "10-03-04", "r": 82, "g": 72, "b": 32},
+{"color_key": "10-03-06", "r": 85, "g": 71, "b": 0},
+{"color_key": "10-04-02", "r": 104, "g": 96, "b": 77},
+{"color_key": "10-04-04", "r": 108, "g": 96, "b": 51},
+{"color_key": "10-04-06", "r": 111, "g": 96, "b": 23},
+{"color_key": "10-04-08", "r": 113, "g": 96, "b": 0},
+{"color_key": "10-05-02", "r": 130, "g": 121, "b": 102},
+{"color_key": "10-05-04", "r": 135, "g": 121, "b": 76},
+{"color_key": "10-05-06", "r": 138, "g": 122, "b": 46},
+{"color_key": "10-05-08", "r": 141, "g": 122, "b": 0},
+{"color_key": "10-05-10", "r": 142, "g": 121, "b": 0},
+{"color_key": "10-05-12", "r": 144, "g": 121, "b": 0},
+{"color_key": "10-06-02", "r": 157, "g": 147, "b": 127},
+{"color_key": "10-06-04", "r": 161, "g": 147, "b": 101},
+{"color_key": "10-06-06", "r": 165, "g": 148, "b": 72},
+{"color_key": "10-06-08", "r": 168, "g": 148, "b": 37},
+{"color_key": "10-06-10", "r": 170, "g": 148, "b": 0},
+{"color_key": "10-06-12", "r": 172, "g": 147, "b": 0},
+{"color_key": "10-06-14", "r": 173, "g": 147, "b": 0},
+{"color_key": "10-07-02", "r": 184, "g": 173, "b": 153},
+{"color_key": "10-07-04", "r": 188, "g": 173, "b": 126},
+{"color_key": "10-07-06", "r": 192, "g": 174, "b": 99},
+{"color_key": "10-07-08", "r": 195, "g": 174, "b": 68},
+{"color_key": "10-07-10", "r": 198, "g": 174, "b": 19},
+{"color_key": "10-07-12", "r": 200, "g": 174, "b": 0},
+{"color_key": "10-07-14", "r": 201, "g": 174, "b": 0},
+{"color_key": "10-07-16", "r": 202, "g": 174, "b": 0},
+{"color_key": "10-08-02", "r": 211, "g": 199, "b": 178},
+{"color_key": "10-08-04", "r": 215, "g": 200, "b": 152},
+{"color_key": "10-08-06", "r": 219, "g": 200, "b": 124},
+{"color_key": "10-08-08", "r": 222, "g": 200, "b": 93},
+{"color_key": "10-08-10", "r": 225, "g": 201, "b": 58},
+{"color_key": "10-08-12", "r": 228, "g": 201, "b": 0},
+{"color_key": "10-08-14", "r": 229, "g": 201, "b": 0},
+{"color_key": "10-08-16", "r": 230, "g": 200, "b": 0},
+{"color_key": "10-08-18", "r": 231, "g": 200, "b": 0},
+{"color_key": "10-09-02", "r": 239, "g": 226, "b": 204},
+{"color_key": "10-09-04", "r": 243, "g": 227, "b": 176},
+{"color_key": "10-09-06", "r": 247, "g": 227, "b": 147},
+{"color_key": "10-09-08", "r": 251, "g": 228, "b": 117},
+{"color_key": "10-09-10", "r": 254, "g": 228, "b": 85},
+{"color_key": "10-09-12", "r": 255, "g": 228, "b": 36},
+{"color_key": "10-09-14", "r": 255, "g": 228, "b": 0},
+{"color_key": "10-09-16", "r": 255, "g": 228, "b": 0},
+{"color_key": "10-09-18", "r": 255, "g": 228, "b": 0},
 {"color_key": "11-01-02", "r": 31, "g": 29, "b": 14},
 {"color_key": "11-02-02", "r": 52, "g": 50, "b": 36},
 {"color_key": "11-02-04", "r": 54, "g": 50, "b": 8},
@@ -669,55 +653,55 @@ export const flatColorChips = [
 {"color_key": "11-09-14", "r": 247, "g": 232, "b": 0},
 {"color_key": "11-09-16", "r": 247, "g": 232, "b": 0},
 {"color_key": "11-09-18", "r": 248, "g": 232, "b": 0},
-{"color_key": "12-01-02", "r": 29, "g": 29, "b": 15},
-{"color_key": "12-02-02", "r": 51, "g": 50, "b": 37},
-{"color_key": "12-02-04", "r": 51, "g": 51, "b": 11},
-{"color_key": "12-03-02", "r": 74, "g": 72, "b": 56},
-{"color_key": "12-03-04", "r": 75, "g": 74, "b": 33},
-{"color_key": "12-03-06", "r": 75, "g": 75, "b": 1},
-{"color_key": "12-04-02", "r": 99, "g": 97, "b": 79},
-{"color_key": "12-04-04", "r": 100, "g": 98, "b": 53},
-{"color_key": "12-04-06", "r": 100, "g": 99, "b": 25},
-{"color_key": "12-04-08", "r": 100, "g": 100, "b": 0},
-{"color_key": "12-05-02", "r": 126, "g": 122, "b": 104},
-{"color_key": "12-05-04", "r": 126, "g": 124, "b": 78},
-{"color_key": "12-05-06", "r": 127, "g": 125, "b": 49},
-{"color_key": "12-05-08", "r": 127, "g": 125, "b": 5},
-{"color_key": "12-05-10", "r": 126, "g": 126, "b": 0},
-{"color_key": "12-05-12", "r": 127, "g": 127, "b": 0},
-{"color_key": "12-06-02", "r": 152, "g": 148, "b": 128},
-{"color_key": "12-06-04", "r": 153, "g": 150, "b": 103},
-{"color_key": "12-06-06", "r": 154, "g": 151, "b": 75},
-{"color_key": "12-06-08", "r": 154, "g": 152, "b": 40},
-{"color_key": "12-06-10", "r": 154, "g": 153, "b": 0},
-{"color_key": "12-06-12", "r": 154, "g": 153, "b": 0},
-{"color_key": "12-06-14", "r": 154, "g": 153, "b": 0},
-{"color_key": "12-07-02", "r": 179, "g": 174, "b": 153},
-{"color_key": "12-07-04", "r": 180, "g": 176, "b": 127},
-{"color_key": "12-07-06", "r": 181, "g": 177, "b": 101},
-{"color_key": "12-07-08", "r": 181, "g": 178, "b": 70},
-{"color_key": "12-07-10", "r": 182, "g": 179, "b": 20},
-{"color_key": "12-07-12", "r": 181, "g": 179, "b": 0},
-{"color_key": "12-07-14", "r": 182, "g": 180, "b": 0},
-{"color_key": "12-07-16", "r": 181, "g": 180, "b": 0},
-{"color_key": "12-08-02", "r": 206, "g": 200, "b": 178},
-{"color_key": "12-08-04", "r": 208, "g": 202, "b": 153},
-{"color_key": "12-08-06", "r": 208, "g": 203, "b": 125},
-{"color_key": "12-08-08", "r": 209, "g": 204, "b": 96},
-{"color_key": "12-08-10", "r": 209, "g": 206, "b": 59},
-{"color_key": "12-08-12", "r": 209, "g": 206, "b": 0},
-{"color_key": "12-08-14", "r": 209, "g": 206, "b": 0},
-{"color_key": "12-08-16", "r": 209, "g": 207, "b": 0},
-{"color_key": "12-08-18", "r": 209, "g": 207, "b": 0},
-{"color_key": "12-09-02", "r": 234, "g": 227, "b": 204},
-{"color_key": "12-09-04", "r": 236, "g": 229, "b": 176},
-{"color_key": "12-09-06", "r": 237, "g": 230, "b": 148},
-{"color_key": "12-09-08", "r": 237, "g": 232, "b": 117},
-{"color_key": "12-09-10", "r": 238, "g": 233, "b": 85},
-{"color_key": "12-09-12", "r": 238, "g": 233, "b": 34},
-{"color_key": "12-09-14", "r": 238, "g": 234, "b": 0},
-{"color_key": "12-09-16", "r": 238, "g": 235, "b": 0},
-{"color_key": "12-09-18", "r": 238, "g": 235, "b": 0},
+{"color_key": "12-01-02", "r": 28, "g": 30, "b": 17},
+{"color_key": "12-02-02", "r": 50, "g": 50, "b": 38},
+{"color_key": "12-02-04", "r": 48, "g": 52, "b": 15},
+{"color_key": "12-03-02", "r": 73, "g": 73, "b": 57},
+{"color_key": "12-03-04", "r": 72, "g": 75, "b": 35},
+{"color_key": "12-03-06", "r": 71, "g": 76, "b": 3},
+{"color_key": "12-04-02", "r": 98, "g": 98, "b": 80},
+{"color_key": "12-04-04", "r": 97, "g": 99, "b": 55},
+{"color_key": "12-04-06", "r": 96, "g": 101, "b": 28},
+{"color_key": "12-04-08", "r": 95, "g": 102, "b": 0},
+{"color_key": "12-05-02", "r": 124, "g": 123, "b": 105},
+{"color_key": "12-05-04", "r": 123, "g": 125, "b": 80},
+{"color_key": "12-05-06", "r": 123, "g": 126, "b": 52},
+{"color_key": "12-05-08", "r": 122, "g": 127, "b": 11},
+{"color_key": "12-05-10", "r": 120, "g": 128, "b": 0},
+{"color_key": "12-05-12", "r": 120, "g": 129, "b": 0},
+{"color_key": "12-06-02", "r": 151, "g": 149, "b": 129},
+{"color_key": "12-06-04", "r": 150, "g": 151, "b": 104},
+{"color_key": "12-06-06", "r": 149, "g": 152, "b": 77},
+{"color_key": "12-06-08", "r": 148, "g": 154, "b": 43},
+{"color_key": "12-06-10", "r": 148, "g": 155, "b": 0},
+{"color_key": "12-06-12", "r": 147, "g": 155, "b": 0},
+{"color_key": "12-06-14", "r": 146, "g": 156, "b": 0},
+{"color_key": "12-07-02", "r": 178, "g": 175, "b": 154},
+{"color_key": "12-07-04", "r": 177, "g": 177, "b": 129},
+{"color_key": "12-07-06", "r": 177, "g": 178, "b": 104},
+{"color_key": "12-07-08", "r": 176, "g": 180, "b": 73},
+{"color_key": "12-07-10", "r": 175, "g": 181, "b": 27},
+{"color_key": "12-07-12", "r": 174, "g": 182, "b": 0},
+{"color_key": "12-07-14", "r": 174, "g": 182, "b": 0},
+{"color_key": "12-07-16", "r": 173, "g": 183, "b": 0},
+{"color_key": "12-08-02", "r": 205, "g": 201, "b": 179},
+{"color_key": "12-08-04", "r": 205, "g": 203, "b": 154},
+{"color_key": "12-08-06", "r": 204, "g": 205, "b": 127},
+{"color_key": "12-08-08", "r": 203, "g": 206, "b": 99},
+{"color_key": "12-08-10", "r": 203, "g": 208, "b": 62},
+{"color_key": "12-08-12", "r": 202, "g": 209, "b": 0},
+{"color_key": "12-08-14", "r": 201, "g": 209, "b": 0},
+{"color_key": "12-08-16", "r": 201, "g": 210, "b": 0},
+{"color_key": "12-08-18", "r": 201, "g": 210, "b": 0},
+{"color_key": "12-09-02", "r": 233, "g": 228, "b": 204},
+{"color_key": "12-09-04", "r": 233, "g": 230, "b": 177},
+{"color_key": "12-09-06", "r": 233, "g": 232, "b": 149},
+{"color_key": "12-09-08", "r": 232, "g": 234, "b": 119},
+{"color_key": "12-09-10", "r": 231, "g": 235, "b": 87},
+{"color_key": "12-09-12", "r": 230, "g": 236, "b": 37},
+{"color_key": "12-09-14", "r": 229, "g": 237, "b": 0},
+{"color_key": "12-09-16", "r": 229, "g": 238, "b": 0},
+{"color_key": "12-09-18", "r": 229, "g": 238, "b": 0},
 {"color_key": "13-01-02", "r": 26, "g": 30, "b": 19},
 {"color_key": "13-01-04", "r": 18, "g": 33, "b": 0},
 {"color_key": "13-02-02", "r": 48, "g": 51, "b": 40},
@@ -772,66 +756,66 @@ export const flatColorChips = [
 {"color_key": "13-09-14", "r": 209, "g": 242, "b": 0},
 {"color_key": "13-09-16", "r": 206, "g": 244, "b": 0},
 {"color_key": "13-09-18", "r": 204, "g": 244, "b": 0},
-{"color_key": "14-01-02", "r": 25, "g": 30, "b": 20},
-{"color_key": "14-01-04", "r": 13, "g": 33, "b": 2},
-{"color_key": "14-02-02", "r": 46, "g": 51, "b": 41},
-{"color_key": "14-02-04", "r": 39, "g": 53, "b": 24},
-{"color_key": "14-02-06", "r": 31, "g": 56, "b": 5},
+{"color_key": "14-01-02", "r": 24, "g": 31, "b": 22},
+{"color_key": "14-01-04", "r": 9, "g": 34, "b": 5},
+{"color_key": "14-02-02", "r": 45, "g": 51, "b": 43},
+{"color_key": "14-02-04", "r": 36, "g": 54, "b": 28},
+{"color_key": "14-02-06", "r": 25, "g": 57, "b": 10},
 {"color_key": "14-02-08", "r": 2, "g": 59, "b": 0},
-{"color_key": "14-03-02", "r": 68, "g": 74, "b": 61},
-{"color_key": "14-03-04", "r": 62, "g": 76, "b": 43},
-{"color_key": "14-03-06", "r": 55, "g": 79, "b": 22},
-{"color_key": "14-03-08", "r": 47, "g": 81, "b": 1},
+{"color_key": "14-03-02", "r": 67, "g": 74, "b": 63},
+{"color_key": "14-03-04", "r": 58, "g": 77, "b": 47},
+{"color_key": "14-03-06", "r": 49, "g": 80, "b": 30},
+{"color_key": "14-03-08", "r": 37, "g": 82, "b": 2},
 {"color_key": "14-03-10", "r": 17, "g": 84, "b": 0},
-{"color_key": "14-04-02", "r": 93, "g": 98, "b": 84},
-{"color_key": "14-04-04", "r": 86, "g": 102, "b": 64},
-{"color_key": "14-04-06", "r": 80, "g": 104, "b": 42},
-{"color_key": "14-04-08", "r": 72, "g": 106, "b": 12},
-{"color_key": "14-04-10", "r": 64, "g": 108, "b": 0},
+{"color_key": "14-04-02", "r": 91, "g": 99, "b": 86},
+{"color_key": "14-04-04", "r": 82, "g": 103, "b": 68},
+{"color_key": "14-04-06", "r": 73, "g": 105, "b": 49},
+{"color_key": "14-04-08", "r": 62, "g": 108, "b": 25},
+{"color_key": "14-04-10", "r": 50, "g": 110, "b": 0},
 {"color_key": "14-04-12", "r": 33, "g": 112, "b": 0},
-{"color_key": "14-05-02", "r": 119, "g": 124, "b": 109},
-{"color_key": "14-05-04", "r": 113, "g": 127, "b": 89},
-{"color_key": "14-05-06", "r": 106, "g": 130, "b": 67},
-{"color_key": "14-05-08", "r": 99, "g": 132, "b": 41},
-{"color_key": "14-05-10", "r": 92, "g": 134, "b": 10},
-{"color_key": "14-05-12", "r": 85, "g": 135, "b": 0},
+{"color_key": "14-05-02", "r": 117, "g": 125, "b": 111},
+{"color_key": "14-05-04", "r": 109, "g": 128, "b": 93},
+{"color_key": "14-05-06", "r": 99, "g": 131, "b": 74},
+{"color_key": "14-05-08", "r": 90, "g": 134, "b": 52},
+{"color_key": "14-05-10", "r": 79, "g": 136, "b": 20},
+{"color_key": "14-05-12", "r": 68, "g": 138, "b": 0},
 {"color_key": "14-05-14", "r": 56, "g": 140, "b": 0},
-{"color_key": "14-06-02", "r": 145, "g": 150, "b": 133},
-{"color_key": "14-06-04", "r": 139, "g": 153, "b": 112},
-{"color_key": "14-06-06", "r": 133, "g": 156, "b": 91},
-{"color_key": "14-06-08", "r": 126, "g": 158, "b": 65},
-{"color_key": "14-06-10", "r": 119, "g": 160, "b": 28},
-{"color_key": "14-06-12", "r": 113, "g": 162, "b": 2},
-{"color_key": "14-06-14", "r": 106, "g": 164, "b": 0},
+{"color_key": "14-06-02", "r": 142, "g": 151, "b": 135},
+{"color_key": "14-06-04", "r": 134, "g": 154, "b": 117},
+{"color_key": "14-06-06", "r": 126, "g": 157, "b": 98},
+{"color_key": "14-06-08", "r": 117, "g": 160, "b": 75},
+{"color_key": "14-06-10", "r": 107, "g": 163, "b": 50},
+{"color_key": "14-06-12", "r": 97, "g": 165, "b": 4},
+{"color_key": "14-06-14", "r": 86, "g": 167, "b": 0},
 {"color_key": "14-06-16", "r": 77, "g": 169, "b": 0},
-{"color_key": "14-07-02", "r": 172, "g": 176, "b": 158},
-{"color_key": "14-07-04", "r": 166, "g": 179, "b": 137},
-{"color_key": "14-07-06", "r": 160, "g": 182, "b": 116},
-{"color_key": "14-07-08", "r": 154, "g": 185, "b": 92},
-{"color_key": "14-07-10", "r": 147, "g": 187, "b": 62},
-{"color_key": "14-07-12", "r": 140, "g": 189, "b": 23},
-{"color_key": "14-07-14", "r": 134, "g": 190, "b": 0},
-{"color_key": "14-07-16", "r": 128, "g": 192, "b": 0},
+{"color_key": "14-07-02", "r": 169, "g": 177, "b": 160},
+{"color_key": "14-07-04", "r": 161, "g": 180, "b": 142},
+{"color_key": "14-07-06", "r": 153, "g": 183, "b": 122},
+{"color_key": "14-07-08", "r": 144, "g": 187, "b": 101},
+{"color_key": "14-07-10", "r": 135, "g": 189, "b": 77},
+{"color_key": "14-07-12", "r": 125, "g": 192, "b": 46},
+{"color_key": "14-07-14", "r": 115, "g": 194, "b": 0},
+{"color_key": "14-07-16", "r": 106, "g": 196, "b": 0},
 {"color_key": "14-07-18", "r": 99, "g": 197, "b": 0},
-{"color_key": "14-08-02", "r": 199, "g": 202, "b": 183},
-{"color_key": "14-08-04", "r": 193, "g": 205, "b": 161},
-{"color_key": "14-08-06", "r": 187, "g": 208, "b": 138},
-{"color_key": "14-08-08", "r": 181, "g": 211, "b": 115},
-{"color_key": "14-08-10", "r": 175, "g": 213, "b": 88},
-{"color_key": "14-08-12", "r": 168, "g": 216, "b": 48},
-{"color_key": "14-08-14", "r": 161, "g": 218, "b": 13},
-{"color_key": "14-08-16", "r": 155, "g": 220, "b": 0},
-{"color_key": "14-08-18", "r": 150, "g": 220, "b": 0},
-{"color_key": "14-08-20", "r": 147, "g": 221, "b": 0},
-{"color_key": "14-09-02", "r": 226, "g": 229, "b": 208},
-{"color_key": "14-09-04", "r": 220, "g": 233, "b": 184},
-{"color_key": "14-09-06", "r": 215, "g": 236, "b": 159},
-{"color_key": "14-09-08", "r": 208, "g": 239, "b": 134},
-{"color_key": "14-09-10", "r": 202, "g": 242, "b": 107},
-{"color_key": "14-09-12", "r": 195, "g": 244, "b": 73},
-{"color_key": "14-09-14", "r": 189, "g": 246, "b": 28},
-{"color_key": "14-09-16", "r": 182, "g": 248, "b": 0},
-{"color_key": "14-09-18", "r": 177, "g": 249, "b": 0},
+{"color_key": "14-08-02", "r": 196, "g": 203, "b": 186},
+{"color_key": "14-08-04", "r": 187, "g": 207, "b": 166},
+{"color_key": "14-08-06", "r": 179, "g": 210, "b": 145},
+{"color_key": "14-08-08", "r": 171, "g": 213, "b": 124},
+{"color_key": "14-08-10", "r": 162, "g": 216, "b": 101},
+{"color_key": "14-08-12", "r": 152, "g": 219, "b": 72},
+{"color_key": "14-08-14", "r": 142, "g": 222, "b": 26},
+{"color_key": "14-08-16", "r": 133, "g": 224, "b": 0},
+{"color_key": "14-08-18", "r": 125, "g": 225, "b": 0},
+{"color_key": "14-08-20", "r": 119, "g": 226, "b": 0},
+{"color_key": "14-09-02", "r": 223, "g": 230, "b": 211},
+{"color_key": "14-09-04", "r": 214, "g": 234, "b": 189},
+{"color_key": "14-09-06", "r": 206, "g": 238, "b": 166},
+{"color_key": "14-09-08", "r": 197, "g": 242, "b": 144},
+{"color_key": "14-09-10", "r": 188, "g": 245, "b": 119},
+{"color_key": "14-09-12", "r": 179, "g": 247, "b": 92},
+{"color_key": "14-09-14", "r": 169, "g": 250, "b": 57},
+{"color_key": "14-09-16", "r": 159, "g": 252, "b": 0},
+{"color_key": "14-09-18", "r": 150, "g": 254, "b": 0},
 {"color_key": "15-01-02", "r": 22, "g": 31, "b": 24},
 {"color_key": "15-01-04", "r": 1, "g": 35, "b": 13},
 {"color_key": "15-01-06", "r": 0, "g": 37, "b": 2},
@@ -907,692 +891,600 @@ export const flatColorChips = [
 {"color_key": "15-09-14", "r": 124, "g": 255, "b": 108},
 {"color_key": "15-09-16", "r": 99, "g": 255, "b": 84},
 {"color_key": "15-09-18", "r": 64, "g": 255, "b": 55},
-{"color_key": "16-01-02", "r": 21, "g": 31, "b": 25},
-{"color_key": "16-01-04", "r": 0, "g": 35, "b": 16},
-{"color_key": "16-01-06", "r": 0, "g": 37, "b": 7},
+{"color_key": "16-01-02", "r": 20, "g": 31, "b": 26},
+{"color_key": "16-01-04", "r": 0, "g": 35, "b": 19},
+{"color_key": "16-01-06", "r": 0, "g": 38, "b": 13},
 {"color_key": "16-01-08", "r": 0, "g": 41, "b": 8},
-{"color_key": "16-02-02", "r": 42, "g": 51, "b": 46},
-{"color_key": "16-02-04", "r": 27, "g": 55, "b": 37},
-{"color_key": "16-02-06", "r": 5, "g": 57, "b": 29},
-{"color_key": "16-02-08", "r": 0, "g": 60, "b": 19},
-{"color_key": "16-02-10", "r": 0, "g": 62, "b": 12},
-{"color_key": "16-02-12", "r": 0, "g": 64, "b": 9},
+{"color_key": "16-02-02", "r": 41, "g": 52, "b": 47},
+{"color_key": "16-02-04", "r": 24, "g": 55, "b": 40},
+{"color_key": "16-02-06", "r": 0, "g": 58, "b": 34},
+{"color_key": "16-02-08", "r": 0, "g": 60, "b": 29},
+{"color_key": "16-02-10", "r": 0, "g": 63, "b": 24},
+{"color_key": "16-02-12", "r": 0, "g": 65, "b": 19},
 {"color_key": "16-02-14", "r": 0, "g": 66, "b": 16},
 {"color_key": "16-02-16", "r": 0, "g": 68, "b": 13},
-{"color_key": "16-03-02", "r": 63, "g": 75, "b": 67},
-{"color_key": "16-03-04", "r": 48, "g": 78, "b": 57},
-{"color_key": "16-03-06", "r": 27, "g": 81, "b": 47},
-{"color_key": "16-03-08", "r": 5, "g": 84, "b": 37},
-{"color_key": "16-03-10", "r": 0, "g": 87, "b": 25},
-{"color_key": "16-03-12", "r": 0, "g": 89, "b": 18},
-{"color_key": "16-03-14", "r": 0, "g": 90, "b": 16},
+{"color_key": "16-03-02", "r": 62, "g": 75, "b": 68},
+{"color_key": "16-03-04", "r": 45, "g": 79, "b": 61},
+{"color_key": "16-03-06", "r": 18, "g": 82, "b": 54},
+{"color_key": "16-03-08", "r": 0, "g": 85, "b": 48},
+{"color_key": "16-03-10", "r": 0, "g": 88, "b": 42},
+{"color_key": "16-03-12", "r": 0, "g": 90, "b": 36},
+{"color_key": "16-03-14", "r": 0, "g": 91, "b": 32},
 {"color_key": "16-03-16", "r": 0, "g": 93, "b": 28},
 {"color_key": "16-03-18", "r": 0, "g": 94, "b": 25},
 {"color_key": "16-03-20", "r": 0, "g": 95, "b": 22},
 {"color_key": "16-03-22", "r": 0, "g": 97, "b": 20},
-{"color_key": "16-04-02", "r": 86, "g": 99, "b": 91},
-{"color_key": "16-04-04", "r": 72, "g": 103, "b": 79},
-{"color_key": "16-04-06", "r": 52, "g": 107, "b": 68},
-{"color_key": "16-04-08", "r": 21, "g": 111, "b": 56},
-{"color_key": "16-04-10", "r": 0, "g": 114, "b": 43},
-{"color_key": "16-04-12", "r": 0, "g": 116, "b": 26},
-{"color_key": "16-04-14", "r": 0, "g": 118, "b": 23},
-{"color_key": "16-04-16", "r": 0, "g": 120, "b": 21},
+{"color_key": "16-04-02", "r": 85, "g": 100, "b": 93},
+{"color_key": "16-04-04", "r": 68, "g": 104, "b": 84},
+{"color_key": "16-04-06", "r": 43, "g": 108, "b": 75},
+{"color_key": "16-04-08", "r": 0, "g": 112, "b": 68},
+{"color_key": "16-04-10", "r": 0, "g": 115, "b": 60},
+{"color_key": "16-04-12", "r": 0, "g": 117, "b": 53},
+{"color_key": "16-04-14", "r": 0, "g": 119, "b": 47},
+{"color_key": "16-04-16", "r": 0, "g": 121, "b": 42},
 {"color_key": "16-04-18", "r": 0, "g": 123, "b": 37},
 {"color_key": "16-04-20", "r": 0, "g": 124, "b": 34},
 {"color_key": "16-04-22", "r": 0, "g": 125, "b": 30},
 {"color_key": "16-04-24", "r": 0, "g": 127, "b": 27},
 {"color_key": "16-04-26", "r": 0, "g": 128, "b": 24},
-{"color_key": "16-05-02", "r": 111, "g": 125, "b": 116},
-{"color_key": "16-05-04", "r": 97, "g": 129, "b": 104},
-{"color_key": "16-05-06", "r": 81, "g": 133, "b": 93},
-{"color_key": "16-05-08", "r": 59, "g": 137, "b": 80},
-{"color_key": "16-05-10", "r": 25, "g": 140, "b": 68},
-{"color_key": "16-05-12", "r": 2, "g": 143, "b": 52},
-{"color_key": "16-05-14", "r": 0, "g": 145, "b": 33},
-{"color_key": "16-05-16", "r": 0, "g": 147, "b": 29},
-{"color_key": "16-05-18", "r": 0, "g": 150, "b": 26},
+{"color_key": "16-05-02", "r": 110, "g": 126, "b": 118},
+{"color_key": "16-05-04", "r": 94, "g": 130, "b": 109},
+{"color_key": "16-05-06", "r": 74, "g": 134, "b": 100},
+{"color_key": "16-05-08", "r": 46, "g": 138, "b": 91},
+{"color_key": "16-05-10", "r": 0, "g": 141, "b": 83},
+{"color_key": "16-05-12", "r": 0, "g": 144, "b": 74},
+{"color_key": "16-05-14", "r": 0, "g": 147, "b": 67},
+{"color_key": "16-05-16", "r": 0, "g": 149, "b": 59},
+{"color_key": "16-05-18", "r": 0, "g": 152, "b": 53},
 {"color_key": "16-05-20", "r": 0, "g": 153, "b": 47},
 {"color_key": "16-05-22", "r": 0, "g": 155, "b": 42},
 {"color_key": "16-05-24", "r": 0, "g": 156, "b": 37},
 {"color_key": "16-05-26", "r": 0, "g": 158, "b": 33},
 {"color_key": "16-05-28", "r": 0, "g": 159, "b": 29},
-{"color_key": "16-06-02", "r": 136, "g": 151, "b": 141},
-{"color_key": "16-06-04", "r": 122, "g": 156, "b": 128},
-{"color_key": "16-06-06", "r": 107, "g": 160, "b": 116},
-{"color_key": "16-06-08", "r": 88, "g": 163, "b": 103},
-{"color_key": "16-06-10", "r": 62, "g": 167, "b": 91},
-{"color_key": "16-06-12", "r": 30, "g": 170, "b": 77},
-{"color_key": "16-06-14", "r": 5, "g": 173, "b": 60},
-{"color_key": "16-06-16", "r": 0, "g": 175, "b": 39},
-{"color_key": "16-06-18", "r": 0, "g": 177, "b": 35},
-{"color_key": "16-06-20", "r": 0, "g": 180, "b": 32},
+{"color_key": "16-06-02", "r": 135, "g": 152, "b": 143},
+{"color_key": "16-06-04", "r": 118, "g": 157, "b": 133},
+{"color_key": "16-06-06", "r": 100, "g": 161, "b": 123},
+{"color_key": "16-06-08", "r": 78, "g": 164, "b": 114},
+{"color_key": "16-06-10", "r": 43, "g": 168, "b": 105},
+{"color_key": "16-06-12", "r": 0, "g": 171, "b": 97},
+{"color_key": "16-06-14", "r": 0, "g": 174, "b": 87},
+{"color_key": "16-06-16", "r": 0, "g": 177, "b": 79},
+{"color_key": "16-06-18", "r": 0, "g": 179, "b": 71},
+{"color_key": "16-06-20", "r": 0, "g": 182, "b": 64},
 {"color_key": "16-06-22", "r": 0, "g": 184, "b": 57},
 {"color_key": "16-06-24", "r": 0, "g": 186, "b": 50},
 {"color_key": "16-06-26", "r": 0, "g": 188, "b": 43},
 {"color_key": "16-06-28", "r": 0, "g": 189, "b": 37},
-{"color_key": "16-07-02", "r": 162, "g": 177, "b": 167},
-{"color_key": "16-07-04", "r": 148, "g": 182, "b": 154},
-{"color_key": "16-07-06", "r": 134, "g": 186, "b": 142},
-{"color_key": "16-07-08", "r": 117, "g": 190, "b": 128},
-{"color_key": "16-07-10", "r": 95, "g": 193, "b": 115},
-{"color_key": "16-07-12", "r": 62, "g": 197, "b": 100},
-{"color_key": "16-07-14", "r": 34, "g": 200, "b": 86},
-{"color_key": "16-07-16", "r": 10, "g": 203, "b": 67},
-{"color_key": "16-07-18", "r": 0, "g": 205, "b": 45},
-{"color_key": "16-07-20", "r": 0, "g": 208, "b": 41},
-{"color_key": "16-07-22", "r": 0, "g": 210, "b": 36},
+{"color_key": "16-07-02", "r": 161, "g": 178, "b": 169},
+{"color_key": "16-07-04", "r": 144, "g": 183, "b": 159},
+{"color_key": "16-07-06", "r": 128, "g": 187, "b": 149},
+{"color_key": "16-07-08", "r": 107, "g": 191, "b": 138},
+{"color_key": "16-07-10", "r": 80, "g": 195, "b": 128},
+{"color_key": "16-07-12", "r": 32, "g": 198, "b": 118},
+{"color_key": "16-07-14", "r": 0, "g": 202, "b": 109},
+{"color_key": "16-07-16", "r": 0, "g": 205, "b": 100},
+{"color_key": "16-07-18", "r": 0, "g": 207, "b": 91},
+{"color_key": "16-07-20", "r": 0, "g": 210, "b": 82},
+{"color_key": "16-07-22", "r": 0, "g": 212, "b": 73},
 {"color_key": "16-07-24", "r": 0, "g": 214, "b": 66},
 {"color_key": "16-07-26", "r": 0, "g": 217, "b": 57},
-{"color_key": "16-08-02", "r": 188, "g": 204, "b": 192},
-{"color_key": "16-08-04", "r": 174, "g": 209, "b": 179},
-{"color_key": "16-08-06", "r": 158, "g": 214, "b": 165},
-{"color_key": "16-08-08", "r": 142, "g": 217, "b": 152},
-{"color_key": "16-08-10", "r": 123, "g": 221, "b": 138},
-{"color_key": "16-08-12", "r": 97, "g": 224, "b": 123},
-{"color_key": "16-08-14", "r": 49, "g": 227, "b": 109},
-{"color_key": "16-08-16", "r": 35, "g": 231, "b": 92},
-{"color_key": "16-08-18", "r": 6, "g": 234, "b": 69},
-{"color_key": "16-08-20", "r": 0, "g": 237, "b": 50},
-{"color_key": "16-08-22", "r": 0, "g": 239, "b": 45},
-{"color_key": "16-08-24", "r": 0, "g": 241, "b": 41},
-{"color_key": "16-09-02", "r": 214, "g": 231, "b": 219},
-{"color_key": "16-09-04", "r": 199, "g": 236, "b": 204},
-{"color_key": "16-09-06", "r": 181, "g": 242, "b": 188},
-{"color_key": "16-09-08", "r": 165, "g": 246, "b": 174},
-{"color_key": "16-09-10", "r": 145, "g": 250, "b": 159},
-{"color_key": "16-09-12", "r": 123, "g": 253, "b": 145},
-{"color_key": "16-09-14", "r": 90, "g": 255, "b": 129},
-{"color_key": "16-09-16", "r": 49, "g": 255, "b": 112},
-{"color_key": "16-09-18", "r": 64, "g": 255, "b": 55},
-{"color_key": "17-01-02", "r": 20, "g": 31, "b": 25},
-{"color_key": "17-01-04", "r": 0, "g": 35, "b": 18},
-{"color_key": "17-01-06", "r": 0, "g": 37, "b": 11},
-{"color_key": "17-01-08", "r": 0, "g": 41, "b": 13},
-{"color_key": "17-02-02", "r": 41, "g": 51, "b": 46},
-{"color_key": "17-02-04", "r": 25, "g": 55, "b": 39},
-{"color_key": "17-02-06", "r": 3, "g": 57, "b": 32},
-{"color_key": "17-02-08", "r": 0, "g": 60, "b": 25},
-{"color_key": "17-02-10", "r": 0, "g": 62, "b": 19},
-{"color_key": "17-02-12", "r": 0, "g": 64, "b": 17},
-{"color_key": "17-02-14", "r": 0, "g": 66, "b": 24},
-{"color_key": "17-02-16", "r": 0, "g": 68, "b": 22},
-{"color_key": "17-03-02", "r": 62, "g": 75, "b": 68},
-{"color_key": "17-03-04", "r": 45, "g": 78, "b": 60},
-{"color_key": "17-03-06", "r": 18, "g": 82, "b": 52},
-{"color_key": "17-03-08", "r": 3, "g": 84, "b": 44},
-{"color_key": "17-03-10", "r": 0, "g": 87, "b": 35},
-{"color_key": "17-03-12", "r": 0, "g": 89, "b": 29},
-{"color_key": "17-03-14", "r": 0, "g": 91, "b": 27},
-{"color_key": "17-03-16", "r": 0, "g": 93, "b": 39},
-{"color_key": "17-03-18", "r": 0, "g": 94, "b": 37},
-{"color_key": "17-03-20", "r": 0, "g": 95, "b": 35},
-{"color_key": "17-03-22", "r": 0, "g": 97, "b": 33},
-{"color_key": "17-04-02", "r": 85, "g": 99, "b": 92},
-{"color_key": "17-04-04", "r": 69, "g": 104, "b": 82},
-{"color_key": "17-04-06", "r": 45, "g": 108, "b": 73},
-{"color_key": "17-04-08", "r": 14, "g": 111, "b": 64},
-{"color_key": "17-04-10", "r": 0, "g": 114, "b": 54},
-{"color_key": "17-04-12", "r": 0, "g": 116, "b": 42},
-{"color_key": "17-04-14", "r": 0, "g": 118, "b": 39},
-{"color_key": "17-04-16", "r": 0, "g": 120, "b": 37},
-{"color_key": "17-04-18", "r": 0, "g": 123, "b": 52},
-{"color_key": "17-04-20", "r": 0, "g": 124, "b": 50},
-{"color_key": "17-04-22", "r": 0, "g": 125, "b": 47},
-{"color_key": "17-04-24", "r": 0, "g": 127, "b": 46},
-{"color_key": "17-04-26", "r": 0, "g": 128, "b": 44},
-{"color_key": "17-05-02", "r": 110, "g": 125, "b": 117},
-{"color_key": "17-05-04", "r": 94, "g": 129, "b": 107},
-{"color_key": "17-05-06", "r": 76, "g": 134, "b": 98},
-{"color_key": "17-05-08", "r": 45, "g": 137, "b": 88},
-{"color_key": "17-05-10", "r": 17, "g": 140, "b": 78},
-{"color_key": "17-05-12", "r": 1, "g": 143, "b": 66},
-{"color_key": "17-05-14", "r": 0, "g": 146, "b": 53},
-{"color_key": "17-05-16", "r": 0, "g": 148, "b": 49},
-{"color_key": "17-05-18", "r": 0, "g": 150, "b": 47},
-{"color_key": "17-05-20", "r": 0, "g": 153, "b": 66},
-{"color_key": "17-05-22", "r": 0, "g": 155, "b": 63},
-{"color_key": "17-05-24", "r": 0, "g": 156, "b": 60},
-{"color_key": "17-05-26", "r": 0, "g": 158, "b": 57},
-{"color_key": "17-05-28", "r": 0, "g": 159, "b": 55},
-{"color_key": "17-06-02", "r": 135, "g": 151, "b": 142},
-{"color_key": "17-06-04", "r": 119, "g": 156, "b": 132},
-{"color_key": "17-06-06", "r": 101, "g": 160, "b": 121},
-{"color_key": "17-06-08", "r": 79, "g": 164, "b": 111},
-{"color_key": "17-06-10", "r": 41, "g": 167, "b": 102},
-{"color_key": "17-06-12", "r": 20, "g": 170, "b": 91},
-{"color_key": "17-06-14", "r": 3, "g": 173, "b": 78},
-{"color_key": "17-06-16", "r": 0, "g": 176, "b": 63},
-{"color_key": "17-06-18", "r": 0, "g": 178, "b": 60},
-{"color_key": "17-06-20", "r": 0, "g": 181, "b": 57},
-{"color_key": "17-06-22", "r": 0, "g": 184, "b": 81},
-{"color_key": "17-06-24", "r": 0, "g": 186, "b": 76},
-{"color_key": "17-06-26", "r": 0, "g": 188, "b": 72},
-{"color_key": "17-06-28", "r": 0, "g": 189, "b": 69},
-{"color_key": "17-07-02", "r": 161, "g": 177, "b": 169},
-{"color_key": "17-07-04", "r": 145, "g": 182, "b": 158},
-{"color_key": "17-07-06", "r": 129, "g": 186, "b": 148},
-{"color_key": "17-07-08", "r": 109, "g": 190, "b": 137},
-{"color_key": "17-07-10", "r": 80, "g": 194, "b": 126},
-{"color_key": "17-07-12", "r": 41, "g": 197, "b": 114},
-{"color_key": "17-07-14", "r": 22, "g": 201, "b": 103},
-{"color_key": "17-07-16", "r": 7, "g": 204, "b": 90},
-{"color_key": "17-07-18", "r": 0, "g": 206, "b": 74},
-{"color_key": "17-07-20", "r": 0, "g": 209, "b": 70},
-{"color_key": "17-07-22", "r": 0, "g": 211, "b": 66},
-{"color_key": "17-07-24", "r": 0, "g": 215, "b": 95},
-{"color_key": "17-07-26", "r": 0, "g": 217, "b": 90},
-{"color_key": "17-08-02", "r": 187, "g": 204, "b": 194},
-{"color_key": "17-08-04", "r": 171, "g": 209, "b": 183},
-{"color_key": "17-08-06", "r": 153, "g": 214, "b": 171},
-{"color_key": "17-08-08", "r": 134, "g": 218, "b": 161},
-{"color_key": "17-08-10", "r": 109, "g": 222, "b": 149},
-{"color_key": "17-08-12", "r": 64, "g": 225, "b": 138},
-{"color_key": "17-08-14", "r": 33, "g": 228, "b": 126},
-{"color_key": "17-08-16", "r": 23, "g": 232, "b": 114},
-{"color_key": "17-08-18", "r": 4, "g": 235, "b": 97},
-{"color_key": "17-08-20", "r": 0, "g": 238, "b": 83},
-{"color_key": "17-08-22", "r": 0, "g": 240, "b": 79},
-{"color_key": "17-08-24", "r": 0, "g": 241, "b": 41},
-{"color_key": "17-09-02", "r": 213, "g": 231, "b": 221},
-{"color_key": "17-09-04", "r": 196, "g": 237, "b": 209},
-{"color_key": "17-09-06", "r": 175, "g": 242, "b": 195},
-{"color_key": "17-09-08", "r": 155, "g": 247, "b": 184},
-{"color_key": "17-09-10", "r": 131, "g": 251, "b": 171},
-{"color_key": "17-09-12", "r": 97, "g": 254, "b": 160},
-{"color_key": "17-09-14", "r": 90, "g": 255, "b": 129},
-{"color_key": "17-09-16", "r": 49, "g": 255, "b": 112},
-{"color_key": "17-09-18", "r": 64, "g": 255, "b": 55},
-{"color_key": "18-01-02", "r": 19, "g": 31, "b": 26},
-{"color_key": "18-01-04", "r": 0, "g": 35, "b": 20},
-{"color_key": "18-01-06", "r": 0, "g": 37, "b": 15},
-{"color_key": "18-01-08", "r": 0, "g": 41, "b": 16},
-{"color_key": "18-02-02", "r": 40, "g": 51, "b": 47},
-{"color_key": "18-02-04", "r": 23, "g": 55, "b": 41},
-{"color_key": "18-02-06", "r": 2, "g": 57, "b": 35},
-{"color_key": "18-02-08", "r": 0, "g": 60, "b": 30},
-{"color_key": "18-02-10", "r": 0, "g": 62, "b": 25},
-{"color_key": "18-02-12", "r": 0, "g": 64, "b": 23},
-{"color_key": "18-02-14", "r": 0, "g": 66, "b": 30},
-{"color_key": "18-02-16", "r": 0, "g": 68, "b": 29},
-{"color_key": "18-03-02", "r": 61, "g": 75, "b": 69},
-{"color_key": "18-03-04", "r": 43, "g": 79, "b": 62},
-{"color_key": "18-03-06", "r": 13, "g": 82, "b": 55},
-{"color_key": "18-03-08", "r": 2, "g": 84, "b": 49},
-{"color_key": "18-03-10", "r": 0, "g": 87, "b": 42},
-{"color_key": "18-03-12", "r": 0, "g": 89, "b": 37},
-{"color_key": "18-03-14", "r": 0, "g": 91, "b": 36},
-{"color_key": "18-03-16", "r": 0, "g": 93, "b": 46},
-{"color_key": "18-03-18", "r": 0, "g": 94, "b": 45},
-{"color_key": "18-03-20", "r": 0, "g": 95, "b": 43},
-{"color_key": "18-03-22", "r": 0, "g": 97, "b": 42},
-{"color_key": "18-04-02", "r": 84, "g": 99, "b": 93},
-{"color_key": "18-04-04", "r": 66, "g": 104, "b": 85},
-{"color_key": "18-04-06", "r": 40, "g": 108, "b": 77},
-{"color_key": "18-04-08", "r": 10, "g": 111, "b": 69},
-{"color_key": "18-04-10", "r": 0, "g": 114, "b": 62},
-{"color_key": "18-04-12", "r": 0, "g": 117, "b": 52},
-{"color_key": "18-04-14", "r": 0, "g": 119, "b": 50},
-{"color_key": "18-04-16", "r": 0, "g": 121, "b": 48},
-{"color_key": "18-04-18", "r": 0, "g": 123, "b": 61},
-{"color_key": "18-04-20", "r": 0, "g": 124, "b": 60},
-{"color_key": "18-04-22", "r": 0, "g": 125, "b": 58},
-{"color_key": "18-04-24", "r": 0, "g": 127, "b": 57},
-{"color_key": "18-04-26", "r": 0, "g": 128, "b": 56},
-{"color_key": "18-05-02", "r": 109, "g": 125, "b": 119},
-{"color_key": "18-05-04", "r": 92, "g": 130, "b": 110},
-{"color_key": "18-05-06", "r": 72, "g": 134, "b": 102},
-{"color_key": "18-05-08", "r": 34, "g": 137, "b": 94},
-{"color_key": "18-05-10", "r": 12, "g": 141, "b": 86},
-{"color_key": "18-05-12", "r": 1, "g": 144, "b": 76},
-{"color_key": "18-05-14", "r": 0, "g": 146, "b": 66},
-{"color_key": "18-05-16", "r": 0, "g": 148, "b": 63},
-{"color_key": "18-05-18", "r": 0, "g": 151, "b": 61},
-{"color_key": "18-05-20", "r": 0, "g": 153, "b": 78},
-{"color_key": "18-05-22", "r": 0, "g": 155, "b": 76},
-{"color_key": "18-05-24", "r": 0, "g": 156, "b": 73},
-{"color_key": "18-05-26", "r": 0, "g": 158, "b": 71},
-{"color_key": "18-05-28", "r": 0, "g": 159, "b": 70},
-{"color_key": "18-06-02", "r": 134, "g": 151, "b": 144},
-{"color_key": "18-06-04", "r": 117, "g": 156, "b": 135},
-{"color_key": "18-06-06", "r": 97, "g": 160, "b": 126},
-{"color_key": "18-06-08", "r": 72, "g": 164, "b": 118},
-{"color_key": "18-06-10", "r": 31, "g": 168, "b": 110},
-{"color_key": "18-06-12", "r": 15, "g": 171, "b": 101},
-{"color_key": "18-06-14", "r": 2, "g": 174, "b": 91},
-{"color_key": "18-06-16", "r": 0, "g": 176, "b": 79},
-{"color_key": "18-06-18", "r": 0, "g": 179, "b": 76},
-{"color_key": "18-06-20", "r": 0, "g": 181, "b": 73},
-{"color_key": "18-06-22", "r": 0, "g": 184, "b": 95},
-{"color_key": "18-06-24", "r": 0, "g": 186, "b": 91},
-{"color_key": "18-06-26", "r": 0, "g": 188, "b": 88},
-{"color_key": "18-06-28", "r": 0, "g": 189, "b": 86},
-{"color_key": "18-07-02", "r": 160, "g": 177, "b": 170},
-{"color_key": "18-07-04", "r": 143, "g": 182, "b": 161},
-{"color_key": "18-07-06", "r": 125, "g": 187, "b": 152},
-{"color_key": "18-07-08", "r": 103, "g": 191, "b": 143},
-{"color_key": "18-07-10", "r": 67, "g": 194, "b": 134},
-{"color_key": "18-07-12", "r": 31, "g": 198, "b": 124},
-{"color_key": "18-07-14", "r": 17, "g": 201, "b": 115},
-{"color_key": "18-07-16", "r": 5, "g": 204, "b": 105},
-{"color_key": "18-07-18", "r": 0, "g": 207, "b": 92},
-{"color_key": "18-07-20", "r": 0, "g": 209, "b": 89},
-{"color_key": "18-07-22", "r": 0, "g": 212, "b": 86},
-{"color_key": "18-07-24", "r": 0, "g": 215, "b": 111},
-{"color_key": "18-07-26", "r": 0, "g": 217, "b": 107},
-{"color_key": "18-08-02", "r": 186, "g": 204, "b": 196},
-{"color_key": "18-08-04", "r": 169, "g": 209, "b": 186},
-{"color_key": "18-08-06", "r": 149, "g": 214, "b": 176},
-{"color_key": "18-08-08", "r": 128, "g": 218, "b": 167},
-{"color_key": "18-08-10", "r": 99, "g": 222, "b": 158},
-{"color_key": "18-08-12", "r": 48, "g": 226, "b": 148},
-{"color_key": "18-08-14", "r": 24, "g": 229, "b": 139},
-{"color_key": "18-08-16", "r": 17, "g": 232, "b": 129},
-{"color_key": "18-08-18", "r": 3, "g": 235, "b": 115},
-{"color_key": "18-08-20", "r": 0, "g": 238, "b": 105},
-{"color_key": "18-08-22", "r": 0, "g": 240, "b": 79},
-{"color_key": "18-08-24", "r": 0, "g": 241, "b": 41},
-{"color_key": "18-09-02", "r": 211, "g": 231, "b": 223},
-{"color_key": "18-09-04", "r": 193, "g": 237, "b": 212},
-{"color_key": "18-09-06", "r": 171, "g": 243, "b": 200},
-{"color_key": "18-09-08", "r": 148, "g": 247, "b": 191},
-{"color_key": "18-09-10", "r": 121, "g": 251, "b": 180},
-{"color_key": "18-09-12", "r": 73, "g": 254, "b": 171},
-{"color_key": "18-09-14", "r": 90, "g": 255, "b": 129},
-{"color_key": "18-09-16", "r": 49, "g": 255, "b": 112},
-{"color_key": "18-09-18", "r": 64, "g": 255, "b": 55},
-{"color_key": "19-01-02", "r": 19, "g": 31, "b": 27},
-{"color_key": "19-01-04", "r": 0, "g": 35, "b": 22},
-{"color_key": "19-01-06", "r": 0, "g": 37, "b": 18},
-{"color_key": "19-01-08", "r": 0, "g": 41, "b": 20},
-{"color_key": "19-02-02", "r": 40, "g": 51, "b": 48},
-{"color_key": "19-02-04", "r": 21, "g": 55, "b": 43},
-{"color_key": "19-02-06", "r": 2, "g": 57, "b": 38},
-{"color_key": "19-02-08", "r": 0, "g": 60, "b": 34},
-{"color_key": "19-02-10", "r": 0, "g": 62, "b": 30},
-{"color_key": "19-02-12", "r": 0, "g": 64, "b": 29},
-{"color_key": "19-02-14", "r": 0, "g": 66, "b": 35},
-{"color_key": "19-02-16", "r": 0, "g": 68, "b": 34},
-{"color_key": "19-03-02", "r": 60, "g": 75, "b": 70},
-{"color_key": "19-03-04", "r": 41, "g": 79, "b": 64},
-{"color_key": "19-03-06", "r": 11, "g": 82, "b": 58},
-{"color_key": "19-03-08", "r": 2, "g": 85, "b": 53},
-{"color_key": "19-03-10", "r": 0, "g": 87, "b": 48},
-{"color_key": "19-03-12", "r": 0, "g": 89, "b": 44},
-{"color_key": "19-03-14", "r": 0, "g": 91, "b": 43},
-{"color_key": "19-03-16", "r": 0, "g": 93, "b": 52},
-{"color_key": "19-03-18", "r": 0, "g": 94, "b": 51},
-{"color_key": "19-03-20", "r": 0, "g": 95, "b": 50},
-{"color_key": "19-03-22", "r": 0, "g": 97, "b": 50},
-{"color_key": "19-04-02", "r": 84, "g": 99, "b": 94},
-{"color_key": "19-04-04", "r": 64, "g": 104, "b": 87},
-{"color_key": "19-04-06", "r": 34, "g": 108, "b": 81},
-{"color_key": "19-04-08", "r": 8, "g": 111, "b": 74},
-{"color_key": "19-04-10", "r": 0, "g": 114, "b": 68},
-{"color_key": "19-04-12", "r": 0, "g": 117, "b": 60},
-{"color_key": "19-04-14", "r": 0, "g": 119, "b": 58},
-{"color_key": "19-04-16", "r": 0, "g": 121, "b": 57},
-{"color_key": "19-04-18", "r": 0, "g": 123, "b": 69},
-{"color_key": "19-04-20", "r": 0, "g": 124, "b": 68},
-{"color_key": "19-04-22", "r": 0, "g": 125, "b": 67},
-{"color_key": "19-04-24", "r": 0, "g": 127, "b": 66},
-{"color_key": "19-04-26", "r": 0, "g": 128, "b": 65},
-{"color_key": "19-05-02", "r": 108, "g": 125, "b": 120},
-{"color_key": "19-05-04", "r": 90, "g": 130, "b": 112},
-{"color_key": "19-05-06", "r": 68, "g": 134, "b": 106},
-{"color_key": "19-05-08", "r": 27, "g": 138, "b": 99},
-{"color_key": "19-05-10", "r": 10, "g": 141, "b": 92},
-{"color_key": "19-05-12", "r": 0, "g": 144, "b": 84},
-{"color_key": "19-05-14", "r": 0, "g": 147, "b": 76},
-{"color_key": "19-05-16", "r": 0, "g": 149, "b": 74},
-{"color_key": "19-05-18", "r": 0, "g": 151, "b": 72},
-{"color_key": "19-05-20", "r": 0, "g": 153, "b": 87},
-{"color_key": "19-05-22", "r": 0, "g": 155, "b": 86},
-{"color_key": "19-05-24", "r": 0, "g": 156, "b": 84},
-{"color_key": "19-05-26", "r": 0, "g": 158, "b": 83},
-{"color_key": "19-05-28", "r": 0, "g": 159, "b": 82},
-{"color_key": "19-06-02", "r": 133, "g": 151, "b": 145},
-{"color_key": "19-06-04", "r": 115, "g": 156, "b": 137},
-{"color_key": "19-06-06", "r": 94, "g": 160, "b": 130},
-{"color_key": "19-06-08", "r": 65, "g": 164, "b": 123},
-{"color_key": "19-06-10", "r": 25, "g": 168, "b": 116},
-{"color_key": "19-06-12", "r": 12, "g": 171, "b": 109},
-{"color_key": "19-06-14", "r": 2, "g": 174, "b": 101},
-{"color_key": "19-06-16", "r": 0, "g": 177, "b": 91},
-{"color_key": "19-06-18", "r": 0, "g": 179, "b": 89},
-{"color_key": "19-06-20", "r": 0, "g": 181, "b": 86},
-{"color_key": "19-06-22", "r": 0, "g": 184, "b": 106},
-{"color_key": "19-06-24", "r": 0, "g": 186, "b": 103},
-{"color_key": "19-06-26", "r": 0, "g": 188, "b": 101},
-{"color_key": "19-06-28", "r": 0, "g": 189, "b": 86},
-{"color_key": "19-07-02", "r": 159, "g": 177, "b": 172},
-{"color_key": "19-07-04", "r": 141, "g": 182, "b": 163},
-{"color_key": "19-07-06", "r": 122, "g": 187, "b": 156},
-{"color_key": "19-07-08", "r": 97, "g": 191, "b": 148},
-{"color_key": "19-07-10", "r": 53, "g": 195, "b": 140},
-{"color_key": "19-07-12", "r": 24, "g": 198, "b": 133},
-{"color_key": "19-07-14", "r": 13, "g": 202, "b": 125},
-{"color_key": "19-07-16", "r": 4, "g": 204, "b": 117},
-{"color_key": "19-07-18", "r": 0, "g": 207, "b": 107},
-{"color_key": "19-07-20", "r": 0, "g": 210, "b": 104},
-{"color_key": "19-07-22", "r": 0, "g": 212, "b": 101},
-{"color_key": "19-07-24", "r": 0, "g": 215, "b": 124},
-{"color_key": "19-07-26", "r": 0, "g": 217, "b": 107},
-{"color_key": "19-08-02", "r": 185, "g": 204, "b": 198},
-{"color_key": "19-08-04", "r": 167, "g": 209, "b": 189},
-{"color_key": "19-08-06", "r": 146, "g": 214, "b": 181},
-{"color_key": "19-08-08", "r": 123, "g": 218, "b": 173},
-{"color_key": "19-08-10", "r": 91, "g": 222, "b": 165},
-{"color_key": "19-08-12", "r": 38, "g": 226, "b": 157},
-{"color_key": "19-08-14", "r": 19, "g": 229, "b": 149},
-{"color_key": "19-08-16", "r": 14, "g": 233, "b": 141},
-{"color_key": "19-08-18", "r": 2, "g": 236, "b": 130},
-{"color_key": "19-08-20", "r": 0, "g": 239, "b": 121},
-{"color_key": "19-08-22", "r": 0, "g": 240, "b": 79},
-{"color_key": "19-08-24", "r": 0, "g": 241, "b": 41},
-{"color_key": "19-09-02", "r": 211, "g": 231, "b": 225},
-{"color_key": "19-09-04", "r": 191, "g": 237, "b": 215},
-{"color_key": "19-09-06", "r": 167, "g": 243, "b": 205},
-{"color_key": "19-09-08", "r": 143, "g": 247, "b": 197},
-{"color_key": "19-09-10", "r": 112, "g": 251, "b": 188},
-{"color_key": "19-09-12", "r": 58, "g": 254, "b": 180},
-{"color_key": "19-09-14", "r": 90, "g": 255, "b": 129},
-{"color_key": "19-09-16", "r": 49, "g": 255, "b": 112},
-{"color_key": "19-09-18", "r": 64, "g": 255, "b": 55},
-{"color_key": "20-01-02", "r": 18, "g": 31, "b": 27},
-{"color_key": "20-01-04", "r": 0, "g": 35, "b": 23},
-{"color_key": "20-01-06", "r": 0, "g": 37, "b": 21},
-{"color_key": "20-01-08", "r": 0, "g": 41, "b": 24},
-{"color_key": "20-02-02", "r": 39, "g": 51, "b": 48},
-{"color_key": "20-02-04", "r": 18, "g": 55, "b": 45},
-{"color_key": "20-02-06", "r": 1, "g": 57, "b": 41},
-{"color_key": "20-02-08", "r": 0, "g": 60, "b": 37},
-{"color_key": "20-02-10", "r": 0, "g": 62, "b": 35},
-{"color_key": "20-02-12", "r": 0, "g": 64, "b": 34},
-{"color_key": "20-02-14", "r": 0, "g": 66, "b": 40},
-{"color_key": "20-02-16", "r": 0, "g": 68, "b": 34},
-{"color_key": "20-03-02", "r": 60, "g": 75, "b": 71},
-{"color_key": "20-03-04", "r": 38, "g": 79, "b": 66},
-{"color_key": "20-03-06", "r": 9, "g": 82, "b": 62},
-{"color_key": "20-03-08", "r": 1, "g": 85, "b": 58},
-{"color_key": "20-03-10", "r": 0, "g": 87, "b": 53},
-{"color_key": "20-03-12", "r": 0, "g": 89, "b": 50},
-{"color_key": "20-03-14", "r": 0, "g": 91, "b": 49},
-{"color_key": "20-03-16", "r": 0, "g": 93, "b": 59},
-{"color_key": "20-03-18", "r": 0, "g": 94, "b": 58},
-{"color_key": "20-03-20", "r": 0, "g": 95, "b": 58},
-{"color_key": "20-03-22", "r": 0, "g": 97, "b": 50},
-{"color_key": "20-04-02", "r": 83, "g": 99, "b": 95},
-{"color_key": "20-04-04", "r": 63, "g": 104, "b": 90},
-{"color_key": "20-04-06", "r": 28, "g": 108, "b": 84},
-{"color_key": "20-04-08", "r": 7, "g": 111, "b": 79},
-{"color_key": "20-04-10", "r": 0, "g": 114, "b": 74},
-{"color_key": "20-04-12", "r": 0, "g": 117, "b": 68},
-{"color_key": "20-04-14", "r": 0, "g": 119, "b": 67},
-{"color_key": "20-04-16", "r": 0, "g": 121, "b": 66},
-{"color_key": "20-04-18", "r": 0, "g": 123, "b": 77},
-{"color_key": "20-04-20", "r": 0, "g": 124, "b": 77},
-{"color_key": "20-04-22", "r": 0, "g": 125, "b": 76},
-{"color_key": "20-04-24", "r": 0, "g": 127, "b": 76},
-{"color_key": "20-04-26", "r": 0, "g": 128, "b": 65},
-{"color_key": "20-05-02", "r": 108, "g": 125, "b": 121},
-{"color_key": "20-05-04", "r": 89, "g": 130, "b": 115},
-{"color_key": "20-05-06", "r": 65, "g": 134, "b": 109},
-{"color_key": "20-05-08", "r": 22, "g": 138, "b": 103},
-{"color_key": "20-05-10", "r": 8, "g": 141, "b": 98},
-{"color_key": "20-05-12", "r": 0, "g": 144, "b": 92},
-{"color_key": "20-05-14", "r": 0, "g": 147, "b": 85},
-{"color_key": "20-05-16", "r": 0, "g": 149, "b": 83},
-{"color_key": "20-05-18", "r": 0, "g": 151, "b": 82},
-{"color_key": "20-05-20", "r": 0, "g": 154, "b": 97},
-{"color_key": "20-05-22", "r": 0, "g": 155, "b": 96},
-{"color_key": "20-05-24", "r": 0, "g": 156, "b": 95},
-{"color_key": "20-05-26", "r": 0, "g": 158, "b": 83},
-{"color_key": "20-05-28", "r": 0, "g": 159, "b": 82},
-{"color_key": "20-06-02", "r": 133, "g": 151, "b": 146},
-{"color_key": "20-06-04", "r": 113, "g": 156, "b": 140},
-{"color_key": "20-06-06", "r": 91, "g": 160, "b": 133},
-{"color_key": "20-06-08", "r": 57, "g": 164, "b": 128},
-{"color_key": "20-06-10", "r": 20, "g": 168, "b": 122},
-{"color_key": "20-06-12", "r": 10, "g": 171, "b": 116},
-{"color_key": "20-06-14", "r": 1, "g": 174, "b": 110},
-{"color_key": "20-06-16", "r": 0, "g": 177, "b": 102},
-{"color_key": "20-06-18", "r": 0, "g": 179, "b": 100},
-{"color_key": "20-06-20", "r": 0, "g": 182, "b": 98},
-{"color_key": "20-06-22", "r": 0, "g": 184, "b": 116},
-{"color_key": "20-06-24", "r": 0, "g": 186, "b": 103},
-{"color_key": "20-06-26", "r": 0, "g": 188, "b": 101},
-{"color_key": "20-06-28", "r": 0, "g": 189, "b": 86},
-{"color_key": "20-07-02", "r": 158, "g": 177, "b": 173},
-{"color_key": "20-07-04", "r": 140, "g": 182, "b": 166},
-{"color_key": "20-07-06", "r": 120, "g": 187, "b": 160},
-{"color_key": "20-07-08", "r": 93, "g": 191, "b": 153},
-{"color_key": "20-07-10", "r": 44, "g": 195, "b": 147},
-{"color_key": "20-07-12", "r": 20, "g": 198, "b": 140},
-{"color_key": "20-07-14", "r": 11, "g": 202, "b": 134},
-{"color_key": "20-07-16", "r": 3, "g": 205, "b": 127},
-{"color_key": "20-07-18", "r": 0, "g": 207, "b": 119},
-{"color_key": "20-07-20", "r": 0, "g": 210, "b": 117},
-{"color_key": "20-07-22", "r": 0, "g": 212, "b": 114},
-{"color_key": "20-07-24", "r": 0, "g": 215, "b": 124},
-{"color_key": "20-07-26", "r": 0, "g": 217, "b": 107},
-{"color_key": "20-08-02", "r": 184, "g": 204, "b": 199},
-{"color_key": "20-08-04", "r": 165, "g": 209, "b": 192},
-{"color_key": "20-08-06", "r": 143, "g": 214, "b": 185},
-{"color_key": "20-08-08", "r": 119, "g": 219, "b": 178},
-{"color_key": "20-08-10", "r": 81, "g": 223, "b": 171},
-{"color_key": "20-08-12", "r": 32, "g": 226, "b": 165},
-{"color_key": "20-08-14", "r": 16, "g": 229, "b": 158},
-{"color_key": "20-08-16", "r": 11, "g": 233, "b": 151},
-{"color_key": "20-08-18", "r": 2, "g": 236, "b": 142},
-{"color_key": "20-08-20", "r": 0, "g": 239, "b": 121},
-{"color_key": "20-08-22", "r": 0, "g": 240, "b": 79},
-{"color_key": "20-08-24", "r": 0, "g": 241, "b": 41},
-{"color_key": "20-09-02", "r": 210, "g": 231, "b": 226},
-{"color_key": "20-09-04", "r": 189, "g": 237, "b": 218},
-{"color_key": "20-09-06", "r": 164, "g": 243, "b": 209},
-{"color_key": "20-09-08", "r": 138, "g": 248, "b": 202},
-{"color_key": "20-09-10", "r": 104, "g": 252, "b": 195},
-{"color_key": "20-09-12", "r": 58, "g": 254, "b": 180},
-{"color_key": "20-09-14", "r": 90, "g": 255, "b": 129},
-{"color_key": "20-09-16", "r": 49, "g": 255, "b": 112},
-{"color_key": "20-09-18", "r": 64, "g": 255, "b": 55},
-{"color_key": "21-01-02", "r": 17, "g": 31, "b": 28},
-{"color_key": "21-01-04", "r": 0, "g": 35, "b": 26},
-{"color_key": "21-01-06", "r": 0, "g": 37, "b": 24},
-{"color_key": "21-01-08", "r": 0, "g": 41, "b": 24},
-{"color_key": "21-02-02", "r": 39, "g": 51, "b": 49},
-{"color_key": "21-02-04", "r": 16, "g": 55, "b": 46},
-{"color_key": "21-02-06", "r": 1, "g": 57, "b": 44},
-{"color_key": "21-02-08", "r": 0, "g": 60, "b": 41},
-{"color_key": "21-02-10", "r": 0, "g": 62, "b": 40},
-{"color_key": "21-02-12", "r": 0, "g": 64, "b": 39},
-{"color_key": "21-02-14", "r": 0, "g": 66, "b": 40},
-{"color_key": "21-02-16", "r": 0, "g": 68, "b": 34},
-{"color_key": "21-03-02", "r": 59, "g": 75, "b": 72},
-{"color_key": "21-03-04", "r": 36, "g": 79, "b": 68},
-{"color_key": "21-03-06", "r": 7, "g": 82, "b": 65},
-{"color_key": "21-03-08", "r": 1, "g": 85, "b": 62},
-{"color_key": "21-03-10", "r": 0, "g": 87, "b": 59},
-{"color_key": "21-03-12", "r": 0, "g": 89, "b": 57},
-{"color_key": "21-03-14", "r": 0, "g": 91, "b": 56},
-{"color_key": "21-03-16", "r": 0, "g": 93, "b": 66},
-{"color_key": "21-03-18", "r": 0, "g": 94, "b": 66},
-{"color_key": "21-03-20", "r": 0, "g": 95, "b": 58},
-{"color_key": "21-03-22", "r": 0, "g": 97, "b": 50},
-{"color_key": "21-04-02", "r": 82, "g": 99, "b": 96},
-{"color_key": "21-04-04", "r": 61, "g": 104, "b": 92},
-{"color_key": "21-04-06", "r": 24, "g": 108, "b": 88},
-{"color_key": "21-04-08", "r": 6, "g": 111, "b": 84},
-{"color_key": "21-04-10", "r": 0, "g": 114, "b": 80},
-{"color_key": "21-04-12", "r": 0, "g": 117, "b": 75},
-{"color_key": "21-04-14", "r": 0, "g": 119, "b": 75},
-{"color_key": "21-04-16", "r": 0, "g": 121, "b": 74},
-{"color_key": "21-04-18", "r": 0, "g": 123, "b": 86},
-{"color_key": "21-04-20", "r": 0, "g": 124, "b": 86},
-{"color_key": "21-04-22", "r": 0, "g": 125, "b": 76},
-{"color_key": "21-04-24", "r": 0, "g": 127, "b": 76},
-{"color_key": "21-04-26", "r": 0, "g": 128, "b": 65},
-{"color_key": "21-05-02", "r": 107, "g": 125, "b": 122},
-{"color_key": "21-05-04", "r": 88, "g": 130, "b": 117},
-{"color_key": "21-05-06", "r": 62, "g": 134, "b": 113},
-{"color_key": "21-05-08", "r": 19, "g": 138, "b": 108},
-{"color_key": "21-05-10", "r": 7, "g": 141, "b": 104},
-{"color_key": "21-05-12", "r": 0, "g": 144, "b": 99},
-{"color_key": "21-05-14", "r": 0, "g": 147, "b": 94},
-{"color_key": "21-05-16", "r": 0, "g": 149, "b": 93},
-{"color_key": "21-05-18", "r": 0, "g": 151, "b": 92},
-{"color_key": "21-05-20", "r": 0, "g": 154, "b": 107},
-{"color_key": "21-05-22", "r": 0, "g": 155, "b": 106},
-{"color_key": "21-05-24", "r": 0, "g": 156, "b": 95},
-{"color_key": "21-05-26", "r": 0, "g": 158, "b": 83},
-{"color_key": "21-05-28", "r": 0, "g": 159, "b": 82},
-{"color_key": "21-06-02", "r": 132, "g": 151, "b": 148},
-{"color_key": "21-06-04", "r": 112, "g": 156, "b": 142},
-{"color_key": "21-06-06", "r": 89, "g": 160, "b": 137},
-{"color_key": "21-06-08", "r": 49, "g": 164, "b": 133},
-{"color_key": "21-06-10", "r": 17, "g": 168, "b": 129},
-{"color_key": "21-06-12", "r": 8, "g": 171, "b": 124},
-{"color_key": "21-06-14", "r": 1, "g": 174, "b": 118},
-{"color_key": "21-06-16", "r": 0, "g": 177, "b": 112},
-{"color_key": "21-06-18", "r": 0, "g": 179, "b": 111},
-{"color_key": "21-06-20", "r": 0, "g": 182, "b": 110},
-{"color_key": "21-06-22", "r": 0, "g": 184, "b": 116},
-{"color_key": "21-06-24", "r": 0, "g": 186, "b": 103},
-{"color_key": "21-06-26", "r": 0, "g": 188, "b": 101},
-{"color_key": "21-06-28", "r": 0, "g": 189, "b": 86},
-{"color_key": "21-07-02", "r": 158, "g": 177, "b": 174},
-{"color_key": "21-07-04", "r": 138, "g": 182, "b": 169},
-{"color_key": "21-07-06", "r": 118, "g": 187, "b": 163},
-{"color_key": "21-07-08", "r": 88, "g": 191, "b": 158},
-{"color_key": "21-07-10", "r": 38, "g": 195, "b": 153},
-{"color_key": "21-07-12", "r": 17, "g": 198, "b": 148},
-{"color_key": "21-07-14", "r": 9, "g": 202, "b": 143},
-{"color_key": "21-07-16", "r": 3, "g": 205, "b": 137},
-{"color_key": "21-07-18", "r": 0, "g": 208, "b": 131},
-{"color_key": "21-07-20", "r": 0, "g": 210, "b": 129},
-{"color_key": "21-07-22", "r": 0, "g": 212, "b": 114},
-{"color_key": "21-07-24", "r": 0, "g": 215, "b": 124},
-{"color_key": "21-07-26", "r": 0, "g": 217, "b": 107},
-{"color_key": "21-08-02", "r": 184, "g": 204, "b": 201},
-{"color_key": "21-08-04", "r": 164, "g": 209, "b": 194},
-{"color_key": "21-08-06", "r": 141, "g": 214, "b": 189},
-{"color_key": "21-08-08", "r": 114, "g": 219, "b": 183},
-{"color_key": "21-08-10", "r": 70, "g": 223, "b": 178},
-{"color_key": "21-08-12", "r": 27, "g": 227, "b": 172},
-{"color_key": "21-08-14", "r": 14, "g": 230, "b": 167},
-{"color_key": "21-08-16", "r": 10, "g": 233, "b": 161},
-{"color_key": "21-08-18", "r": 2, "g": 236, "b": 142},
-{"color_key": "21-08-20", "r": 0, "g": 239, "b": 121},
-{"color_key": "21-08-22", "r": 0, "g": 240, "b": 79},
-{"color_key": "21-08-24", "r": 0, "g": 241, "b": 41},
-{"color_key": "21-09-02", "r": 209, "g": 231, "b": 228},
-{"color_key": "21-09-04", "r": 188, "g": 237, "b": 221},
-{"color_key": "21-09-06", "r": 162, "g": 243, "b": 214},
-{"color_key": "21-09-08", "r": 133, "g": 248, "b": 208},
-{"color_key": "21-09-10", "r": 94, "g": 252, "b": 202},
-{"color_key": "21-09-12", "r": 58, "g": 254, "b": 180},
-{"color_key": "21-09-14", "r": 90, "g": 255, "b": 129},
-{"color_key": "21-09-16", "r": 49, "g": 255, "b": 112},
-{"color_key": "21-09-18", "r": 64, "g": 255, "b": 55},
-{"color_key": "22-01-02", "r": 17, "g": 31, "b": 29},
-{"color_key": "22-01-04", "r": 0, "g": 35, "b": 28},
-{"color_key": "22-01-06", "r": 0, "g": 37, "b": 27},
-{"color_key": "22-01-08", "r": 0, "g": 41, "b": 24},
-{"color_key": "22-02-02", "r": 38, "g": 51, "b": 50},
-{"color_key": "22-02-04", "r": 14, "g": 55, "b": 48},
-{"color_key": "22-02-06", "r": 1, "g": 57, "b": 47},
-{"color_key": "22-02-08", "r": 0, "g": 60, "b": 45},
-{"color_key": "22-02-10", "r": 0, "g": 62, "b": 44},
-{"color_key": "22-02-12", "r": 0, "g": 64, "b": 45},
-{"color_key": "22-02-14", "r": 0, "g": 66, "b": 40},
-{"color_key": "22-02-16", "r": 0, "g": 68, "b": 34},
-{"color_key": "22-03-02", "r": 59, "g": 75, "b": 73},
-{"color_key": "22-03-04", "r": 34, "g": 79, "b": 70},
-{"color_key": "22-03-06", "r": 6, "g": 82, "b": 68},
-{"color_key": "22-03-08", "r": 1, "g": 85, "b": 66},
-{"color_key": "22-03-10", "r": 0, "g": 87, "b": 64},
-{"color_key": "22-03-12", "r": 0, "g": 89, "b": 63},
-{"color_key": "22-03-14", "r": 0, "g": 91, "b": 63},
-{"color_key": "22-03-16", "r": 0, "g": 93, "b": 73},
-{"color_key": "22-03-18", "r": 0, "g": 94, "b": 66},
-{"color_key": "22-03-20", "r": 0, "g": 95, "b": 58},
-{"color_key": "22-03-22", "r": 0, "g": 97, "b": 50},
-{"color_key": "22-04-02", "r": 82, "g": 99, "b": 98},
-{"color_key": "22-04-04", "r": 60, "g": 104, "b": 94},
-{"color_key": "22-04-06", "r": 21, "g": 108, "b": 91},
-{"color_key": "22-04-08", "r": 5, "g": 111, "b": 89},
-{"color_key": "22-04-10", "r": 0, "g": 114, "b": 86},
-{"color_key": "22-04-12", "r": 0, "g": 117, "b": 83},
-{"color_key": "22-04-14", "r": 0, "g": 119, "b": 83},
-{"color_key": "22-04-16", "r": 0, "g": 121, "b": 83},
-{"color_key": "22-04-18", "r": 0, "g": 123, "b": 94},
-{"color_key": "22-04-20", "r": 0, "g": 124, "b": 86},
-{"color_key": "22-04-22", "r": 0, "g": 125, "b": 76},
-{"color_key": "22-04-24", "r": 0, "g": 127, "b": 76},
-{"color_key": "22-04-26", "r": 0, "g": 128, "b": 65},
-{"color_key": "22-05-02", "r": 107, "g": 125, "b": 123},
-{"color_key": "22-05-04", "r": 86, "g": 130, "b": 120},
-{"color_key": "22-05-06", "r": 59, "g": 134, "b": 116},
-{"color_key": "22-05-08", "r": 17, "g": 138, "b": 113},
-{"color_key": "22-05-10", "r": 6, "g": 141, "b": 110},
-{"color_key": "22-05-12", "r": 0, "g": 144, "b": 107},
-{"color_key": "22-05-14", "r": 0, "g": 147, "b": 102},
-{"color_key": "22-05-16", "r": 0, "g": 149, "b": 102},
-{"color_key": "22-05-18", "r": 0, "g": 152, "b": 102},
-{"color_key": "22-05-20", "r": 0, "g": 154, "b": 107},
-{"color_key": "22-05-22", "r": 0, "g": 155, "b": 106},
-{"color_key": "22-05-24", "r": 0, "g": 156, "b": 95},
-{"color_key": "22-05-26", "r": 0, "g": 158, "b": 83},
-{"color_key": "22-05-28", "r": 0, "g": 159, "b": 82},
-{"color_key": "22-06-02", "r": 132, "g": 151, "b": 149},
-{"color_key": "22-06-04", "r": 110, "g": 156, "b": 145},
-{"color_key": "22-06-06", "r": 86, "g": 160, "b": 141},
-{"color_key": "22-06-08", "r": 43, "g": 164, "b": 138},
-{"color_key": "22-06-10", "r": 15, "g": 168, "b": 135},
-{"color_key": "22-06-12", "r": 7, "g": 171, "b": 131},
-{"color_key": "22-06-14", "r": 1, "g": 174, "b": 127},
-{"color_key": "22-06-16", "r": 0, "g": 177, "b": 122},
-{"color_key": "22-06-18", "r": 0, "g": 179, "b": 122},
-{"color_key": "22-06-20", "r": 0, "g": 182, "b": 110},
-{"color_key": "22-06-22", "r": 0, "g": 184, "b": 116},
-{"color_key": "22-06-24", "r": 0, "g": 186, "b": 103},
-{"color_key": "22-06-26", "r": 0, "g": 188, "b": 101},
-{"color_key": "22-06-28", "r": 0, "g": 189, "b": 86},
-{"color_key": "22-07-02", "r": 157, "g": 177, "b": 176},
-{"color_key": "22-07-04", "r": 137, "g": 182, "b": 171},
-{"color_key": "22-07-06", "r": 116, "g": 187, "b": 167},
-{"color_key": "22-07-08", "r": 84, "g": 191, "b": 163},
-{"color_key": "22-07-10", "r": 33, "g": 195, "b": 159},
-{"color_key": "22-07-12", "r": 15, "g": 198, "b": 155},
-{"color_key": "22-07-14", "r": 8, "g": 202, "b": 152},
-{"color_key": "22-07-16", "r": 2, "g": 205, "b": 147},
-{"color_key": "22-07-18", "r": 0, "g": 208, "b": 142},
-{"color_key": "22-07-20", "r": 0, "g": 210, "b": 129},
-{"color_key": "22-07-22", "r": 0, "g": 212, "b": 114},
-{"color_key": "22-07-24", "r": 0, "g": 215, "b": 124},
-{"color_key": "22-07-26", "r": 0, "g": 217, "b": 107},
-{"color_key": "22-08-02", "r": 183, "g": 204, "b": 202},
-{"color_key": "22-08-04", "r": 163, "g": 209, "b": 197},
-{"color_key": "22-08-06", "r": 139, "g": 214, "b": 193},
-{"color_key": "22-08-08", "r": 110, "g": 219, "b": 189},
-{"color_key": "22-08-10", "r": 61, "g": 223, "b": 184},
-{"color_key": "22-08-12", "r": 24, "g": 227, "b": 180},
-{"color_key": "22-08-14", "r": 12, "g": 230, "b": 176},
-{"color_key": "22-08-16", "r": 8, "g": 233, "b": 171},
-{"color_key": "22-08-18", "r": 2, "g": 236, "b": 142},
-{"color_key": "22-08-20", "r": 0, "g": 239, "b": 121},
-{"color_key": "22-08-22", "r": 0, "g": 240, "b": 79},
-{"color_key": "22-08-24", "r": 0, "g": 241, "b": 41},
-{"color_key": "22-09-02", "r": 209, "g": 231, "b": 229},
-{"color_key": "22-09-04", "r": 187, "g": 237, "b": 224},
-{"color_key": "22-09-06", "r": 160, "g": 243, "b": 218},
-{"color_key": "22-09-08", "r": 128, "g": 248, "b": 214},
-{"color_key": "22-09-10", "r": 82, "g": 252, "b": 209},
-{"color_key": "22-09-12", "r": 58, "g": 254, "b": 180},
-{"color_key": "22-09-14", "r": 90, "g": 255, "b": 129},
-{"color_key": "22-09-16", "r": 49, "g": 255, "b": 112},
-{"color_key": "22-09-18", "r": 64, "g": 255, "b": 55},
+{"color_key": "16-08-02", "r": 186, "g": 205, "b": 195},
+{"color_key": "16-08-04", "r": 170, "g": 210, "b": 184},
+{"color_key": "16-08-06", "r": 151, "g": 215, "b": 173},
+{"color_key": "16-08-08", "r": 132, "g": 218, "b": 162},
+{"color_key": "16-08-10", "r": 109, "g": 222, "b": 152},
+{"color_key": "16-08-12", "r": 74, "g": 226, "b": 141},
+{"color_key": "16-08-14", "r": 0, "g": 229, "b": 131},
+{"color_key": "16-08-16", "r": 0, "g": 233, "b": 120},
+{"color_key": "16-08-18", "r": 0, "g": 236, "b": 110},
+{"color_key": "16-08-20", "r": 0, "g": 239, "b": 100},
+{"color_key": "16-08-22", "r": 0, "g": 241, "b": 91},
+{"color_key": "16-08-24", "r": 0, "g": 243, "b": 82},
+{"color_key": "16-09-02", "r": 212, "g": 232, "b": 222},
+{"color_key": "16-09-04", "r": 195, "g": 237, "b": 210},
+{"color_key": "16-09-06", "r": 174, "g": 243, "b": 196},
+{"color_key": "16-09-08", "r": 154, "g": 247, "b": 185},
+{"color_key": "16-09-10", "r": 130, "g": 251, "b": 173},
+{"color_key": "16-09-12", "r": 102, "g": 255, "b": 163},
+{"color_key": "16-09-14", "r": 56, "g": 255, "b": 151},
+{"color_key": "16-09-16", "r": 0, "g": 255, "b": 140},
+{"color_key": "17-01-02", "r": 19, "g": 31, "b": 27},
+{"color_key": "17-01-04", "r": 0, "g": 35, "b": 23},
+{"color_key": "17-01-06", "r": 0, "g": 38, "b": 20},
+{"color_key": "17-01-08", "r": 0, "g": 41, "b": 18},
+{"color_key": "17-02-02", "r": 40, "g": 52, "b": 48},
+{"color_key": "17-02-04", "r": 21, "g": 55, "b": 44},
+{"color_key": "17-02-06", "r": 0, "g": 58, "b": 40},
+{"color_key": "17-02-08", "r": 0, "g": 61, "b": 38},
+{"color_key": "17-02-10", "r": 0, "g": 63, "b": 35},
+{"color_key": "17-02-12", "r": 0, "g": 65, "b": 34},
+{"color_key": "17-02-14", "r": 0, "g": 66, "b": 33},
+{"color_key": "17-02-16", "r": 0, "g": 68, "b": 32},
+{"color_key": "17-03-02", "r": 60, "g": 75, "b": 70},
+{"color_key": "17-03-04", "r": 40, "g": 79, "b": 65},
+{"color_key": "17-03-06", "r": 0, "g": 83, "b": 61},
+{"color_key": "17-03-08", "r": 0, "g": 85, "b": 58},
+{"color_key": "17-03-10", "r": 0, "g": 88, "b": 55},
+{"color_key": "17-03-12", "r": 0, "g": 90, "b": 53},
+{"color_key": "17-03-14", "r": 0, "g": 92, "b": 51},
+{"color_key": "17-03-16", "r": 0, "g": 93, "b": 50},
+{"color_key": "17-03-18", "r": 0, "g": 94, "b": 49},
+{"color_key": "17-03-20", "r": 0, "g": 96, "b": 48},
+{"color_key": "17-03-22", "r": 0, "g": 97, "b": 47},
+{"color_key": "17-04-02", "r": 84, "g": 100, "b": 95},
+{"color_key": "17-04-04", "r": 63, "g": 105, "b": 89},
+{"color_key": "17-04-06", "r": 33, "g": 109, "b": 84},
+{"color_key": "17-04-08", "r": 0, "g": 112, "b": 79},
+{"color_key": "17-04-10", "r": 0, "g": 115, "b": 76},
+{"color_key": "17-04-12", "r": 0, "g": 118, "b": 73},
+{"color_key": "17-04-14", "r": 0, "g": 120, "b": 70},
+{"color_key": "17-04-16", "r": 0, "g": 122, "b": 69},
+{"color_key": "17-04-18", "r": 0, "g": 123, "b": 67},
+{"color_key": "17-04-20", "r": 0, "g": 125, "b": 66},
+{"color_key": "17-04-22", "r": 0, "g": 126, "b": 65},
+{"color_key": "17-04-24", "r": 0, "g": 127, "b": 65},
+{"color_key": "17-04-26", "r": 0, "g": 128, "b": 64},
+{"color_key": "17-05-02", "r": 108, "g": 126, "b": 121},
+{"color_key": "17-05-04", "r": 89, "g": 130, "b": 114},
+{"color_key": "17-05-06", "r": 66, "g": 135, "b": 109},
+{"color_key": "17-05-08", "r": 19, "g": 138, "b": 103},
+{"color_key": "17-05-10", "r": 0, "g": 142, "b": 99},
+{"color_key": "17-05-12", "r": 0, "g": 145, "b": 95},
+{"color_key": "17-05-14", "r": 0, "g": 148, "b": 92},
+{"color_key": "17-05-16", "r": 0, "g": 150, "b": 90},
+{"color_key": "17-05-18", "r": 0, "g": 152, "b": 88},
+{"color_key": "17-05-20", "r": 0, "g": 154, "b": 86},
+{"color_key": "17-05-22", "r": 0, "g": 155, "b": 85},
+{"color_key": "17-05-24", "r": 0, "g": 157, "b": 83},
+{"color_key": "17-05-26", "r": 0, "g": 158, "b": 82},
+{"color_key": "17-05-28", "r": 0, "g": 160, "b": 82},
+{"color_key": "17-06-02", "r": 133, "g": 152, "b": 146},
+{"color_key": "17-06-04", "r": 113, "g": 157, "b": 139},
+{"color_key": "17-06-06", "r": 91, "g": 161, "b": 133},
+{"color_key": "17-06-08", "r": 62, "g": 165, "b": 128},
+{"color_key": "17-06-10", "r": 0, "g": 169, "b": 124},
+{"color_key": "17-06-12", "r": 0, "g": 172, "b": 119},
+{"color_key": "17-06-14", "r": 0, "g": 175, "b": 115},
+{"color_key": "17-06-16", "r": 0, "g": 178, "b": 112},
+{"color_key": "17-06-18", "r": 0, "g": 180, "b": 110},
+{"color_key": "17-06-20", "r": 0, "g": 183, "b": 107},
+{"color_key": "17-06-22", "r": 0, "g": 185, "b": 105},
+{"color_key": "17-06-24", "r": 0, "g": 187, "b": 103},
+{"color_key": "17-06-26", "r": 0, "g": 188, "b": 102},
+{"color_key": "17-06-28", "r": 0, "g": 190, "b": 101},
+{"color_key": "17-07-02", "r": 158, "g": 178, "b": 173},
+{"color_key": "17-07-04", "r": 139, "g": 183, "b": 166},
+{"color_key": "17-07-06", "r": 119, "g": 188, "b": 160},
+{"color_key": "17-07-08", "r": 93, "g": 192, "b": 154},
+{"color_key": "17-07-10", "r": 51, "g": 196, "b": 148},
+{"color_key": "17-07-12", "r": 0, "g": 199, "b": 143},
+{"color_key": "17-07-14", "r": 0, "g": 203, "b": 138},
+{"color_key": "17-07-16", "r": 0, "g": 206, "b": 135},
+{"color_key": "17-07-18", "r": 0, "g": 209, "b": 132},
+{"color_key": "17-07-20", "r": 0, "g": 211, "b": 129},
+{"color_key": "17-07-22", "r": 0, "g": 214, "b": 126},
+{"color_key": "17-07-24", "r": 0, "g": 216, "b": 124},
+{"color_key": "17-07-26", "r": 0, "g": 217, "b": 123},
+{"color_key": "17-08-02", "r": 184, "g": 205, "b": 199},
+{"color_key": "17-08-04", "r": 165, "g": 210, "b": 192},
+{"color_key": "17-08-06", "r": 142, "g": 215, "b": 184},
+{"color_key": "17-08-08", "r": 117, "g": 220, "b": 178},
+{"color_key": "17-08-10", "r": 83, "g": 224, "b": 172},
+{"color_key": "17-08-12", "r": 0, "g": 228, "b": 167},
+{"color_key": "17-08-14", "r": 0, "g": 231, "b": 162},
+{"color_key": "17-08-16", "r": 0, "g": 234, "b": 158},
+{"color_key": "17-08-18", "r": 0, "g": 237, "b": 154},
+{"color_key": "17-08-20", "r": 0, "g": 240, "b": 151},
+{"color_key": "17-08-22", "r": 0, "g": 243, "b": 148},
+{"color_key": "17-09-02", "r": 210, "g": 232, "b": 226},
+{"color_key": "17-09-04", "r": 189, "g": 238, "b": 218},
+{"color_key": "17-09-06", "r": 163, "g": 244, "b": 209},
+{"color_key": "17-09-08", "r": 137, "g": 249, "b": 203},
+{"color_key": "17-09-10", "r": 105, "g": 253, "b": 197},
+{"color_key": "17-09-12", "r": 46, "g": 255, "b": 191},
+{"color_key": "18-01-02", "r": 18, "g": 31, "b": 28},
+{"color_key": "18-01-04", "r": 0, "g": 35, "b": 26},
+{"color_key": "18-01-06", "r": 0, "g": 38, "b": 25},
+{"color_key": "18-01-08", "r": 0, "g": 41, "b": 24},
+{"color_key": "18-02-02", "r": 39, "g": 52, "b": 49},
+{"color_key": "18-02-04", "r": 17, "g": 56, "b": 47},
+{"color_key": "18-02-06", "r": 0, "g": 58, "b": 45},
+{"color_key": "18-02-08", "r": 0, "g": 61, "b": 44},
+{"color_key": "18-02-10", "r": 0, "g": 63, "b": 43},
+{"color_key": "18-02-12", "r": 0, "g": 65, "b": 42},
+{"color_key": "18-02-14", "r": 0, "g": 67, "b": 42},
+{"color_key": "18-02-16", "r": 0, "g": 68, "b": 42},
+{"color_key": "18-03-02", "r": 59, "g": 75, "b": 72},
+{"color_key": "18-03-04", "r": 36, "g": 80, "b": 69},
+{"color_key": "18-03-06", "r": 0, "g": 83, "b": 66},
+{"color_key": "18-03-08", "r": 0, "g": 85, "b": 65},
+{"color_key": "18-03-10", "r": 0, "g": 88, "b": 63},
+{"color_key": "18-03-12", "r": 0, "g": 90, "b": 62},
+{"color_key": "18-03-14", "r": 0, "g": 92, "b": 62},
+{"color_key": "18-03-16", "r": 0, "g": 93, "b": 61},
+{"color_key": "18-03-18", "r": 0, "g": 95, "b": 61},
+{"color_key": "18-03-20", "r": 0, "g": 96, "b": 60},
+{"color_key": "18-03-22", "r": 0, "g": 97, "b": 60},
+{"color_key": "18-04-02", "r": 82, "g": 100, "b": 97},
+{"color_key": "18-04-04", "r": 60, "g": 105, "b": 93},
+{"color_key": "18-04-06", "r": 23, "g": 109, "b": 90},
+{"color_key": "18-04-08", "r": 0, "g": 112, "b": 87},
+{"color_key": "18-04-10", "r": 0, "g": 115, "b": 85},
+{"color_key": "18-04-12", "r": 0, "g": 118, "b": 84},
+{"color_key": "18-04-14", "r": 0, "g": 120, "b": 83},
+{"color_key": "18-04-16", "r": 0, "g": 122, "b": 82},
+{"color_key": "18-04-18", "r": 0, "g": 124, "b": 81},
+{"color_key": "18-04-20", "r": 0, "g": 125, "b": 81},
+{"color_key": "18-04-22", "r": 0, "g": 126, "b": 80},
+{"color_key": "18-04-24", "r": 0, "g": 127, "b": 80},
+{"color_key": "18-04-26", "r": 0, "g": 128, "b": 80},
+{"color_key": "18-05-02", "r": 107, "g": 126, "b": 123},
+{"color_key": "18-05-04", "r": 86, "g": 131, "b": 118},
+{"color_key": "18-05-06", "r": 60, "g": 135, "b": 115},
+{"color_key": "18-05-08", "r": 0, "g": 139, "b": 112},
+{"color_key": "18-05-10", "r": 0, "g": 142, "b": 109},
+{"color_key": "18-05-12", "r": 0, "g": 145, "b": 107},
+{"color_key": "18-05-14", "r": 0, "g": 148, "b": 105},
+{"color_key": "18-05-16", "r": 0, "g": 150, "b": 104},
+{"color_key": "18-05-18", "r": 0, "g": 152, "b": 103},
+{"color_key": "18-05-20", "r": 0, "g": 154, "b": 102},
+{"color_key": "18-05-22", "r": 0, "g": 156, "b": 101},
+{"color_key": "18-05-24", "r": 0, "g": 157, "b": 101},
+{"color_key": "18-05-26", "r": 0, "g": 158, "b": 100},
+{"color_key": "18-05-28", "r": 0, "g": 160, "b": 100},
+{"color_key": "18-06-02", "r": 132, "g": 152, "b": 149},
+{"color_key": "18-06-04", "r": 110, "g": 157, "b": 144},
+{"color_key": "18-06-06", "r": 86, "g": 161, "b": 140},
+{"color_key": "18-06-08", "r": 51, "g": 165, "b": 137},
+{"color_key": "18-06-10", "r": 0, "g": 169, "b": 134},
+{"color_key": "18-06-12", "r": 0, "g": 172, "b": 131},
+{"color_key": "18-06-14", "r": 0, "g": 175, "b": 129},
+{"color_key": "18-06-16", "r": 0, "g": 178, "b": 127},
+{"color_key": "18-06-18", "r": 0, "g": 181, "b": 125},
+{"color_key": "18-06-20", "r": 0, "g": 183, "b": 124},
+{"color_key": "18-06-22", "r": 0, "g": 185, "b": 123},
+{"color_key": "18-06-24", "r": 0, "g": 187, "b": 122},
+{"color_key": "18-06-26", "r": 0, "g": 188, "b": 121},
+{"color_key": "18-06-28", "r": 0, "g": 190, "b": 120},
+{"color_key": "18-07-02", "r": 157, "g": 178, "b": 175},
+{"color_key": "18-07-04", "r": 137, "g": 183, "b": 170},
+{"color_key": "18-07-06", "r": 115, "g": 188, "b": 166},
+{"color_key": "18-07-08", "r": 85, "g": 192, "b": 162},
+{"color_key": "18-07-10", "r": 26, "g": 196, "b": 158},
+{"color_key": "18-07-12", "r": 0, "g": 200, "b": 155},
+{"color_key": "18-07-14", "r": 0, "g": 203, "b": 152},
+{"color_key": "18-07-16", "r": 0, "g": 206, "b": 150},
+{"color_key": "18-07-18", "r": 0, "g": 209, "b": 148},
+{"color_key": "18-07-20", "r": 0, "g": 212, "b": 146},
+{"color_key": "18-07-22", "r": 0, "g": 214, "b": 145},
+{"color_key": "18-07-24", "r": 0, "g": 216, "b": 144},
+{"color_key": "18-07-26", "r": 0, "g": 217, "b": 143},
+{"color_key": "18-08-02", "r": 183, "g": 205, "b": 202},
+{"color_key": "18-08-04", "r": 162, "g": 210, "b": 197},
+{"color_key": "18-08-06", "r": 137, "g": 215, "b": 192},
+{"color_key": "18-08-08", "r": 110, "g": 220, "b": 188},
+{"color_key": "18-08-10", "r": 70, "g": 224, "b": 183},
+{"color_key": "18-08-12", "r": 0, "g": 228, "b": 180},
+{"color_key": "18-08-14", "r": 0, "g": 231, "b": 177},
+{"color_key": "18-08-16", "r": 0, "g": 235, "b": 174},
+{"color_key": "18-08-18", "r": 0, "g": 238, "b": 171},
+{"color_key": "18-08-20", "r": 0, "g": 240, "b": 169},
+{"color_key": "18-09-02", "r": 208, "g": 232, "b": 229},
+{"color_key": "18-09-04", "r": 186, "g": 238, "b": 223},
+{"color_key": "18-09-06", "r": 158, "g": 244, "b": 217},
+{"color_key": "18-09-08", "r": 128, "g": 249, "b": 212},
+{"color_key": "18-09-10", "r": 92, "g": 253, "b": 208},
+{"color_key": "18-09-12", "r": 0, "g": 255, "b": 204},
+{"color_key": "19-01-02", "r": 17, "g": 31, "b": 30},
+{"color_key": "19-01-04", "r": 0, "g": 35, "b": 29},
+{"color_key": "19-01-06", "r": 0, "g": 38, "b": 30},
+{"color_key": "19-01-08", "r": 0, "g": 41, "b": 31},
+{"color_key": "19-02-02", "r": 38, "g": 52, "b": 51},
+{"color_key": "19-02-04", "r": 13, "g": 56, "b": 50},
+{"color_key": "19-02-06", "r": 0, "g": 58, "b": 49},
+{"color_key": "19-02-08", "r": 0, "g": 61, "b": 49},
+{"color_key": "19-02-10", "r": 0, "g": 63, "b": 50},
+{"color_key": "19-02-12", "r": 0, "g": 65, "b": 50},
+{"color_key": "19-02-14", "r": 0, "g": 67, "b": 51},
+{"color_key": "19-02-16", "r": 0, "g": 68, "b": 52},
+{"color_key": "19-03-02", "r": 58, "g": 75, "b": 74},
+{"color_key": "19-03-04", "r": 32, "g": 80, "b": 72},
+{"color_key": "19-03-06", "r": 0, "g": 83, "b": 72},
+{"color_key": "19-03-08", "r": 0, "g": 86, "b": 71},
+{"color_key": "19-03-10", "r": 0, "g": 88, "b": 71},
+{"color_key": "19-03-12", "r": 0, "g": 90, "b": 71},
+{"color_key": "19-03-14", "r": 0, "g": 92, "b": 71},
+{"color_key": "19-03-16", "r": 0, "g": 94, "b": 72},
+{"color_key": "19-03-18", "r": 0, "g": 95, "b": 72},
+{"color_key": "19-03-20", "r": 0, "g": 96, "b": 73},
+{"color_key": "19-03-22", "r": 0, "g": 97, "b": 73},
+{"color_key": "19-04-02", "r": 81, "g": 100, "b": 99},
+{"color_key": "19-04-04", "r": 57, "g": 105, "b": 97},
+{"color_key": "19-04-06", "r": 10, "g": 109, "b": 96},
+{"color_key": "19-04-08", "r": 0, "g": 112, "b": 95},
+{"color_key": "19-04-10", "r": 0, "g": 115, "b": 94},
+{"color_key": "19-04-12", "r": 0, "g": 118, "b": 94},
+{"color_key": "19-04-14", "r": 0, "g": 120, "b": 94},
+{"color_key": "19-04-16", "r": 0, "g": 122, "b": 94},
+{"color_key": "19-04-18", "r": 0, "g": 124, "b": 94},
+{"color_key": "19-04-20", "r": 0, "g": 125, "b": 94},
+{"color_key": "19-04-22", "r": 0, "g": 126, "b": 95},
+{"color_key": "19-04-24", "r": 0, "g": 127, "b": 95},
+{"color_key": "19-04-26", "r": 0, "g": 128, "b": 95},
+{"color_key": "19-05-02", "r": 106, "g": 126, "b": 125},
+{"color_key": "19-05-04", "r": 84, "g": 131, "b": 123},
+{"color_key": "19-05-06", "r": 55, "g": 135, "b": 121},
+{"color_key": "19-05-08", "r": 0, "g": 139, "b": 119},
+{"color_key": "19-05-10", "r": 0, "g": 142, "b": 118},
+{"color_key": "19-05-12", "r": 0, "g": 146, "b": 117},
+{"color_key": "19-05-14", "r": 0, "g": 148, "b": 117},
+{"color_key": "19-05-16", "r": 0, "g": 150, "b": 117},
+{"color_key": "19-05-18", "r": 0, "g": 153, "b": 117},
+{"color_key": "19-05-20", "r": 0, "g": 154, "b": 116},
+{"color_key": "19-05-22", "r": 0, "g": 156, "b": 117},
+{"color_key": "19-05-24", "r": 0, "g": 157, "b": 117},
+{"color_key": "19-05-26", "r": 0, "g": 158, "b": 117},
+{"color_key": "19-05-28", "r": 0, "g": 159, "b": 117},
+{"color_key": "19-06-02", "r": 131, "g": 152, "b": 151},
+{"color_key": "19-06-04", "r": 107, "g": 157, "b": 148},
+{"color_key": "19-06-06", "r": 82, "g": 161, "b": 146},
+{"color_key": "19-06-08", "r": 38, "g": 165, "b": 145},
+{"color_key": "19-06-10", "r": 0, "g": 169, "b": 143},
+{"color_key": "19-06-12", "r": 0, "g": 173, "b": 142},
+{"color_key": "19-06-14", "r": 0, "g": 175, "b": 141},
+{"color_key": "19-06-16", "r": 0, "g": 178, "b": 140},
+{"color_key": "19-06-18", "r": 0, "g": 181, "b": 140},
+{"color_key": "19-06-20", "r": 0, "g": 183, "b": 139},
+{"color_key": "19-06-22", "r": 0, "g": 185, "b": 139},
+{"color_key": "19-06-24", "r": 0, "g": 187, "b": 139},
+{"color_key": "19-06-26", "r": 0, "g": 188, "b": 139},
+{"color_key": "19-07-02", "r": 156, "g": 178, "b": 178},
+{"color_key": "19-07-04", "r": 135, "g": 183, "b": 175},
+{"color_key": "19-07-06", "r": 110, "g": 188, "b": 172},
+{"color_key": "19-07-08", "r": 77, "g": 192, "b": 170},
+{"color_key": "19-07-10", "r": 0, "g": 196, "b": 168},
+{"color_key": "19-07-12", "r": 0, "g": 200, "b": 167},
+{"color_key": "19-07-14", "r": 0, "g": 203, "b": 166},
+{"color_key": "19-07-16", "r": 0, "g": 206, "b": 165},
+{"color_key": "19-07-18", "r": 0, "g": 209, "b": 164},
+{"color_key": "19-07-20", "r": 0, "g": 212, "b": 163},
+{"color_key": "19-07-22", "r": 0, "g": 214, "b": 162},
+{"color_key": "19-07-24", "r": 0, "g": 216, "b": 162},
+{"color_key": "19-08-02", "r": 182, "g": 205, "b": 205},
+{"color_key": "19-08-04", "r": 160, "g": 210, "b": 201},
+{"color_key": "19-08-06", "r": 134, "g": 215, "b": 199},
+{"color_key": "19-08-08", "r": 104, "g": 220, "b": 196},
+{"color_key": "19-08-10", "r": 56, "g": 224, "b": 194},
+{"color_key": "19-08-12", "r": 0, "g": 228, "b": 192},
+{"color_key": "19-08-14", "r": 0, "g": 231, "b": 191},
+{"color_key": "19-08-16", "r": 0, "g": 235, "b": 189},
+{"color_key": "19-08-18", "r": 0, "g": 238, "b": 188},
+{"color_key": "19-08-20", "r": 0, "g": 241, "b": 187},
+{"color_key": "19-09-02", "r": 208, "g": 232, "b": 232},
+{"color_key": "19-09-04", "r": 183, "g": 238, "b": 228},
+{"color_key": "19-09-06", "r": 154, "g": 244, "b": 225},
+{"color_key": "19-09-08", "r": 120, "g": 249, "b": 222},
+{"color_key": "19-09-10", "r": 77, "g": 253, "b": 220},
+{"color_key": "19-09-12", "r": 0, "g": 255, "b": 218},
+{"color_key": "20-01-02", "r": 15, "g": 32, "b": 31},
+{"color_key": "20-01-04", "r": 0, "g": 35, "b": 33},
+{"color_key": "20-01-06", "r": 0, "g": 38, "b": 36},
+{"color_key": "20-01-08", "r": 0, "g": 41, "b": 39},
+{"color_key": "20-02-02", "r": 37, "g": 52, "b": 52},
+{"color_key": "20-02-04", "r": 8, "g": 56, "b": 54},
+{"color_key": "20-02-06", "r": 0, "g": 58, "b": 55},
+{"color_key": "20-02-08", "r": 0, "g": 61, "b": 57},
+{"color_key": "20-02-10", "r": 0, "g": 63, "b": 58},
+{"color_key": "20-02-12", "r": 0, "g": 65, "b": 60},
+{"color_key": "20-02-14", "r": 0, "g": 67, "b": 61},
+{"color_key": "20-03-02", "r": 57, "g": 75, "b": 76},
+{"color_key": "20-03-04", "r": 28, "g": 80, "b": 77},
+{"color_key": "20-03-06", "r": 0, "g": 83, "b": 78},
+{"color_key": "20-03-08", "r": 0, "g": 86, "b": 79},
+{"color_key": "20-03-10", "r": 0, "g": 88, "b": 81},
+{"color_key": "20-03-12", "r": 0, "g": 90, "b": 82},
+{"color_key": "20-03-14", "r": 0, "g": 92, "b": 83},
+{"color_key": "20-03-16", "r": 0, "g": 94, "b": 85},
+{"color_key": "20-03-18", "r": 0, "g": 95, "b": 86},
+{"color_key": "20-03-20", "r": 0, "g": 96, "b": 87},
+{"color_key": "20-04-02", "r": 80, "g": 100, "b": 101},
+{"color_key": "20-04-04", "r": 54, "g": 105, "b": 102},
+{"color_key": "20-04-06", "r": 0, "g": 109, "b": 102},
+{"color_key": "20-04-08", "r": 0, "g": 112, "b": 103},
+{"color_key": "20-04-10", "r": 0, "g": 115, "b": 105},
+{"color_key": "20-04-12", "r": 0, "g": 118, "b": 106},
+{"color_key": "20-04-14", "r": 0, "g": 120, "b": 108},
+{"color_key": "20-04-16", "r": 0, "g": 122, "b": 109},
+{"color_key": "20-04-18", "r": 0, "g": 124, "b": 110},
+{"color_key": "20-04-20", "r": 0, "g": 125, "b": 111},
+{"color_key": "20-04-22", "r": 0, "g": 126, "b": 112},
+{"color_key": "20-04-24", "r": 0, "g": 127, "b": 113},
+{"color_key": "20-05-02", "r": 105, "g": 126, "b": 127},
+{"color_key": "20-05-04", "r": 82, "g": 131, "b": 127},
+{"color_key": "20-05-06", "r": 51, "g": 135, "b": 127},
+{"color_key": "20-05-08", "r": 0, "g": 139, "b": 128},
+{"color_key": "20-05-10", "r": 0, "g": 142, "b": 129},
+{"color_key": "20-05-12", "r": 0, "g": 146, "b": 130},
+{"color_key": "20-05-14", "r": 0, "g": 148, "b": 131},
+{"color_key": "20-05-16", "r": 0, "g": 150, "b": 133},
+{"color_key": "20-05-18", "r": 0, "g": 153, "b": 134},
+{"color_key": "20-05-20", "r": 0, "g": 155, "b": 135},
+{"color_key": "20-05-22", "r": 0, "g": 156, "b": 136},
+{"color_key": "20-05-24", "r": 0, "g": 157, "b": 137},
+{"color_key": "20-06-02", "r": 130, "g": 152, "b": 153},
+{"color_key": "20-06-04", "r": 105, "g": 157, "b": 153},
+{"color_key": "20-06-06", "r": 78, "g": 161, "b": 152},
+{"color_key": "20-06-08", "r": 19, "g": 165, "b": 153},
+{"color_key": "20-06-10", "r": 0, "g": 169, "b": 154},
+{"color_key": "20-06-12", "r": 0, "g": 172, "b": 154},
+{"color_key": "20-06-14", "r": 0, "g": 175, "b": 155},
+{"color_key": "20-06-16", "r": 0, "g": 178, "b": 156},
+{"color_key": "20-06-18", "r": 0, "g": 181, "b": 157},
+{"color_key": "20-06-20", "r": 0, "g": 183, "b": 159},
+{"color_key": "20-06-22", "r": 0, "g": 185, "b": 160},
+{"color_key": "20-07-02", "r": 156, "g": 178, "b": 180},
+{"color_key": "20-07-04", "r": 133, "g": 183, "b": 179},
+{"color_key": "20-07-06", "r": 108, "g": 188, "b": 178},
+{"color_key": "20-07-08", "r": 69, "g": 192, "b": 178},
+{"color_key": "20-07-10", "r": 0, "g": 196, "b": 179},
+{"color_key": "20-07-12", "r": 0, "g": 200, "b": 179},
+{"color_key": "20-07-14", "r": 0, "g": 203, "b": 180},
+{"color_key": "20-07-16", "r": 0, "g": 206, "b": 181},
+{"color_key": "20-07-18", "r": 0, "g": 209, "b": 181},
+{"color_key": "20-07-20", "r": 0, "g": 211, "b": 182},
+{"color_key": "20-07-22", "r": 0, "g": 214, "b": 183},
+{"color_key": "20-08-02", "r": 181, "g": 205, "b": 207},
+{"color_key": "20-08-04", "r": 158, "g": 210, "b": 205},
+{"color_key": "20-08-06", "r": 131, "g": 215, "b": 205},
+{"color_key": "20-08-08", "r": 98, "g": 220, "b": 204},
+{"color_key": "20-08-10", "r": 36, "g": 224, "b": 204},
+{"color_key": "20-08-12", "r": 0, "g": 228, "b": 204},
+{"color_key": "20-08-14", "r": 0, "g": 231, "b": 205},
+{"color_key": "20-08-16", "r": 0, "g": 234, "b": 205},
+{"color_key": "20-08-18", "r": 0, "g": 238, "b": 206},
+{"color_key": "20-09-02", "r": 207, "g": 232, "b": 234},
+{"color_key": "20-09-04", "r": 182, "g": 238, "b": 233},
+{"color_key": "20-09-06", "r": 150, "g": 244, "b": 232},
+{"color_key": "20-09-08", "r": 113, "g": 249, "b": 231},
+{"color_key": "20-09-10", "r": 61, "g": 253, "b": 231},
+{"color_key": "21-01-02", "r": 14, "g": 32, "b": 34},
+{"color_key": "21-01-04", "r": 0, "g": 35, "b": 39},
+{"color_key": "21-01-06", "r": 0, "g": 38, "b": 44},
+{"color_key": "21-02-02", "r": 36, "g": 52, "b": 55},
+{"color_key": "21-02-04", "r": 4, "g": 55, "b": 58},
+{"color_key": "21-02-06", "r": 0, "g": 58, "b": 62},
+{"color_key": "21-02-08", "r": 0, "g": 61, "b": 66},
+{"color_key": "21-02-10", "r": 0, "g": 63, "b": 70},
+{"color_key": "21-02-12", "r": 0, "g": 65, "b": 73},
+{"color_key": "21-03-02", "r": 56, "g": 75, "b": 78},
+{"color_key": "21-03-04", "r": 24, "g": 80, "b": 82},
+{"color_key": "21-03-06", "r": 0, "g": 83, "b": 85},
+{"color_key": "21-03-08", "r": 0, "g": 85, "b": 89},
+{"color_key": "21-03-10", "r": 0, "g": 88, "b": 93},
+{"color_key": "21-03-12", "r": 0, "g": 90, "b": 96},
+{"color_key": "21-03-14", "r": 0, "g": 92, "b": 99},
+{"color_key": "21-03-16", "r": 0, "g": 94, "b": 102},
+{"color_key": "21-03-18", "r": 0, "g": 95, "b": 104},
+{"color_key": "21-04-02", "r": 80, "g": 100, "b": 104},
+{"color_key": "21-04-04", "r": 52, "g": 105, "b": 107},
+{"color_key": "21-04-06", "r": 0, "g": 109, "b": 110},
+{"color_key": "21-04-08", "r": 0, "g": 112, "b": 114},
+{"color_key": "21-04-10", "r": 0, "g": 115, "b": 117},
+{"color_key": "21-04-12", "r": 0, "g": 118, "b": 121},
+{"color_key": "21-04-14", "r": 0, "g": 120, "b": 124},
+{"color_key": "21-04-16", "r": 0, "g": 122, "b": 127},
+{"color_key": "21-04-18", "r": 0, "g": 124, "b": 129},
+{"color_key": "21-04-20", "r": 0, "g": 125, "b": 132},
+{"color_key": "21-05-02", "r": 104, "g": 126, "b": 130},
+{"color_key": "21-05-04", "r": 80, "g": 130, "b": 132},
+{"color_key": "21-05-06", "r": 45, "g": 134, "b": 135},
+{"color_key": "21-05-08", "r": 0, "g": 138, "b": 139},
+{"color_key": "21-05-10", "r": 0, "g": 142, "b": 142},
+{"color_key": "21-05-12", "r": 0, "g": 145, "b": 145},
+{"color_key": "21-05-14", "r": 0, "g": 148, "b": 148},
+{"color_key": "21-05-16", "r": 0, "g": 150, "b": 151},
+{"color_key": "21-05-18", "r": 0, "g": 153, "b": 154},
+{"color_key": "21-05-20", "r": 0, "g": 155, "b": 157},
+{"color_key": "21-05-22", "r": 0, "g": 156, "b": 159},
+{"color_key": "21-06-02", "r": 129, "g": 152, "b": 156},
+{"color_key": "21-06-04", "r": 104, "g": 157, "b": 158},
+{"color_key": "21-06-06", "r": 72, "g": 161, "b": 161},
+{"color_key": "21-06-08", "r": 0, "g": 165, "b": 164},
+{"color_key": "21-06-10", "r": 0, "g": 169, "b": 167},
+{"color_key": "21-06-12", "r": 0, "g": 172, "b": 169},
+{"color_key": "21-06-14", "r": 0, "g": 175, "b": 172},
+{"color_key": "21-06-16", "r": 0, "g": 178, "b": 175},
+{"color_key": "21-06-18", "r": 0, "g": 181, "b": 178},
+{"color_key": "21-06-20", "r": 0, "g": 183, "b": 180},
+{"color_key": "21-07-02", "r": 155, "g": 178, "b": 183},
+{"color_key": "21-07-04", "r": 131, "g": 183, "b": 185},
+{"color_key": "21-07-06", "r": 105, "g": 187, "b": 186},
+{"color_key": "21-07-08", "r": 60, "g": 192, "b": 189},
+{"color_key": "21-07-10", "r": 0, "g": 196, "b": 191},
+{"color_key": "21-07-12", "r": 0, "g": 199, "b": 194},
+{"color_key": "21-07-14", "r": 0, "g": 203, "b": 196},
+{"color_key": "21-07-16", "r": 0, "g": 206, "b": 199},
+{"color_key": "21-07-18", "r": 0, "g": 209, "b": 202},
+{"color_key": "21-07-20", "r": 0, "g": 211, "b": 204},
+{"color_key": "21-08-02", "r": 181, "g": 205, "b": 210},
+{"color_key": "21-08-04", "r": 157, "g": 210, "b": 211},
+{"color_key": "21-08-06", "r": 129, "g": 215, "b": 213},
+{"color_key": "21-08-08", "r": 89, "g": 219, "b": 215},
+{"color_key": "21-08-10", "r": 0, "g": 224, "b": 217},
+{"color_key": "21-08-12", "r": 0, "g": 228, "b": 219},
+{"color_key": "21-08-14", "r": 0, "g": 231, "b": 221},
+{"color_key": "21-08-16", "r": 0, "g": 234, "b": 223},
+{"color_key": "21-09-02", "r": 207, "g": 232, "b": 237},
+{"color_key": "21-09-04", "r": 180, "g": 238, "b": 238},
+{"color_key": "21-09-06", "r": 147, "g": 244, "b": 240},
+{"color_key": "21-09-08", "r": 105, "g": 249, "b": 241},
+{"color_key": "21-09-10", "r": 37, "g": 253, "b": 243},
+{"color_key": "22-01-02", "r": 13, "g": 31, "b": 36},
+{"color_key": "22-01-04", "r": 0, "g": 35, "b": 42},
+{"color_key": "22-01-06", "r": 0, "g": 38, "b": 49},
+{"color_key": "22-02-02", "r": 36, "g": 52, "b": 56},
+{"color_key": "22-02-04", "r": 1, "g": 55, "b": 62},
+{"color_key": "22-02-06", "r": 0, "g": 58, "b": 67},
+{"color_key": "22-02-08", "r": 0, "g": 61, "b": 73},
+{"color_key": "22-02-10", "r": 0, "g": 63, "b": 78},
+{"color_key": "22-02-12", "r": 0, "g": 65, "b": 82},
+{"color_key": "22-03-02", "r": 56, "g": 75, "b": 81},
+{"color_key": "22-03-04", "r": 21, "g": 79, "b": 87},
+{"color_key": "22-03-06", "r": 0, "g": 82, "b": 92},
+{"color_key": "22-03-08", "r": 0, "g": 85, "b": 97},
+{"color_key": "22-03-10", "r": 0, "g": 88, "b": 102},
+{"color_key": "22-03-12", "r": 0, "g": 90, "b": 106},
+{"color_key": "22-03-14", "r": 0, "g": 92, "b": 110},
+{"color_key": "22-03-16", "r": 0, "g": 94, "b": 114},
+{"color_key": "22-04-02", "r": 79, "g": 100, "b": 106},
+{"color_key": "22-04-04", "r": 51, "g": 104, "b": 111},
+{"color_key": "22-04-06", "r": 0, "g": 108, "b": 117},
+{"color_key": "22-04-08", "r": 0, "g": 112, "b": 123},
+{"color_key": "22-04-10", "r": 0, "g": 115, "b": 128},
+{"color_key": "22-04-12", "r": 0, "g": 117, "b": 133},
+{"color_key": "22-04-14", "r": 0, "g": 120, "b": 138},
+{"color_key": "22-04-16", "r": 0, "g": 122, "b": 142},
+{"color_key": "22-04-18", "r": 0, "g": 124, "b": 145},
+{"color_key": "22-05-02", "r": 104, "g": 126, "b": 132},
+{"color_key": "22-05-04", "r": 79, "g": 130, "b": 137},
+{"color_key": "22-05-06", "r": 40, "g": 134, "b": 142},
+{"color_key": "22-05-08", "r": 0, "g": 138, "b": 147},
+{"color_key": "22-05-10", "r": 0, "g": 141, "b": 153},
+{"color_key": "22-05-12", "r": 0, "g": 145, "b": 158},
+{"color_key": "22-05-14", "r": 0, "g": 147, "b": 163},
+{"color_key": "22-05-16", "r": 0, "g": 150, "b": 167},
+{"color_key": "22-05-18", "r": 0, "g": 153, "b": 172},
+{"color_key": "22-06-02", "r": 129, "g": 152, "b": 159},
+{"color_key": "22-06-04", "r": 103, "g": 157, "b": 164},
+{"color_key": "22-06-06", "r": 70, "g": 161, "b": 168},
+{"color_key": "22-06-08", "r": 0, "g": 165, "b": 173},
+{"color_key": "22-06-10", "r": 0, "g": 168, "b": 178},
+{"color_key": "22-06-12", "r": 0, "g": 172, "b": 183},
+{"color_key": "22-06-14", "r": 0, "g": 175, "b": 187},
+{"color_key": "22-06-16", "r": 0, "g": 177, "b": 191},
+{"color_key": "22-06-18", "r": 0, "g": 180, "b": 196},
+{"color_key": "22-07-02", "r": 155, "g": 178, "b": 185},
+{"color_key": "22-07-04", "r": 130, "g": 183, "b": 190},
+{"color_key": "22-07-06", "r": 103, "g": 187, "b": 194},
+{"color_key": "22-07-08", "r": 55, "g": 191, "b": 198},
+{"color_key": "22-07-10", "r": 0, "g": 195, "b": 203},
+{"color_key": "22-07-12", "r": 0, "g": 199, "b": 208},
+{"color_key": "22-07-14", "r": 0, "g": 202, "b": 212},
+{"color_key": "22-07-16", "r": 0, "g": 205, "b": 217},
+{"color_key": "22-07-18", "r": 0, "g": 208, "b": 221},
+{"color_key": "22-08-02", "r": 181, "g": 204, "b": 213},
+{"color_key": "22-08-04", "r": 157, "g": 209, "b": 216},
+{"color_key": "22-08-06", "r": 125, "g": 214, "b": 221},
+{"color_key": "22-08-08", "r": 84, "g": 219, "b": 226},
+{"color_key": "22-08-10", "r": 0, "g": 223, "b": 230},
+{"color_key": "22-08-12", "r": 0, "g": 227, "b": 234},
+{"color_key": "22-08-14", "r": 0, "g": 230, "b": 238},
+{"color_key": "22-08-16", "r": 0, "g": 234, "b": 242},
+{"color_key": "22-09-02", "r": 207, "g": 231, "b": 241},
+{"color_key": "22-09-04", "r": 179, "g": 238, "b": 245},
+{"color_key": "22-09-06", "r": 145, "g": 243, "b": 249},
+{"color_key": "22-09-08", "r": 97, "g": 248, "b": 254},
+{"color_key": "22-09-10", "r": 0, "g": 252, "b": 255},
 {"color_key": "23-01-02", "r": 12, "g": 31, "b": 38},
 {"color_key": "23-01-04", "r": 0, "g": 34, "b": 46},
 {"color_key": "23-01-06", "r": 0, "g": 37, "b": 55},
@@ -1651,64 +1543,60 @@ export const flatColorChips = [
 {"color_key": "23-09-02", "r": 209, "g": 231, "b": 243},
 {"color_key": "23-09-04", "r": 180, "g": 237, "b": 250},
 {"color_key": "23-09-06", "r": 144, "g": 242, "b": 255},
-{"color_key": "24-01-02", "r": 12, "g": 31, "b": 38},
-{"color_key": "24-01-04", "r": 0, "g": 34, "b": 47},
-{"color_key": "24-01-06", "r": 0, "g": 36, "b": 57},
-{"color_key": "24-02-02", "r": 35, "g": 52, "b": 59},
-{"color_key": "24-02-04", "r": 0, "g": 54, "b": 67},
-{"color_key": "24-02-06", "r": 0, "g": 57, "b": 76},
-{"color_key": "24-02-08", "r": 0, "g": 60, "b": 85},
-{"color_key": "24-02-10", "r": 0, "g": 62, "b": 94},
-{"color_key": "24-03-02", "r": 55, "g": 75, "b": 84},
-{"color_key": "24-03-04", "r": 21, "g": 78, "b": 93},
-{"color_key": "24-03-06", "r": 0, "g": 81, "b": 102},
-{"color_key": "24-03-08", "r": 0, "g": 84, "b": 110},
-{"color_key": "24-03-10", "r": 0, "g": 86, "b": 119},
-{"color_key": "24-03-12", "r": 0, "g": 89, "b": 126},
-{"color_key": "24-03-14", "r": 0, "g": 92, "b": 127},
-{"color_key": "24-04-02", "r": 79, "g": 99, "b": 109},
-{"color_key": "24-04-04", "r": 52, "g": 103, "b": 118},
-{"color_key": "24-04-06", "r": 0, "g": 106, "b": 127},
-{"color_key": "24-04-08", "r": 0, "g": 110, "b": 136},
-{"color_key": "24-04-10", "r": 0, "g": 113, "b": 145},
-{"color_key": "24-04-12", "r": 0, "g": 116, "b": 153},
-{"color_key": "24-04-14", "r": 0, "g": 118, "b": 161},
-{"color_key": "24-04-16", "r": 0, "g": 120, "b": 167},
-{"color_key": "24-05-02", "r": 105, "g": 125, "b": 135},
-{"color_key": "24-05-04", "r": 81, "g": 129, "b": 144},
-{"color_key": "24-05-06", "r": 41, "g": 132, "b": 152},
-{"color_key": "24-05-08", "r": 0, "g": 136, "b": 161},
-{"color_key": "24-05-10", "r": 0, "g": 139, "b": 170},
-{"color_key": "24-05-12", "r": 0, "g": 143, "b": 179},
-{"color_key": "24-05-14", "r": 0, "g": 145, "b": 186},
-{"color_key": "24-05-16", "r": 0, "g": 148, "b": 195},
-{"color_key": "24-06-02", "r": 130, "g": 151, "b": 162},
-{"color_key": "24-06-04", "r": 106, "g": 155, "b": 170},
-{"color_key": "24-06-06", "r": 71, "g": 159, "b": 179},
-{"color_key": "24-06-08", "r": 0, "g": 163, "b": 187},
-{"color_key": "24-06-10", "r": 0, "g": 166, "b": 195},
-{"color_key": "24-06-12", "r": 0, "g": 169, "b": 204},
-{"color_key": "24-06-14", "r": 0, "g": 172, "b": 212},
-{"color_key": "24-06-16", "r": 0, "g": 175, "b": 220},
-{"color_key": "24-06-18", "r": 0, "g": 179, "b": 218},
-{"color_key": "24-07-02", "r": 157, "g": 177, "b": 189},
-{"color_key": "24-07-04", "r": 132, "g": 181, "b": 197},
-{"color_key": "24-07-06", "r": 104, "g": 185, "b": 204},
-{"color_key": "24-07-08", "r": 55, "g": 189, "b": 213},
-{"color_key": "24-07-10", "r": 0, "g": 193, "b": 221},
-{"color_key": "24-07-12", "r": 0, "g": 197, "b": 230},
-{"color_key": "24-07-14", "r": 0, "g": 200, "b": 238},
-{"color_key": "24-07-16", "r": 0, "g": 204, "b": 246},
-{"color_key": "24-08-02", "r": 184, "g": 203, "b": 216},
-{"color_key": "24-08-04", "r": 157, "g": 208, "b": 224},
-{"color_key": "24-08-06", "r": 126, "g": 213, "b": 231},
-{"color_key": "24-08-08", "r": 83, "g": 217, "b": 240},
-{"color_key": "24-08-10", "r": 0, "g": 221, "b": 248},
-{"color_key": "24-08-12", "r": 0, "g": 225, "b": 252},
-{"color_key": "24-08-14", "r": 0, "g": 230, "b": 255},
-{"color_key": "24-09-02", "r": 210, "g": 230, "b": 244},
-{"color_key": "24-09-04", "r": 180, "g": 236, "b": 252},
-{"color_key": "24-09-06", "r": 144, "g": 242, "b": 255},
+{"color_key": "24-01-02", "r": 12, "g": 31, "b": 39},
+{"color_key": "24-01-04", "r": 0, "g": 34, "b": 49},
+{"color_key": "24-01-06", "r": 0, "g": 36, "b": 59},
+{"color_key": "24-02-02", "r": 35, "g": 52, "b": 60},
+{"color_key": "24-02-04", "r": 0, "g": 54, "b": 69},
+{"color_key": "24-02-06", "r": 0, "g": 57, "b": 79},
+{"color_key": "24-02-08", "r": 0, "g": 60, "b": 89},
+{"color_key": "24-02-10", "r": 0, "g": 62, "b": 99},
+{"color_key": "24-03-02", "r": 55, "g": 75, "b": 85},
+{"color_key": "24-03-04", "r": 22, "g": 78, "b": 95},
+{"color_key": "24-03-06", "r": 0, "g": 81, "b": 105},
+{"color_key": "24-03-08", "r": 0, "g": 84, "b": 114},
+{"color_key": "24-03-10", "r": 0, "g": 86, "b": 124},
+{"color_key": "24-03-12", "r": 0, "g": 89, "b": 133},
+{"color_key": "24-04-02", "r": 80, "g": 99, "b": 110},
+{"color_key": "24-04-04", "r": 53, "g": 103, "b": 120},
+{"color_key": "24-04-06", "r": 0, "g": 106, "b": 130},
+{"color_key": "24-04-08", "r": 0, "g": 109, "b": 140},
+{"color_key": "24-04-10", "r": 0, "g": 112, "b": 151},
+{"color_key": "24-04-12", "r": 0, "g": 115, "b": 159},
+{"color_key": "24-04-14", "r": 0, "g": 118, "b": 169},
+{"color_key": "24-04-16", "r": 0, "g": 120, "b": 175},
+{"color_key": "24-05-02", "r": 106, "g": 125, "b": 136},
+{"color_key": "24-05-04", "r": 82, "g": 129, "b": 146},
+{"color_key": "24-05-06", "r": 43, "g": 132, "b": 155},
+{"color_key": "24-05-08", "r": 0, "g": 135, "b": 165},
+{"color_key": "24-05-10", "r": 0, "g": 139, "b": 175},
+{"color_key": "24-05-12", "r": 0, "g": 142, "b": 186},
+{"color_key": "24-05-14", "r": 0, "g": 145, "b": 194},
+{"color_key": "24-05-16", "r": 0, "g": 148, "b": 204},
+{"color_key": "24-06-02", "r": 131, "g": 151, "b": 163},
+{"color_key": "24-06-04", "r": 107, "g": 155, "b": 172},
+{"color_key": "24-06-06", "r": 73, "g": 159, "b": 182},
+{"color_key": "24-06-08", "r": 0, "g": 162, "b": 192},
+{"color_key": "24-06-10", "r": 0, "g": 165, "b": 201},
+{"color_key": "24-06-12", "r": 0, "g": 169, "b": 211},
+{"color_key": "24-06-14", "r": 0, "g": 172, "b": 220},
+{"color_key": "24-06-16", "r": 0, "g": 175, "b": 230},
+{"color_key": "24-07-02", "r": 158, "g": 177, "b": 190},
+{"color_key": "24-07-04", "r": 133, "g": 181, "b": 199},
+{"color_key": "24-07-06", "r": 105, "g": 185, "b": 208},
+{"color_key": "24-07-08", "r": 58, "g": 189, "b": 217},
+{"color_key": "24-07-10", "r": 0, "g": 193, "b": 227},
+{"color_key": "24-07-12", "r": 0, "g": 196, "b": 238},
+{"color_key": "24-07-14", "r": 0, "g": 199, "b": 247},
+{"color_key": "24-07-16", "r": 0, "g": 203, "b": 255},
+{"color_key": "24-08-02", "r": 185, "g": 203, "b": 217},
+{"color_key": "24-08-04", "r": 158, "g": 208, "b": 226},
+{"color_key": "24-08-06", "r": 127, "g": 213, "b": 235},
+{"color_key": "24-08-08", "r": 84, "g": 217, "b": 245},
+{"color_key": "24-08-10", "r": 0, "g": 221, "b": 255},
+{"color_key": "24-08-12", "r": 0, "g": 225, "b": 255},
+{"color_key": "24-09-02", "r": 211, "g": 230, "b": 245},
+{"color_key": "24-09-04", "r": 181, "g": 236, "b": 255},
 {"color_key": "25-01-02", "r": 12, "g": 31, "b": 41},
 {"color_key": "25-01-04", "r": 0, "g": 33, "b": 52},
 {"color_key": "25-01-06", "r": 0, "g": 35, "b": 63},
@@ -1759,57 +1647,56 @@ export const flatColorChips = [
 {"color_key": "25-08-08", "r": 92, "g": 214, "b": 255},
 {"color_key": "25-09-02", "r": 214, "g": 229, "b": 247},
 {"color_key": "25-09-04", "r": 185, "g": 235, "b": 255},
-{"color_key": "26-01-02", "r": 13, "g": 30, "b": 41},
-{"color_key": "26-01-04", "r": 0, "g": 32, "b": 53},
-{"color_key": "26-01-06", "r": 0, "g": 34, "b": 64},
+{"color_key": "26-01-02", "r": 14, "g": 30, "b": 42},
+{"color_key": "26-01-04", "r": 0, "g": 32, "b": 54},
+{"color_key": "26-01-06", "r": 0, "g": 33, "b": 65},
 {"color_key": "26-01-08", "r": 0, "g": 35, "b": 77},
-{"color_key": "26-02-02", "r": 36, "g": 51, "b": 62},
-{"color_key": "26-02-04", "r": 6, "g": 53, "b": 73},
-{"color_key": "26-02-06", "r": 0, "g": 55, "b": 86},
-{"color_key": "26-02-08", "r": 0, "g": 57, "b": 99},
-{"color_key": "26-02-10", "r": 0, "g": 59, "b": 111},
-{"color_key": "26-03-02", "r": 56, "g": 74, "b": 87},
-{"color_key": "26-03-04", "r": 30, "g": 76, "b": 100},
-{"color_key": "26-03-06", "r": 0, "g": 79, "b": 112},
-{"color_key": "26-03-08", "r": 0, "g": 81, "b": 124},
-{"color_key": "26-03-10", "r": 0, "g": 83, "b": 136},
-{"color_key": "26-03-12", "r": 0, "g": 85, "b": 148},
-{"color_key": "26-04-02", "r": 82, "g": 98, "b": 112},
-{"color_key": "26-04-04", "r": 60, "g": 101, "b": 124},
-{"color_key": "26-04-06", "r": 20, "g": 104, "b": 136},
-{"color_key": "26-04-08", "r": 0, "g": 106, "b": 150},
-{"color_key": "26-04-10", "r": 0, "g": 108, "b": 161},
-{"color_key": "26-04-12", "r": 0, "g": 110, "b": 174},
-{"color_key": "26-04-14", "r": 0, "g": 113, "b": 186},
-{"color_key": "26-05-02", "r": 108, "g": 124, "b": 138},
-{"color_key": "26-05-04", "r": 87, "g": 127, "b": 150},
-{"color_key": "26-05-06", "r": 59, "g": 130, "b": 162},
-{"color_key": "26-05-08", "r": 1, "g": 132, "b": 175},
-{"color_key": "26-05-10", "r": 0, "g": 134, "b": 188},
-{"color_key": "26-05-12", "r": 0, "g": 137, "b": 201},
-{"color_key": "26-05-14", "r": 0, "g": 139, "b": 214},
-{"color_key": "26-05-16", "r": 0, "g": 142, "b": 228},
-{"color_key": "26-06-02", "r": 135, "g": 149, "b": 164},
-{"color_key": "26-06-04", "r": 115, "g": 153, "b": 176},
-{"color_key": "26-06-06", "r": 87, "g": 156, "b": 189},
-{"color_key": "26-06-08", "r": 41, "g": 158, "b": 202},
-{"color_key": "26-06-10", "r": 0, "g": 161, "b": 215},
-{"color_key": "26-06-12", "r": 0, "g": 163, "b": 228},
-{"color_key": "26-06-14", "r": 0, "g": 166, "b": 242},
-{"color_key": "26-06-16", "r": 0, "g": 169, "b": 252},
-{"color_key": "26-07-02", "r": 161, "g": 175, "b": 191},
-{"color_key": "26-07-04", "r": 140, "g": 179, "b": 204},
-{"color_key": "26-07-06", "r": 115, "g": 182, "b": 216},
-{"color_key": "26-07-08", "r": 80, "g": 185, "b": 229},
-{"color_key": "26-07-10", "r": 0, "g": 188, "b": 243},
-{"color_key": "26-07-12", "r": 0, "g": 191, "b": 254},
-{"color_key": "26-07-14", "r": 0, "g": 196, "b": 255},
-{"color_key": "26-08-02", "r": 189, "g": 201, "b": 218},
-{"color_key": "26-08-04", "r": 165, "g": 206, "b": 231},
-{"color_key": "26-08-06", "r": 139, "g": 209, "b": 245},
-{"color_key": "26-08-08", "r": 99, "g": 213, "b": 255},
-{"color_key": "26-09-02", "r": 215, "g": 228, "b": 247},
-{"color_key": "26-09-04", "r": 188, "g": 234, "b": 255},
+{"color_key": "26-02-02", "r": 37, "g": 51, "b": 63},
+{"color_key": "26-02-04", "r": 10, "g": 53, "b": 75},
+{"color_key": "26-02-06", "r": 0, "g": 55, "b": 88},
+{"color_key": "26-02-08", "r": 0, "g": 56, "b": 101},
+{"color_key": "26-02-10", "r": 0, "g": 58, "b": 114},
+{"color_key": "26-03-02", "r": 57, "g": 74, "b": 88},
+{"color_key": "26-03-04", "r": 34, "g": 76, "b": 102},
+{"color_key": "26-03-06", "r": 0, "g": 78, "b": 114},
+{"color_key": "26-03-08", "r": 0, "g": 80, "b": 126},
+{"color_key": "26-03-10", "r": 0, "g": 82, "b": 139},
+{"color_key": "26-03-12", "r": 0, "g": 84, "b": 152},
+{"color_key": "26-04-02", "r": 83, "g": 98, "b": 113},
+{"color_key": "26-04-04", "r": 63, "g": 101, "b": 126},
+{"color_key": "26-04-06", "r": 33, "g": 103, "b": 138},
+{"color_key": "26-04-08", "r": 0, "g": 105, "b": 152},
+{"color_key": "26-04-10", "r": 0, "g": 107, "b": 164},
+{"color_key": "26-04-12", "r": 0, "g": 109, "b": 177},
+{"color_key": "26-04-14", "r": 0, "g": 111, "b": 190},
+{"color_key": "26-05-02", "r": 109, "g": 124, "b": 139},
+{"color_key": "26-05-04", "r": 90, "g": 126, "b": 152},
+{"color_key": "26-05-06", "r": 65, "g": 129, "b": 164},
+{"color_key": "26-05-08", "r": 3, "g": 131, "b": 177},
+{"color_key": "26-05-10", "r": 0, "g": 133, "b": 191},
+{"color_key": "26-05-12", "r": 0, "g": 135, "b": 205},
+{"color_key": "26-05-14", "r": 0, "g": 138, "b": 218},
+{"color_key": "26-05-16", "r": 0, "g": 140, "b": 233},
+{"color_key": "26-06-02", "r": 136, "g": 149, "b": 165},
+{"color_key": "26-06-04", "r": 118, "g": 152, "b": 178},
+{"color_key": "26-06-06", "r": 93, "g": 155, "b": 191},
+{"color_key": "26-06-08", "r": 57, "g": 157, "b": 205},
+{"color_key": "26-06-10", "r": 0, "g": 160, "b": 218},
+{"color_key": "26-06-12", "r": 0, "g": 162, "b": 232},
+{"color_key": "26-06-14", "r": 0, "g": 165, "b": 247},
+{"color_key": "26-06-16", "r": 0, "g": 167, "b": 255},
+{"color_key": "26-07-02", "r": 163, "g": 175, "b": 192},
+{"color_key": "26-07-04", "r": 143, "g": 179, "b": 205},
+{"color_key": "26-07-06", "r": 120, "g": 181, "b": 218},
+{"color_key": "26-07-08", "r": 88, "g": 184, "b": 232},
+{"color_key": "26-07-10", "r": 0, "g": 187, "b": 247},
+{"color_key": "26-07-12", "r": 0, "g": 190, "b": 255},
+{"color_key": "26-08-02", "r": 190, "g": 201, "b": 219},
+{"color_key": "26-08-04", "r": 168, "g": 205, "b": 233},
+{"color_key": "26-08-06", "r": 143, "g": 209, "b": 247},
+{"color_key": "26-08-08", "r": 106, "g": 212, "b": 255},
+{"color_key": "26-09-02", "r": 217, "g": 228, "b": 247},
+{"color_key": "26-09-04", "r": 191, "g": 233, "b": 255},
 {"color_key": "27-01-02", "r": 16, "g": 30, "b": 44},
 {"color_key": "27-01-04", "r": 0, "g": 31, "b": 55},
 {"color_key": "27-01-06", "r": 0, "g": 32, "b": 66},
@@ -1863,61 +1750,57 @@ export const flatColorChips = [
 {"color_key": "27-08-08", "r": 124, "g": 209, "b": 255},
 {"color_key": "27-09-02", "r": 220, "g": 227, "b": 248},
 {"color_key": "27-09-04", "r": 197, "g": 231, "b": 255},
-{"color_key": "28-01-02", "r": 17, "g": 29, "b": 44},
-{"color_key": "28-01-04", "r": 1, "g": 30, "b": 55},
-{"color_key": "28-01-06", "r": 0, "g": 31, "b": 67},
-{"color_key": "28-01-08", "r": 0, "g": 31, "b": 79},
-{"color_key": "28-02-02", "r": 40, "g": 50, "b": 64},
-{"color_key": "28-02-04", "r": 23, "g": 51, "b": 77},
-{"color_key": "28-02-06", "r": 0, "g": 52, "b": 91},
-{"color_key": "28-02-08", "r": 0, "g": 53, "b": 105},
-{"color_key": "28-02-10", "r": 0, "g": 54, "b": 118},
+{"color_key": "28-01-02", "r": 19, "g": 29, "b": 44},
+{"color_key": "28-01-04", "r": 3, "g": 30, "b": 56},
+{"color_key": "28-01-06", "r": 0, "g": 30, "b": 68},
+{"color_key": "28-01-08", "r": 0, "g": 30, "b": 80},
+{"color_key": "28-02-02", "r": 41, "g": 50, "b": 65},
+{"color_key": "28-02-04", "r": 28, "g": 50, "b": 78},
+{"color_key": "28-02-06", "r": 0, "g": 51, "b": 92},
+{"color_key": "28-02-08", "r": 0, "g": 52, "b": 106},
+{"color_key": "28-02-10", "r": 0, "g": 52, "b": 119},
 {"color_key": "28-02-12", "r": 0, "g": 52, "b": 132},
-{"color_key": "28-03-02", "r": 61, "g": 72, "b": 90},
-{"color_key": "28-03-04", "r": 45, "g": 74, "b": 104},
-{"color_key": "28-03-06", "r": 14, "g": 75, "b": 117},
-{"color_key": "28-03-08", "r": 0, "g": 76, "b": 130},
-{"color_key": "28-03-10", "r": 0, "g": 77, "b": 143},
-{"color_key": "28-03-12", "r": 0, "g": 78, "b": 157},
-{"color_key": "28-03-14", "r": 0, "g": 79, "b": 170},
-{"color_key": "28-04-02", "r": 87, "g": 97, "b": 114},
-{"color_key": "28-04-04", "r": 73, "g": 98, "b": 128},
-{"color_key": "28-04-06", "r": 54, "g": 100, "b": 141},
-{"color_key": "28-04-08", "r": 17, "g": 101, "b": 155},
-{"color_key": "28-04-10", "r": 0, "g": 102, "b": 168},
-{"color_key": "28-04-12", "r": 0, "g": 103, "b": 181},
-{"color_key": "28-04-14", "r": 0, "g": 105, "b": 195},
-{"color_key": "28-04-16", "r": 0, "g": 106, "b": 210},
+{"color_key": "28-03-02", "r": 63, "g": 72, "b": 91},
+{"color_key": "28-03-04", "r": 50, "g": 73, "b": 105},
+{"color_key": "28-03-06", "r": 29, "g": 74, "b": 118},
+{"color_key": "28-03-08", "r": 0, "g": 75, "b": 131},
+{"color_key": "28-03-10", "r": 0, "g": 75, "b": 144},
+{"color_key": "28-03-12", "r": 0, "g": 76, "b": 158},
+{"color_key": "28-03-14", "r": 0, "g": 77, "b": 172},
+{"color_key": "28-04-02", "r": 89, "g": 97, "b": 115},
+{"color_key": "28-04-04", "r": 77, "g": 98, "b": 129},
+{"color_key": "28-04-06", "r": 62, "g": 99, "b": 142},
+{"color_key": "28-04-08", "r": 35, "g": 100, "b": 156},
+{"color_key": "28-04-10", "r": 0, "g": 100, "b": 169},
+{"color_key": "28-04-12", "r": 0, "g": 101, "b": 183},
+{"color_key": "28-04-14", "r": 0, "g": 102, "b": 197},
+{"color_key": "28-04-16", "r": 0, "g": 103, "b": 212},
 {"color_key": "28-04-18", "r": 0, "g": 103, "b": 226},
-{"color_key": "28-05-02", "r": 113, "g": 122, "b": 140},
-{"color_key": "28-05-04", "r": 100, "g": 124, "b": 153},
-{"color_key": "28-05-06", "r": 83, "g": 125, "b": 168},
-{"color_key": "28-05-08", "r": 57, "g": 127, "b": 181},
-{"color_key": "28-05-10", "r": 19, "g": 128, "b": 195},
-{"color_key": "28-05-12", "r": 0, "g": 129, "b": 209},
-{"color_key": "28-05-14", "r": 0, "g": 131, "b": 223},
-{"color_key": "28-05-16", "r": 0, "g": 132, "b": 239},
-{"color_key": "28-05-18", "r": 0, "g": 134, "b": 253},
-{"color_key": "28-06-02", "r": 140, "g": 147, "b": 166},
-{"color_key": "28-06-04", "r": 127, "g": 150, "b": 179},
-{"color_key": "28-06-06", "r": 110, "g": 151, "b": 194},
-{"color_key": "28-06-08", "r": 88, "g": 153, "b": 209},
-{"color_key": "28-06-10", "r": 53, "g": 154, "b": 223},
-{"color_key": "28-06-12", "r": 10, "g": 156, "b": 239},
-{"color_key": "28-06-14", "r": 0, "g": 158, "b": 254},
-{"color_key": "28-06-16", "r": 0, "g": 163, "b": 255},
-{"color_key": "28-07-02", "r": 167, "g": 173, "b": 193},
-{"color_key": "28-07-04", "r": 153, "g": 176, "b": 207},
-{"color_key": "28-07-06", "r": 136, "g": 177, "b": 221},
-{"color_key": "28-07-08", "r": 115, "g": 179, "b": 236},
-{"color_key": "28-07-10", "r": 83, "g": 181, "b": 253},
-{"color_key": "28-07-12", "r": 0, "g": 186, "b": 255},
-{"color_key": "28-08-02", "r": 194, "g": 199, "b": 220},
-{"color_key": "28-08-04", "r": 178, "g": 202, "b": 235},
-{"color_key": "28-08-06", "r": 160, "g": 204, "b": 251},
-{"color_key": "28-08-08", "r": 124, "g": 209, "b": 255},
-{"color_key": "28-09-02", "r": 222, "g": 226, "b": 248},
-{"color_key": "28-09-04", "r": 197, "g": 231, "b": 255},
+{"color_key": "28-05-02", "r": 115, "g": 122, "b": 141},
+{"color_key": "28-05-04", "r": 103, "g": 123, "b": 154},
+{"color_key": "28-05-06", "r": 89, "g": 124, "b": 169},
+{"color_key": "28-05-08", "r": 70, "g": 125, "b": 183},
+{"color_key": "28-05-10", "r": 39, "g": 126, "b": 197},
+{"color_key": "28-05-12", "r": 0, "g": 127, "b": 211},
+{"color_key": "28-05-14", "r": 0, "g": 128, "b": 225},
+{"color_key": "28-05-16", "r": 0, "g": 129, "b": 241},
+{"color_key": "28-05-18", "r": 0, "g": 130, "b": 255},
+{"color_key": "28-06-02", "r": 142, "g": 147, "b": 167},
+{"color_key": "28-06-04", "r": 131, "g": 149, "b": 180},
+{"color_key": "28-06-06", "r": 116, "g": 150, "b": 195},
+{"color_key": "28-06-08", "r": 99, "g": 151, "b": 210},
+{"color_key": "28-06-10", "r": 76, "g": 152, "b": 225},
+{"color_key": "28-06-12", "r": 21, "g": 154, "b": 241},
+{"color_key": "28-06-14", "r": 0, "g": 155, "b": 255},
+{"color_key": "28-07-02", "r": 169, "g": 173, "b": 193},
+{"color_key": "28-07-04", "r": 157, "g": 175, "b": 208},
+{"color_key": "28-07-06", "r": 142, "g": 176, "b": 222},
+{"color_key": "28-07-08", "r": 125, "g": 178, "b": 238},
+{"color_key": "28-07-10", "r": 100, "g": 179, "b": 255},
+{"color_key": "28-08-02", "r": 196, "g": 199, "b": 220},
+{"color_key": "28-08-04", "r": 182, "g": 201, "b": 236},
+{"color_key": "28-08-06", "r": 166, "g": 203, "b": 253},
+{"color_key": "28-09-02", "r": 224, "g": 226, "b": 248},
 {"color_key": "29-01-02", "r": 23, "g": 28, "b": 45},
 {"color_key": "29-01-04", "r": 13, "g": 28, "b": 56},
 {"color_key": "29-01-06", "r": 0, "g": 28, "b": 68},
@@ -1974,11 +1857,11 @@ export const flatColorChips = [
 {"color_key": "29-08-04", "r": 189, "g": 200, "b": 236},
 {"color_key": "29-08-06", "r": 177, "g": 200, "b": 254},
 {"color_key": "29-09-02", "r": 226, "g": 225, "b": 248},
-{"color_key": "30-01-02", "r": 25, "g": 27, "b": 45},
-{"color_key": "30-01-04", "r": 19, "g": 26, "b": 56},
-{"color_key": "30-01-06", "r": 11, "g": 25, "b": 68},
-{"color_key": "30-01-08", "r": 12, "g": 23, "b": 79},
-{"color_key": "30-01-10", "r": 12, "g": 19, "b": 90},
+{"color_key": "30-01-02", "r": 27, "g": 27, "b": 45},
+{"color_key": "30-01-04", "r": 25, "g": 25, "b": 56},
+{"color_key": "30-01-06", "r": 23, "g": 23, "b": 68},
+{"color_key": "30-01-08", "r": 24, "g": 19, "b": 78},
+{"color_key": "30-01-10", "r": 25, "g": 14, "b": 87},
 {"color_key": "30-01-12", "r": 28, "g": 6, "b": 95},
 {"color_key": "30-01-14", "r": 31, "g": 0, "b": 104},
 {"color_key": "30-01-16", "r": 36, "g": 0, "b": 113},
@@ -1993,13 +1876,13 @@ export const flatColorChips = [
 {"color_key": "30-01-34", "r": 77, "g": 0, "b": 199},
 {"color_key": "30-01-36", "r": 82, "g": 0, "b": 210},
 {"color_key": "30-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "30-02-02", "r": 46, "g": 48, "b": 66},
-{"color_key": "30-02-04", "r": 40, "g": 47, "b": 79},
-{"color_key": "30-02-06", "r": 31, "g": 47, "b": 91},
-{"color_key": "30-02-08", "r": 19, "g": 45, "b": 105},
-{"color_key": "30-02-10", "r": 18, "g": 43, "b": 117},
-{"color_key": "30-02-12", "r": 18, "g": 41, "b": 129},
-{"color_key": "30-02-14", "r": 19, "g": 37, "b": 141},
+{"color_key": "30-02-02", "r": 48, "g": 48, "b": 66},
+{"color_key": "30-02-04", "r": 45, "g": 46, "b": 79},
+{"color_key": "30-02-06", "r": 42, "g": 45, "b": 91},
+{"color_key": "30-02-08", "r": 39, "g": 42, "b": 104},
+{"color_key": "30-02-10", "r": 37, "g": 39, "b": 116},
+{"color_key": "30-02-12", "r": 37, "g": 35, "b": 126},
+{"color_key": "30-02-14", "r": 39, "g": 30, "b": 136},
 {"color_key": "30-02-16", "r": 41, "g": 22, "b": 145},
 {"color_key": "30-02-18", "r": 44, "g": 8, "b": 155},
 {"color_key": "30-02-20", "r": 48, "g": 0, "b": 164},
@@ -2012,15 +1895,15 @@ export const flatColorChips = [
 {"color_key": "30-02-34", "r": 74, "g": 0, "b": 227},
 {"color_key": "30-02-36", "r": 79, "g": 0, "b": 237},
 {"color_key": "30-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "30-03-02", "r": 68, "g": 70, "b": 91},
-{"color_key": "30-03-04", "r": 62, "g": 70, "b": 105},
-{"color_key": "30-03-06", "r": 54, "g": 70, "b": 119},
-{"color_key": "30-03-08", "r": 43, "g": 69, "b": 131},
-{"color_key": "30-03-10", "r": 27, "g": 68, "b": 144},
-{"color_key": "30-03-12", "r": 26, "g": 66, "b": 157},
-{"color_key": "30-03-14", "r": 25, "g": 64, "b": 170},
-{"color_key": "30-03-16", "r": 25, "g": 61, "b": 183},
-{"color_key": "30-03-18", "r": 26, "g": 58, "b": 196},
+{"color_key": "30-03-02", "r": 71, "g": 70, "b": 92},
+{"color_key": "30-03-04", "r": 67, "g": 69, "b": 105},
+{"color_key": "30-03-06", "r": 64, "g": 68, "b": 119},
+{"color_key": "30-03-08", "r": 60, "g": 66, "b": 131},
+{"color_key": "30-03-10", "r": 55, "g": 64, "b": 144},
+{"color_key": "30-03-12", "r": 52, "g": 61, "b": 156},
+{"color_key": "30-03-14", "r": 51, "g": 57, "b": 168},
+{"color_key": "30-03-16", "r": 51, "g": 52, "b": 180},
+{"color_key": "30-03-18", "r": 52, "g": 47, "b": 191},
 {"color_key": "30-03-20", "r": 53, "g": 40, "b": 200},
 {"color_key": "30-03-22", "r": 56, "g": 30, "b": 211},
 {"color_key": "30-03-24", "r": 59, "g": 13, "b": 221},
@@ -2029,956 +1912,761 @@ export const flatColorChips = [
 {"color_key": "30-03-30", "r": 68, "g": 0, "b": 250},
 {"color_key": "30-03-32", "r": 72, "g": 0, "b": 255},
 {"color_key": "30-03-34", "r": 75, "g": 0, "b": 255},
-{"color_key": "30-04-02", "r": 94, "g": 95, "b": 116},
-{"color_key": "30-04-04", "r": 88, "g": 95, "b": 129},
-{"color_key": "30-04-06", "r": 81, "g": 94, "b": 142},
-{"color_key": "30-04-08", "r": 71, "g": 94, "b": 156},
-{"color_key": "30-04-10", "r": 58, "g": 93, "b": 169},
-{"color_key": "30-04-12", "r": 37, "g": 92, "b": 182},
-{"color_key": "30-04-14", "r": 35, "g": 91, "b": 196},
-{"color_key": "30-04-16", "r": 33, "g": 89, "b": 210},
-{"color_key": "30-04-18", "r": 32, "g": 87, "b": 224},
-{"color_key": "30-04-20", "r": 31, "g": 84, "b": 240},
+{"color_key": "30-04-02", "r": 96, "g": 94, "b": 116},
+{"color_key": "30-04-04", "r": 93, "g": 94, "b": 129},
+{"color_key": "30-04-06", "r": 89, "g": 93, "b": 142},
+{"color_key": "30-04-08", "r": 84, "g": 91, "b": 156},
+{"color_key": "30-04-10", "r": 79, "g": 90, "b": 169},
+{"color_key": "30-04-12", "r": 74, "g": 88, "b": 182},
+{"color_key": "30-04-14", "r": 70, "g": 86, "b": 195},
+{"color_key": "30-04-16", "r": 66, "g": 82, "b": 208},
+{"color_key": "30-04-18", "r": 64, "g": 79, "b": 221},
+{"color_key": "30-04-20", "r": 62, "g": 73, "b": 235},
 {"color_key": "30-04-22", "r": 62, "g": 68, "b": 245},
 {"color_key": "30-04-24", "r": 63, "g": 62, "b": 255},
 {"color_key": "30-04-26", "r": 64, "g": 54, "b": 255},
-{"color_key": "30-05-02", "r": 120, "g": 120, "b": 141},
-{"color_key": "30-05-04", "r": 114, "g": 120, "b": 154},
-{"color_key": "30-05-06", "r": 107, "g": 120, "b": 169},
-{"color_key": "30-05-08", "r": 99, "g": 119, "b": 183},
-{"color_key": "30-05-10", "r": 88, "g": 119, "b": 197},
-{"color_key": "30-05-12", "r": 72, "g": 118, "b": 211},
-{"color_key": "30-05-14", "r": 46, "g": 118, "b": 225},
-{"color_key": "30-05-16", "r": 43, "g": 116, "b": 241},
-{"color_key": "30-05-18", "r": 40, "g": 115, "b": 254},
+{"color_key": "30-05-02", "r": 122, "g": 120, "b": 141},
+{"color_key": "30-05-04", "r": 118, "g": 119, "b": 154},
+{"color_key": "30-05-06", "r": 114, "g": 118, "b": 169},
+{"color_key": "30-05-08", "r": 110, "g": 117, "b": 183},
+{"color_key": "30-05-10", "r": 105, "g": 116, "b": 196},
+{"color_key": "30-05-12", "r": 99, "g": 114, "b": 210},
+{"color_key": "30-05-14", "r": 93, "g": 113, "b": 225},
+{"color_key": "30-05-16", "r": 86, "g": 110, "b": 239},
+{"color_key": "30-05-18", "r": 80, "g": 107, "b": 254},
 {"color_key": "30-05-20", "r": 74, "g": 104, "b": 255},
-{"color_key": "30-06-02", "r": 146, "g": 146, "b": 167},
-{"color_key": "30-06-04", "r": 140, "g": 146, "b": 181},
-{"color_key": "30-06-06", "r": 133, "g": 146, "b": 196},
-{"color_key": "30-06-08", "r": 125, "g": 145, "b": 210},
-{"color_key": "30-06-10", "r": 116, "g": 145, "b": 224},
-{"color_key": "30-06-12", "r": 101, "g": 145, "b": 241},
-{"color_key": "30-06-14", "r": 77, "g": 144, "b": 255},
-{"color_key": "30-07-02", "r": 173, "g": 171, "b": 193},
-{"color_key": "30-07-04", "r": 167, "g": 172, "b": 208},
-{"color_key": "30-07-06", "r": 159, "g": 172, "b": 223},
-{"color_key": "30-07-08", "r": 150, "g": 171, "b": 239},
-{"color_key": "30-07-10", "r": 139, "g": 171, "b": 255},
-{"color_key": "30-08-02", "r": 200, "g": 198, "b": 220},
-{"color_key": "30-08-04", "r": 193, "g": 198, "b": 236},
-{"color_key": "30-08-06", "r": 184, "g": 198, "b": 254},
-{"color_key": "30-09-02", "r": 227, "g": 225, "b": 248},
-{"color_key": "31-01-02", "r": 27, "g": 27, "b": 45},
-{"color_key": "31-01-04", "r": 23, "g": 25, "b": 55},
-{"color_key": "31-01-06", "r": 19, "g": 23, "b": 67},
-{"color_key": "31-01-08", "r": 20, "g": 20, "b": 77},
-{"color_key": "31-01-10", "r": 22, "g": 15, "b": 87},
-{"color_key": "31-01-12", "r": 36, "g": 3, "b": 92},
-{"color_key": "31-01-14", "r": 39, "g": 0, "b": 101},
-{"color_key": "31-01-16", "r": 44, "g": 0, "b": 109},
-{"color_key": "31-01-18", "r": 47, "g": 0, "b": 116},
-{"color_key": "31-01-20", "r": 52, "g": 0, "b": 124},
-{"color_key": "31-01-22", "r": 56, "g": 0, "b": 132},
-{"color_key": "31-01-24", "r": 60, "g": 0, "b": 141},
-{"color_key": "31-01-26", "r": 65, "g": 0, "b": 152},
-{"color_key": "31-01-28", "r": 71, "g": 0, "b": 162},
-{"color_key": "31-01-30", "r": 77, "g": 0, "b": 174},
-{"color_key": "31-01-32", "r": 72, "g": 0, "b": 189},
-{"color_key": "31-01-34", "r": 77, "g": 0, "b": 199},
-{"color_key": "31-01-36", "r": 82, "g": 0, "b": 210},
-{"color_key": "31-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "31-02-02", "r": 48, "g": 47, "b": 66},
-{"color_key": "31-02-04", "r": 44, "g": 46, "b": 78},
-{"color_key": "31-02-06", "r": 38, "g": 45, "b": 90},
-{"color_key": "31-02-08", "r": 31, "g": 43, "b": 103},
-{"color_key": "31-02-10", "r": 32, "g": 40, "b": 115},
-{"color_key": "31-02-12", "r": 33, "g": 36, "b": 125},
-{"color_key": "31-02-14", "r": 34, "g": 30, "b": 136},
-{"color_key": "31-02-16", "r": 55, "g": 12, "b": 141},
-{"color_key": "31-02-18", "r": 58, "g": 4, "b": 150},
-{"color_key": "31-02-20", "r": 62, "g": 0, "b": 159},
-{"color_key": "31-02-22", "r": 66, "g": 0, "b": 169},
-{"color_key": "31-02-24", "r": 70, "g": 0, "b": 177},
-{"color_key": "31-02-26", "r": 75, "g": 0, "b": 186},
-{"color_key": "31-02-28", "r": 78, "g": 0, "b": 194},
-{"color_key": "31-02-30", "r": 83, "g": 0, "b": 205},
-{"color_key": "31-02-32", "r": 88, "g": 0, "b": 214},
-{"color_key": "31-02-34", "r": 93, "g": 0, "b": 224},
-{"color_key": "31-02-36", "r": 79, "g": 0, "b": 237},
-{"color_key": "31-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "31-03-02", "r": 70, "g": 70, "b": 91},
-{"color_key": "31-03-04", "r": 66, "g": 69, "b": 104},
-{"color_key": "31-03-06", "r": 61, "g": 68, "b": 118},
-{"color_key": "31-03-08", "r": 54, "g": 66, "b": 130},
-{"color_key": "31-03-10", "r": 44, "g": 64, "b": 142},
-{"color_key": "31-03-12", "r": 44, "g": 61, "b": 154},
-{"color_key": "31-03-14", "r": 45, "g": 58, "b": 167},
-{"color_key": "31-03-16", "r": 46, "g": 53, "b": 179},
-{"color_key": "31-03-18", "r": 47, "g": 48, "b": 191},
-{"color_key": "31-03-20", "r": 74, "g": 28, "b": 194},
-{"color_key": "31-03-22", "r": 77, "g": 15, "b": 205},
-{"color_key": "31-03-24", "r": 81, "g": 6, "b": 214},
-{"color_key": "31-03-26", "r": 84, "g": 0, "b": 224},
-{"color_key": "31-03-28", "r": 88, "g": 0, "b": 233},
-{"color_key": "31-03-30", "r": 92, "g": 0, "b": 243},
-{"color_key": "31-03-32", "r": 97, "g": 0, "b": 251},
-{"color_key": "31-03-34", "r": 101, "g": 0, "b": 255},
-{"color_key": "31-04-02", "r": 95, "g": 94, "b": 116},
-{"color_key": "31-04-04", "r": 92, "g": 93, "b": 128},
-{"color_key": "31-04-06", "r": 87, "g": 92, "b": 142},
-{"color_key": "31-04-08", "r": 81, "g": 91, "b": 155},
-{"color_key": "31-04-10", "r": 72, "g": 90, "b": 168},
-{"color_key": "31-04-12", "r": 58, "g": 88, "b": 180},
-{"color_key": "31-04-14", "r": 58, "g": 86, "b": 193},
-{"color_key": "31-04-16", "r": 57, "g": 83, "b": 206},
-{"color_key": "31-04-18", "r": 57, "g": 80, "b": 219},
-{"color_key": "31-04-20", "r": 58, "g": 75, "b": 234},
-{"color_key": "31-04-22", "r": 89, "g": 59, "b": 237},
-{"color_key": "31-04-24", "r": 91, "g": 51, "b": 247},
-{"color_key": "31-04-26", "r": 94, "g": 38, "b": 253},
+{"color_key": "30-06-02", "r": 148, "g": 146, "b": 167},
+{"color_key": "30-06-04", "r": 144, "g": 145, "b": 181},
+{"color_key": "30-06-06", "r": 140, "g": 144, "b": 196},
+{"color_key": "30-06-08", "r": 136, "g": 143, "b": 209},
+{"color_key": "30-06-10", "r": 131, "g": 142, "b": 223},
+{"color_key": "30-06-12", "r": 124, "g": 141, "b": 240},
+{"color_key": "30-06-14", "r": 116, "g": 139, "b": 255},
+{"color_key": "30-07-02", "r": 175, "g": 171, "b": 193},
+{"color_key": "30-07-04", "r": 171, "g": 171, "b": 208},
+{"color_key": "30-07-06", "r": 166, "g": 170, "b": 223},
+{"color_key": "30-07-08", "r": 160, "g": 169, "b": 240},
+{"color_key": "30-07-10", "r": 155, "g": 168, "b": 255},
+{"color_key": "30-08-02", "r": 202, "g": 198, "b": 220},
+{"color_key": "30-08-04", "r": 197, "g": 197, "b": 236},
+{"color_key": "30-08-06", "r": 191, "g": 197, "b": 254},
+{"color_key": "30-09-02", "r": 229, "g": 225, "b": 248},
+{"color_key": "31-01-02", "r": 32, "g": 26, "b": 45},
+{"color_key": "31-01-04", "r": 33, "g": 23, "b": 55},
+{"color_key": "31-01-06", "r": 35, "g": 19, "b": 65},
+{"color_key": "31-01-08", "r": 38, "g": 14, "b": 73},
+{"color_key": "31-01-10", "r": 41, "g": 7, "b": 81},
+{"color_key": "31-01-12", "r": 44, "g": 0, "b": 90},
+{"color_key": "31-01-14", "r": 48, "g": 0, "b": 98},
+{"color_key": "31-01-16", "r": 53, "g": 0, "b": 106},
+{"color_key": "31-01-18", "r": 56, "g": 0, "b": 113},
+{"color_key": "31-01-20", "r": 61, "g": 0, "b": 121},
+{"color_key": "31-01-22", "r": 65, "g": 0, "b": 129},
+{"color_key": "31-01-24", "r": 70, "g": 0, "b": 138},
+{"color_key": "31-01-26", "r": 75, "g": 0, "b": 149},
+{"color_key": "31-01-28", "r": 82, "g": 0, "b": 160},
+{"color_key": "31-01-30", "r": 88, "g": 0, "b": 172},
+{"color_key": "31-02-02", "r": 52, "g": 46, "b": 66},
+{"color_key": "31-02-04", "r": 53, "g": 44, "b": 77},
+{"color_key": "31-02-06", "r": 54, "g": 41, "b": 88},
+{"color_key": "31-02-08", "r": 56, "g": 38, "b": 99},
+{"color_key": "31-02-10", "r": 59, "g": 33, "b": 110},
+{"color_key": "31-02-12", "r": 62, "g": 27, "b": 118},
+{"color_key": "31-02-14", "r": 65, "g": 17, "b": 128},
+{"color_key": "31-02-16", "r": 69, "g": 2, "b": 137},
+{"color_key": "31-02-18", "r": 73, "g": 0, "b": 146},
+{"color_key": "31-02-20", "r": 77, "g": 0, "b": 155},
+{"color_key": "31-02-22", "r": 82, "g": 0, "b": 164},
+{"color_key": "31-02-24", "r": 86, "g": 0, "b": 173},
+{"color_key": "31-02-26", "r": 91, "g": 0, "b": 182},
+{"color_key": "31-02-28", "r": 95, "g": 0, "b": 191},
+{"color_key": "31-02-30", "r": 101, "g": 0, "b": 202},
+{"color_key": "31-02-32", "r": 107, "g": 0, "b": 212},
+{"color_key": "31-02-34", "r": 112, "g": 0, "b": 222},
+{"color_key": "31-03-02", "r": 75, "g": 69, "b": 91},
+{"color_key": "31-03-04", "r": 75, "g": 67, "b": 104},
+{"color_key": "31-03-06", "r": 76, "g": 64, "b": 116},
+{"color_key": "31-03-08", "r": 78, "g": 61, "b": 127},
+{"color_key": "31-03-10", "r": 79, "g": 57, "b": 139},
+{"color_key": "31-03-12", "r": 81, "g": 53, "b": 149},
+{"color_key": "31-03-14", "r": 84, "g": 47, "b": 160},
+{"color_key": "31-03-16", "r": 88, "g": 39, "b": 171},
+{"color_key": "31-03-18", "r": 91, "g": 30, "b": 180},
+{"color_key": "31-03-20", "r": 95, "g": 16, "b": 189},
+{"color_key": "31-03-22", "r": 99, "g": 0, "b": 199},
+{"color_key": "31-03-24", "r": 103, "g": 0, "b": 208},
+{"color_key": "31-03-26", "r": 107, "g": 0, "b": 218},
+{"color_key": "31-03-28", "r": 112, "g": 0, "b": 227},
+{"color_key": "31-03-30", "r": 117, "g": 0, "b": 237},
+{"color_key": "31-03-32", "r": 123, "g": 0, "b": 248},
+{"color_key": "31-03-34", "r": 127, "g": 0, "b": 255},
+{"color_key": "31-04-02", "r": 99, "g": 93, "b": 116},
+{"color_key": "31-04-04", "r": 100, "g": 91, "b": 128},
+{"color_key": "31-04-06", "r": 100, "g": 89, "b": 141},
+{"color_key": "31-04-08", "r": 101, "g": 87, "b": 153},
+{"color_key": "31-04-10", "r": 101, "g": 84, "b": 165},
+{"color_key": "31-04-12", "r": 102, "g": 80, "b": 177},
+{"color_key": "31-04-14", "r": 104, "g": 77, "b": 188},
+{"color_key": "31-04-16", "r": 107, "g": 72, "b": 199},
+{"color_key": "31-04-18", "r": 109, "g": 66, "b": 210},
+{"color_key": "31-04-20", "r": 113, "g": 58, "b": 222},
+{"color_key": "31-04-22", "r": 116, "g": 51, "b": 230},
+{"color_key": "31-04-24", "r": 119, "g": 41, "b": 240},
+{"color_key": "31-04-26", "r": 124, "g": 22, "b": 251},
 {"color_key": "31-04-28", "r": 127, "g": 0, "b": 255},
 {"color_key": "31-04-30", "r": 131, "g": 0, "b": 255},
-{"color_key": "31-05-02", "r": 122, "g": 120, "b": 140},
-{"color_key": "31-05-04", "r": 118, "g": 119, "b": 154},
-{"color_key": "31-05-06", "r": 113, "g": 118, "b": 168},
-{"color_key": "31-05-08", "r": 107, "g": 117, "b": 182},
-{"color_key": "31-05-10", "r": 101, "g": 116, "b": 195},
-{"color_key": "31-05-12", "r": 90, "g": 114, "b": 209},
-{"color_key": "31-05-14", "r": 73, "g": 113, "b": 223},
-{"color_key": "31-05-16", "r": 71, "g": 111, "b": 237},
-{"color_key": "31-05-18", "r": 69, "g": 108, "b": 250},
-{"color_key": "31-05-20", "r": 102, "g": 97, "b": 254},
+{"color_key": "31-05-02", "r": 125, "g": 119, "b": 140},
+{"color_key": "31-05-04", "r": 125, "g": 117, "b": 153},
+{"color_key": "31-05-06", "r": 125, "g": 115, "b": 168},
+{"color_key": "31-05-08", "r": 125, "g": 113, "b": 180},
+{"color_key": "31-05-10", "r": 126, "g": 110, "b": 192},
+{"color_key": "31-05-12", "r": 126, "g": 107, "b": 205},
+{"color_key": "31-05-14", "r": 127, "g": 104, "b": 218},
+{"color_key": "31-05-16", "r": 128, "g": 100, "b": 230},
+{"color_key": "31-05-18", "r": 129, "g": 96, "b": 241},
+{"color_key": "31-05-20", "r": 131, "g": 91, "b": 253},
 {"color_key": "31-05-22", "r": 135, "g": 84, "b": 255},
-{"color_key": "31-06-02", "r": 148, "g": 146, "b": 166},
-{"color_key": "31-06-04", "r": 144, "g": 145, "b": 180},
-{"color_key": "31-06-06", "r": 139, "g": 144, "b": 195},
-{"color_key": "31-06-08", "r": 133, "g": 143, "b": 209},
-{"color_key": "31-06-10", "r": 127, "g": 142, "b": 222},
-{"color_key": "31-06-12", "r": 117, "g": 141, "b": 238},
-{"color_key": "31-06-14", "r": 101, "g": 139, "b": 253},
+{"color_key": "31-06-02", "r": 151, "g": 145, "b": 166},
+{"color_key": "31-06-04", "r": 151, "g": 143, "b": 180},
+{"color_key": "31-06-06", "r": 150, "g": 141, "b": 194},
+{"color_key": "31-06-08", "r": 150, "g": 139, "b": 207},
+{"color_key": "31-06-10", "r": 150, "g": 137, "b": 220},
+{"color_key": "31-06-12", "r": 150, "g": 134, "b": 234},
+{"color_key": "31-06-14", "r": 150, "g": 131, "b": 249},
 {"color_key": "31-06-16", "r": 151, "g": 127, "b": 255},
-{"color_key": "31-07-02", "r": 174, "g": 171, "b": 193},
-{"color_key": "31-07-04", "r": 170, "g": 171, "b": 207},
-{"color_key": "31-07-06", "r": 164, "g": 170, "b": 222},
-{"color_key": "31-07-08", "r": 159, "g": 169, "b": 238},
-{"color_key": "31-07-10", "r": 151, "g": 168, "b": 254},
+{"color_key": "31-07-02", "r": 177, "g": 171, "b": 193},
+{"color_key": "31-07-04", "r": 176, "g": 169, "b": 207},
+{"color_key": "31-07-06", "r": 176, "g": 167, "b": 221},
+{"color_key": "31-07-08", "r": 176, "g": 165, "b": 236},
+{"color_key": "31-07-10", "r": 175, "g": 163, "b": 252},
 {"color_key": "31-07-12", "r": 175, "g": 159, "b": 255},
-{"color_key": "31-08-02", "r": 201, "g": 198, "b": 219},
-{"color_key": "31-08-04", "r": 196, "g": 197, "b": 235},
-{"color_key": "31-08-06", "r": 190, "g": 197, "b": 253},
+{"color_key": "31-08-02", "r": 204, "g": 197, "b": 219},
+{"color_key": "31-08-04", "r": 203, "g": 196, "b": 234},
+{"color_key": "31-08-06", "r": 202, "g": 194, "b": 251},
 {"color_key": "31-08-08", "r": 202, "g": 191, "b": 255},
-{"color_key": "31-09-02", "r": 229, "g": 224, "b": 247},
+{"color_key": "31-09-02", "r": 232, "g": 224, "b": 247},
 {"color_key": "31-09-04", "r": 230, "g": 222, "b": 255},
-{"color_key": "32-01-02", "r": 29, "g": 26, "b": 44},
-{"color_key": "32-01-04", "r": 27, "g": 24, "b": 55},
-{"color_key": "32-01-06", "r": 25, "g": 21, "b": 65},
-{"color_key": "32-01-08", "r": 27, "g": 17, "b": 75},
-{"color_key": "32-01-10", "r": 29, "g": 11, "b": 84},
-{"color_key": "32-01-12", "r": 42, "g": 2, "b": 89},
-{"color_key": "32-01-14", "r": 46, "g": 0, "b": 98},
-{"color_key": "32-01-16", "r": 51, "g": 0, "b": 106},
-{"color_key": "32-01-18", "r": 54, "g": 0, "b": 113},
-{"color_key": "32-01-20", "r": 59, "g": 0, "b": 121},
-{"color_key": "32-01-22", "r": 63, "g": 0, "b": 129},
-{"color_key": "32-01-24", "r": 68, "g": 0, "b": 137},
-{"color_key": "32-01-26", "r": 73, "g": 0, "b": 148},
-{"color_key": "32-01-28", "r": 71, "g": 0, "b": 162},
-{"color_key": "32-01-30", "r": 77, "g": 0, "b": 174},
-{"color_key": "32-01-32", "r": 72, "g": 0, "b": 189},
-{"color_key": "32-01-34", "r": 77, "g": 0, "b": 199},
-{"color_key": "32-01-36", "r": 82, "g": 0, "b": 210},
-{"color_key": "32-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "32-02-02", "r": 49, "g": 47, "b": 65},
-{"color_key": "32-02-04", "r": 47, "g": 45, "b": 77},
-{"color_key": "32-02-06", "r": 44, "g": 43, "b": 88},
-{"color_key": "32-02-08", "r": 40, "g": 40, "b": 100},
-{"color_key": "32-02-10", "r": 41, "g": 36, "b": 112},
-{"color_key": "32-02-12", "r": 43, "g": 31, "b": 122},
-{"color_key": "32-02-14", "r": 46, "g": 23, "b": 132},
-{"color_key": "32-02-16", "r": 65, "g": 8, "b": 137},
-{"color_key": "32-02-18", "r": 69, "g": 2, "b": 146},
-{"color_key": "32-02-20", "r": 73, "g": 0, "b": 155},
-{"color_key": "32-02-22", "r": 77, "g": 0, "b": 164},
-{"color_key": "32-02-24", "r": 82, "g": 0, "b": 173},
-{"color_key": "32-02-26", "r": 87, "g": 0, "b": 181},
-{"color_key": "32-02-28", "r": 91, "g": 0, "b": 191},
-{"color_key": "32-02-30", "r": 97, "g": 0, "b": 202},
-{"color_key": "32-02-32", "r": 88, "g": 0, "b": 214},
-{"color_key": "32-02-34", "r": 93, "g": 0, "b": 224},
-{"color_key": "32-02-36", "r": 79, "g": 0, "b": 237},
-{"color_key": "32-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "32-03-02", "r": 72, "g": 69, "b": 91},
-{"color_key": "32-03-04", "r": 70, "g": 68, "b": 104},
-{"color_key": "32-03-06", "r": 67, "g": 66, "b": 116},
-{"color_key": "32-03-08", "r": 63, "g": 64, "b": 128},
-{"color_key": "32-03-10", "r": 57, "g": 61, "b": 140},
-{"color_key": "32-03-12", "r": 57, "g": 57, "b": 151},
-{"color_key": "32-03-14", "r": 59, "g": 53, "b": 163},
-{"color_key": "32-03-16", "r": 61, "g": 46, "b": 174},
-{"color_key": "32-03-18", "r": 64, "g": 37, "b": 185},
-{"color_key": "32-03-20", "r": 88, "g": 18, "b": 189},
-{"color_key": "32-03-22", "r": 92, "g": 10, "b": 199},
-{"color_key": "32-03-24", "r": 96, "g": 4, "b": 208},
-{"color_key": "32-03-26", "r": 100, "g": 0, "b": 218},
-{"color_key": "32-03-28", "r": 104, "g": 0, "b": 227},
-{"color_key": "32-03-30", "r": 109, "g": 0, "b": 237},
-{"color_key": "32-03-32", "r": 115, "g": 0, "b": 246},
-{"color_key": "32-03-34", "r": 119, "g": 0, "b": 251},
-{"color_key": "32-04-02", "r": 97, "g": 94, "b": 115},
-{"color_key": "32-04-04", "r": 95, "g": 92, "b": 128},
-{"color_key": "32-04-06", "r": 93, "g": 91, "b": 140},
-{"color_key": "32-04-08", "r": 89, "g": 89, "b": 153},
-{"color_key": "32-04-10", "r": 83, "g": 87, "b": 165},
-{"color_key": "32-04-12", "r": 74, "g": 84, "b": 177},
-{"color_key": "32-04-14", "r": 74, "g": 82, "b": 190},
-{"color_key": "32-04-16", "r": 75, "g": 78, "b": 202},
-{"color_key": "32-04-18", "r": 77, "g": 73, "b": 214},
-{"color_key": "32-04-20", "r": 78, "g": 67, "b": 227},
-{"color_key": "32-04-22", "r": 107, "g": 49, "b": 230},
-{"color_key": "32-04-24", "r": 110, "g": 34, "b": 240},
-{"color_key": "32-04-26", "r": 114, "g": 25, "b": 247},
-{"color_key": "32-04-28", "r": 143, "g": 0, "b": 250},
-{"color_key": "32-04-30", "r": 147, "g": 0, "b": 255},
+{"color_key": "32-01-02", "r": 35, "g": 25, "b": 44},
+{"color_key": "32-01-04", "r": 38, "g": 21, "b": 53},
+{"color_key": "32-01-06", "r": 42, "g": 16, "b": 61},
+{"color_key": "32-01-08", "r": 46, "g": 9, "b": 69},
+{"color_key": "32-01-10", "r": 50, "g": 0, "b": 76},
+{"color_key": "32-01-12", "r": 55, "g": 0, "b": 84},
+{"color_key": "32-01-14", "r": 59, "g": 0, "b": 92},
+{"color_key": "32-01-16", "r": 64, "g": 0, "b": 99},
+{"color_key": "32-01-18", "r": 68, "g": 0, "b": 106},
+{"color_key": "32-01-20", "r": 73, "g": 0, "b": 114},
+{"color_key": "32-01-22", "r": 78, "g": 0, "b": 122},
+{"color_key": "32-01-24", "r": 83, "g": 0, "b": 129},
+{"color_key": "32-01-26", "r": 90, "g": 0, "b": 140},
+{"color_key": "32-02-02", "r": 55, "g": 46, "b": 65},
+{"color_key": "32-02-04", "r": 58, "g": 43, "b": 75},
+{"color_key": "32-02-06", "r": 62, "g": 39, "b": 84},
+{"color_key": "32-02-08", "r": 67, "g": 34, "b": 94},
+{"color_key": "32-02-10", "r": 71, "g": 27, "b": 103},
+{"color_key": "32-02-12", "r": 76, "g": 17, "b": 112},
+{"color_key": "32-02-14", "r": 80, "g": 1, "b": 120},
+{"color_key": "32-02-16", "r": 85, "g": 0, "b": 129},
+{"color_key": "32-02-18", "r": 90, "g": 0, "b": 137},
+{"color_key": "32-02-20", "r": 95, "g": 0, "b": 146},
+{"color_key": "32-02-22", "r": 100, "g": 0, "b": 155},
+{"color_key": "32-02-24", "r": 106, "g": 0, "b": 164},
+{"color_key": "32-02-26", "r": 111, "g": 0, "b": 173},
+{"color_key": "32-02-28", "r": 118, "g": 0, "b": 184},
+{"color_key": "32-02-30", "r": 126, "g": 0, "b": 196},
+{"color_key": "32-03-02", "r": 78, "g": 68, "b": 90},
+{"color_key": "32-03-04", "r": 82, "g": 65, "b": 102},
+{"color_key": "32-03-06", "r": 85, "g": 61, "b": 113},
+{"color_key": "32-03-08", "r": 89, "g": 57, "b": 123},
+{"color_key": "32-03-10", "r": 94, "g": 51, "b": 133},
+{"color_key": "32-03-12", "r": 98, "g": 45, "b": 142},
+{"color_key": "32-03-14", "r": 103, "g": 37, "b": 152},
+{"color_key": "32-03-16", "r": 108, "g": 25, "b": 161},
+{"color_key": "32-03-18", "r": 113, "g": 4, "b": 170},
+{"color_key": "32-03-20", "r": 117, "g": 0, "b": 178},
+{"color_key": "32-03-22", "r": 123, "g": 0, "b": 188},
+{"color_key": "32-03-24", "r": 128, "g": 0, "b": 197},
+{"color_key": "32-03-26", "r": 133, "g": 0, "b": 206},
+{"color_key": "32-03-28", "r": 138, "g": 0, "b": 215},
+{"color_key": "32-03-30", "r": 144, "g": 0, "b": 225},
+{"color_key": "32-03-32", "r": 150, "g": 0, "b": 235},
+{"color_key": "32-03-34", "r": 156, "g": 0, "b": 244},
+{"color_key": "32-04-02", "r": 102, "g": 93, "b": 115},
+{"color_key": "32-04-04", "r": 106, "g": 90, "b": 127},
+{"color_key": "32-04-06", "r": 109, "g": 87, "b": 137},
+{"color_key": "32-04-08", "r": 112, "g": 83, "b": 148},
+{"color_key": "32-04-10", "r": 116, "g": 79, "b": 158},
+{"color_key": "32-04-12", "r": 121, "g": 74, "b": 169},
+{"color_key": "32-04-14", "r": 125, "g": 69, "b": 179},
+{"color_key": "32-04-16", "r": 130, "g": 62, "b": 189},
+{"color_key": "32-04-18", "r": 135, "g": 53, "b": 199},
+{"color_key": "32-04-20", "r": 140, "g": 42, "b": 209},
+{"color_key": "32-04-22", "r": 144, "g": 29, "b": 217},
+{"color_key": "32-04-24", "r": 149, "g": 0, "b": 226},
+{"color_key": "32-04-26", "r": 154, "g": 0, "b": 237},
+{"color_key": "32-04-28", "r": 159, "g": 0, "b": 246},
+{"color_key": "32-04-30", "r": 164, "g": 0, "b": 255},
 {"color_key": "32-04-32", "r": 171, "g": 0, "b": 255},
-{"color_key": "32-05-02", "r": 123, "g": 119, "b": 140},
-{"color_key": "32-05-04", "r": 121, "g": 118, "b": 153},
-{"color_key": "32-05-06", "r": 118, "g": 117, "b": 167},
-{"color_key": "32-05-08", "r": 115, "g": 115, "b": 180},
-{"color_key": "32-05-10", "r": 111, "g": 113, "b": 193},
-{"color_key": "32-05-12", "r": 104, "g": 111, "b": 206},
-{"color_key": "32-05-14", "r": 92, "g": 109, "b": 219},
-{"color_key": "32-05-16", "r": 91, "g": 106, "b": 232},
-{"color_key": "32-05-18", "r": 91, "g": 103, "b": 244},
-{"color_key": "32-05-20", "r": 122, "g": 91, "b": 249},
-{"color_key": "32-05-22", "r": 151, "g": 76, "b": 252},
+{"color_key": "32-05-02", "r": 128, "g": 118, "b": 139},
+{"color_key": "32-05-04", "r": 130, "g": 116, "b": 152},
+{"color_key": "32-05-06", "r": 133, "g": 113, "b": 164},
+{"color_key": "32-05-08", "r": 137, "g": 109, "b": 176},
+{"color_key": "32-05-10", "r": 141, "g": 106, "b": 186},
+{"color_key": "32-05-12", "r": 145, "g": 101, "b": 198},
+{"color_key": "32-05-14", "r": 149, "g": 97, "b": 208},
+{"color_key": "32-05-16", "r": 153, "g": 91, "b": 218},
+{"color_key": "32-05-18", "r": 158, "g": 86, "b": 228},
+{"color_key": "32-05-20", "r": 162, "g": 78, "b": 239},
+{"color_key": "32-05-22", "r": 167, "g": 69, "b": 250},
 {"color_key": "32-05-24", "r": 172, "g": 58, "b": 255},
 {"color_key": "32-05-26", "r": 178, "g": 42, "b": 255},
-{"color_key": "32-06-02", "r": 149, "g": 145, "b": 166},
-{"color_key": "32-06-04", "r": 147, "g": 144, "b": 180},
-{"color_key": "32-06-06", "r": 144, "g": 143, "b": 194},
-{"color_key": "32-06-08", "r": 140, "g": 141, "b": 207},
-{"color_key": "32-06-10", "r": 137, "g": 139, "b": 220},
-{"color_key": "32-06-12", "r": 130, "g": 138, "b": 235},
-{"color_key": "32-06-14", "r": 119, "g": 135, "b": 249},
-{"color_key": "32-06-16", "r": 165, "g": 122, "b": 253},
+{"color_key": "32-06-02", "r": 153, "g": 144, "b": 166},
+{"color_key": "32-06-04", "r": 156, "g": 142, "b": 178},
+{"color_key": "32-06-06", "r": 159, "g": 139, "b": 191},
+{"color_key": "32-06-08", "r": 162, "g": 136, "b": 203},
+{"color_key": "32-06-10", "r": 166, "g": 132, "b": 215},
+{"color_key": "32-06-12", "r": 170, "g": 128, "b": 227},
+{"color_key": "32-06-14", "r": 174, "g": 124, "b": 238},
+{"color_key": "32-06-16", "r": 179, "g": 118, "b": 251},
 {"color_key": "32-06-18", "r": 183, "g": 113, "b": 255},
-{"color_key": "32-07-02", "r": 176, "g": 171, "b": 192},
-{"color_key": "32-07-04", "r": 173, "g": 170, "b": 207},
-{"color_key": "32-07-06", "r": 169, "g": 169, "b": 221},
-{"color_key": "32-07-08", "r": 166, "g": 167, "b": 236},
-{"color_key": "32-07-10", "r": 161, "g": 166, "b": 251},
-{"color_key": "32-07-12", "r": 185, "g": 156, "b": 255},
-{"color_key": "32-08-02", "r": 202, "g": 197, "b": 219},
-{"color_key": "32-08-04", "r": 199, "g": 196, "b": 234},
-{"color_key": "32-08-06", "r": 195, "g": 195, "b": 251},
-{"color_key": "32-08-08", "r": 208, "g": 189, "b": 255},
-{"color_key": "32-09-02", "r": 230, "g": 224, "b": 247},
-{"color_key": "32-09-04", "r": 233, "g": 221, "b": 255},
-{"color_key": "33-01-02", "r": 30, "g": 26, "b": 44},
-{"color_key": "33-01-04", "r": 30, "g": 23, "b": 54},
-{"color_key": "33-01-06", "r": 29, "g": 20, "b": 64},
-{"color_key": "33-01-08", "r": 31, "g": 14, "b": 73},
-{"color_key": "33-01-10", "r": 34, "g": 9, "b": 82},
-{"color_key": "33-01-12", "r": 47, "g": 1, "b": 87},
-{"color_key": "33-01-14", "r": 51, "g": 0, "b": 95},
-{"color_key": "33-01-16", "r": 56, "g": 0, "b": 103},
-{"color_key": "33-01-18", "r": 60, "g": 0, "b": 109},
-{"color_key": "33-01-20", "r": 64, "g": 0, "b": 117},
-{"color_key": "33-01-22", "r": 69, "g": 0, "b": 125},
-{"color_key": "33-01-24", "r": 68, "g": 0, "b": 137},
-{"color_key": "33-01-26", "r": 73, "g": 0, "b": 148},
-{"color_key": "33-01-28", "r": 71, "g": 0, "b": 162},
-{"color_key": "33-01-30", "r": 77, "g": 0, "b": 174},
-{"color_key": "33-01-32", "r": 72, "g": 0, "b": 189},
-{"color_key": "33-01-34", "r": 77, "g": 0, "b": 199},
-{"color_key": "33-01-36", "r": 82, "g": 0, "b": 210},
-{"color_key": "33-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "33-02-02", "r": 51, "g": 46, "b": 65},
-{"color_key": "33-02-04", "r": 50, "g": 44, "b": 76},
-{"color_key": "33-02-06", "r": 49, "g": 42, "b": 87},
-{"color_key": "33-02-08", "r": 47, "g": 38, "b": 98},
-{"color_key": "33-02-10", "r": 49, "g": 33, "b": 109},
-{"color_key": "33-02-12", "r": 51, "g": 26, "b": 118},
-{"color_key": "33-02-14", "r": 54, "g": 18, "b": 129},
-{"color_key": "33-02-16", "r": 72, "g": 6, "b": 133},
-{"color_key": "33-02-18", "r": 76, "g": 2, "b": 142},
-{"color_key": "33-02-20", "r": 81, "g": 0, "b": 150},
-{"color_key": "33-02-22", "r": 86, "g": 0, "b": 159},
-{"color_key": "33-02-24", "r": 91, "g": 0, "b": 168},
-{"color_key": "33-02-26", "r": 96, "g": 0, "b": 177},
-{"color_key": "33-02-28", "r": 102, "g": 0, "b": 187},
-{"color_key": "33-02-30", "r": 97, "g": 0, "b": 202},
-{"color_key": "33-02-32", "r": 88, "g": 0, "b": 214},
-{"color_key": "33-02-34", "r": 93, "g": 0, "b": 224},
-{"color_key": "33-02-36", "r": 79, "g": 0, "b": 237},
-{"color_key": "33-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "33-03-02", "r": 74, "g": 69, "b": 90},
-{"color_key": "33-03-04", "r": 73, "g": 67, "b": 103},
-{"color_key": "33-03-06", "r": 72, "g": 64, "b": 115},
-{"color_key": "33-03-08", "r": 70, "g": 62, "b": 126},
-{"color_key": "33-03-10", "r": 66, "g": 58, "b": 137},
-{"color_key": "33-03-12", "r": 68, "g": 53, "b": 148},
-{"color_key": "33-03-14", "r": 70, "g": 48, "b": 159},
-{"color_key": "33-03-16", "r": 73, "g": 38, "b": 170},
-{"color_key": "33-03-18", "r": 76, "g": 30, "b": 180},
-{"color_key": "33-03-20", "r": 99, "g": 14, "b": 183},
-{"color_key": "33-03-22", "r": 103, "g": 7, "b": 193},
-{"color_key": "33-03-24", "r": 108, "g": 3, "b": 203},
-{"color_key": "33-03-26", "r": 112, "g": 0, "b": 212},
-{"color_key": "33-03-28", "r": 117, "g": 0, "b": 221},
-{"color_key": "33-03-30", "r": 122, "g": 0, "b": 231},
-{"color_key": "33-03-32", "r": 128, "g": 0, "b": 240},
-{"color_key": "33-03-34", "r": 119, "g": 0, "b": 251},
-{"color_key": "33-04-02", "r": 98, "g": 93, "b": 115},
-{"color_key": "33-04-04", "r": 98, "g": 91, "b": 127},
-{"color_key": "33-04-06", "r": 97, "g": 90, "b": 139},
-{"color_key": "33-04-08", "r": 95, "g": 87, "b": 151},
-{"color_key": "33-04-10", "r": 92, "g": 85, "b": 162},
-{"color_key": "33-04-12", "r": 85, "g": 81, "b": 174},
-{"color_key": "33-04-14", "r": 87, "g": 78, "b": 186},
-{"color_key": "33-04-16", "r": 89, "g": 73, "b": 197},
-{"color_key": "33-04-18", "r": 91, "g": 67, "b": 209},
-{"color_key": "33-04-20", "r": 94, "g": 58, "b": 221},
-{"color_key": "33-04-22", "r": 120, "g": 37, "b": 224},
-{"color_key": "33-04-24", "r": 124, "g": 25, "b": 233},
-{"color_key": "33-04-26", "r": 128, "g": 19, "b": 241},
-{"color_key": "33-04-28", "r": 155, "g": 0, "b": 244},
-{"color_key": "33-04-30", "r": 160, "g": 0, "b": 250},
-{"color_key": "33-04-32", "r": 182, "g": 0, "b": 254},
-{"color_key": "33-05-02", "r": 124, "g": 119, "b": 139},
-{"color_key": "33-05-04", "r": 123, "g": 117, "b": 152},
-{"color_key": "33-05-06", "r": 122, "g": 115, "b": 166},
-{"color_key": "33-05-08", "r": 121, "g": 113, "b": 178},
-{"color_key": "33-05-10", "r": 119, "g": 111, "b": 190},
-{"color_key": "33-05-12", "r": 114, "g": 108, "b": 203},
-{"color_key": "33-05-14", "r": 106, "g": 105, "b": 215},
-{"color_key": "33-05-16", "r": 107, "g": 101, "b": 227},
-{"color_key": "33-05-18", "r": 108, "g": 97, "b": 239},
-{"color_key": "33-05-20", "r": 136, "g": 85, "b": 243},
-{"color_key": "33-05-22", "r": 162, "g": 69, "b": 247},
-{"color_key": "33-05-24", "r": 182, "g": 48, "b": 251},
-{"color_key": "33-05-26", "r": 188, "g": 21, "b": 255},
+{"color_key": "32-07-02", "r": 180, "g": 170, "b": 192},
+{"color_key": "32-07-04", "r": 182, "g": 168, "b": 205},
+{"color_key": "32-07-06", "r": 185, "g": 165, "b": 218},
+{"color_key": "32-07-08", "r": 188, "g": 162, "b": 231},
+{"color_key": "32-07-10", "r": 192, "g": 158, "b": 245},
+{"color_key": "32-07-12", "r": 196, "g": 154, "b": 255},
+{"color_key": "32-08-02", "r": 206, "g": 196, "b": 218},
+{"color_key": "32-08-04", "r": 209, "g": 194, "b": 233},
+{"color_key": "32-08-06", "r": 211, "g": 191, "b": 248},
+{"color_key": "32-08-08", "r": 214, "g": 188, "b": 255},
+{"color_key": "32-09-02", "r": 234, "g": 223, "b": 247},
+{"color_key": "32-09-04", "r": 236, "g": 221, "b": 255},
+{"color_key": "33-01-02", "r": 37, "g": 24, "b": 43},
+{"color_key": "33-01-04", "r": 42, "g": 20, "b": 51},
+{"color_key": "33-01-06", "r": 47, "g": 14, "b": 58},
+{"color_key": "33-01-08", "r": 51, "g": 5, "b": 65},
+{"color_key": "33-01-10", "r": 56, "g": 0, "b": 72},
+{"color_key": "33-01-12", "r": 61, "g": 0, "b": 79},
+{"color_key": "33-01-14", "r": 67, "g": 0, "b": 87},
+{"color_key": "33-01-16", "r": 72, "g": 0, "b": 94},
+{"color_key": "33-01-18", "r": 77, "g": 0, "b": 100},
+{"color_key": "33-01-20", "r": 82, "g": 0, "b": 107},
+{"color_key": "33-01-22", "r": 88, "g": 0, "b": 115},
+{"color_key": "33-02-02", "r": 57, "g": 45, "b": 64},
+{"color_key": "33-02-04", "r": 62, "g": 41, "b": 73},
+{"color_key": "33-02-06", "r": 67, "g": 37, "b": 80},
+{"color_key": "33-02-08", "r": 73, "g": 30, "b": 90},
+{"color_key": "33-02-10", "r": 78, "g": 22, "b": 98},
+{"color_key": "33-02-12", "r": 84, "g": 8, "b": 106},
+{"color_key": "33-02-14", "r": 90, "g": 0, "b": 115},
+{"color_key": "33-02-16", "r": 95, "g": 0, "b": 122},
+{"color_key": "33-02-18", "r": 100, "g": 0, "b": 130},
+{"color_key": "33-02-20", "r": 106, "g": 0, "b": 138},
+{"color_key": "33-02-22", "r": 112, "g": 0, "b": 146},
+{"color_key": "33-02-24", "r": 118, "g": 0, "b": 155},
+{"color_key": "33-02-26", "r": 126, "g": 0, "b": 165},
+{"color_key": "33-02-28", "r": 133, "g": 0, "b": 175},
+{"color_key": "33-03-02", "r": 81, "g": 67, "b": 89},
+{"color_key": "33-03-04", "r": 87, "g": 63, "b": 99},
+{"color_key": "33-03-06", "r": 92, "g": 59, "b": 108},
+{"color_key": "33-03-08", "r": 97, "g": 54, "b": 118},
+{"color_key": "33-03-10", "r": 103, "g": 47, "b": 127},
+{"color_key": "33-03-12", "r": 109, "g": 39, "b": 136},
+{"color_key": "33-03-14", "r": 115, "g": 28, "b": 145},
+{"color_key": "33-03-16", "r": 120, "g": 7, "b": 153},
+{"color_key": "33-03-18", "r": 126, "g": 0, "b": 161},
+{"color_key": "33-03-20", "r": 131, "g": 0, "b": 168},
+{"color_key": "33-03-22", "r": 137, "g": 0, "b": 177},
+{"color_key": "33-03-24", "r": 143, "g": 0, "b": 186},
+{"color_key": "33-03-26", "r": 149, "g": 0, "b": 195},
+{"color_key": "33-03-28", "r": 156, "g": 0, "b": 204},
+{"color_key": "33-03-30", "r": 162, "g": 0, "b": 213},
+{"color_key": "33-03-32", "r": 170, "g": 0, "b": 223},
+{"color_key": "33-04-02", "r": 105, "g": 92, "b": 113},
+{"color_key": "33-04-04", "r": 110, "g": 88, "b": 124},
+{"color_key": "33-04-06", "r": 115, "g": 85, "b": 133},
+{"color_key": "33-04-08", "r": 121, "g": 81, "b": 143},
+{"color_key": "33-04-10", "r": 126, "g": 75, "b": 152},
+{"color_key": "33-04-12", "r": 132, "g": 70, "b": 162},
+{"color_key": "33-04-14", "r": 138, "g": 63, "b": 171},
+{"color_key": "33-04-16", "r": 144, "g": 53, "b": 181},
+{"color_key": "33-04-18", "r": 150, "g": 42, "b": 189},
+{"color_key": "33-04-20", "r": 156, "g": 25, "b": 198},
+{"color_key": "33-04-22", "r": 161, "g": 0, "b": 206},
+{"color_key": "33-04-24", "r": 167, "g": 0, "b": 214},
+{"color_key": "33-04-26", "r": 173, "g": 0, "b": 223},
+{"color_key": "33-04-28", "r": 179, "g": 0, "b": 233},
+{"color_key": "33-04-30", "r": 185, "g": 0, "b": 242},
+{"color_key": "33-04-32", "r": 193, "g": 0, "b": 253},
+{"color_key": "33-05-02", "r": 130, "g": 118, "b": 138},
+{"color_key": "33-05-04", "r": 135, "g": 114, "b": 149},
+{"color_key": "33-05-06", "r": 141, "g": 111, "b": 160},
+{"color_key": "33-05-08", "r": 146, "g": 106, "b": 170},
+{"color_key": "33-05-10", "r": 152, "g": 102, "b": 180},
+{"color_key": "33-05-12", "r": 157, "g": 97, "b": 190},
+{"color_key": "33-05-14", "r": 163, "g": 91, "b": 199},
+{"color_key": "33-05-16", "r": 168, "g": 85, "b": 209},
+{"color_key": "33-05-18", "r": 174, "g": 77, "b": 218},
+{"color_key": "33-05-20", "r": 180, "g": 68, "b": 228},
+{"color_key": "33-05-22", "r": 186, "g": 56, "b": 237},
+{"color_key": "33-05-24", "r": 193, "g": 38, "b": 247},
+{"color_key": "33-05-26", "r": 199, "g": 0, "b": 255},
 {"color_key": "33-05-28", "r": 206, "g": 0, "b": 255},
-{"color_key": "33-06-02", "r": 150, "g": 145, "b": 166},
-{"color_key": "33-06-04", "r": 149, "g": 143, "b": 179},
-{"color_key": "33-06-06", "r": 148, "g": 141, "b": 192},
-{"color_key": "33-06-08", "r": 146, "g": 139, "b": 205},
-{"color_key": "33-06-10", "r": 145, "g": 137, "b": 218},
-{"color_key": "33-06-12", "r": 141, "g": 135, "b": 232},
-{"color_key": "33-06-14", "r": 133, "g": 132, "b": 245},
-{"color_key": "33-06-16", "r": 175, "g": 119, "b": 248},
-{"color_key": "33-06-18", "r": 191, "g": 109, "b": 252},
+{"color_key": "33-06-02", "r": 156, "g": 143, "b": 165},
+{"color_key": "33-06-04", "r": 161, "g": 140, "b": 175},
+{"color_key": "33-06-06", "r": 166, "g": 137, "b": 187},
+{"color_key": "33-06-08", "r": 171, "g": 133, "b": 197},
+{"color_key": "33-06-10", "r": 177, "g": 129, "b": 208},
+{"color_key": "33-06-12", "r": 183, "g": 124, "b": 218},
+{"color_key": "33-06-14", "r": 189, "g": 118, "b": 229},
+{"color_key": "33-06-16", "r": 195, "g": 112, "b": 240},
+{"color_key": "33-06-18", "r": 200, "g": 106, "b": 250},
 {"color_key": "33-06-20", "r": 207, "g": 97, "b": 255},
-{"color_key": "33-07-02", "r": 177, "g": 170, "b": 192},
-{"color_key": "33-07-04", "r": 175, "g": 169, "b": 206},
-{"color_key": "33-07-06", "r": 174, "g": 167, "b": 219},
-{"color_key": "33-07-08", "r": 172, "g": 165, "b": 234},
-{"color_key": "33-07-10", "r": 169, "g": 163, "b": 249},
-{"color_key": "33-07-12", "r": 193, "g": 154, "b": 253},
+{"color_key": "33-07-02", "r": 182, "g": 170, "b": 191},
+{"color_key": "33-07-04", "r": 187, "g": 166, "b": 203},
+{"color_key": "33-07-06", "r": 192, "g": 163, "b": 214},
+{"color_key": "33-07-08", "r": 197, "g": 159, "b": 226},
+{"color_key": "33-07-10", "r": 203, "g": 155, "b": 238},
+{"color_key": "33-07-12", "r": 209, "g": 150, "b": 250},
 {"color_key": "33-07-14", "r": 215, "g": 145, "b": 255},
-{"color_key": "33-08-02", "r": 203, "g": 197, "b": 218},
-{"color_key": "33-08-04", "r": 202, "g": 196, "b": 233},
-{"color_key": "33-08-06", "r": 199, "g": 194, "b": 250},
-{"color_key": "33-08-08", "r": 213, "g": 188, "b": 255},
+{"color_key": "33-08-02", "r": 208, "g": 196, "b": 217},
+{"color_key": "33-08-04", "r": 213, "g": 193, "b": 230},
+{"color_key": "33-08-06", "r": 218, "g": 189, "b": 243},
+{"color_key": "33-08-08", "r": 225, "g": 185, "b": 255},
 {"color_key": "33-08-10", "r": 231, "g": 180, "b": 255},
-{"color_key": "33-09-02", "r": 231, "g": 224, "b": 247},
-{"color_key": "33-09-04", "r": 235, "g": 220, "b": 255},
-{"color_key": "34-01-02", "r": 32, "g": 25, "b": 44},
-{"color_key": "34-01-04", "r": 32, "g": 22, "b": 53},
-{"color_key": "34-01-06", "r": 32, "g": 18, "b": 62},
-{"color_key": "34-01-08", "r": 35, "g": 12, "b": 71},
-{"color_key": "34-01-10", "r": 38, "g": 7, "b": 79},
-{"color_key": "34-01-12", "r": 50, "g": 1, "b": 84},
-{"color_key": "34-01-14", "r": 55, "g": 0, "b": 92},
-{"color_key": "34-01-16", "r": 60, "g": 0, "b": 100},
-{"color_key": "34-01-18", "r": 64, "g": 0, "b": 106},
-{"color_key": "34-01-20", "r": 69, "g": 0, "b": 114},
-{"color_key": "34-01-22", "r": 69, "g": 0, "b": 125},
-{"color_key": "34-01-24", "r": 68, "g": 0, "b": 137},
-{"color_key": "34-01-26", "r": 73, "g": 0, "b": 148},
-{"color_key": "34-01-28", "r": 71, "g": 0, "b": 162},
-{"color_key": "34-01-30", "r": 77, "g": 0, "b": 174},
-{"color_key": "34-01-32", "r": 72, "g": 0, "b": 189},
-{"color_key": "34-01-34", "r": 77, "g": 0, "b": 199},
-{"color_key": "34-01-36", "r": 82, "g": 0, "b": 210},
-{"color_key": "34-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "34-02-02", "r": 52, "g": 46, "b": 64},
-{"color_key": "34-02-04", "r": 53, "g": 43, "b": 75},
-{"color_key": "34-02-06", "r": 52, "g": 41, "b": 85},
-{"color_key": "34-02-08", "r": 52, "g": 36, "b": 96},
-{"color_key": "34-02-10", "r": 54, "g": 31, "b": 106},
-{"color_key": "34-02-12", "r": 58, "g": 22, "b": 115},
-{"color_key": "34-02-14", "r": 61, "g": 15, "b": 125},
-{"color_key": "34-02-16", "r": 78, "g": 4, "b": 129},
-{"color_key": "34-02-18", "r": 83, "g": 1, "b": 138},
-{"color_key": "34-02-20", "r": 88, "g": 0, "b": 146},
-{"color_key": "34-02-22", "r": 93, "g": 0, "b": 155},
-{"color_key": "34-02-24", "r": 98, "g": 0, "b": 164},
-{"color_key": "34-02-26", "r": 96, "g": 0, "b": 177},
-{"color_key": "34-02-28", "r": 102, "g": 0, "b": 187},
-{"color_key": "34-02-30", "r": 97, "g": 0, "b": 202},
-{"color_key": "34-02-32", "r": 88, "g": 0, "b": 214},
-{"color_key": "34-02-34", "r": 93, "g": 0, "b": 224},
-{"color_key": "34-02-36", "r": 79, "g": 0, "b": 237},
-{"color_key": "34-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "34-03-02", "r": 75, "g": 68, "b": 90},
-{"color_key": "34-03-04", "r": 76, "g": 66, "b": 101},
-{"color_key": "34-03-06", "r": 76, "g": 63, "b": 113},
-{"color_key": "34-03-08", "r": 75, "g": 60, "b": 124},
-{"color_key": "34-03-10", "r": 73, "g": 55, "b": 134},
-{"color_key": "34-03-12", "r": 76, "g": 50, "b": 145},
-{"color_key": "34-03-14", "r": 79, "g": 42, "b": 155},
-{"color_key": "34-03-16", "r": 83, "g": 32, "b": 166},
-{"color_key": "34-03-18", "r": 86, "g": 25, "b": 176},
-{"color_key": "34-03-20", "r": 107, "g": 11, "b": 178},
-{"color_key": "34-03-22", "r": 112, "g": 6, "b": 188},
-{"color_key": "34-03-24", "r": 117, "g": 2, "b": 197},
-{"color_key": "34-03-26", "r": 122, "g": 0, "b": 206},
-{"color_key": "34-03-28", "r": 128, "g": 0, "b": 215},
-{"color_key": "34-03-30", "r": 133, "g": 0, "b": 224},
-{"color_key": "34-03-32", "r": 128, "g": 0, "b": 240},
-{"color_key": "34-03-34", "r": 119, "g": 0, "b": 251},
-{"color_key": "34-04-02", "r": 100, "g": 93, "b": 114},
-{"color_key": "34-04-04", "r": 101, "g": 91, "b": 126},
-{"color_key": "34-04-06", "r": 101, "g": 88, "b": 137},
-{"color_key": "34-04-08", "r": 101, "g": 86, "b": 149},
-{"color_key": "34-04-10", "r": 99, "g": 82, "b": 159},
-{"color_key": "34-04-12", "r": 95, "g": 78, "b": 171},
-{"color_key": "34-04-14", "r": 97, "g": 74, "b": 182},
-{"color_key": "34-04-16", "r": 100, "g": 68, "b": 193},
-{"color_key": "34-04-18", "r": 103, "g": 60, "b": 204},
-{"color_key": "34-04-20", "r": 107, "g": 48, "b": 215},
-{"color_key": "34-04-22", "r": 132, "g": 29, "b": 218},
-{"color_key": "34-04-24", "r": 136, "g": 20, "b": 227},
-{"color_key": "34-04-26", "r": 141, "g": 15, "b": 235},
-{"color_key": "34-04-28", "r": 165, "g": 0, "b": 237},
-{"color_key": "34-04-30", "r": 171, "g": 0, "b": 244},
-{"color_key": "34-04-32", "r": 192, "g": 0, "b": 248},
-{"color_key": "34-05-02", "r": 126, "g": 118, "b": 139},
-{"color_key": "34-05-04", "r": 126, "g": 116, "b": 151},
-{"color_key": "34-05-06", "r": 127, "g": 114, "b": 164},
-{"color_key": "34-05-08", "r": 127, "g": 111, "b": 175},
-{"color_key": "34-05-10", "r": 126, "g": 109, "b": 187},
-{"color_key": "34-05-12", "r": 123, "g": 105, "b": 199},
-{"color_key": "34-05-14", "r": 118, "g": 102, "b": 210},
-{"color_key": "34-05-16", "r": 120, "g": 97, "b": 222},
-{"color_key": "34-05-18", "r": 122, "g": 92, "b": 233},
-{"color_key": "34-05-20", "r": 149, "g": 78, "b": 237},
-{"color_key": "34-05-22", "r": 173, "g": 59, "b": 241},
-{"color_key": "34-05-24", "r": 192, "g": 32, "b": 243},
-{"color_key": "34-05-26", "r": 199, "g": 14, "b": 249},
-{"color_key": "34-05-28", "r": 217, "g": 0, "b": 250},
+{"color_key": "33-09-02", "r": 235, "g": 223, "b": 245},
+{"color_key": "33-09-04", "r": 241, "g": 219, "b": 255},
+{"color_key": "34-01-02", "r": 39, "g": 23, "b": 42},
+{"color_key": "34-01-04", "r": 44, "g": 19, "b": 49},
+{"color_key": "34-01-06", "r": 49, "g": 12, "b": 56},
+{"color_key": "34-01-08", "r": 55, "g": 3, "b": 62},
+{"color_key": "34-01-10", "r": 60, "g": 0, "b": 69},
+{"color_key": "34-01-12", "r": 65, "g": 0, "b": 76},
+{"color_key": "34-01-14", "r": 71, "g": 0, "b": 83},
+{"color_key": "34-01-16", "r": 77, "g": 0, "b": 90},
+{"color_key": "34-01-18", "r": 81, "g": 0, "b": 95},
+{"color_key": "34-01-20", "r": 87, "g": 0, "b": 102},
+{"color_key": "34-02-02", "r": 59, "g": 44, "b": 62},
+{"color_key": "34-02-04", "r": 65, "g": 40, "b": 70},
+{"color_key": "34-02-06", "r": 71, "g": 35, "b": 77},
+{"color_key": "34-02-08", "r": 78, "g": 28, "b": 86},
+{"color_key": "34-02-10", "r": 84, "g": 17, "b": 93},
+{"color_key": "34-02-12", "r": 90, "g": 0, "b": 101},
+{"color_key": "34-02-14", "r": 96, "g": 0, "b": 108},
+{"color_key": "34-02-16", "r": 102, "g": 0, "b": 116},
+{"color_key": "34-02-18", "r": 108, "g": 0, "b": 123},
+{"color_key": "34-02-20", "r": 114, "g": 0, "b": 130},
+{"color_key": "34-02-22", "r": 121, "g": 0, "b": 139},
+{"color_key": "34-02-24", "r": 128, "g": 0, "b": 146},
+{"color_key": "34-03-02", "r": 84, "g": 66, "b": 87},
+{"color_key": "34-03-04", "r": 91, "g": 62, "b": 96},
+{"color_key": "34-03-06", "r": 98, "g": 57, "b": 104},
+{"color_key": "34-03-08", "r": 105, "g": 50, "b": 113},
+{"color_key": "34-03-10", "r": 111, "g": 43, "b": 121},
+{"color_key": "34-03-12", "r": 118, "g": 32, "b": 129},
+{"color_key": "34-03-14", "r": 125, "g": 14, "b": 137},
+{"color_key": "34-03-16", "r": 131, "g": 0, "b": 144},
+{"color_key": "34-03-18", "r": 137, "g": 0, "b": 152},
+{"color_key": "34-03-20", "r": 143, "g": 0, "b": 158},
+{"color_key": "34-03-22", "r": 149, "g": 0, "b": 166},
+{"color_key": "34-03-24", "r": 156, "g": 0, "b": 174},
+{"color_key": "34-03-26", "r": 163, "g": 0, "b": 182},
+{"color_key": "34-03-28", "r": 171, "g": 0, "b": 191},
+{"color_key": "34-03-30", "r": 178, "g": 0, "b": 199},
+{"color_key": "34-04-02", "r": 108, "g": 91, "b": 111},
+{"color_key": "34-04-04", "r": 115, "g": 87, "b": 120},
+{"color_key": "34-04-06", "r": 122, "g": 82, "b": 128},
+{"color_key": "34-04-08", "r": 129, "g": 77, "b": 137},
+{"color_key": "34-04-10", "r": 136, "g": 71, "b": 145},
+{"color_key": "34-04-12", "r": 143, "g": 64, "b": 153},
+{"color_key": "34-04-14", "r": 150, "g": 55, "b": 161},
+{"color_key": "34-04-16", "r": 157, "g": 43, "b": 169},
+{"color_key": "34-04-18", "r": 164, "g": 25, "b": 178},
+{"color_key": "34-04-20", "r": 171, "g": 0, "b": 186},
+{"color_key": "34-04-22", "r": 177, "g": 0, "b": 193},
+{"color_key": "34-04-24", "r": 183, "g": 0, "b": 200},
+{"color_key": "34-04-26", "r": 191, "g": 0, "b": 209},
+{"color_key": "34-04-28", "r": 197, "g": 0, "b": 217},
+{"color_key": "34-04-30", "r": 205, "g": 0, "b": 226},
+{"color_key": "34-04-32", "r": 213, "g": 0, "b": 236},
+{"color_key": "34-05-02", "r": 133, "g": 117, "b": 136},
+{"color_key": "34-05-04", "r": 141, "g": 113, "b": 145},
+{"color_key": "34-05-06", "r": 148, "g": 108, "b": 154},
+{"color_key": "34-05-08", "r": 156, "g": 103, "b": 163},
+{"color_key": "34-05-10", "r": 163, "g": 98, "b": 171},
+{"color_key": "34-05-12", "r": 170, "g": 91, "b": 180},
+{"color_key": "34-05-14", "r": 178, "g": 84, "b": 188},
+{"color_key": "34-05-16", "r": 185, "g": 76, "b": 196},
+{"color_key": "34-05-18", "r": 192, "g": 66, "b": 204},
+{"color_key": "34-05-20", "r": 199, "g": 53, "b": 213},
+{"color_key": "34-05-22", "r": 207, "g": 30, "b": 222},
+{"color_key": "34-05-24", "r": 213, "g": 0, "b": 229},
+{"color_key": "34-05-26", "r": 220, "g": 0, "b": 238},
+{"color_key": "34-05-28", "r": 228, "g": 0, "b": 246},
 {"color_key": "34-05-30", "r": 236, "g": 0, "b": 255},
-{"color_key": "34-06-02", "r": 152, "g": 144, "b": 165},
-{"color_key": "34-06-04", "r": 152, "g": 142, "b": 177},
-{"color_key": "34-06-06", "r": 152, "g": 140, "b": 190},
-{"color_key": "34-06-08", "r": 152, "g": 138, "b": 202},
-{"color_key": "34-06-10", "r": 152, "g": 135, "b": 214},
-{"color_key": "34-06-12", "r": 150, "g": 132, "b": 227},
-{"color_key": "34-06-14", "r": 145, "g": 128, "b": 240},
-{"color_key": "34-06-16", "r": 184, "g": 115, "b": 242},
-{"color_key": "34-06-18", "r": 201, "g": 105, "b": 245},
-{"color_key": "34-06-20", "r": 218, "g": 90, "b": 249},
+{"color_key": "34-06-02", "r": 159, "g": 143, "b": 162},
+{"color_key": "34-06-04", "r": 167, "g": 139, "b": 171},
+{"color_key": "34-06-06", "r": 175, "g": 134, "b": 180},
+{"color_key": "34-06-08", "r": 183, "g": 129, "b": 189},
+{"color_key": "34-06-10", "r": 191, "g": 124, "b": 198},
+{"color_key": "34-06-12", "r": 198, "g": 118, "b": 206},
+{"color_key": "34-06-14", "r": 206, "g": 112, "b": 215},
+{"color_key": "34-06-16", "r": 213, "g": 104, "b": 224},
+{"color_key": "34-06-18", "r": 221, "g": 96, "b": 232},
+{"color_key": "34-06-20", "r": 230, "g": 83, "b": 243},
 {"color_key": "34-06-22", "r": 238, "g": 69, "b": 252},
 {"color_key": "34-06-24", "r": 246, "g": 50, "b": 255},
-{"color_key": "34-07-02", "r": 178, "g": 170, "b": 191},
-{"color_key": "34-07-04", "r": 178, "g": 168, "b": 204},
-{"color_key": "34-07-06", "r": 178, "g": 166, "b": 217},
-{"color_key": "34-07-08", "r": 178, "g": 164, "b": 231},
-{"color_key": "34-07-10", "r": 178, "g": 161, "b": 245},
-{"color_key": "34-07-12", "r": 201, "g": 151, "b": 248},
-{"color_key": "34-07-14", "r": 225, "g": 141, "b": 249},
+{"color_key": "34-07-02", "r": 185, "g": 169, "b": 188},
+{"color_key": "34-07-04", "r": 193, "g": 165, "b": 197},
+{"color_key": "34-07-06", "r": 202, "g": 160, "b": 206},
+{"color_key": "34-07-08", "r": 210, "g": 155, "b": 216},
+{"color_key": "34-07-10", "r": 219, "g": 150, "b": 225},
+{"color_key": "34-07-12", "r": 227, "g": 144, "b": 234},
+{"color_key": "34-07-14", "r": 235, "g": 137, "b": 244},
 {"color_key": "34-07-16", "r": 244, "g": 130, "b": 253},
 {"color_key": "34-07-18", "r": 252, "g": 121, "b": 255},
-{"color_key": "34-08-02", "r": 204, "g": 196, "b": 218},
-{"color_key": "34-08-04", "r": 205, "g": 195, "b": 232},
-{"color_key": "34-08-06", "r": 204, "g": 193, "b": 247},
-{"color_key": "34-08-08", "r": 220, "g": 186, "b": 252},
-{"color_key": "34-08-10", "r": 240, "g": 177, "b": 255},
+{"color_key": "34-08-02", "r": 211, "g": 195, "b": 215},
+{"color_key": "34-08-04", "r": 221, "g": 191, "b": 225},
+{"color_key": "34-08-06", "r": 229, "g": 187, "b": 234},
+{"color_key": "34-08-08", "r": 240, "g": 181, "b": 245},
+{"color_key": "34-08-10", "r": 249, "g": 175, "b": 255},
 {"color_key": "34-08-12", "r": 255, "g": 169, "b": 255},
-{"color_key": "34-09-02", "r": 232, "g": 223, "b": 246},
-{"color_key": "34-09-04", "r": 239, "g": 219, "b": 254},
+{"color_key": "34-09-02", "r": 238, "g": 222, "b": 243},
+{"color_key": "34-09-04", "r": 250, "g": 217, "b": 254},
 {"color_key": "34-09-06", "r": 255, "g": 212, "b": 255},
-{"color_key": "35-01-02", "r": 33, "g": 25, "b": 43},
-{"color_key": "35-01-04", "r": 34, "g": 22, "b": 52},
-{"color_key": "35-01-06", "r": 35, "g": 17, "b": 61},
-{"color_key": "35-01-08", "r": 38, "g": 11, "b": 69},
-{"color_key": "35-01-10", "r": 42, "g": 6, "b": 77},
-{"color_key": "35-01-12", "r": 53, "g": 1, "b": 82},
-{"color_key": "35-01-14", "r": 58, "g": 0, "b": 90},
-{"color_key": "35-01-16", "r": 63, "g": 0, "b": 97},
-{"color_key": "35-01-18", "r": 67, "g": 0, "b": 104},
-{"color_key": "35-01-20", "r": 69, "g": 0, "b": 114},
-{"color_key": "35-01-22", "r": 69, "g": 0, "b": 125},
-{"color_key": "35-01-24", "r": 68, "g": 0, "b": 137},
-{"color_key": "35-01-26", "r": 73, "g": 0, "b": 148},
-{"color_key": "35-01-28", "r": 71, "g": 0, "b": 162},
-{"color_key": "35-01-30", "r": 77, "g": 0, "b": 174},
-{"color_key": "35-01-32", "r": 72, "g": 0, "b": 189},
-{"color_key": "35-01-34", "r": 77, "g": 0, "b": 199},
-{"color_key": "35-01-36", "r": 82, "g": 0, "b": 210},
-{"color_key": "35-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "35-02-02", "r": 53, "g": 46, "b": 64},
-{"color_key": "35-02-04", "r": 55, "g": 43, "b": 74},
-{"color_key": "35-02-06", "r": 55, "g": 40, "b": 83},
-{"color_key": "35-02-08", "r": 56, "g": 35, "b": 94},
-{"color_key": "35-02-10", "r": 59, "g": 28, "b": 103},
-{"color_key": "35-02-12", "r": 63, "g": 19, "b": 112},
-{"color_key": "35-02-14", "r": 67, "g": 13, "b": 122},
-{"color_key": "35-02-16", "r": 83, "g": 4, "b": 126},
-{"color_key": "35-02-18", "r": 88, "g": 1, "b": 134},
-{"color_key": "35-02-20", "r": 93, "g": 0, "b": 142},
-{"color_key": "35-02-22", "r": 99, "g": 0, "b": 151},
-{"color_key": "35-02-24", "r": 98, "g": 0, "b": 164},
-{"color_key": "35-02-26", "r": 96, "g": 0, "b": 177},
-{"color_key": "35-02-28", "r": 102, "g": 0, "b": 187},
-{"color_key": "35-02-30", "r": 97, "g": 0, "b": 202},
-{"color_key": "35-02-32", "r": 88, "g": 0, "b": 214},
-{"color_key": "35-02-34", "r": 93, "g": 0, "b": 224},
-{"color_key": "35-02-36", "r": 79, "g": 0, "b": 237},
-{"color_key": "35-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "35-03-02", "r": 77, "g": 68, "b": 89},
-{"color_key": "35-03-04", "r": 79, "g": 65, "b": 100},
-{"color_key": "35-03-06", "r": 80, "g": 62, "b": 111},
-{"color_key": "35-03-08", "r": 80, "g": 58, "b": 121},
-{"color_key": "35-03-10", "r": 80, "g": 53, "b": 131},
-{"color_key": "35-03-12", "r": 83, "g": 46, "b": 141},
-{"color_key": "35-03-14", "r": 87, "g": 36, "b": 151},
-{"color_key": "35-03-16", "r": 91, "g": 27, "b": 161},
-{"color_key": "35-03-18", "r": 95, "g": 21, "b": 171},
-{"color_key": "35-03-20", "r": 115, "g": 9, "b": 173},
-{"color_key": "35-03-22", "r": 120, "g": 5, "b": 182},
-{"color_key": "35-03-24", "r": 126, "g": 2, "b": 191},
-{"color_key": "35-03-26", "r": 131, "g": 0, "b": 199},
-{"color_key": "35-03-28", "r": 128, "g": 0, "b": 215},
-{"color_key": "35-03-30", "r": 133, "g": 0, "b": 224},
-{"color_key": "35-03-32", "r": 128, "g": 0, "b": 240},
-{"color_key": "35-03-34", "r": 119, "g": 0, "b": 251},
-{"color_key": "35-04-02", "r": 101, "g": 92, "b": 113},
-{"color_key": "35-04-04", "r": 103, "g": 90, "b": 124},
-{"color_key": "35-04-06", "r": 105, "g": 87, "b": 135},
-{"color_key": "35-04-08", "r": 106, "g": 84, "b": 146},
-{"color_key": "35-04-10", "r": 105, "g": 80, "b": 156},
-{"color_key": "35-04-12", "r": 103, "g": 76, "b": 167},
-{"color_key": "35-04-14", "r": 106, "g": 70, "b": 177},
-{"color_key": "35-04-16", "r": 110, "g": 63, "b": 187},
-{"color_key": "35-04-18", "r": 114, "g": 51, "b": 198},
-{"color_key": "35-04-20", "r": 118, "g": 41, "b": 209},
-{"color_key": "35-04-22", "r": 141, "g": 24, "b": 211},
-{"color_key": "35-04-24", "r": 146, "g": 17, "b": 219},
-{"color_key": "35-04-26", "r": 152, "g": 12, "b": 227},
-{"color_key": "35-04-28", "r": 175, "g": 0, "b": 229},
-{"color_key": "35-04-30", "r": 181, "g": 0, "b": 237},
-{"color_key": "35-04-32", "r": 192, "g": 0, "b": 248},
-{"color_key": "35-05-02", "r": 127, "g": 118, "b": 138},
-{"color_key": "35-05-04", "r": 129, "g": 116, "b": 149},
-{"color_key": "35-05-06", "r": 130, "g": 113, "b": 161},
-{"color_key": "35-05-08", "r": 132, "g": 110, "b": 172},
-{"color_key": "35-05-10", "r": 133, "g": 106, "b": 183},
-{"color_key": "35-05-12", "r": 132, "g": 102, "b": 194},
-{"color_key": "35-05-14", "r": 128, "g": 98, "b": 205},
-{"color_key": "35-05-16", "r": 131, "g": 93, "b": 216},
-{"color_key": "35-05-18", "r": 134, "g": 87, "b": 227},
-{"color_key": "35-05-20", "r": 160, "g": 71, "b": 230},
-{"color_key": "35-05-22", "r": 183, "g": 47, "b": 233},
-{"color_key": "35-05-24", "r": 201, "g": 24, "b": 235},
-{"color_key": "35-05-26", "r": 208, "g": 10, "b": 241},
-{"color_key": "35-05-28", "r": 226, "g": 0, "b": 241},
-{"color_key": "35-05-30", "r": 245, "g": 0, "b": 243},
-{"color_key": "35-06-02", "r": 153, "g": 144, "b": 164},
-{"color_key": "35-06-04", "r": 155, "g": 142, "b": 176},
-{"color_key": "35-06-06", "r": 156, "g": 139, "b": 188},
-{"color_key": "35-06-08", "r": 158, "g": 136, "b": 199},
-{"color_key": "35-06-10", "r": 159, "g": 133, "b": 211},
-{"color_key": "35-06-12", "r": 158, "g": 129, "b": 223},
-{"color_key": "35-06-14", "r": 156, "g": 125, "b": 234},
-{"color_key": "35-06-16", "r": 193, "g": 111, "b": 235},
-{"color_key": "35-06-18", "r": 209, "g": 100, "b": 238},
-{"color_key": "35-06-20", "r": 227, "g": 84, "b": 240},
-{"color_key": "35-06-22", "r": 245, "g": 62, "b": 242},
-{"color_key": "35-06-24", "r": 250, "g": 37, "b": 247},
+{"color_key": "35-01-02", "r": 40, "g": 23, "b": 41},
+{"color_key": "35-01-04", "r": 46, "g": 18, "b": 47},
+{"color_key": "35-01-06", "r": 52, "g": 10, "b": 54},
+{"color_key": "35-01-08", "r": 57, "g": 0, "b": 60},
+{"color_key": "35-01-10", "r": 63, "g": 0, "b": 66},
+{"color_key": "35-01-12", "r": 68, "g": 0, "b": 72},
+{"color_key": "35-01-14", "r": 75, "g": 0, "b": 79},
+{"color_key": "35-01-16", "r": 80, "g": 0, "b": 85},
+{"color_key": "35-01-18", "r": 85, "g": 0, "b": 91},
+{"color_key": "35-02-02", "r": 61, "g": 44, "b": 61},
+{"color_key": "35-02-04", "r": 68, "g": 39, "b": 67},
+{"color_key": "35-02-06", "r": 75, "g": 34, "b": 74},
+{"color_key": "35-02-08", "r": 82, "g": 25, "b": 81},
+{"color_key": "35-02-10", "r": 89, "g": 12, "b": 88},
+{"color_key": "35-02-12", "r": 96, "g": 0, "b": 95},
+{"color_key": "35-02-14", "r": 103, "g": 0, "b": 102},
+{"color_key": "35-02-16", "r": 109, "g": 0, "b": 109},
+{"color_key": "35-02-18", "r": 116, "g": 0, "b": 116},
+{"color_key": "35-02-20", "r": 122, "g": 0, "b": 122},
+{"color_key": "35-02-22", "r": 129, "g": 0, "b": 130},
+{"color_key": "35-03-02", "r": 86, "g": 66, "b": 85},
+{"color_key": "35-03-04", "r": 95, "g": 61, "b": 92},
+{"color_key": "35-03-06", "r": 102, "g": 55, "b": 99},
+{"color_key": "35-03-08", "r": 111, "g": 47, "b": 107},
+{"color_key": "35-03-10", "r": 118, "g": 38, "b": 114},
+{"color_key": "35-03-12", "r": 126, "g": 23, "b": 121},
+{"color_key": "35-03-14", "r": 133, "g": 0, "b": 128},
+{"color_key": "35-03-16", "r": 140, "g": 0, "b": 134},
+{"color_key": "35-03-18", "r": 147, "g": 0, "b": 142},
+{"color_key": "35-03-20", "r": 154, "g": 0, "b": 148},
+{"color_key": "35-03-22", "r": 161, "g": 0, "b": 154},
+{"color_key": "35-03-24", "r": 168, "g": 0, "b": 162},
+{"color_key": "35-03-26", "r": 175, "g": 0, "b": 168},
+{"color_key": "35-04-02", "r": 110, "g": 91, "b": 109},
+{"color_key": "35-04-04", "r": 119, "g": 86, "b": 116},
+{"color_key": "35-04-06", "r": 128, "g": 80, "b": 123},
+{"color_key": "35-04-08", "r": 136, "g": 74, "b": 130},
+{"color_key": "35-04-10", "r": 144, "g": 68, "b": 136},
+{"color_key": "35-04-12", "r": 152, "g": 59, "b": 143},
+{"color_key": "35-04-14", "r": 160, "g": 48, "b": 150},
+{"color_key": "35-04-16", "r": 167, "g": 34, "b": 156},
+{"color_key": "35-04-18", "r": 176, "g": 0, "b": 164},
+{"color_key": "35-04-20", "r": 185, "g": 0, "b": 172},
+{"color_key": "35-04-22", "r": 191, "g": 0, "b": 178},
+{"color_key": "35-04-24", "r": 198, "g": 0, "b": 184},
+{"color_key": "35-04-26", "r": 206, "g": 0, "b": 192},
+{"color_key": "35-04-28", "r": 213, "g": 0, "b": 198},
+{"color_key": "35-04-30", "r": 223, "g": 0, "b": 208},
+{"color_key": "35-05-02", "r": 134, "g": 117, "b": 134},
+{"color_key": "35-05-04", "r": 144, "g": 112, "b": 141},
+{"color_key": "35-05-06", "r": 154, "g": 106, "b": 148},
+{"color_key": "35-05-08", "r": 164, "g": 100, "b": 155},
+{"color_key": "35-05-10", "r": 172, "g": 94, "b": 162},
+{"color_key": "35-05-12", "r": 181, "g": 87, "b": 169},
+{"color_key": "35-05-14", "r": 189, "g": 78, "b": 176},
+{"color_key": "35-05-16", "r": 197, "g": 68, "b": 182},
+{"color_key": "35-05-18", "r": 205, "g": 55, "b": 189},
+{"color_key": "35-05-20", "r": 214, "g": 34, "b": 196},
+{"color_key": "35-05-22", "r": 221, "g": 0, "b": 203},
+{"color_key": "35-05-24", "r": 229, "g": 0, "b": 210},
+{"color_key": "35-05-26", "r": 238, "g": 0, "b": 217},
+{"color_key": "35-05-28", "r": 246, "g": 0, "b": 224},
+{"color_key": "35-05-30", "r": 254, "g": 0, "b": 232},
+{"color_key": "35-06-02", "r": 161, "g": 142, "b": 160},
+{"color_key": "35-06-04", "r": 170, "g": 138, "b": 167},
+{"color_key": "35-06-06", "r": 181, "g": 132, "b": 174},
+{"color_key": "35-06-08", "r": 190, "g": 127, "b": 181},
+{"color_key": "35-06-10", "r": 200, "g": 121, "b": 188},
+{"color_key": "35-06-12", "r": 208, "g": 114, "b": 195},
+{"color_key": "35-06-14", "r": 218, "g": 106, "b": 202},
+{"color_key": "35-06-16", "r": 227, "g": 97, "b": 209},
+{"color_key": "35-06-18", "r": 235, "g": 88, "b": 216},
+{"color_key": "35-06-20", "r": 244, "g": 73, "b": 224},
+{"color_key": "35-06-22", "r": 253, "g": 55, "b": 232},
+{"color_key": "35-06-24", "r": 255, "g": 24, "b": 239},
 {"color_key": "35-06-26", "r": 255, "g": 0, "b": 247},
-{"color_key": "35-07-02", "r": 179, "g": 170, "b": 191},
-{"color_key": "35-07-04", "r": 181, "g": 168, "b": 203},
-{"color_key": "35-07-06", "r": 183, "g": 165, "b": 215},
-{"color_key": "35-07-08", "r": 184, "g": 162, "b": 228},
-{"color_key": "35-07-10", "r": 185, "g": 159, "b": 240},
-{"color_key": "35-07-12", "r": 209, "g": 149, "b": 243},
-{"color_key": "35-07-14", "r": 232, "g": 138, "b": 243},
-{"color_key": "35-07-16", "r": 249, "g": 126, "b": 245},
-{"color_key": "35-07-18", "r": 253, "g": 117, "b": 250},
+{"color_key": "35-07-02", "r": 187, "g": 168, "b": 187},
+{"color_key": "35-07-04", "r": 197, "g": 164, "b": 193},
+{"color_key": "35-07-06", "r": 208, "g": 159, "b": 200},
+{"color_key": "35-07-08", "r": 219, "g": 153, "b": 208},
+{"color_key": "35-07-10", "r": 229, "g": 147, "b": 215},
+{"color_key": "35-07-12", "r": 238, "g": 140, "b": 222},
+{"color_key": "35-07-14", "r": 247, "g": 133, "b": 230},
+{"color_key": "35-07-16", "r": 255, "g": 123, "b": 238},
+{"color_key": "35-07-18", "r": 255, "g": 113, "b": 246},
 {"color_key": "35-07-20", "r": 255, "g": 101, "b": 253},
 {"color_key": "35-07-22", "r": 255, "g": 85, "b": 255},
-{"color_key": "35-08-02", "r": 205, "g": 196, "b": 217},
-{"color_key": "35-08-04", "r": 208, "g": 194, "b": 230},
-{"color_key": "35-08-06", "r": 209, "g": 191, "b": 244},
-{"color_key": "35-08-08", "r": 225, "g": 184, "b": 249},
-{"color_key": "35-08-10", "r": 245, "g": 175, "b": 251},
-{"color_key": "35-08-12", "r": 255, "g": 167, "b": 253},
+{"color_key": "35-08-02", "r": 212, "g": 195, "b": 213},
+{"color_key": "35-08-04", "r": 224, "g": 190, "b": 220},
+{"color_key": "35-08-06", "r": 236, "g": 185, "b": 228},
+{"color_key": "35-08-08", "r": 248, "g": 178, "b": 236},
+{"color_key": "35-08-10", "r": 255, "g": 172, "b": 244},
+{"color_key": "35-08-12", "r": 255, "g": 165, "b": 252},
 {"color_key": "35-08-14", "r": 255, "g": 156, "b": 255},
-{"color_key": "35-09-02", "r": 233, "g": 223, "b": 245},
-{"color_key": "35-09-04", "r": 242, "g": 219, "b": 253},
-{"color_key": "35-09-06", "r": 255, "g": 211, "b": 255},
-{"color_key": "36-01-02", "r": 34, "g": 24, "b": 43},
-{"color_key": "36-01-04", "r": 36, "g": 21, "b": 51},
-{"color_key": "36-01-06", "r": 37, "g": 16, "b": 60},
-{"color_key": "36-01-08", "r": 41, "g": 9, "b": 68},
-{"color_key": "36-01-10", "r": 45, "g": 5, "b": 75},
-{"color_key": "36-01-12", "r": 56, "g": 0, "b": 80},
-{"color_key": "36-01-14", "r": 61, "g": 0, "b": 88},
-{"color_key": "36-01-16", "r": 66, "g": 0, "b": 95},
-{"color_key": "36-01-18", "r": 67, "g": 0, "b": 104},
-{"color_key": "36-01-20", "r": 69, "g": 0, "b": 114},
-{"color_key": "36-01-22", "r": 69, "g": 0, "b": 125},
-{"color_key": "36-01-24", "r": 68, "g": 0, "b": 137},
-{"color_key": "36-01-26", "r": 73, "g": 0, "b": 148},
-{"color_key": "36-01-28", "r": 71, "g": 0, "b": 162},
-{"color_key": "36-01-30", "r": 77, "g": 0, "b": 174},
-{"color_key": "36-01-32", "r": 72, "g": 0, "b": 189},
-{"color_key": "36-01-34", "r": 77, "g": 0, "b": 199},
-{"color_key": "36-01-36", "r": 82, "g": 0, "b": 210},
-{"color_key": "36-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "36-02-02", "r": 54, "g": 45, "b": 63},
-{"color_key": "36-02-04", "r": 57, "g": 42, "b": 72},
-{"color_key": "36-02-06", "r": 58, "g": 39, "b": 81},
-{"color_key": "36-02-08", "r": 60, "g": 33, "b": 91},
-{"color_key": "36-02-10", "r": 64, "g": 25, "b": 100},
-{"color_key": "36-02-12", "r": 68, "g": 16, "b": 109},
-{"color_key": "36-02-14", "r": 72, "g": 11, "b": 118},
-{"color_key": "36-02-16", "r": 88, "g": 3, "b": 122},
-{"color_key": "36-02-18", "r": 93, "g": 1, "b": 130},
-{"color_key": "36-02-20", "r": 99, "g": 0, "b": 137},
-{"color_key": "36-02-22", "r": 99, "g": 0, "b": 151},
-{"color_key": "36-02-24", "r": 98, "g": 0, "b": 164},
-{"color_key": "36-02-26", "r": 96, "g": 0, "b": 177},
-{"color_key": "36-02-28", "r": 102, "g": 0, "b": 187},
-{"color_key": "36-02-30", "r": 97, "g": 0, "b": 202},
-{"color_key": "36-02-32", "r": 88, "g": 0, "b": 214},
-{"color_key": "36-02-34", "r": 93, "g": 0, "b": 224},
-{"color_key": "36-02-36", "r": 79, "g": 0, "b": 237},
-{"color_key": "36-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "36-03-02", "r": 78, "g": 67, "b": 88},
-{"color_key": "36-03-04", "r": 81, "g": 64, "b": 98},
-{"color_key": "36-03-06", "r": 83, "g": 61, "b": 108},
-{"color_key": "36-03-08", "r": 85, "g": 56, "b": 118},
-{"color_key": "36-03-10", "r": 85, "g": 50, "b": 128},
-{"color_key": "36-03-12", "r": 89, "g": 42, "b": 137},
-{"color_key": "36-03-14", "r": 94, "g": 31, "b": 147},
-{"color_key": "36-03-16", "r": 98, "g": 24, "b": 156},
-{"color_key": "36-03-18", "r": 103, "g": 18, "b": 165},
-{"color_key": "36-03-20", "r": 122, "g": 8, "b": 167},
-{"color_key": "36-03-22", "r": 128, "g": 4, "b": 175},
-{"color_key": "36-03-24", "r": 126, "g": 2, "b": 191},
-{"color_key": "36-03-26", "r": 131, "g": 0, "b": 199},
-{"color_key": "36-03-28", "r": 128, "g": 0, "b": 215},
-{"color_key": "36-03-30", "r": 133, "g": 0, "b": 224},
-{"color_key": "36-03-32", "r": 128, "g": 0, "b": 240},
-{"color_key": "36-03-34", "r": 119, "g": 0, "b": 251},
-{"color_key": "36-04-02", "r": 103, "g": 92, "b": 112},
-{"color_key": "36-04-04", "r": 106, "g": 89, "b": 123},
-{"color_key": "36-04-06", "r": 108, "g": 86, "b": 132},
-{"color_key": "36-04-08", "r": 110, "g": 82, "b": 143},
-{"color_key": "36-04-10", "r": 111, "g": 78, "b": 152},
-{"color_key": "36-04-12", "r": 110, "g": 73, "b": 162},
-{"color_key": "36-04-14", "r": 114, "g": 66, "b": 172},
-{"color_key": "36-04-16", "r": 118, "g": 57, "b": 181},
-{"color_key": "36-04-18", "r": 123, "g": 45, "b": 192},
-{"color_key": "36-04-20", "r": 128, "g": 36, "b": 202},
-{"color_key": "36-04-22", "r": 150, "g": 21, "b": 203},
-{"color_key": "36-04-24", "r": 155, "g": 14, "b": 211},
-{"color_key": "36-04-26", "r": 161, "g": 10, "b": 219},
-{"color_key": "36-04-28", "r": 175, "g": 0, "b": 229},
-{"color_key": "36-04-30", "r": 181, "g": 0, "b": 237},
-{"color_key": "36-04-32", "r": 192, "g": 0, "b": 248},
-{"color_key": "36-05-02", "r": 128, "g": 118, "b": 137},
-{"color_key": "36-05-04", "r": 131, "g": 115, "b": 148},
-{"color_key": "36-05-06", "r": 134, "g": 112, "b": 159},
-{"color_key": "36-05-08", "r": 137, "g": 108, "b": 169},
-{"color_key": "36-05-10", "r": 138, "g": 104, "b": 179},
-{"color_key": "36-05-12", "r": 139, "g": 100, "b": 190},
-{"color_key": "36-05-14", "r": 137, "g": 95, "b": 200},
-{"color_key": "36-05-16", "r": 140, "g": 89, "b": 210},
-{"color_key": "36-05-18", "r": 144, "g": 81, "b": 220},
-{"color_key": "36-05-20", "r": 169, "g": 61, "b": 222},
-{"color_key": "36-05-22", "r": 191, "g": 39, "b": 224},
-{"color_key": "36-05-24", "r": 210, "g": 19, "b": 225},
-{"color_key": "36-05-26", "r": 217, "g": 8, "b": 231},
-{"color_key": "36-05-28", "r": 226, "g": 0, "b": 241},
-{"color_key": "36-05-30", "r": 245, "g": 0, "b": 243},
-{"color_key": "36-06-02", "r": 154, "g": 144, "b": 163},
-{"color_key": "36-06-04", "r": 157, "g": 141, "b": 174},
-{"color_key": "36-06-06", "r": 160, "g": 138, "b": 185},
-{"color_key": "36-06-08", "r": 163, "g": 135, "b": 196},
-{"color_key": "36-06-10", "r": 165, "g": 131, "b": 206},
-{"color_key": "36-06-12", "r": 166, "g": 127, "b": 217},
-{"color_key": "36-06-14", "r": 165, "g": 122, "b": 228},
-{"color_key": "36-06-16", "r": 200, "g": 108, "b": 228},
-{"color_key": "36-06-18", "r": 217, "g": 96, "b": 230},
-{"color_key": "36-06-20", "r": 234, "g": 78, "b": 231},
-{"color_key": "36-06-22", "r": 248, "g": 54, "b": 230},
-{"color_key": "36-06-24", "r": 252, "g": 24, "b": 235},
-{"color_key": "36-06-26", "r": 255, "g": 0, "b": 247},
-{"color_key": "36-07-02", "r": 180, "g": 169, "b": 190},
-{"color_key": "36-07-04", "r": 183, "g": 167, "b": 201},
-{"color_key": "36-07-06", "r": 186, "g": 164, "b": 212},
-{"color_key": "36-07-08", "r": 189, "g": 161, "b": 224},
-{"color_key": "36-07-10", "r": 191, "g": 157, "b": 236},
-{"color_key": "36-07-12", "r": 215, "g": 147, "b": 237},
-{"color_key": "36-07-14", "r": 238, "g": 135, "b": 235},
-{"color_key": "36-07-16", "r": 251, "g": 123, "b": 236},
-{"color_key": "36-07-18", "r": 254, "g": 112, "b": 242},
-{"color_key": "36-07-20", "r": 255, "g": 94, "b": 242},
-{"color_key": "36-07-22", "r": 255, "g": 85, "b": 255},
-{"color_key": "36-08-02", "r": 206, "g": 196, "b": 216},
-{"color_key": "36-08-04", "r": 210, "g": 193, "b": 228},
-{"color_key": "36-08-06", "r": 213, "g": 190, "b": 241},
-{"color_key": "36-08-08", "r": 230, "g": 183, "b": 245},
-{"color_key": "36-08-10", "r": 247, "g": 174, "b": 246},
-{"color_key": "36-08-12", "r": 255, "g": 165, "b": 247},
-{"color_key": "36-08-14", "r": 255, "g": 153, "b": 248},
-{"color_key": "36-09-02", "r": 234, "g": 223, "b": 244},
-{"color_key": "36-09-04", "r": 244, "g": 218, "b": 252},
-{"color_key": "36-09-06", "r": 255, "g": 210, "b": 253},
-{"color_key": "37-01-02", "r": 35, "g": 24, "b": 42},
-{"color_key": "37-01-04", "r": 37, "g": 20, "b": 50},
-{"color_key": "37-01-06", "r": 39, "g": 15, "b": 58},
-{"color_key": "37-01-08", "r": 43, "g": 8, "b": 66},
-{"color_key": "37-01-10", "r": 47, "g": 5, "b": 73},
-{"color_key": "37-01-12", "r": 58, "g": 0, "b": 78},
-{"color_key": "37-01-14", "r": 63, "g": 0, "b": 85},
-{"color_key": "37-01-16", "r": 66, "g": 0, "b": 95},
-{"color_key": "37-01-18", "r": 67, "g": 0, "b": 104},
-{"color_key": "37-01-20", "r": 69, "g": 0, "b": 114},
-{"color_key": "37-01-22", "r": 69, "g": 0, "b": 125},
-{"color_key": "37-01-24", "r": 68, "g": 0, "b": 137},
-{"color_key": "37-01-26", "r": 73, "g": 0, "b": 148},
-{"color_key": "37-01-28", "r": 71, "g": 0, "b": 162},
-{"color_key": "37-01-30", "r": 77, "g": 0, "b": 174},
-{"color_key": "37-01-32", "r": 72, "g": 0, "b": 189},
-{"color_key": "37-01-34", "r": 77, "g": 0, "b": 199},
-{"color_key": "37-01-36", "r": 82, "g": 0, "b": 210},
-{"color_key": "37-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "37-02-02", "r": 55, "g": 45, "b": 62},
-{"color_key": "37-02-04", "r": 58, "g": 42, "b": 71},
-{"color_key": "37-02-06", "r": 61, "g": 38, "b": 79},
-{"color_key": "37-02-08", "r": 63, "g": 31, "b": 89},
-{"color_key": "37-02-10", "r": 68, "g": 22, "b": 97},
-{"color_key": "37-02-12", "r": 72, "g": 14, "b": 105},
-{"color_key": "37-02-14", "r": 77, "g": 10, "b": 114},
-{"color_key": "37-02-16", "r": 92, "g": 3, "b": 117},
-{"color_key": "37-02-18", "r": 98, "g": 1, "b": 125},
-{"color_key": "37-02-20", "r": 99, "g": 0, "b": 137},
-{"color_key": "37-02-22", "r": 99, "g": 0, "b": 151},
-{"color_key": "37-02-24", "r": 98, "g": 0, "b": 164},
-{"color_key": "37-02-26", "r": 96, "g": 0, "b": 177},
-{"color_key": "37-02-28", "r": 102, "g": 0, "b": 187},
-{"color_key": "37-02-30", "r": 97, "g": 0, "b": 202},
-{"color_key": "37-02-32", "r": 88, "g": 0, "b": 214},
-{"color_key": "37-02-34", "r": 93, "g": 0, "b": 224},
-{"color_key": "37-02-36", "r": 79, "g": 0, "b": 237},
-{"color_key": "37-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "37-03-02", "r": 79, "g": 67, "b": 87},
-{"color_key": "37-03-04", "r": 83, "g": 64, "b": 96},
-{"color_key": "37-03-06", "r": 86, "g": 60, "b": 106},
-{"color_key": "37-03-08", "r": 89, "g": 54, "b": 115},
-{"color_key": "37-03-10", "r": 90, "g": 48, "b": 124},
-{"color_key": "37-03-12", "r": 95, "g": 37, "b": 132},
-{"color_key": "37-03-14", "r": 100, "g": 28, "b": 141},
-{"color_key": "37-03-16", "r": 105, "g": 21, "b": 150},
-{"color_key": "37-03-18", "r": 110, "g": 16, "b": 158},
-{"color_key": "37-03-20", "r": 129, "g": 7, "b": 160},
-{"color_key": "37-03-22", "r": 128, "g": 4, "b": 175},
-{"color_key": "37-03-24", "r": 126, "g": 2, "b": 191},
-{"color_key": "37-03-26", "r": 131, "g": 0, "b": 199},
-{"color_key": "37-03-28", "r": 128, "g": 0, "b": 215},
-{"color_key": "37-03-30", "r": 133, "g": 0, "b": 224},
-{"color_key": "37-03-32", "r": 128, "g": 0, "b": 240},
-{"color_key": "37-03-34", "r": 119, "g": 0, "b": 251},
-{"color_key": "37-04-02", "r": 104, "g": 92, "b": 111},
-{"color_key": "37-04-04", "r": 108, "g": 89, "b": 121},
-{"color_key": "37-04-06", "r": 112, "g": 85, "b": 130},
-{"color_key": "37-04-08", "r": 114, "g": 81, "b": 139},
-{"color_key": "37-04-10", "r": 116, "g": 76, "b": 148},
-{"color_key": "37-04-12", "r": 117, "g": 70, "b": 157},
-{"color_key": "37-04-14", "r": 121, "g": 63, "b": 166},
-{"color_key": "37-04-16", "r": 126, "g": 51, "b": 175},
-{"color_key": "37-04-18", "r": 131, "g": 40, "b": 184},
-{"color_key": "37-04-20", "r": 136, "g": 32, "b": 194},
-{"color_key": "37-04-22", "r": 158, "g": 18, "b": 194},
-{"color_key": "37-04-24", "r": 155, "g": 14, "b": 211},
-{"color_key": "37-04-26", "r": 161, "g": 10, "b": 219},
-{"color_key": "37-04-28", "r": 175, "g": 0, "b": 229},
-{"color_key": "37-04-30", "r": 181, "g": 0, "b": 237},
-{"color_key": "37-04-32", "r": 192, "g": 0, "b": 248},
-{"color_key": "37-05-02", "r": 129, "g": 118, "b": 136},
-{"color_key": "37-05-04", "r": 133, "g": 114, "b": 146},
-{"color_key": "37-05-06", "r": 137, "g": 111, "b": 156},
-{"color_key": "37-05-08", "r": 141, "g": 107, "b": 165},
-{"color_key": "37-05-10", "r": 144, "g": 103, "b": 174},
-{"color_key": "37-05-12", "r": 145, "g": 97, "b": 184},
-{"color_key": "37-05-14", "r": 145, "g": 92, "b": 193},
-{"color_key": "37-05-16", "r": 149, "g": 84, "b": 203},
-{"color_key": "37-05-18", "r": 153, "g": 75, "b": 211},
-{"color_key": "37-05-20", "r": 178, "g": 53, "b": 213},
-{"color_key": "37-05-22", "r": 199, "g": 34, "b": 214},
-{"color_key": "37-05-24", "r": 217, "g": 16, "b": 213},
-{"color_key": "37-05-26", "r": 217, "g": 8, "b": 231},
-{"color_key": "37-05-28", "r": 226, "g": 0, "b": 241},
-{"color_key": "37-05-30", "r": 245, "g": 0, "b": 243},
-{"color_key": "37-06-02", "r": 155, "g": 143, "b": 162},
-{"color_key": "37-06-04", "r": 159, "g": 140, "b": 172},
-{"color_key": "37-06-06", "r": 163, "g": 137, "b": 182},
-{"color_key": "37-06-08", "r": 167, "g": 133, "b": 192},
-{"color_key": "37-06-10", "r": 170, "g": 129, "b": 201},
-{"color_key": "37-06-12", "r": 172, "g": 125, "b": 211},
-{"color_key": "37-06-14", "r": 173, "g": 119, "b": 221},
-{"color_key": "37-06-16", "r": 207, "g": 104, "b": 220},
-{"color_key": "37-06-18", "r": 223, "g": 92, "b": 220},
-{"color_key": "37-06-20", "r": 238, "g": 71, "b": 219},
-{"color_key": "37-06-22", "r": 250, "g": 40, "b": 217},
-{"color_key": "37-06-24", "r": 252, "g": 24, "b": 235},
-{"color_key": "37-06-26", "r": 255, "g": 0, "b": 247},
-{"color_key": "37-07-02", "r": 181, "g": 169, "b": 189},
-{"color_key": "37-07-04", "r": 186, "g": 166, "b": 199},
-{"color_key": "37-07-06", "r": 190, "g": 163, "b": 209},
-{"color_key": "37-07-08", "r": 194, "g": 159, "b": 220},
-{"color_key": "37-07-10", "r": 197, "g": 155, "b": 230},
-{"color_key": "37-07-12", "r": 221, "g": 145, "b": 230},
-{"color_key": "37-07-14", "r": 241, "g": 133, "b": 226},
-{"color_key": "37-07-16", "r": 252, "g": 120, "b": 226},
-{"color_key": "37-07-18", "r": 254, "g": 108, "b": 231},
-{"color_key": "37-07-20", "r": 255, "g": 94, "b": 242},
-{"color_key": "37-07-22", "r": 255, "g": 85, "b": 255},
-{"color_key": "37-08-02", "r": 207, "g": 196, "b": 215},
-{"color_key": "37-08-04", "r": 212, "g": 193, "b": 226},
-{"color_key": "37-08-06", "r": 217, "g": 189, "b": 238},
-{"color_key": "37-08-08", "r": 234, "g": 181, "b": 240},
-{"color_key": "37-08-10", "r": 249, "g": 172, "b": 239},
-{"color_key": "37-08-12", "r": 255, "g": 163, "b": 240},
-{"color_key": "37-08-14", "r": 255, "g": 153, "b": 248},
-{"color_key": "37-09-02", "r": 235, "g": 223, "b": 244},
-{"color_key": "37-09-04", "r": 245, "g": 218, "b": 250},
-{"color_key": "37-09-06", "r": 255, "g": 209, "b": 249},
-{"color_key": "38-01-02", "r": 36, "g": 24, "b": 41},
-{"color_key": "38-01-04", "r": 39, "g": 20, "b": 49},
-{"color_key": "38-01-06", "r": 41, "g": 14, "b": 57},
-{"color_key": "38-01-08", "r": 46, "g": 7, "b": 64},
-{"color_key": "38-01-10", "r": 50, "g": 4, "b": 71},
-{"color_key": "38-01-12", "r": 61, "g": 0, "b": 75},
-{"color_key": "38-01-14", "r": 63, "g": 0, "b": 85},
-{"color_key": "38-01-16", "r": 66, "g": 0, "b": 95},
-{"color_key": "38-01-18", "r": 67, "g": 0, "b": 104},
-{"color_key": "38-01-20", "r": 69, "g": 0, "b": 114},
-{"color_key": "38-01-22", "r": 69, "g": 0, "b": 125},
-{"color_key": "38-01-24", "r": 68, "g": 0, "b": 137},
-{"color_key": "38-01-26", "r": 73, "g": 0, "b": 148},
-{"color_key": "38-01-28", "r": 71, "g": 0, "b": 162},
-{"color_key": "38-01-30", "r": 77, "g": 0, "b": 174},
-{"color_key": "38-01-32", "r": 72, "g": 0, "b": 189},
-{"color_key": "38-01-34", "r": 77, "g": 0, "b": 199},
-{"color_key": "38-01-36", "r": 82, "g": 0, "b": 210},
-{"color_key": "38-01-38", "r": 88, "g": 0, "b": 223},
-{"color_key": "38-02-02", "r": 56, "g": 45, "b": 61},
-{"color_key": "38-02-04", "r": 60, "g": 41, "b": 69},
-{"color_key": "38-02-06", "r": 63, "g": 37, "b": 77},
-{"color_key": "38-02-08", "r": 66, "g": 30, "b": 86},
-{"color_key": "38-02-10", "r": 71, "g": 20, "b": 94},
-{"color_key": "38-02-12", "r": 76, "g": 13, "b": 102},
-{"color_key": "38-02-14", "r": 81, "g": 9, "b": 110},
-{"color_key": "38-02-16", "r": 96, "g": 2, "b": 113},
-{"color_key": "38-02-18", "r": 98, "g": 1, "b": 125},
-{"color_key": "38-02-20", "r": 99, "g": 0, "b": 137},
-{"color_key": "38-02-22", "r": 99, "g": 0, "b": 151},
-{"color_key": "38-02-24", "r": 98, "g": 0, "b": 164},
-{"color_key": "38-02-26", "r": 96, "g": 0, "b": 177},
-{"color_key": "38-02-28", "r": 102, "g": 0, "b": 187},
-{"color_key": "38-02-30", "r": 97, "g": 0, "b": 202},
-{"color_key": "38-02-32", "r": 88, "g": 0, "b": 214},
-{"color_key": "38-02-34", "r": 93, "g": 0, "b": 224},
-{"color_key": "38-02-36", "r": 79, "g": 0, "b": 237},
-{"color_key": "38-02-38", "r": 83, "g": 0, "b": 248},
-{"color_key": "38-03-02", "r": 80, "g": 67, "b": 86},
-{"color_key": "38-03-04", "r": 85, "g": 63, "b": 94},
-{"color_key": "38-03-06", "r": 89, "g": 59, "b": 103},
-{"color_key": "38-03-08", "r": 93, "g": 53, "b": 111},
-{"color_key": "38-03-10", "r": 95, "g": 45, "b": 119},
-{"color_key": "38-03-12", "r": 100, "g": 33, "b": 127},
-{"color_key": "38-03-14", "r": 105, "g": 25, "b": 136},
-{"color_key": "38-03-16", "r": 111, "g": 19, "b": 144},
-{"color_key": "38-03-18", "r": 116, "g": 15, "b": 152},
-{"color_key": "38-03-20", "r": 129, "g": 7, "b": 160},
-{"color_key": "38-03-22", "r": 128, "g": 4, "b": 175},
-{"color_key": "38-03-24", "r": 126, "g": 2, "b": 191},
-{"color_key": "38-03-26", "r": 131, "g": 0, "b": 199},
-{"color_key": "38-03-28", "r": 128, "g": 0, "b": 215},
-{"color_key": "38-03-30", "r": 133, "g": 0, "b": 224},
-{"color_key": "38-03-32", "r": 128, "g": 0, "b": 240},
-{"color_key": "38-03-34", "r": 119, "g": 0, "b": 251},
-{"color_key": "38-04-02", "r": 105, "g": 92, "b": 110},
-{"color_key": "38-04-04", "r": 110, "g": 88, "b": 118},
-{"color_key": "38-04-06", "r": 114, "g": 84, "b": 127},
-{"color_key": "38-04-08", "r": 118, "g": 79, "b": 135},
-{"color_key": "38-04-10", "r": 121, "g": 74, "b": 143},
-{"color_key": "38-04-12", "r": 122, "g": 68, "b": 151},
-{"color_key": "38-04-14", "r": 127, "g": 59, "b": 160},
-{"color_key": "38-04-16", "r": 132, "g": 46, "b": 168},
-{"color_key": "38-04-18", "r": 138, "g": 36, "b": 177},
-{"color_key": "38-04-20", "r": 144, "g": 29, "b": 186},
-{"color_key": "38-04-22", "r": 158, "g": 18, "b": 194},
-{"color_key": "38-04-24", "r": 155, "g": 14, "b": 211},
-{"color_key": "38-04-26", "r": 161, "g": 10, "b": 219},
-{"color_key": "38-04-28", "r": 175, "g": 0, "b": 229},
-{"color_key": "38-04-30", "r": 181, "g": 0, "b": 237},
-{"color_key": "38-04-32", "r": 192, "g": 0, "b": 248},
-{"color_key": "38-05-02", "r": 130, "g": 117, "b": 135},
-{"color_key": "38-05-04", "r": 135, "g": 114, "b": 144},
-{"color_key": "38-05-06", "r": 140, "g": 110, "b": 153},
-{"color_key": "38-05-08", "r": 145, "g": 105, "b": 161},
-{"color_key": "38-05-10", "r": 149, "g": 101, "b": 169},
-{"color_key": "38-05-12", "r": 151, "g": 95, "b": 178},
-{"color_key": "38-05-14", "r": 152, "g": 89, "b": 187},
-{"color_key": "38-05-16", "r": 156, "g": 80, "b": 195},
-{"color_key": "38-05-18", "r": 161, "g": 68, "b": 203},
-{"color_key": "38-05-20", "r": 185, "g": 47, "b": 204},
-{"color_key": "38-05-22", "r": 206, "g": 29, "b": 204},
-{"color_key": "38-05-24", "r": 217, "g": 16, "b": 213},
-{"color_key": "38-05-26", "r": 217, "g": 8, "b": 231},
-{"color_key": "38-05-28", "r": 226, "g": 0, "b": 241},
-{"color_key": "38-05-30", "r": 245, "g": 0, "b": 243},
-{"color_key": "38-06-02", "r": 156, "g": 143, "b": 161},
-{"color_key": "38-06-04", "r": 161, "g": 140, "b": 170},
-{"color_key": "38-06-06", "r": 167, "g": 136, "b": 179},
-{"color_key": "38-06-08", "r": 171, "g": 132, "b": 188},
-{"color_key": "38-06-10", "r": 175, "g": 128, "b": 196},
-{"color_key": "38-06-12", "r": 178, "g": 123, "b": 205},
-{"color_key": "38-06-14", "r": 180, "g": 117, "b": 214},
-{"color_key": "38-06-16", "r": 213, "g": 101, "b": 211},
-{"color_key": "38-06-18", "r": 228, "g": 88, "b": 210},
-{"color_key": "38-06-20", "r": 241, "g": 65, "b": 209},
-{"color_key": "38-06-22", "r": 250, "g": 40, "b": 217},
-{"color_key": "38-06-24", "r": 252, "g": 24, "b": 235},
-{"color_key": "38-06-26", "r": 255, "g": 0, "b": 247},
-{"color_key": "38-07-02", "r": 182, "g": 169, "b": 188},
-{"color_key": "38-07-04", "r": 188, "g": 166, "b": 197},
-{"color_key": "38-07-06", "r": 193, "g": 162, "b": 206},
-{"color_key": "38-07-08", "r": 198, "g": 158, "b": 215},
-{"color_key": "38-07-10", "r": 202, "g": 154, "b": 225},
-{"color_key": "38-07-12", "r": 225, "g": 143, "b": 223},
-{"color_key": "38-07-14", "r": 243, "g": 131, "b": 218},
-{"color_key": "38-07-16", "r": 252, "g": 117, "b": 216},
-{"color_key": "38-07-18", "r": 254, "g": 108, "b": 231},
-{"color_key": "38-07-20", "r": 255, "g": 94, "b": 242},
-{"color_key": "38-07-22", "r": 255, "g": 85, "b": 255},
-{"color_key": "38-08-02", "r": 208, "g": 196, "b": 215},
-{"color_key": "38-08-04", "r": 214, "g": 192, "b": 224},
-{"color_key": "38-08-06", "r": 220, "g": 188, "b": 234},
-{"color_key": "38-08-08", "r": 236, "g": 180, "b": 236},
-{"color_key": "38-08-10", "r": 250, "g": 171, "b": 233},
-{"color_key": "38-08-12", "r": 255, "g": 161, "b": 232},
-{"color_key": "38-08-14", "r": 255, "g": 153, "b": 248},
-{"color_key": "38-09-02", "r": 236, "g": 222, "b": 243},
-{"color_key": "38-09-04", "r": 247, "g": 217, "b": 248},
-{"color_key": "38-09-06", "r": 255, "g": 209, "b": 246},
+{"color_key": "35-09-02", "r": 240, "g": 222, "b": 241},
+{"color_key": "35-09-04", "r": 254, "g": 216, "b": 249},
+{"color_key": "35-09-06", "r": 255, "g": 210, "b": 255},
+{"color_key": "36-01-02", "r": 41, "g": 22, "b": 39},
+{"color_key": "36-01-04", "r": 48, "g": 17, "b": 45},
+{"color_key": "36-01-06", "r": 54, "g": 9, "b": 51},
+{"color_key": "36-01-08", "r": 60, "g": 0, "b": 57},
+{"color_key": "36-01-10", "r": 66, "g": 0, "b": 62},
+{"color_key": "36-01-12", "r": 72, "g": 0, "b": 68},
+{"color_key": "36-01-14", "r": 78, "g": 0, "b": 74},
+{"color_key": "36-01-16", "r": 84, "g": 0, "b": 80},
+{"color_key": "36-02-02", "r": 63, "g": 43, "b": 58},
+{"color_key": "36-02-04", "r": 71, "g": 38, "b": 63},
+{"color_key": "36-02-06", "r": 78, "g": 32, "b": 68},
+{"color_key": "36-02-08", "r": 87, "g": 22, "b": 74},
+{"color_key": "36-02-10", "r": 95, "g": 4, "b": 80},
+{"color_key": "36-02-12", "r": 102, "g": 0, "b": 86},
+{"color_key": "36-02-14", "r": 110, "g": 0, "b": 92},
+{"color_key": "36-02-16", "r": 118, "g": 0, "b": 98},
+{"color_key": "36-02-18", "r": 125, "g": 0, "b": 104},
+{"color_key": "36-02-20", "r": 132, "g": 0, "b": 109},
+{"color_key": "36-03-02", "r": 88, "g": 65, "b": 82},
+{"color_key": "36-03-04", "r": 98, "g": 59, "b": 87},
+{"color_key": "36-03-06", "r": 108, "g": 53, "b": 92},
+{"color_key": "36-03-08", "r": 117, "g": 44, "b": 97},
+{"color_key": "36-03-10", "r": 126, "g": 32, "b": 103},
+{"color_key": "36-03-12", "r": 134, "g": 12, "b": 108},
+{"color_key": "36-03-14", "r": 143, "g": 0, "b": 113},
+{"color_key": "36-03-16", "r": 151, "g": 0, "b": 119},
+{"color_key": "36-03-18", "r": 159, "g": 0, "b": 124},
+{"color_key": "36-03-20", "r": 166, "g": 0, "b": 129},
+{"color_key": "36-03-22", "r": 175, "g": 0, "b": 135},
+{"color_key": "36-04-02", "r": 112, "g": 90, "b": 106},
+{"color_key": "36-04-04", "r": 123, "g": 85, "b": 111},
+{"color_key": "36-04-06", "r": 133, "g": 79, "b": 116},
+{"color_key": "36-04-08", "r": 143, "g": 72, "b": 121},
+{"color_key": "36-04-10", "r": 152, "g": 64, "b": 126},
+{"color_key": "36-04-12", "r": 161, "g": 54, "b": 131},
+{"color_key": "36-04-14", "r": 169, "g": 40, "b": 136},
+{"color_key": "36-04-16", "r": 178, "g": 18, "b": 141},
+{"color_key": "36-04-18", "r": 187, "g": 0, "b": 147},
+{"color_key": "36-04-20", "r": 197, "g": 0, "b": 153},
+{"color_key": "36-04-22", "r": 204, "g": 0, "b": 157},
+{"color_key": "36-04-24", "r": 212, "g": 0, "b": 163},
+{"color_key": "36-04-26", "r": 220, "g": 0, "b": 167},
+{"color_key": "36-05-02", "r": 136, "g": 116, "b": 132},
+{"color_key": "36-05-04", "r": 148, "g": 111, "b": 136},
+{"color_key": "36-05-06", "r": 159, "g": 105, "b": 141},
+{"color_key": "36-05-08", "r": 171, "g": 98, "b": 147},
+{"color_key": "36-05-10", "r": 180, "g": 91, "b": 151},
+{"color_key": "36-05-12", "r": 190, "g": 82, "b": 156},
+{"color_key": "36-05-14", "r": 200, "g": 72, "b": 161},
+{"color_key": "36-05-16", "r": 208, "g": 60, "b": 166},
+{"color_key": "36-05-18", "r": 217, "g": 42, "b": 171},
+{"color_key": "36-05-20", "r": 226, "g": 2, "b": 176},
+{"color_key": "36-05-22", "r": 235, "g": 0, "b": 182},
+{"color_key": "36-05-24", "r": 243, "g": 0, "b": 186},
+{"color_key": "36-05-26", "r": 252, "g": 0, "b": 192},
+{"color_key": "36-06-02", "r": 163, "g": 142, "b": 158},
+{"color_key": "36-06-04", "r": 174, "g": 137, "b": 162},
+{"color_key": "36-06-06", "r": 186, "g": 131, "b": 167},
+{"color_key": "36-06-08", "r": 197, "g": 125, "b": 172},
+{"color_key": "36-06-10", "r": 207, "g": 119, "b": 176},
+{"color_key": "36-06-12", "r": 218, "g": 111, "b": 181},
+{"color_key": "36-06-14", "r": 228, "g": 101, "b": 186},
+{"color_key": "36-06-16", "r": 239, "g": 91, "b": 192},
+{"color_key": "36-06-18", "r": 248, "g": 79, "b": 197},
+{"color_key": "36-06-20", "r": 255, "g": 60, "b": 202},
+{"color_key": "36-06-22", "r": 255, "g": 38, "b": 207},
+{"color_key": "36-06-24", "r": 255, "g": 0, "b": 213},
+{"color_key": "36-07-02", "r": 188, "g": 168, "b": 185},
+{"color_key": "36-07-04", "r": 201, "g": 163, "b": 189},
+{"color_key": "36-07-06", "r": 214, "g": 157, "b": 194},
+{"color_key": "36-07-08", "r": 226, "g": 151, "b": 198},
+{"color_key": "36-07-10", "r": 237, "g": 144, "b": 203},
+{"color_key": "36-07-12", "r": 248, "g": 136, "b": 208},
+{"color_key": "36-07-14", "r": 255, "g": 128, "b": 213},
+{"color_key": "36-07-16", "r": 255, "g": 117, "b": 219},
+{"color_key": "36-07-18", "r": 255, "g": 104, "b": 225},
+{"color_key": "36-07-20", "r": 255, "g": 88, "b": 231},
+{"color_key": "36-08-02", "r": 214, "g": 195, "b": 211},
+{"color_key": "36-08-04", "r": 228, "g": 189, "b": 216},
+{"color_key": "36-08-06", "r": 242, "g": 183, "b": 220},
+{"color_key": "36-08-08", "r": 255, "g": 176, "b": 225},
+{"color_key": "36-08-10", "r": 255, "g": 169, "b": 230},
+{"color_key": "36-08-12", "r": 255, "g": 161, "b": 236},
+{"color_key": "36-08-14", "r": 255, "g": 151, "b": 241},
+{"color_key": "36-09-02", "r": 241, "g": 222, "b": 239},
+{"color_key": "36-09-04", "r": 255, "g": 216, "b": 244},
+{"color_key": "36-09-06", "r": 255, "g": 209, "b": 249},
+{"color_key": "37-01-02", "r": 43, "g": 22, "b": 37},
+{"color_key": "37-01-04", "r": 50, "g": 16, "b": 42},
+{"color_key": "37-01-06", "r": 57, "g": 7, "b": 47},
+{"color_key": "37-01-08", "r": 63, "g": 0, "b": 52},
+{"color_key": "37-01-10", "r": 70, "g": 0, "b": 57},
+{"color_key": "37-01-12", "r": 76, "g": 0, "b": 62},
+{"color_key": "37-01-14", "r": 82, "g": 0, "b": 67},
+{"color_key": "37-02-02", "r": 64, "g": 43, "b": 56},
+{"color_key": "37-02-04", "r": 73, "g": 38, "b": 60},
+{"color_key": "37-02-06", "r": 81, "g": 31, "b": 63},
+{"color_key": "37-02-08", "r": 91, "g": 19, "b": 68},
+{"color_key": "37-02-10", "r": 99, "g": 0, "b": 73},
+{"color_key": "37-02-12", "r": 107, "g": 0, "b": 77},
+{"color_key": "37-02-14", "r": 115, "g": 0, "b": 82},
+{"color_key": "37-02-16", "r": 124, "g": 0, "b": 87},
+{"color_key": "37-02-18", "r": 131, "g": 0, "b": 91},
+{"color_key": "37-03-02", "r": 89, "g": 65, "b": 78},
+{"color_key": "37-03-04", "r": 101, "g": 59, "b": 81},
+{"color_key": "37-03-06", "r": 112, "g": 51, "b": 84},
+{"color_key": "37-03-08", "r": 122, "g": 42, "b": 88},
+{"color_key": "37-03-10", "r": 131, "g": 28, "b": 92},
+{"color_key": "37-03-12", "r": 140, "g": 1, "b": 95},
+{"color_key": "37-03-14", "r": 149, "g": 0, "b": 100},
+{"color_key": "37-03-16", "r": 158, "g": 0, "b": 104},
+{"color_key": "37-03-18", "r": 166, "g": 0, "b": 108},
+{"color_key": "37-03-20", "r": 174, "g": 0, "b": 112},
+{"color_key": "37-04-02", "r": 114, "g": 90, "b": 103},
+{"color_key": "37-04-04", "r": 126, "g": 84, "b": 105},
+{"color_key": "37-04-06", "r": 138, "g": 77, "b": 108},
+{"color_key": "37-04-08", "r": 149, "g": 69, "b": 110},
+{"color_key": "37-04-10", "r": 158, "g": 61, "b": 113},
+{"color_key": "37-04-12", "r": 169, "g": 49, "b": 116},
+{"color_key": "37-04-14", "r": 178, "g": 32, "b": 119},
+{"color_key": "37-04-16", "r": 187, "g": 0, "b": 122},
+{"color_key": "37-04-18", "r": 197, "g": 0, "b": 126},
+{"color_key": "37-04-20", "r": 207, "g": 0, "b": 130},
+{"color_key": "37-04-22", "r": 215, "g": 0, "b": 133},
+{"color_key": "37-05-02", "r": 138, "g": 116, "b": 129},
+{"color_key": "37-05-04", "r": 151, "g": 110, "b": 130},
+{"color_key": "37-05-06", "r": 164, "g": 104, "b": 132},
+{"color_key": "37-05-08", "r": 177, "g": 96, "b": 135},
+{"color_key": "37-05-10", "r": 188, "g": 88, "b": 137},
+{"color_key": "37-05-12", "r": 199, "g": 78, "b": 139},
+{"color_key": "37-05-14", "r": 209, "g": 66, "b": 142},
+{"color_key": "37-05-16", "r": 219, "g": 50, "b": 144},
+{"color_key": "37-05-18", "r": 229, "g": 25, "b": 147},
+{"color_key": "37-05-20", "r": 239, "g": 0, "b": 150},
+{"color_key": "37-05-22", "r": 248, "g": 0, "b": 153},
+{"color_key": "37-05-24", "r": 255, "g": 0, "b": 156},
+{"color_key": "37-06-02", "r": 164, "g": 142, "b": 155},
+{"color_key": "37-06-04", "r": 177, "g": 136, "b": 157},
+{"color_key": "37-06-06", "r": 191, "g": 130, "b": 158},
+{"color_key": "37-06-08", "r": 203, "g": 123, "b": 160},
+{"color_key": "37-06-10", "r": 214, "g": 116, "b": 162},
+{"color_key": "37-06-12", "r": 226, "g": 108, "b": 164},
+{"color_key": "37-06-14", "r": 238, "g": 97, "b": 167},
+{"color_key": "37-06-16", "r": 249, "g": 85, "b": 169},
+{"color_key": "37-06-18", "r": 255, "g": 70, "b": 172},
+{"color_key": "37-06-20", "r": 255, "g": 44, "b": 175},
+{"color_key": "37-06-22", "r": 255, "g": 0, "b": 177},
+{"color_key": "37-07-02", "r": 190, "g": 168, "b": 182},
+{"color_key": "37-07-04", "r": 204, "g": 163, "b": 183},
+{"color_key": "37-07-06", "r": 219, "g": 156, "b": 185},
+{"color_key": "37-07-08", "r": 232, "g": 149, "b": 186},
+{"color_key": "37-07-10", "r": 244, "g": 142, "b": 188},
+{"color_key": "37-07-12", "r": 255, "g": 133, "b": 190},
+{"color_key": "37-07-14", "r": 255, "g": 123, "b": 192},
+{"color_key": "37-07-16", "r": 255, "g": 111, "b": 195},
+{"color_key": "37-07-18", "r": 255, "g": 97, "b": 198},
+{"color_key": "37-08-02", "r": 215, "g": 195, "b": 209},
+{"color_key": "37-08-04", "r": 231, "g": 189, "b": 210},
+{"color_key": "37-08-06", "r": 247, "g": 182, "b": 212},
+{"color_key": "37-08-08", "r": 255, "g": 174, "b": 213},
+{"color_key": "37-08-10", "r": 255, "g": 167, "b": 215},
+{"color_key": "37-08-12", "r": 255, "g": 157, "b": 217},
+{"color_key": "37-09-02", "r": 243, "g": 221, "b": 238},
+{"color_key": "37-09-04", "r": 255, "g": 215, "b": 238},
+{"color_key": "37-09-06", "r": 255, "g": 207, "b": 240},
+{"color_key": "38-01-02", "r": 44, "g": 22, "b": 36},
+{"color_key": "38-01-04", "r": 52, "g": 15, "b": 40},
+{"color_key": "38-01-06", "r": 59, "g": 5, "b": 43},
+{"color_key": "38-01-08", "r": 66, "g": 0, "b": 47},
+{"color_key": "38-01-10", "r": 73, "g": 0, "b": 52},
+{"color_key": "38-01-12", "r": 80, "g": 0, "b": 56},
+{"color_key": "38-02-02", "r": 65, "g": 43, "b": 54},
+{"color_key": "38-02-04", "r": 75, "g": 37, "b": 56},
+{"color_key": "38-02-06", "r": 84, "g": 30, "b": 59},
+{"color_key": "38-02-08", "r": 93, "g": 17, "b": 62},
+{"color_key": "38-02-10", "r": 102, "g": 0, "b": 66},
+{"color_key": "38-02-12", "r": 111, "g": 0, "b": 69},
+{"color_key": "38-02-14", "r": 119, "g": 0, "b": 73},
+{"color_key": "38-02-16", "r": 127, "g": 0, "b": 77},
+{"color_key": "38-03-02", "r": 90, "g": 65, "b": 76},
+{"color_key": "38-03-04", "r": 103, "g": 58, "b": 77},
+{"color_key": "38-03-06", "r": 114, "g": 50, "b": 78},
+{"color_key": "38-03-08", "r": 125, "g": 40, "b": 79},
+{"color_key": "38-03-10", "r": 135, "g": 25, "b": 81},
+{"color_key": "38-03-12", "r": 145, "g": 0, "b": 83},
+{"color_key": "38-03-14", "r": 155, "g": 0, "b": 85},
+{"color_key": "38-03-16", "r": 164, "g": 0, "b": 88},
+{"color_key": "38-03-18", "r": 173, "g": 0, "b": 91},
+{"color_key": "38-04-02", "r": 115, "g": 90, "b": 101},
+{"color_key": "38-04-04", "r": 128, "g": 84, "b": 100},
+{"color_key": "38-04-06", "r": 141, "g": 77, "b": 100},
+{"color_key": "38-04-08", "r": 153, "g": 68, "b": 101},
+{"color_key": "38-04-10", "r": 162, "g": 59, "b": 102},
+{"color_key": "38-04-12", "r": 173, "g": 46, "b": 103},
+{"color_key": "38-04-14", "r": 183, "g": 26, "b": 104},
+{"color_key": "38-04-16", "r": 193, "g": 0, "b": 106},
+{"color_key": "38-04-18", "r": 203, "g": 0, "b": 108},
+{"color_key": "38-04-20", "r": 214, "g": 0, "b": 110},
+{"color_key": "38-05-02", "r": 139, "g": 116, "b": 127},
+{"color_key": "38-05-04", "r": 154, "g": 110, "b": 126},
+{"color_key": "38-05-06", "r": 167, "g": 103, "b": 126},
+{"color_key": "38-05-08", "r": 181, "g": 95, "b": 126},
+{"color_key": "38-05-10", "r": 191, "g": 87, "b": 126},
+{"color_key": "38-05-12", "r": 204, "g": 75, "b": 126},
+{"color_key": "38-05-14", "r": 214, "g": 64, "b": 127},
+{"color_key": "38-05-16", "r": 224, "g": 46, "b": 128},
+{"color_key": "38-05-18", "r": 234, "g": 12, "b": 129},
+{"color_key": "38-05-20", "r": 245, "g": 0, "b": 131},
+{"color_key": "38-05-22", "r": 254, "g": 0, "b": 132},
+{"color_key": "38-06-02", "r": 165, "g": 142, "b": 153},
+{"color_key": "38-06-04", "r": 179, "g": 136, "b": 152},
+{"color_key": "38-06-06", "r": 195, "g": 129, "b": 152},
+{"color_key": "38-06-08", "r": 206, "g": 123, "b": 151},
+{"color_key": "38-06-10", "r": 219, "g": 115, "b": 151},
+{"color_key": "38-06-12", "r": 231, "g": 106, "b": 151},
+{"color_key": "38-06-14", "r": 243, "g": 95, "b": 152},
+{"color_key": "38-06-16", "r": 255, "g": 81, "b": 153},
+{"color_key": "38-06-18", "r": 255, "g": 66, "b": 153},
+{"color_key": "38-06-20", "r": 255, "g": 37, "b": 155},
+{"color_key": "38-07-02", "r": 191, "g": 168, "b": 180},
+{"color_key": "38-07-04", "r": 206, "g": 162, "b": 179},
+{"color_key": "38-07-06", "r": 221, "g": 155, "b": 178},
+{"color_key": "38-07-08", "r": 235, "g": 148, "b": 178},
+{"color_key": "38-07-10", "r": 248, "g": 141, "b": 177},
+{"color_key": "38-07-12", "r": 255, "g": 131, "b": 177},
+{"color_key": "38-07-14", "r": 255, "g": 121, "b": 177},
+{"color_key": "38-07-16", "r": 255, "g": 108, "b": 178},
+{"color_key": "38-08-02", "r": 216, "g": 194, "b": 208},
+{"color_key": "38-08-04", "r": 233, "g": 188, "b": 206},
+{"color_key": "38-08-06", "r": 250, "g": 181, "b": 205},
+{"color_key": "38-08-08", "r": 255, "g": 174, "b": 204},
+{"color_key": "38-08-10", "r": 255, "g": 166, "b": 204},
+{"color_key": "38-08-12", "r": 255, "g": 155, "b": 203},
+{"color_key": "38-09-02", "r": 244, "g": 221, "b": 236},
+{"color_key": "38-09-04", "r": 255, "g": 214, "b": 234},
+{"color_key": "38-09-06", "r": 255, "g": 207, "b": 232},
 {"color_key": "39-01-02", "r": 44, "g": 21, "b": 34},
 {"color_key": "39-01-04", "r": 53, "g": 14, "b": 36},
 {"color_key": "39-01-06", "r": 60, "g": 4, "b": 39},
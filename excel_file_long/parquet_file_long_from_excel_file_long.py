@@ -1,18 +1,30 @@
 import re
-import pandas as pd
-import openpyxl
 import os
 import argparse
 
 # from create_js_color_chips import create_js_file
-from munsell_data_frame import MunsellDataFrame
 
 # read_lines_from_excel_spreadsheet
 # parse the lines into pages and tables
 # parse each 'Hue Name' table into V,C,R,G,B values to create a MunsellDataFrame
 # save the MunsellDataFrame as a parquet file 
 
+# precompiled patterns for the lines of the 'munsell2rgb' sheet
+QUINTET_PATTERN = re.compile(r'(\d+) (\d+) (\d+) (\d+) (\d+)')
+TABLE_PATTERN = re.compile(r'Table (\d+): Munsell to sRGB Conversions for Hue (.+)')
+FOOTER_YEAR_FIRST_PATTERN = re.compile(r'^c (\d+) Paul Centore (\d+)$')
+FOOTER_PAGE_FIRST_PATTERN = re.compile(r'^(\d+) c (\d+) Paul Centore$')
+SKIPPED_LINE_PREFIXES = ('CONVERSIONS', 'PAUL CENTORE', 'V C sRGB')
+QUINTET_SEPARATORS = str.maketrans(',[]', '   ')
+
+# the columns of the dataframe returned by parse_pages
+QUINTET_COLUMNS = ['V', 'C', 'R', 'G', 'B']
+TABLE_COLUMNS = ['Table Number', 'Hue Name']
+PAGE_COLUMNS = ['Author Name', 'Copyright Year', 'Page Number']
+
 def process_long_excel_file(excel_file_long_dir):
+    from munsell_data_frame import MunsellDataFrame
+
     # output
     parquet_file_long = excel_file_long_dir + "parquet_file_long.parquet"
     
@@ -22,23 +34,15 @@ def process_long_excel_file(excel_file_long_dir):
     
     lines = read_lines_from_excel_spreadsheet(excel_file_long, sheet_name)
     
-    # parse the lines into one dataframe per table
-    df_list = parse_pages(lines)
-    
-    # Print the number of dataframes
-    print(f"parsed {len(df_list)} tables")
+    # parse the streamed lines into one dataframe of all tables
+    final_df = parse_pages(lines)
     
-    # Print the first and last rows of each dataframe
-    for df in df_list:
-        page_number = df['Page Number'].iloc[0]
-        table_number = df['Table Number'].iloc[0]
-        hue_name = df['Hue Name'].iloc[0]
-        num_rows = len(df)
+    # Print the number of tables and the size of each table
+    tables = final_df.groupby(['Table Number', 'Hue Name', 'Page Number'], sort=False).size()
+    print(f"parsed {len(tables)} tables")
+    for (table_number, hue_name, page_number), num_rows in tables.items():
         print(f"Page Number: {page_number}, Table Number: {table_number}, Hue Name: {hue_name}, Number of Rows: {num_rows}")
     
-    # Combine all dataframes into one for exporting to a CSV file
-    final_df = pd.concat(df_list)
-    
     # Sort by these columns
     final_df = final_df.sort_values(by=["Table Number", "V", "C"])
 
@@ -73,12 +77,14 @@ def process_long_excel_file(excel_file_long_dir):
     print(f"munsell_df.shape: {munsell_df.shape}")
     print("written to ", parquet_file_long)
 
-def quintext_to_quindict(quintext):
-    match = re.search(r'(\d+) (\d+) (\d+) (\d+) (\d+)', quintext)
-    if match:
-        return {"V":int(match.group(1)), "C":int(match.group(2)), "R":int(match.group(3)), "G":int(match.group(4)), "B":int(match.group(5))}
-    else:
-        return None
+# yield a (V,C,R,G,B) tuple for each group of 5 words in a table line,
+# for example '1 2 [45,21,31] 4 6 [144,76,88]' yields (1,2,45,21,31) and (4,6,144,76,88)
+def parse_quintets(line):
+    words = line.translate(QUINTET_SEPARATORS).split()
+    for i in range(0, len(words), 5):
+        match = QUINTET_PATTERN.search(' '.join(words[i:i+5]))
+        if match:
+            yield tuple(int(group) for group in match.groups())
 
 def df_dump(df):
     df = df.sort_values(by=["Table Number", "V", "C"])
@@ -86,84 +92,74 @@ def df_dump(df):
     for i, row in enumerate(df.itertuples(index=False), start=1):
         print(f'Row {i}:', row)
 
-def parse_pages(lines):
-    df_list = []
-    page_dfs = []
-    table_number = None
-    hue = None
-    author_name = None
-    copyright_year = None
-    page_number = None
-
-    df = pd.DataFrame()
-
+# yield (V, C, R, G, B, table_number, hue, author_name, copyright_year, page_number)
+# records from the lines of the sheet.
+#
+# Each table's quintets precede its 'Table N: ... Hue H' line, and each
+# page's tables precede its 'Paul Centore' footer line, so quintets are
+# held until their table line and tables are held until their page footer.
+# Quintets or tables that are never closed are dropped.
+def parse_records(lines):
+    table_quintets = []
+    page_tables = []
     for line in lines:
-        if len(line.strip()) == 0:
+        line = line.strip()
+        if len(line) == 0 or line.startswith(SKIPPED_LINE_PREFIXES):
             continue
-        elif line.strip().startswith('CONVERSIONS'):
+        if line.startswith('Table'):
+            match = TABLE_PATTERN.search(line)
+            if match and table_quintets:
+                page_tables.append((int(match.group(1)), match.group(2), table_quintets))
+                table_quintets = []
             continue
-        if line.strip().startswith('CONVERSIONS'):
-            continue
-        elif line.strip().startswith('PAUL CENTORE'):
-            continue
-        elif line.strip().startswith('V C sRGB'):
-            continue
-        elif line.strip().startswith('Table'):
-            match = re.search(r'Table (\d+): Munsell to sRGB Conversions for Hue (.+)', line)
+        match = None
+        if 'Paul Centore' in line:
+            match = FOOTER_YEAR_FIRST_PATTERN.search(line)
             if match:
-                table_number = int(match.group(1))
-                hue = match.group(2)
-                if not df.empty:
-                    df['Table Number'] = table_number
-                    df['Hue Name'] = hue
-                    page_dfs.append(df)
-                    df = pd.DataFrame()
-        elif re.search(r'^c (\d+) Paul Centore (\d+)$', line) or re.search(r'^(\d+) c (\d+) Paul Centore$', line):
-            match1 = re.search(r'^c (\d+) Paul Centore (\d+)$', line)
-            match2 = re.search(r'^(\d+) c (\d+) Paul Centore$', line)
-            if match1:
-                copyright_year = int(match1.group(1))
-                author_name = "Paul Centore"
-                page_number = int(match1.group(2))
-            elif match2:
-                page_number = int(match2.group(1))
-                copyright_year = int(match2.group(2))
-                author_name = "Paul Centore"
-            for df in page_dfs:
-                # hue_name = df["Hue Name"].iloc[0]
-                # if hue_name == "5.0B":
-                #     df_dump(df)
-                df['Author Name'] = author_name
-                df['Copyright Year'] = copyright_year
-                df['Page Number'] = page_number
-
-            df_list.extend(page_dfs)
-            print(f"{len(df_list)} page:{page_number}")
-            page_dfs = []
-        else:
-            line = line.replace(',', ' ').replace('[', ' ').replace(']', ' ')
-            words = line.split()
-            for i in range(0, len(words), 5):
-                quintext = ' '.join(words[i:i+5])
-                quindict = quintext_to_quindict(quintext)
-                if quindict is not None:
-                    df = pd.concat([df, pd.DataFrame([quindict])])
-
-
-    return df_list
+                copyright_year, page_number = int(match.group(1)), int(match.group(2))
+            else:
+                match = FOOTER_PAGE_FIRST_PATTERN.search(line)
+                if match:
+                    page_number, copyright_year = int(match.group(1)), int(match.group(2))
+        if match:
+            for table_number, hue, quintets in page_tables:
+                for quintet in quintets:
+                    yield quintet + (table_number, hue, "Paul Centore", copyright_year, page_number)
+            page_tables = []
+            continue
+        table_quintets.extend(parse_quintets(line))
 
+# parse the lines of the sheet into one dataframe with columns
+# V, C, R, G, B, Table Number, Hue Name, Author Name, Copyright Year, Page Number.
+# Records are accumulated in plain column lists and the dataframe is built once
+def parse_pages(lines):
+    import pandas as pd
+
+    columns = QUINTET_COLUMNS + TABLE_COLUMNS + PAGE_COLUMNS
+    column_values = [[] for _ in columns]
+    appends = [values.append for values in column_values]
+    for record in parse_records(lines):
+        for append, value in zip(appends, record):
+            append(value)
+    return pd.DataFrame(dict(zip(columns, column_values)), columns=columns)
+
+# yield the non-empty values of the first column of the sheet,
+# streaming rows from a read-only workbook
 def read_lines_from_excel_spreadsheet(excel_file_long, sheet_name='munsell2rgb'):
     
-    # Load the workbook
-    workbook = openpyxl.load_workbook(excel_file_long)
-    
-    # Get the sheet named 'munsell2rgb'
-    sheet_data = workbook[sheet_name]
-    
-    # Read the lines from the first column
-    lines = [cell.value for cell in sheet_data['A'] if cell.value is not None]
-    
-    return lines
+    import openpyxl
+
+    # Load the workbook in read-only mode so rows are streamed, not loaded
+    workbook = openpyxl.load_workbook(excel_file_long, read_only=True)
+    try:
+        sheet_data = workbook[sheet_name]
+        
+        # Read the lines from the first column
+        for (value,) in sheet_data.iter_rows(min_col=1, max_col=1, values_only=True):
+            if value is not None:
+                yield value
+    finally:
+        workbook.close()
 
 
 def main(excel_file_long_dir):
@@ -1,13 +1,13 @@
 
-import pandas as pd
-import numpy as np
-from munsell_data_frame.MunsellDataFrame import MunsellDataFrame, SortOrder
 from munsell_data_frame.constants import HUE_PAGE_NAMES
 import os
 import argparse
 
 # reads an Excel spreadsheet with macros and writes a 
 def process_excel_file_macro(excel_file_macro_dir):
+    import pandas as pd
+    from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+
     # output
     parquet_file_macro = excel_file_macro_dir + "parquet_file_macro.parquet"
 
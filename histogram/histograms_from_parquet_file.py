@@ -1,65 +1,100 @@
 import argparse
 import os
-from matplotlib import pyplot as plt
-from munsell_data_frame import MunsellDataFrame
-
-# Requires a list of colorTuplles like this:
-# colorTuples = [
-#     (0,255,175),
-#     (255,175,0),
-#     (175,0,255),
-#     ...
-# ]
-def plot_color_histograms(parquet_file, colorTuples):
-    # Convert strings to integers and create separate lists for r, g, b values
-    r_values = [int(colorTuple[0]) for colorTuple in colorTuples]
-    g_values = [int(colorTuple[1]) for colorTuple in colorTuples]
-    b_values = [int(colorTuple[2]) for colorTuple in colorTuples]
-
-    # Create histograms for r, g, b values
-    fig = plt.figure(f"histogram of {parquet_file}" ,figsize=(18, 6))
-    # fig = plt.figure()
-
-    plt.subplot(131)  # 1 row, 3 columns, plot 1
-    plt.hist(r_values, bins=20, color='red', alpha=0.7)
-    plt.title('Red Values')
-
-    plt.subplot(132)  # 1 row, 3 columns, plot 2
-    plt.hist(g_values, bins=20, color='green', alpha=0.7)
-    plt.title('Green Values')
-
-    plt.subplot(133)  # 1 row, 3 columns, plot 3
-    plt.hist(b_values, bins=20, color='blue', alpha=0.7)
-    plt.title('Blue Values')
-
-    plt.draw()
-    plt.pause(1)
-    
-    input("\nHit any key to continue!\n")
-    
-    plt.close(fig)
-
-    
-def main(parquet_file):
-    munsell_df = MunsellDataFrame.from_parquet(parquet_file)
-    rgb_tuples = munsell_df.get_rgb_tuples()
-    plot_color_histograms(parquet_file, rgb_tuples)
+
+plot_bins = 20
+channel_colors = {'r': 'red', 'g': 'green', 'b': 'blue'}
+
+# plot the r, g, b histograms of every chip as one figure of 3 plots
+def plot_color_histograms(parquet_file, histograms, num_bins=plot_bins):
+    import numpy as np
+    from matplotlib import pyplot as plt
+    from munsell_data_frame.RGBHistograms import RGBHistograms, CHANNELS
+
+    fig = plt.figure(f"histogram of {parquet_file}", figsize=(18, 6))
+    edges = np.linspace(0, 256, num_bins + 1)
+    binned_counts = RGBHistograms.rebin(histograms.channel_counts, num_bins)
+    for channel_index, channel in enumerate(CHANNELS):
+        plt.subplot(131 + channel_index)  # 1 row, 3 columns
+        plt.stairs(binned_counts[channel_index], edges, fill=True, color=channel_colors[channel], alpha=0.7)
+        plt.title(f"{channel_colors[channel].capitalize()} Values")
+    return fig
+
+# return the png file name of the histograms of a parquet file,
+# named after its folder and file name
+def get_histogram_file_name(parquet_file):
+    folder_name = os.path.basename(os.path.dirname(os.path.abspath(parquet_file)))
+    return f"histogram_of_{folder_name}:{os.path.basename(parquet_file)}.png"
+
+# return the .npy file name of the joint r/g/b counts written next to stats_file
+def get_joint_counts_file_name(stats_file):
+    return os.path.splitext(stats_file)[0] + '_joint_counts.npy'
+
+# save a png of the histograms of every parquet file in output_folder,
+# write the stats of all of them to stats_file, as json if it ends with
+# '.json' or else as parquet, and their joint r/g/b counts, one
+# (bins, bins, bins) array per parquet file in order, to a .npy file
+# next to it
+def main(parquet_files, output_folder, stats_file, show=False):
+    import matplotlib
+    import numpy as np
+    import pandas as pd
+    from munsell_data_frame import MunsellDataFrame
+    from munsell_data_frame.RGBHistograms import RGBHistograms
+
+    if not show:
+        matplotlib.use('Agg')
+    from matplotlib import pyplot as plt
+
+    os.makedirs(output_folder, exist_ok=True)
+    stats_dfs = []
+    joint_counts = []
+    for parquet_file in parquet_files:
+        munsell_df = MunsellDataFrame.from_parquet(parquet_file)
+        histograms = RGBHistograms.from_munsell_data_frame(munsell_df)
+
+        fig = plot_color_histograms(parquet_file, histograms)
+        png_file = os.path.join(output_folder, get_histogram_file_name(parquet_file))
+        fig.savefig(png_file)
+        if show:
+            plt.show()
+        plt.close(fig)
+
+        stats_df = histograms.get_stats()
+        stats_df.insert(0, 'parquet_file', parquet_file)
+        stats_dfs.append(stats_df)
+        joint_counts.append(histograms.joint_counts)
+        print(f"{png_file} chips:{histograms.num_chips}")
+
+    stats_df = pd.concat(stats_dfs, ignore_index=True)
+    if stats_file.lower().endswith('.json'):
+        stats_df.to_json(stats_file, orient='records', indent=2)
+    else:
+        stats_df.to_parquet(stats_file, index=False)
+    print(f"{stats_file} rows:{len(stats_df)}")
+
+    joint_counts = np.stack(joint_counts)
+    joint_counts_file = get_joint_counts_file_name(stats_file)
+    np.save(joint_counts_file, joint_counts)
+    print(f"{joint_counts_file} shape:{joint_counts.shape}")
 
 
 if __name__ == "__main__":
-    
-    parser = argparse.ArgumentParser(description='Display a color histogram from a Munsell parquet file.')
-    parser.add_argument('--p', required=True, help='Input Munsell Parquet file')
+
+    parser = argparse.ArgumentParser(description='Save color histograms and stats of Munsell parquet files.')
+    parser.add_argument('--p', required=True, nargs='+', help='Input Munsell Parquet files')
+    parser.add_argument('--o', default=os.path.dirname(os.path.abspath(__file__)), help='output folder of the histogram png files (default: this folder)')
+    parser.add_argument('--stats', default=None, help='output stats .parquet or .json file, the joint r/g/b counts are written next to it as <name>_joint_counts.npy (default: histogram_stats.parquet in the output folder)')
+    parser.add_argument('--show', action='store_true', help='also display each histogram and wait for its window to close')
 
     args = parser.parse_args()
-    
-    parquet_file = args.p
 
-    # Check if the parquet_file exists and is readable
-    if not os.path.isfile(parquet_file) or not os.access(parquet_file, os.R_OK):
-        print(f"Error: The file {parquet_file} does not exist or is not readable.")
-        exit(1)
+    # Check if every parquet_file exists and is readable
+    for parquet_file in args.p:
+        if not os.path.isfile(parquet_file) or not os.access(parquet_file, os.R_OK):
+            print(f"Error: The file {parquet_file} does not exist or is not readable.")
+            exit(1)
+
+    stats_file = args.stats or os.path.join(args.o, 'histogram_stats.parquet')
+    main(args.p, args.o, stats_file, show=args.show)
 
-    main(parquet_file)
-    
     print("done")
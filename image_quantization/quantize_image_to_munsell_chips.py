@@ -0,0 +1,56 @@
+import argparse
+import os
+import time
+
+# map every pixel of an image to its nearest Munsell chip and save the
+# recoloured image, the chip index raster and the chip pixel counts
+def main(image_file, parquet_file, output_folder, space='rgb', table_file=None, tile_size=512, num_workers=None):
+    from munsell_data_frame import MunsellDataFrame
+    from munsell_data_frame.ImageQuantizer import ImageQuantizer
+
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file).groupby_color_key()
+    quantizer = ImageQuantizer(munsell_df, space=space, table_file=table_file, tile_size=tile_size, num_workers=num_workers)
+
+    os.makedirs(output_folder, exist_ok=True)
+    image_name = os.path.splitext(os.path.basename(image_file))[0]
+    chip_index_file = os.path.join(output_folder, f"{image_name}_chip_indices.npy")
+
+    start = time.perf_counter()
+    quantized = quantizer.quantize(image_file, chip_index_file=chip_index_file)
+    seconds = time.perf_counter() - start
+    height, width = quantized.chip_indices.shape
+    print(f"{image_file} {width}x{height} quantized in {seconds:.2f}s")
+
+    recolored_file = os.path.join(output_folder, f"{image_name}_munsell.png")
+    quantized.get_recolored_image().save(recolored_file)
+    print(f"{recolored_file} written")
+    print(f"{chip_index_file} written")
+
+    counts_file = os.path.join(output_folder, f"{image_name}_chip_counts.parquet")
+    counts_mdf = quantized.get_counts_munsell_df()
+    counts_mdf.to_parquet(counts_file)
+    print(f"{counts_file} written with {len(counts_mdf.df)} chips")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Quantize an image to the nearest chips of a Munsell Parquet file.')
+    parser.add_argument('--i', required=True, help='Input image file')
+    parser.add_argument('--p', required=True, help='Input Munsell Parquet file')
+    parser.add_argument('--o', required=True, help='output folder')
+    parser.add_argument('--space', choices=['rgb', 'lab'], default='rgb', help='colour space of the nearest chip distance (default: rgb)')
+    parser.add_argument('--table', default=None, help='chip lookup table .npy file, built if missing or stale')
+    parser.add_argument('--tile-size', type=int, default=512, help='tile size in pixels (default: 512)')
+    parser.add_argument('--workers', type=int, default=None, help='number of quantizing processes (default: all cores)')
+
+    args = parser.parse_args()
+
+    for input_file in [args.i, args.p]:
+        # Check if the input file exists and is readable
+        if not os.path.isfile(input_file) or not os.access(input_file, os.R_OK):
+            print(f"Error: The file {input_file} does not exist or is not readable.")
+            exit(1)
+
+    main(args.i, args.p, args.o, space=args.space, table_file=args.table, tile_size=args.tile_size, num_workers=args.workers)
+
+    print("done")
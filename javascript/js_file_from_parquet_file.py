@@ -1,16 +1,54 @@
 import os
-import pandas as pd
+import base64
+import io
 from pathlib import Path
-from munsell_data_frame import MunsellDataFrame
 import argparse
 import json
 
-def main(js_file, parquet_file):
+# the uint8 columns of the typed array formats, in blob order
+TYPED_COLUMNS = ['hue_page_number', 'value_row', 'chroma_column', 'r', 'g', 'b']
+
+# loader shared by the typed array formats. It slices one Uint8Array per
+# column out of the chip bytes and rebuilds flatColorChips from them, so
+# existing imports keep working
+TYPED_LOADER = """
+export const numChips = %(num_chips)d;
+export const columns = Object.fromEntries(
+  %(columns)s.map((name, i) => [name, chipBytes.subarray(i * numChips, (i + 1) * numChips)]));
+
+const pad = (n) => (n < 10 ? "0" : "") + n;
+const { hue_page_number, value_row, chroma_column, r, g, b } = columns;
+export const flatColorChips = new Array(numChips);
+for (let i = 0; i < numChips; i++) {
+  flatColorChips[i] = {
+    color_key: pad(hue_page_number[i]) + "-" + pad(value_row[i]) + "-" + pad(chroma_column[i]),
+    r: r[i], g: g[i], b: b[i],
+  };
+}
+"""
+
+BASE64_SOURCE = """const chipBase64 = "%(base64)s";
+const chipBytes = typeof Buffer !== "undefined"
+  ? new Uint8Array(Buffer.from(chipBase64, "base64"))
+  : Uint8Array.from(atob(chipBase64), (c) => c.charCodeAt(0));
+"""
+
+BIN_SOURCE = """const chipBytesUrl = new URL("./%(bin_name)s", import.meta.url);
+const chipBytes = chipBytesUrl.protocol === "file:"
+  ? new Uint8Array(await (await import("node:fs/promises")).readFile(chipBytesUrl))
+  : new Uint8Array(await (await fetch(chipBytesUrl)).arrayBuffer());
+"""
+
+# return the color_key grouped records of a Munsell parquet file, as a
+# MunsellDataFrame, or as a ChipTable without importing pandas
+def get_munsell_df(parquet_file, engine='pandas'):
+    if engine == 'chiptable':
+        from munsell_data_frame import ChipTable
+        return ChipTable.from_parquet(parquet_file).groupby_color_key()
+
+    from munsell_data_frame import MunsellDataFrame
+    munsell_df = MunsellDataFrame.from_parquet(parquet_file)
 
-    # parquet_file input
-    parquet_filename = parquet_file
-    munsell_df = MunsellDataFrame.from_parquet(parquet_filename)
-    
     if 'page_hue_name' in munsell_df.df.columns:
         munsell_df.df.rename(columns={'page_hue_name':'hue_page_name'}, inplace=True)
         assert 'page_hue_name' not in munsell_df.df.columns, "page_hue_name not renamed"
@@ -18,41 +56,88 @@ def main(js_file, parquet_file):
     if 'page_hue_number' in munsell_df.df.columns:
         munsell_df.df.rename(columns={'page_hue_number':'hue_page_number'}, inplace=True)
         assert 'page_hue_number' not in munsell_df.df.columns, "page_hue_number not renamed"
-            
+
     munsell_df.set_color_key()
-    munsell_df = munsell_df.groupby_color_key()
-        
-    munsell_records = munsell_df.to_dict('records')
+    return munsell_df.groupby_color_key()
+
+# return the js source of one json object per chip
+def get_json_source(munsell_df):
+    from munsell_data_frame import ChipTable
+
+    if isinstance(munsell_df, ChipTable):
+        munsell_records = munsell_df.to_records()
+    else:
+        munsell_records = munsell_df.df[['color_key', 'r', 'g', 'b']].to_dict('records')
+    js = io.StringIO()
+    js.write("export const flatColorChips = [\n")
+    for record in munsell_records:
+        js.write(json.dumps(record) + ',\n')
+    js.write("\n];\n")
+    return js.getvalue()
+
+# return the chip bytes of the typed array formats: one block of
+# len(munsell_df) uint8 per TYPED_COLUMNS column, of a MunsellDataFrame,
+# a MunsellGrid or a ChipTable
+def get_chip_bytes(munsell_df):
+    import numpy as np
+    from munsell_data_frame import ChipTable, MunsellGrid
+    from munsell_data_frame.color_keys import decode_color_keys
+
+    if isinstance(munsell_df, (MunsellGrid, ChipTable)):
+        return munsell_df.get_chip_bytes()
+    df = munsell_df.df
+    hue_page_numbers, value_rows, chroma_columns = decode_color_keys(df['color_key'].to_numpy())
+    rgbs = [df[channel].to_numpy(dtype=np.uint8) for channel in ['r', 'g', 'b']]
+    return np.concatenate([hue_page_numbers, value_rows, chroma_columns] + rgbs).astype(np.uint8).tobytes()
+
+# return the js source of the typed array loader given its chip bytes source
+def get_typed_source(num_chips, chip_bytes_source):
+    return chip_bytes_source + TYPED_LOADER % {'num_chips': num_chips, 'columns': json.dumps(TYPED_COLUMNS)}
+
+# write js_file in the given format:
+#   'json'   one json object per chip in flatColorChips
+#   'base64' uint8 columns inlined as base64, decoded by the loader
+#   'bin'    uint8 columns in a sidecar .bin file, fetched by the loader
+# every file is written with one write call
+# the 'chiptable' engine reads the parquet file without importing pandas
+def main(js_file, parquet_file, js_format='json', engine='pandas'):
+    munsell_df = get_munsell_df(parquet_file, engine)
+    num_chips = len(munsell_df)
 
-    # js_file output
     js_filename = js_file
     js_file = Path(js_filename)
-    if js_file.exists():
-        js_file.unlink()
-    with open(js_file, "w") as js:
-        num_objects = 0
-        js.write("export const flatColorChips = [\n")
-        for record in munsell_records:
-            js.write(json.dumps(record) + ',\n')
-            num_objects += 1
-        js.write("\n];\n")
-        
-    print(f"{js_filename} written as a javascript array with {num_objects} objects")
+    if js_format == 'json':
+        js_source = get_json_source(munsell_df)
+    else:
+        chip_bytes = get_chip_bytes(munsell_df)
+        if js_format == 'base64':
+            js_source = get_typed_source(num_chips, BASE64_SOURCE % {'base64': base64.b64encode(chip_bytes).decode('ascii')})
+        else:
+            bin_file = js_file.with_suffix('.bin')
+            bin_file.write_bytes(chip_bytes)
+            js_source = get_typed_source(num_chips, BIN_SOURCE % {'bin_name': bin_file.name})
+            print(f"{bin_file} written with {len(chip_bytes)} bytes")
+
+    js_file.write_text(js_source)
+
+    print(f"{js_filename} written as a {js_format} javascript module with {num_chips} objects")
 
 if __name__ == "__main__":
-    
+
     parser = argparse.ArgumentParser(description='Convert Munsell Parquet file to JS.')
     parser.add_argument('--dir', required=True, help='parent dir')
     parser.add_argument('--p', required=True, help='Input Munsell Parquet file')
     parser.add_argument('--j', required=True, help='Output Munsell JS file')
+    parser.add_argument('--format', choices=['json', 'base64', 'bin'], default='json', help='json objects, or typed array columns inlined as base64 or in a sidecar .bin file (default: json)')
+    parser.add_argument('--engine', choices=['pandas', 'chiptable'], default='pandas', help='read the chips into a MunsellDataFrame, or into a ChipTable without importing pandas (default: pandas)')
 
     args = parser.parse_args()
-    
+
     excel_file_dir = args.dir + "/"
     js_file = excel_file_dir + args.j
     parquet_file = excel_file_dir + args.p
 
-    
+
     # Check if the directory exists and is read/writeable
     if not os.path.isdir(excel_file_dir) or not os.access(excel_file_dir, os.R_OK | os.W_OK):
         print(f"Error: The directory {excel_file_dir} does not exist or is not read/writeable.")
@@ -62,7 +147,7 @@ if __name__ == "__main__":
     if not os.path.isfile(parquet_file) or not os.access(parquet_file, os.R_OK):
         print(f"Error: The file {parquet_file} does not exist or is not readable.")
         exit(1)
-        
-    main(js_file, parquet_file)
+
+    main(js_file, parquet_file, args.format, args.engine)
 
     print("done")
@@ -0,0 +1,101 @@
+import numpy as np
+from .color_science import rgb_to_lab
+
+# the colour spaces that ChipLookup can measure distances in
+SPACES = ('rgb', 'lab')
+
+# Nearest-chip lookup of arbitrary sRGB colours.
+#
+# The chip colours are indexed once in a scipy cKDTree, or searched by
+# chunked brute force with NumPy when scipy is not installed. Integer
+# queries are deduplicated first, so images with repeated colours only
+# search each distinct colour once.
+class ChipLookup:
+
+    # rgbs is an (n, 3) array of the chip colours and color_keys their keys.
+    # space is 'rgb' for euclidean distance in 0-255 sRGB or 'lab' for
+    # CIE76 distance in CIELAB
+    # raises ValueError for other spaces or if there are no chips
+    def __init__(self, rgbs, color_keys=None, space='rgb', use_kdtree=True):
+        if space not in SPACES:
+            raise ValueError(f"space must be one of {SPACES}, not '{space}'")
+        self.rgbs = np.asarray(rgbs).reshape(-1, 3)
+        if len(self.rgbs) == 0:
+            raise ValueError("no chips to look up")
+        self.color_keys = None if color_keys is None else np.asarray(color_keys)
+        self.space = space
+        self.points = self._to_space(self.rgbs)
+        self.kdtree = None
+        if use_kdtree:
+            try:
+                from scipy.spatial import cKDTree
+                self.kdtree = cKDTree(self.points)
+            except ImportError:
+                pass
+
+    # return a ChipLookup of the 'r', 'g', 'b' and 'color_key' columns
+    # of a MunsellDataFrame
+    @classmethod
+    def from_munsell_data_frame(cls, munsell_df, space='rgb', use_kdtree=True):
+        df = munsell_df.df
+        color_keys = df['color_key'].to_numpy() if 'color_key' in df.columns else None
+        return cls(df[['r', 'g', 'b']].to_numpy(dtype=np.float64), color_keys, space=space, use_kdtree=use_kdtree)
+
+    # return float64 points of (n, 3) rgbs in the lookup space
+    def _to_space(self, rgbs):
+        if self.space == 'lab':
+            return rgb_to_lab(rgbs)
+        return np.asarray(rgbs, dtype=np.float64)
+
+    # return (distances, indices) of the k nearest chips of each of
+    # (n, 3) rgbs, ordered by distance, with shape (n,) if k is 1
+    # otherwise (n, k). Indices are chip row positions.
+    # num_workers is the number of cKDTree query threads, -1 for all cores
+    def query(self, rgbs, k=1, chunk_size=65536, num_workers=-1):
+        rgbs = np.asarray(rgbs).reshape(-1, 3)
+        k = min(k, len(self.points))
+
+        # search each distinct integer colour once
+        inverse = None
+        if rgbs.dtype.kind in 'ui' and len(rgbs) > 1:
+            packed = (rgbs[:, 0].astype(np.uint32) << 16) | (rgbs[:, 1].astype(np.uint32) << 8) | rgbs[:, 2].astype(np.uint32)
+            unique_packed, inverse = np.unique(packed, return_inverse=True)
+            rgbs = np.stack([unique_packed >> 16, (unique_packed >> 8) & 255, unique_packed & 255], axis=1)
+
+        points = self._to_space(rgbs)
+        if self.kdtree is not None:
+            distances, indices = self.kdtree.query(points, k=k, workers=num_workers)
+            distances, indices = distances.reshape(len(points), k), indices.reshape(len(points), k)
+        else:
+            distances, indices = self._brute_force_query(points, k, chunk_size)
+
+        if inverse is not None:
+            distances, indices = distances[inverse.ravel()], indices[inverse.ravel()]
+        if k == 1:
+            return distances[:, 0], indices[:, 0]
+        return distances, indices
+
+    # return (distances, indices) of shape (n, k) by comparing every point
+    # with every chip, chunk_size points at a time
+    def _brute_force_query(self, points, k, chunk_size):
+        distances = np.empty((len(points), k))
+        indices = np.empty((len(points), k), dtype=np.int64)
+        chip_norms = (self.points ** 2).sum(axis=1)
+        rows = np.arange(min(chunk_size, len(points)))[:, None]
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start:start + chunk_size]
+            squared = chip_norms - 2 * chunk @ self.points.T + (chunk ** 2).sum(axis=1)[:, None]
+            nearest = np.argpartition(squared, k - 1, axis=1)[:, :k] if k < len(self.points) else np.tile(np.arange(k), (len(chunk), 1))
+            order = np.argsort(squared[rows[:len(chunk)], nearest], axis=1, kind='stable')
+            nearest = nearest[rows[:len(chunk)], order]
+            indices[start:start + len(chunk)] = nearest
+            distances[start:start + len(chunk)] = np.sqrt(np.maximum(squared[rows[:len(chunk)], nearest], 0))
+        return distances, indices
+
+    # return the color_keys of the k nearest chips of each of (n, 3) rgbs,
+    # see query
+    # raises ValueError if the chips have no color_keys
+    def lookup(self, rgbs, k=1):
+        if self.color_keys is None:
+            raise ValueError("the chips have no color_keys")
+        return self.color_keys[self.query(rgbs, k=k)[1]]
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .ChipLookup import ChipLookup
+
+# bumped whenever the table layout or the way it is built changes
+TABLE_VERSION = 1
+
+# the ChipLookup of the chips being tabulated by this worker process
+_worker_lookup = None
+
+# A table of the nearest chip index of every sRGB colour, for O(1) lookups.
+#
+# With bits=8 the table has one uint16 entry for each of the 256**3
+# colours, indexed by (r << 16) | (g << 8) | b. Fewer bits quantize each
+# channel to 2**bits levels and store the nearest chip of each level's
+# centre. The table is a .npy file loaded with np.load(mmap_mode='r'),
+# and a sidecar .json holds the color_keys of the chips and the sha256
+# of everything the table was built from, so a stale table is rebuilt.
+class ChipLookupTable:
+
+    def __init__(self, table, color_keys, bits=8, space='rgb'):
+        self.table = table
+        self.color_keys = np.asarray(color_keys)
+        self.bits = bits
+        self.space = space
+
+    # return the sha256 hex digest of the inputs of a table
+    @classmethod
+    def content_hash(cls, chip_rgbs, color_keys, space, bits):
+        digest = hashlib.sha256(f"{TABLE_VERSION}:{space}:{bits}:".encode())
+        digest.update(np.ascontiguousarray(chip_rgbs, dtype=np.uint8).tobytes())
+        digest.update('\n'.join(map(str, color_keys)).encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def _metadata_file(cls, table_file):
+        return os.path.splitext(table_file)[0] + '.json'
+
+    # return the ChipLookupTable of the 'r', 'g', 'b' and 'color_key' columns
+    # of a MunsellDataFrame, see load_or_build
+    @classmethod
+    def from_munsell_data_frame(cls, munsell_df, table_file, space='rgb', bits=8, num_workers=None):
+        df = munsell_df.df
+        return cls.load_or_build(table_file, df[['r', 'g', 'b']].to_numpy(dtype=np.uint8), df['color_key'].to_numpy(), space=space, bits=bits, num_workers=num_workers)
+
+    # return the table saved in table_file if it was built from the same
+    # chips, space and bits, otherwise build it there first
+    @classmethod
+    def load_or_build(cls, table_file, chip_rgbs, color_keys, space='rgb', bits=8, num_workers=None):
+        content_hash = cls.content_hash(chip_rgbs, color_keys, space, bits)
+        try:
+            with open(cls._metadata_file(table_file)) as f:
+                metadata = json.load(f)
+            if metadata['sha256'] == content_hash and os.path.isfile(table_file):
+                return cls(np.load(table_file, mmap_mode='r'), metadata['color_keys'], bits=bits, space=space)
+        except (OSError, ValueError, KeyError):
+            pass
+        cls.build(table_file, chip_rgbs, color_keys, space=space, bits=bits, num_workers=num_workers)
+        return cls(np.load(table_file, mmap_mode='r'), color_keys, bits=bits, space=space)
+
+    # build the table of the given chips into table_file and its sidecar,
+    # num_red_levels red levels at a time in a pool of num_workers
+    # processes (all cores if None, in this process if 1). Each worker
+    # writes its rows straight into the memory mapped .npy file.
+    # raises ValueError if there are more chips than a uint16 can index
+    @classmethod
+    def build(cls, table_file, chip_rgbs, color_keys, space='rgb', bits=8, num_workers=None, num_red_levels=8):
+        if not 1 <= bits <= 8:
+            raise ValueError("bits must be between 1 and 8")
+        chip_rgbs = np.asarray(chip_rgbs, dtype=np.uint8).reshape(-1, 3)
+        if len(chip_rgbs) > np.iinfo(np.uint16).max:
+            raise ValueError("too many chips for a uint16 table")
+
+        # build into a temporary file so a failed build leaves no table behind
+        num_levels = 1 << bits
+        building_file = table_file + '.building.npy'
+        table = np.lib.format.open_memmap(building_file, mode='w+', dtype=np.uint16, shape=(num_levels ** 3,))
+        del table
+
+        tasks = [(building_file, bits, start, min(start + num_red_levels, num_levels)) for start in range(0, num_levels, num_red_levels)]
+        if num_workers == 1:
+            _init_worker(chip_rgbs, space)
+            for task in tasks:
+                _build_red_levels(*task, num_threads=-1)
+        else:
+            with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker, initargs=(chip_rgbs, space)) as executor:
+                for future in [executor.submit(_build_red_levels, *task) for task in tasks]:
+                    future.result()
+
+        os.replace(building_file, table_file)
+        metadata = {
+            'sha256': cls.content_hash(chip_rgbs, color_keys, space, bits),
+            'space': space,
+            'bits': bits,
+            'num_chips': len(chip_rgbs),
+            'color_keys': [str(color_key) for color_key in color_keys],
+        }
+        with open(cls._metadata_file(table_file), 'w') as f:
+            json.dump(metadata, f)
+
+    # return the table index of each of (n, 3) uint8 rgbs
+    def table_indices(self, rgbs):
+        rgbs = np.asarray(rgbs, dtype=np.uint8).reshape(-1, 3)
+        shift = 8 - self.bits
+        levels = (rgbs >> shift).astype(np.uint32)
+        return (levels[:, 0] << (2 * self.bits)) | (levels[:, 1] << self.bits) | levels[:, 2]
+
+    # return the nearest chip index of each of (n, 3) uint8 rgbs
+    def lookup_indices(self, rgbs):
+        return self.table[self.table_indices(rgbs)]
+
+    # return the nearest chip color_key of each of (n, 3) uint8 rgbs
+    def lookup(self, rgbs):
+        return self.color_keys[self.lookup_indices(rgbs)]
+
+
+# set up the ChipLookup of a table building process
+def _init_worker(chip_rgbs, space):
+    global _worker_lookup
+    _worker_lookup = ChipLookup(chip_rgbs, space=space)
+
+# write the nearest chip of every colour with red level in [red_start, red_stop)
+# into the table, querying the centre colour of each level
+def _build_red_levels(table_file, bits, red_start, red_stop, num_threads=1):
+    num_levels = 1 << bits
+    shift = 8 - bits
+    centres = np.arange(num_levels) * (1 << shift) + ((1 << shift) - 1) / 2
+    red, green, blue = np.meshgrid(centres[red_start:red_stop], centres, centres, indexing='ij')
+    rgbs = np.stack([red.ravel(), green.ravel(), blue.ravel()], axis=1)
+    _, indices = _worker_lookup.query(rgbs, num_workers=num_threads)
+
+    table = np.load(table_file, mmap_mode='r+')
+    table[red_start * num_levels ** 2:red_stop * num_levels ** 2] = indices
+    table.flush()
@@ -0,0 +1,287 @@
+import csv
+import numpy as np
+from .constants import HUE_PAGE_NAMES, MUNSELL_DATAFRAME_COLUMNS
+from .color_keys import pack_color_keys, unpack_color_keys, encode_color_keys, decode_color_keys
+from .GamutBoundary import GamutBoundary
+
+# the uint8 columns of a ChipTable, in the block order of get_chip_bytes
+CHIP_COLUMNS = ['hue_page_number', 'value_row', 'chroma_column', 'r', 'g', 'b']
+
+# the older name of the hue_page_number column in some parquet files
+LEGACY_COLUMNS = {'page_hue_number': 'hue_page_number'}
+
+# one chip of a ChipTable
+class ColorChip:
+    __slots__ = ('hue_page_number', 'value_row', 'chroma_column', 'r', 'g', 'b')
+
+    def __init__(self, hue_page_number, value_row, chroma_column, r, g, b):
+        self.hue_page_number = hue_page_number
+        self.value_row = value_row
+        self.chroma_column = chroma_column
+        self.r = r
+        self.g = g
+        self.b = b
+
+    # the "HH-VV-CC" color_key of the chip
+    @property
+    def color_key(self):
+        return f"{self.hue_page_number:02d}-{self.value_row:02d}-{self.chroma_column:02d}"
+
+    # the hue page name of the chip, e.g. '2.5R'
+    @property
+    def hue_page_name(self):
+        return HUE_PAGE_NAMES[self.hue_page_number]
+
+    # the (r, g, b) tuple of the chip
+    @property
+    def rgb(self):
+        return (self.r, self.g, self.b)
+
+    # return the chip's values in CHIP_COLUMNS order
+    def _values(self):
+        return (self.hue_page_number, self.value_row, self.chroma_column, self.r, self.g, self.b)
+
+    def __eq__(self, other):
+        return isinstance(other, ColorChip) and self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        return f"ColorChip({self.color_key!r}, r={self.r}, g={self.g}, b={self.b})"
+
+
+# The chips of a Munsell parquet or csv file as uint8 numpy columns, for
+# short-lived scripts that only read, look up and export the reference
+# chips. Unlike MunsellDataFrame it never imports pandas, and pyarrow only
+# to read or write parquet files.
+#
+# Chips are read as ColorChip records by index or iteration, and color
+# keys are looked up with a searchsorted over the sorted packed keys.
+class ChipTable:
+
+    # the dimension arrays and (n, 3) rgbs of the chips
+    def __init__(self, hue_page_numbers, value_rows, chroma_columns, rgbs):
+        self.hue_page_numbers = np.asarray(hue_page_numbers, dtype=np.uint8)
+        self.value_rows = np.asarray(value_rows, dtype=np.uint8)
+        self.chroma_columns = np.asarray(chroma_columns, dtype=np.uint8)
+        self.rgbs = np.asarray(rgbs, dtype=np.uint8).reshape(-1, 3)
+        self._sorted_lookup = None
+
+    # return the table of an array of "HH-VV-CC" color_keys and their (n, 3) rgbs
+    # raises ValueError if any key is not of the form "HH-VV-CC"
+    @classmethod
+    def from_color_keys(cls, color_keys, rgbs):
+        return cls(*decode_color_keys(color_keys), rgbs)
+
+    # return the table of the bytes of get_chip_bytes
+    @classmethod
+    def from_chip_bytes(cls, chip_bytes):
+        blocks = np.frombuffer(chip_bytes, dtype=np.uint8).reshape(len(CHIP_COLUMNS), -1)
+        return cls(blocks[0], blocks[1], blocks[2], blocks[3:].T)
+
+    # return the table of a dict of column name to equal-length arrays or
+    # lists, with 'r', 'g', 'b' and either the dimension columns or 'color_key'
+    # raises ValueError if the chips cannot be located or have missing values
+    @classmethod
+    def _from_columns(cls, columns):
+        columns = {LEGACY_COLUMNS.get(name, name): values for name, values in columns.items()}
+        if any(channel not in columns for channel in ['r', 'g', 'b']):
+            raise ValueError("chips need 'r', 'g' and 'b' columns")
+        try:
+            rgbs = np.column_stack([np.asarray(columns[channel], dtype=np.float64) for channel in ['r', 'g', 'b']])
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"invalid r, g, b values: {e}") from e
+        if np.isnan(rgbs).any():
+            raise ValueError("chips must not have missing r, g, b values")
+        if all(name in columns for name in CHIP_COLUMNS[:3]):
+            try:
+                dims = [np.asarray(columns[name], dtype=np.float64) for name in CHIP_COLUMNS[:3]]
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"invalid dimension values: {e}") from e
+            if not any(np.isnan(dim).any() for dim in dims):
+                return cls(*dims, rgbs)
+        if 'color_key' in columns:
+            return cls.from_color_keys(columns['color_key'], rgbs)
+        raise ValueError("chips need dimension columns or 'color_key'")
+
+    # return the table of a Munsell parquet file, reading only the columns
+    # it needs. ParquetFile.read and to_pylist are used because read_table
+    # and the to_numpy of pyarrow arrays import pandas
+    @classmethod
+    def from_parquet(cls, filename):
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(filename.strip())
+        names = [name for name in parquet_file.schema_arrow.names if _is_chip_column(name)]
+        table = parquet_file.read(columns=names)
+        return cls._from_columns({name: table.column(name).to_pylist() for name in names})
+
+    # return the table of a csv file with a header row, such as one written
+    # by to_csv or MunsellDataFrame.to_csv
+    @classmethod
+    def from_csv(cls, filename):
+        with open(filename, newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = list(reader)
+        return cls._from_columns({name: [row[i] for row in rows] if name == 'color_key' else [_float_or_nan(row[i]) for row in rows]
+                                  for i, name in enumerate(header) if _is_chip_column(name)})
+
+    # return the table of the chips of a MunsellDataFrame
+    @classmethod
+    def from_munsell_data_frame(cls, munsell_df):
+        df = munsell_df.df
+        return cls._from_columns({name: df[name].to_numpy() if name == 'color_key' else df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+                                  for name in df.columns if _is_chip_column(name)})
+
+    # return a new MunsellDataFrame of the chips, with every column of MUNSELL_DATAFRAME_COLUMNS
+    def to_munsell_data_frame(self):
+        from .MunsellDataFrame import MunsellDataFrame
+        return MunsellDataFrame(self._get_columns())
+
+    # return a dict of MUNSELL_DATAFRAME_COLUMNS name to column array
+    def _get_columns(self):
+        return {
+            'hue_page_number': self.hue_page_numbers,
+            'hue_page_name': np.array(HUE_PAGE_NAMES)[self.hue_page_numbers],
+            'value_row': self.value_rows,
+            'chroma_column': self.chroma_columns,
+            'color_key': self.color_keys,
+            'r': self.rgbs[:, 0],
+            'g': self.rgbs[:, 1],
+            'b': self.rgbs[:, 2],
+        }
+
+    # write the chips to a parquet file with MUNSELL_DATAFRAME_COLUMNS.
+    # The arrow arrays are built from their buffers because pa.array and
+    # pa.table import pandas
+    def to_parquet(self, filename):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        columns = self._get_columns()
+        arrays = [_arrow_array(columns[name]) for name in MUNSELL_DATAFRAME_COLUMNS]
+        pq.write_table(pa.Table.from_arrays(arrays, names=MUNSELL_DATAFRAME_COLUMNS), filename)
+
+    # write the chips to a csv file with a header row of MUNSELL_DATAFRAME_COLUMNS
+    def to_csv(self, filename):
+        columns = self._get_columns()
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(MUNSELL_DATAFRAME_COLUMNS)
+            writer.writerows(zip(*(columns[name].tolist() for name in MUNSELL_DATAFRAME_COLUMNS)))
+
+    def __len__(self):
+        return len(self.hue_page_numbers)
+
+    # return the ColorChip of row i
+    def __getitem__(self, i):
+        r, g, b = self.rgbs[i].tolist()
+        return ColorChip(int(self.hue_page_numbers[i]), int(self.value_rows[i]), int(self.chroma_columns[i]), r, g, b)
+
+    # yield the ColorChip of every row
+    def __iter__(self):
+        columns = [self.hue_page_numbers.tolist(), self.value_rows.tolist(), self.chroma_columns.tolist()] + self.rgbs.T.tolist()
+        for values in zip(*columns):
+            yield ColorChip(*values)
+
+    # the "HH-VV-CC" color_keys of the chips
+    @property
+    def color_keys(self):
+        return encode_color_keys(self.hue_page_numbers, self.value_rows, self.chroma_columns)
+
+    # the packed uint32 color keys of the chips
+    @property
+    def packed_color_keys(self):
+        return pack_color_keys(self.hue_page_numbers, self.value_rows, self.chroma_columns)
+
+    # return (sorted packed keys, their rows), built on first use
+    def _get_sorted_lookup(self):
+        if self._sorted_lookup is None:
+            packed_color_keys = self.packed_color_keys
+            order = np.argsort(packed_color_keys, kind='stable')
+            self._sorted_lookup = (packed_color_keys[order], order)
+        return self._sorted_lookup
+
+    # return (rgbs, found) of an array of "HH-VV-CC" color_keys: the (n, 3)
+    # uint8 rgbs of the first chip of each key, 0 where found is False
+    # raises ValueError if any key is not of the form "HH-VV-CC"
+    def lookup_color_keys(self, color_keys):
+        sorted_keys, order = self._get_sorted_lookup()
+        packed_color_keys = pack_color_keys(*decode_color_keys(color_keys))
+        positions = np.minimum(np.searchsorted(sorted_keys, packed_color_keys), max(len(sorted_keys) - 1, 0))
+        found = sorted_keys[positions] == packed_color_keys if len(sorted_keys) else np.zeros(len(packed_color_keys), dtype=bool)
+        rgbs = np.zeros((len(packed_color_keys), 3), dtype=np.uint8)
+        rgbs[found] = self.rgbs[order[positions[found]]]
+        return rgbs, found
+
+    # return the (r, g, b) tuple of one color_key, or None if there is no such chip
+    def get_rgb(self, color_key):
+        try:
+            rgbs, found = self.lookup_color_keys([color_key])
+        except ValueError:
+            return None
+        return tuple(rgbs[0].tolist()) if found[0] else None
+
+    # return a new table of one chip per color_key in key order with the
+    # mean r, g, b of its chips truncated to uint8, as
+    # MunsellDataFrame.groupby_color_key
+    def groupby_color_key(self):
+        packed_color_keys = self.packed_color_keys
+        unique_keys, group_ids, counts = np.unique(packed_color_keys, return_inverse=True, return_counts=True)
+        sums = np.column_stack([np.bincount(group_ids, weights=self.rgbs[:, i], minlength=len(unique_keys)) for i in range(3)])
+        return ChipTable(*unpack_color_keys(unique_keys), (sums / counts[:, None]).astype(np.uint8))
+
+    # return a new table of the rows selected by an index array or boolean mask
+    def take(self, rows):
+        return ChipTable(self.hue_page_numbers[rows], self.value_rows[rows], self.chroma_columns[rows], self.rgbs[rows])
+
+    # yield (hue_page_number, ChipTable) for every hue page that has chips,
+    # in hue_page_number order
+    def iter_hue_pages(self):
+        order = np.argsort(self.hue_page_numbers, kind='stable')
+        sorted_pages = self.hue_page_numbers[order]
+        boundaries = np.flatnonzero(np.diff(sorted_pages)) + 1
+        for rows in np.split(order, boundaries):
+            if len(rows):
+                yield int(self.hue_page_numbers[rows[0]]), self.take(rows)
+
+    # return a dict of hue_page_number to (value_rows, chroma_columns, rgbs)
+    # arrays of every hue page, like HuePageRenderer.get_hue_page_arrays
+    def get_hue_page_arrays(self):
+        return {hue_page_number: (page.value_rows.astype(np.int64), page.chroma_columns.astype(np.int64), page.rgbs)
+                for hue_page_number, page in self.iter_hue_pages()}
+
+    # return the GamutBoundary of the chips, e.g. to size a HuePageRenderer
+    def get_gamut_boundary(self):
+        return GamutBoundary.from_arrays(self.hue_page_numbers, self.value_rows, self.chroma_columns)
+
+    # return the bytes of one uint8 block per CHIP_COLUMNS column, the
+    # layout of the typed array javascript exports
+    def get_chip_bytes(self):
+        return np.concatenate([self.hue_page_numbers, self.value_rows, self.chroma_columns, self.rgbs[:, 0], self.rgbs[:, 1], self.rgbs[:, 2]]).tobytes()
+
+    # return a list of {'color_key', 'r', 'g', 'b'} dicts of python values
+    def to_records(self):
+        return [{'color_key': color_key, 'r': r, 'g': g, 'b': b} for color_key, (r, g, b) in zip(self.color_keys.tolist(), self.rgbs.tolist())]
+
+
+# return True for the columns a ChipTable is read from
+def _is_chip_column(name):
+    return name in CHIP_COLUMNS or name in LEGACY_COLUMNS or name == 'color_key'
+
+# return the float of a csv field, nan for an empty or missing value
+def _float_or_nan(value):
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+# return the pyarrow array of a uint8 or string numpy column
+def _arrow_array(values):
+    import pyarrow as pa
+    if values.dtype == np.uint8:
+        return pa.Array.from_buffers(pa.uint8(), len(values), [None, pa.py_buffer(np.ascontiguousarray(values))])
+    encoded = [value.encode('utf-8') for value in values.tolist()]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int32)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return pa.Array.from_buffers(pa.string(), len(encoded), [None, pa.py_buffer(offsets), pa.py_buffer(b''.join(encoded))])
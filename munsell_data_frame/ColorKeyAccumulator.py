@@ -0,0 +1,90 @@
+import numpy as np
+from .MunsellDataFrame import MunsellDataFrame
+
+# Running per color_key sums of r/g/b samples, for reduce_by_color_key over
+# more rows than fit in memory.
+#
+# The accumulator holds one slot per distinct packed color key seen so far,
+# in key order: the number of rows, the sum of each channel and the total
+# weight of each channel's non-missing values (their count when unweighted).
+# Its size depends only on the number of distinct keys, e.g. 2734 keys take
+# about 150 kB however many batches of samples are added.
+class ColorKeyAccumulator:
+
+    def __init__(self):
+        self.packed_color_keys = np.zeros(0, dtype=np.uint32)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.sums = np.zeros((0, 3))
+        self.totals = np.zeros((0, 3))
+
+    # the number of distinct color keys accumulated
+    @property
+    def num_color_keys(self):
+        return len(self.packed_color_keys)
+
+    # the number of rows accumulated
+    @property
+    def num_rows(self):
+        return int(self.counts.sum())
+
+    # the bytes held by the accumulator
+    @property
+    def nbytes(self):
+        return self.packed_color_keys.nbytes + self.counts.nbytes + self.sums.nbytes + self.totals.nbytes
+
+    # add a batch of rows given their packed color keys, their (n, 3) float
+    # r/g/b values with nan where missing and optionally their weights
+    # returns None - since self has been altered
+    def update(self, packed_color_keys, rgbs, weights=None):
+        packed_color_keys = np.asarray(packed_color_keys, dtype=np.uint32)
+        if len(packed_color_keys) == 0:
+            return
+        unique_keys, counts, group_ids = MunsellDataFrame._group_packed_color_keys(packed_color_keys)
+        rgbs = np.asarray(rgbs, dtype=np.float64)
+        valid = ~np.isnan(rgbs)
+        channel_weights = valid if weights is None else valid * np.asarray(weights, dtype=np.float64)[:, None]
+        values = (rgbs if valid.all() else np.where(valid, rgbs, 0)) * channel_weights
+        sums = np.column_stack([np.bincount(group_ids, weights=values[:, i], minlength=len(counts)) for i in range(3)])
+        totals = np.column_stack([np.bincount(group_ids, weights=channel_weights[:, i], minlength=len(counts)) for i in range(3)])
+        self._add(unique_keys, counts, sums, totals)
+
+    # add the slots of another accumulator, e.g. of another partition
+    # returns None - since self has been altered
+    def merge(self, other):
+        self._add(other.packed_color_keys, other.counts, other.sums, other.totals)
+
+    # add the counts, sums and totals of sorted unique keys, growing the
+    # slots for keys not seen before
+    def _add(self, unique_keys, counts, sums, totals):
+        positions = np.searchsorted(self.packed_color_keys, unique_keys)
+        in_range = positions < len(self.packed_color_keys)
+        is_new = ~in_range
+        is_new[in_range] = self.packed_color_keys[positions[in_range]] != unique_keys[in_range]
+        if is_new.any():
+            packed_color_keys = np.union1d(self.packed_color_keys, unique_keys).astype(np.uint32)
+            old_positions = np.searchsorted(packed_color_keys, self.packed_color_keys)
+            grown_counts = np.zeros(len(packed_color_keys), dtype=np.int64)
+            grown_sums = np.zeros((len(packed_color_keys), 3))
+            grown_totals = np.zeros((len(packed_color_keys), 3))
+            grown_counts[old_positions] = self.counts
+            grown_sums[old_positions] = self.sums
+            grown_totals[old_positions] = self.totals
+            self.packed_color_keys, self.counts, self.sums, self.totals = packed_color_keys, grown_counts, grown_sums, grown_totals
+            positions = np.searchsorted(self.packed_color_keys, unique_keys)
+        self.counts[positions] += counts
+        self.sums[positions] += sums
+        self.totals[positions] += totals
+
+    # return the (n, 3) float means of each channel of each key, nan for a
+    # channel without values
+    def get_means(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.totals > 0, self.sums / self.totals, np.nan)
+
+    # return a new MunsellDataFrame of one row per color_key in key order,
+    # as returned by MunsellDataFrame.reduce_by_color_key: the dimension and
+    # 'color_key' columns with the mean r/g/b rounded to UInt8 unless
+    # round_rgb is False, and the 'count' of rows if with_counts
+    def to_munsell_data_frame(self, with_counts=False, round_rgb=True, with_packed_color_key=False):
+        return MunsellDataFrame._from_color_key_groups(self.packed_color_keys, self.get_means(), self.counts if with_counts else None,
+                                                       round_rgb=round_rgb, with_packed_color_key=with_packed_color_key)
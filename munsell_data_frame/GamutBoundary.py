@@ -0,0 +1,122 @@
+import numpy as np
+from .constants import HUE_PAGE_NAMES
+
+# The gamut of a set of chips as the range of chroma columns of each
+# (hue page, value row).
+#
+# Each hue page has an irregular shape, but every value row of it holds
+# one contiguous run of chroma columns, so two small uint8 arrays of the
+# lowest and highest chroma column of each row describe the whole gamut.
+# Queries take arrays of fractional hue page numbers (wrapping at 40),
+# values and chromas, like MunsellGrid.interpolate, and are answered from
+# the rows around each chip without rescanning any frame.
+class GamutBoundary:
+
+    # min_chroma_columns and max_chroma_columns are (num_hue_pages,
+    # num_value_rows) uint8 arrays, with 0 in both for rows without chips
+    def __init__(self, min_chroma_columns, max_chroma_columns):
+        self.min_chroma_columns = min_chroma_columns
+        self.max_chroma_columns = max_chroma_columns
+
+    # return the boundary of equal-length arrays of chip dimensions
+    @classmethod
+    def from_arrays(cls, hue_page_numbers, value_rows, chroma_columns, num_hue_pages=len(HUE_PAGE_NAMES)):
+        hue_page_numbers = np.asarray(hue_page_numbers, dtype=np.intp)
+        value_rows = np.asarray(value_rows, dtype=np.intp)
+        chroma_columns = np.asarray(chroma_columns, dtype=np.intp)
+        shape = (num_hue_pages, int(value_rows.max(initial=0)) + 1)
+
+        # each row's extremes through its flat (hue page, value row) cell
+        cells = hue_page_numbers * shape[1] + value_rows
+        max_chroma_columns = np.zeros(shape[0] * shape[1], dtype=np.intp)
+        np.maximum.at(max_chroma_columns, cells, chroma_columns)
+        min_chroma_columns = np.full(shape[0] * shape[1], np.iinfo(np.uint8).max, dtype=np.intp)
+        np.minimum.at(min_chroma_columns, cells, chroma_columns)
+        min_chroma_columns[max_chroma_columns == 0] = 0
+        return cls(min_chroma_columns.reshape(shape).astype(np.uint8), max_chroma_columns.reshape(shape).astype(np.uint8))
+
+    # return the boundary of the chips of a MunsellDataFrame,
+    # decoding 'color_key' first if the dimension columns are missing
+    @classmethod
+    def from_munsell_data_frame(cls, munsell_df):
+        if not munsell_df.is_color_key_encodeable:
+            munsell_df.decode_color_key()
+        df = munsell_df.df
+        return cls.from_arrays(df['hue_page_number'].to_numpy(dtype=np.intp), df['value_row'].to_numpy(dtype=np.intp), df['chroma_column'].to_numpy(dtype=np.intp))
+
+    # return the boundary of the occupied cells of a MunsellGrid
+    @classmethod
+    def from_munsell_grid(cls, grid):
+        occupied = grid.mask.any(axis=2)
+        num_chroma_indices = grid.mask.shape[2]
+        min_chroma_columns = np.argmax(grid.mask, axis=2) * 2
+        max_chroma_columns = (num_chroma_indices - 1 - np.argmax(grid.mask[:, :, ::-1], axis=2)) * 2
+        return cls(np.where(occupied, min_chroma_columns, 0).astype(np.uint8), np.where(occupied, max_chroma_columns, 0).astype(np.uint8))
+
+    # the largest value row with chips
+    @property
+    def max_value_row(self):
+        occupied_rows = np.flatnonzero(self.max_chroma_columns.any(axis=0))
+        return int(occupied_rows[-1]) if len(occupied_rows) else 0
+
+    # the largest chroma column of any chip
+    @property
+    def max_chroma_column(self):
+        return int(self.max_chroma_columns.max(initial=0))
+
+    # return (max_value_row, max_chroma_column) of the chips of one hue page
+    def get_hue_page_extent(self, hue_page_number):
+        max_chroma_columns = self.max_chroma_columns[hue_page_number]
+        occupied_rows = np.flatnonzero(max_chroma_columns)
+        return (int(occupied_rows[-1]) if len(occupied_rows) else 0), int(max_chroma_columns.max(initial=0))
+
+    # return (lowest, highest) float chroma arrays inside the gamut at each
+    # fractional hue page number and value. These are the tightest bounds
+    # of the up to 4 rows around the chip, so chips within them are
+    # surrounded by chips, and lowest > highest where there is no gamut
+    def get_chroma_bounds(self, hue_page_numbers, values):
+        hue_page_numbers, values = (np.ravel(array) for array in np.broadcast_arrays(
+            np.asarray(hue_page_numbers, dtype=np.float64), np.asarray(values, dtype=np.float64)))
+        num_hue_pages, num_value_rows = self.max_chroma_columns.shape
+        in_range = np.isfinite(hue_page_numbers) & (values >= 0) & (values <= num_value_rows - 1)
+
+        hues = np.mod(np.where(in_range, hue_page_numbers, 0), num_hue_pages)
+        hue0 = np.floor(hues).astype(np.intp)
+        hue1 = np.where(hue0 + 1 == num_hue_pages, 0, hue0 + 1)
+        values = np.clip(values, 0, num_value_rows - 1)
+        value0 = np.minimum(np.floor(values).astype(np.intp), max(num_value_rows - 2, 0))
+        value1 = np.minimum(value0 + 1, num_value_rows - 1)
+
+        # rows without chips bound every chroma out
+        occupied = self.max_chroma_columns > 0
+        row_lowest = np.where(occupied, self.min_chroma_columns, np.inf).ravel()
+        row_highest = np.where(occupied, self.max_chroma_columns, -np.inf).ravel()
+
+        lowest = np.where(in_range, -np.inf, np.inf)
+        highest = np.where(in_range, np.inf, -np.inf)
+        for hue, hue_used in ((hue0, True), (hue1, hues > hue0)):
+            for value, value_used in ((value0, values < value0 + 1), (value1, values > value0)):
+                rows = hue * num_value_rows + value
+                used = hue_used & value_used
+                lowest = np.maximum(lowest, np.where(used, row_lowest[rows], -np.inf))
+                highest = np.minimum(highest, np.where(used, row_highest[rows], np.inf))
+        return lowest, highest
+
+    # return the float max chroma inside the gamut at each fractional hue
+    # page number and value, nan where there is no gamut
+    def max_chroma(self, hue_page_numbers, values):
+        lowest, highest = self.get_chroma_bounds(hue_page_numbers, values)
+        return np.where(lowest <= highest, highest, np.nan)
+
+    # return a bool array of whether each fractional chip is inside the gamut
+    def is_in_gamut(self, hue_page_numbers, values, chromas):
+        chromas = np.ravel(np.asarray(chromas, dtype=np.float64))
+        lowest, highest = self.get_chroma_bounds(hue_page_numbers, values)
+        return (lowest <= chromas) & (chromas <= highest)
+
+    # return the chromas of fractional chips clipped into the gamut at
+    # their hue page number and value, nan where there is no gamut
+    def clip_to_gamut(self, hue_page_numbers, values, chromas):
+        chromas = np.ravel(np.asarray(chromas, dtype=np.float64))
+        lowest, highest = self.get_chroma_bounds(hue_page_numbers, values)
+        return np.where(lowest <= highest, np.clip(chromas, lowest, highest), np.nan)
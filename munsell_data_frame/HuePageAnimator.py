@@ -0,0 +1,226 @@
+import os
+import struct
+import zlib
+import numpy as np
+from PIL import Image, GifImagePlugin
+from .constants import HUE_PAGE_NAMES
+from .process_pool import imap_bounded
+
+# the palette index of the gaps between chips in indexed (gif) frames
+BACKGROUND_INDEX = 255
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# return (palette, page_chip_indices) where palette is a (256, 3) uint8 array
+# shared by every hue page and page_chip_indices maps each hue_page_number
+# to the palette index of each of its chips.
+# The chip colours are known up front, so they are quantized once with
+# median cut, refined by one k-means pass, when there are more than
+# max_colors of them, and index BACKGROUND_INDEX is kept for the
+# background colour.
+def build_global_palette(page_arrays, background=(0, 0, 0, 0), max_colors=255):
+    page_numbers = sorted(page_arrays)
+    rgbs = np.concatenate([page_arrays[n][2] for n in page_numbers]).reshape(-1, 3)
+    packed = (rgbs[:, 0].astype(np.uint32) << 16) | (rgbs[:, 1].astype(np.uint32) << 8) | rgbs[:, 2]
+    unique_packed, inverse = np.unique(packed, return_inverse=True)
+    unique_rgbs = np.stack([unique_packed >> 16, (unique_packed >> 8) & 255, unique_packed & 255], axis=1).astype(np.uint8)
+
+    palette = np.zeros((256, 3), dtype=np.uint8)
+    if len(unique_rgbs) <= max_colors:
+        palette[:len(unique_rgbs)] = unique_rgbs
+        chip_indices = inverse.astype(np.uint8)
+    else:
+        quantized = Image.fromarray(unique_rgbs.reshape(1, -1, 3), 'RGB').quantize(max_colors, method=Image.Quantize.MEDIANCUT, kmeans=1)
+        palette[:max_colors] = np.asarray(quantized.getpalette()[:max_colors * 3], dtype=np.uint8).reshape(-1, 3)
+        chip_indices = np.asarray(quantized, dtype=np.uint8).reshape(-1)[inverse]
+    palette[BACKGROUND_INDEX] = background[:3]
+
+    split_points = np.cumsum([len(page_arrays[n][0]) for n in page_numbers])[:-1]
+    return palette, dict(zip(page_numbers, np.split(chip_indices, split_points)))
+
+# return a dict of hue_page_number to (palette, chip_indices) with an
+# exact palette of the chip colours of each hue page
+# raises ValueError if a hue page has more than max_colors colours
+def build_local_palettes(page_arrays, background=(0, 0, 0, 0), max_colors=255):
+    local_palettes = {}
+    for hue_page_number, (_, _, rgbs) in page_arrays.items():
+        unique_rgbs, inverse = np.unique(np.asarray(rgbs, dtype=np.uint8).reshape(-1, 3), axis=0, return_inverse=True)
+        if len(unique_rgbs) > max_colors:
+            raise ValueError(f"hue page {hue_page_number} has more than {max_colors} colours")
+        palette = np.zeros((256, 3), dtype=np.uint8)
+        palette[:len(unique_rgbs)] = unique_rgbs
+        palette[BACKGROUND_INDEX] = background[:3]
+        local_palettes[hue_page_number] = (palette, inverse.reshape(-1).astype(np.uint8))
+    return local_palettes
+
+# render one frame: palette indices if chip_indices is given, else RGBA
+def _render_frame(renderer, page_arrays, chip_indices):
+    value_rows, chroma_columns, rgbs = page_arrays
+    if chip_indices is None:
+        return renderer.render_page_array(value_rows, chroma_columns, rgbs)
+    return renderer.render_page_indices(value_rows, chroma_columns, chip_indices, BACKGROUND_INDEX)
+
+# yield the frames of the given _render_frame tasks in order, rendered in a
+# pool of num_workers processes (all cores if None, in this process if 1).
+# At most window frames are pending at once so memory stays bounded
+# however many frames there are.
+def iter_frames(tasks, num_workers=None, window=None):
+    return imap_bounded(_render_frame, tasks, num_workers, window)
+
+# return the (left, top, right, bottom) box of the pixels that differ
+# between two frames, or None if they are identical
+def _changed_box(previous, frame):
+    changed = previous != frame
+    rows = np.flatnonzero(changed.any(axis=1))
+    if len(rows) == 0:
+        return None
+    cols = np.flatnonzero(changed.any(axis=0))
+    return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+
+# return the gif bytes of one (indices, palette) frame, see write_gif,
+# preceded by the gif header if previous is None, i.e. for the first frame
+def _encode_gif_frame(indices, palette, previous, global_palette, frame_info, transparent, loop):
+    chunks = []
+    box = (0, 0, indices.shape[1], indices.shape[0])
+    if previous is None:
+        image = Image.fromarray(indices, 'P')
+        image.putpalette(global_palette.tobytes())
+        header, _ = GifImagePlugin.getheader(image, info={'loop': loop, 'duration': frame_info['duration']})
+        chunks.extend(header)
+    elif not transparent and palette is None:
+        box = _changed_box(previous, indices) or (0, 0, 1, 1)
+
+    image = Image.fromarray(np.ascontiguousarray(indices[box[1]:box[3], box[0]:box[2]]), 'P')
+    image.putpalette((global_palette if palette is None else palette).tobytes())
+    chunks.extend(GifImagePlugin.getdata(image, offset=box[:2], include_color_table=palette is not None, **frame_info))
+    return b''.join(chunks)
+
+# return True if GifImagePlugin has the getheader(im, palette, info) and
+# getdata(im, offset, **params) helpers that write_gif streams frames with.
+# They are not part of Pillow's documented API, so they may be missing or
+# change signature in a later release
+def _can_stream_gif():
+    import inspect
+    try:
+        header_parameters = inspect.signature(GifImagePlugin.getheader).parameters
+        data_parameters = inspect.signature(GifImagePlugin.getdata).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return ('info' in header_parameters and 'offset' in data_parameters and
+            any(parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in data_parameters.values()))
+
+# write an animated gif of (indices, palette) frames, streaming each frame
+# to the file as it arrives. global_palette is the (256, 3) palette of the
+# file and palette is None for frames that use it, or a local palette.
+# Opaque frames are cropped to the pixels that changed since the previous
+# frame; transparent frames are written whole and disposed to background.
+# Without the GifImagePlugin helpers, see _can_stream_gif, the file is
+# written by _save_gif instead.
+def write_gif(gif_filename, frames, global_palette, duration=100, transparent=False, loop=0):
+    frame_info = {'duration': duration}
+    if transparent:
+        frame_info.update(transparency=BACKGROUND_INDEX, disposal=2)
+    else:
+        frame_info.update(disposal=1)
+    if not _can_stream_gif():
+        return _save_gif(gif_filename, frames, global_palette, frame_info, loop)
+
+    num_frames = 0
+    previous = None
+    with open(gif_filename, 'wb') as f:
+        for indices, palette in frames:
+            f.write(_encode_gif_frame(indices, palette, previous, global_palette, frame_info, transparent, loop))
+            previous = indices
+            num_frames += 1
+        f.write(b';')
+    return num_frames
+
+# write an animated gif of (indices, palette) frames, see write_gif, with
+# Pillow's public save_all writer. It takes every frame in one save call,
+# so the frames are held in memory until then.
+def _save_gif(gif_filename, frames, global_palette, frame_info, loop):
+    images = []
+    for indices, palette in frames:
+        image = Image.fromarray(indices, 'P')
+        image.putpalette((global_palette if palette is None else palette).tobytes())
+        images.append(image)
+    images[0].save(gif_filename, save_all=True, append_images=images[1:], loop=loop, optimize=False, **frame_info)
+    return len(images)
+
+def _png_chunk(chunk_type, data):
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+# write an animated png of (height, width, 4) RGBA frames, streaming each
+# frame to the file as it arrives. num_frames must be known up front for
+# the acTL chunk. Frames are stored as RGB unless transparent.
+def write_apng(png_filename, frames, num_frames, duration=100, transparent=False, loop=0, compress_level=6):
+    channels = 4 if transparent else 3
+    written = 0
+    sequence_number = 0
+    with open(png_filename, 'wb') as f:
+        for frame in frames:
+            height, width = frame.shape[:2]
+            if written == 0:
+                f.write(PNG_SIGNATURE)
+                f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6 if transparent else 2, 0, 0, 0)))
+                f.write(_png_chunk(b'acTL', struct.pack('>II', num_frames, loop)))
+
+            # every frame replaces the whole canvas
+            f.write(_png_chunk(b'fcTL', struct.pack('>IIIIIHHBB', sequence_number, width, height, 0, 0, duration, 1000, 0, 0)))
+            sequence_number += 1
+
+            # each row starts with filter type 0
+            rows = np.zeros((height, width * channels + 1), dtype=np.uint8)
+            rows[:, 1:] = frame[:, :, :channels].reshape(height, -1)
+            data = zlib.compress(rows.tobytes(), compress_level)
+            if written == 0:
+                f.write(_png_chunk(b'IDAT', data))
+            else:
+                f.write(_png_chunk(b'fdAT', struct.pack('>I', sequence_number) + data))
+                sequence_number += 1
+            written += 1
+        f.write(_png_chunk(b'IEND', b''))
+    if written != num_frames:
+        raise ValueError(f"expected {num_frames} frames, got {written}")
+    return written
+
+# write an animated webp of (height, width, 4) RGBA frames.
+# Pillow's webp encoder takes every frame in one save call, so unlike
+# write_gif and write_apng the frames are held in memory until then.
+def write_webp(webp_filename, frames, duration=100, transparent=False, loop=0, lossless=True):
+    mode = 'RGBA' if transparent else 'RGB'
+    images = [Image.fromarray(np.ascontiguousarray(frame[:, :, :len(mode)]), mode) for frame in frames]
+    images[0].save(webp_filename, save_all=True, append_images=images[1:], duration=duration, loop=loop, lossless=lossless)
+    return len(images)
+
+# write an animation of every hue page rendered by renderer to output_file,
+# as a gif, png (apng) or webp file chosen by its extension.
+# Gif frames use one global palette of all chip colours, or an exact
+# palette per frame if local_palettes.
+# returns the number of frames
+# raises ValueError for other extensions
+def animate_hue_pages(page_arrays, renderer, output_file, duration=100, num_workers=None, local_palettes=False):
+    extension = os.path.splitext(output_file)[1].lower()
+    if extension not in ('.gif', '.png', '.webp'):
+        raise ValueError(f"unsupported animation file extension '{extension}'")
+
+    transparent = renderer.background[3] == 0
+    empty_page = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty((0, 3), dtype=np.uint8))
+    hue_page_numbers = range(len(HUE_PAGE_NAMES))
+
+    if extension != '.gif':
+        tasks = [(renderer, page_arrays.get(n, empty_page), None) for n in hue_page_numbers]
+        frames = iter_frames(tasks, num_workers)
+        if extension == '.png':
+            return write_apng(output_file, frames, len(tasks), duration=duration, transparent=transparent)
+        return write_webp(output_file, frames, duration=duration, transparent=transparent)
+
+    global_palette, page_chip_indices = build_global_palette(page_arrays, renderer.background)
+    page_palettes = {}
+    if local_palettes:
+        for hue_page_number, (palette, chip_indices) in build_local_palettes(page_arrays, renderer.background).items():
+            page_palettes[hue_page_number] = palette
+            page_chip_indices[hue_page_number] = chip_indices
+    tasks = [(renderer, page_arrays.get(n, empty_page), page_chip_indices.get(n, empty_page[0].astype(np.uint8))) for n in hue_page_numbers]
+    frames = zip(iter_frames(tasks, num_workers), (page_palettes.get(n) for n in hue_page_numbers))
+    return write_gif(output_file, frames, global_palette, duration=duration, transparent=transparent)
@@ -0,0 +1,194 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from .constants import HUE_PAGE_NAMES
+from .MunsellGrid import MunsellGrid
+from .ChipTable import ChipTable
+
+# Renders hue pages as RGBA images where each chip is a square at
+# row value_row - 1 and column chroma_column // 2 - 1 of a grid.
+#
+# A page is rendered by writing every chip colour into a small
+# (rows, columns) colour grid and expanding that grid to pixels with
+# two take operations through precomputed pixel-to-cell maps,
+# instead of drawing one rectangle per chip.
+class HuePageRenderer:
+
+    # max_rows and max_cols are the largest value_row and chroma_column to render
+    def __init__(self, max_rows, max_cols, chip_size=75, chip_gap=10, background=(0, 0, 0, 0)):
+        self.max_rows = int(max_rows)
+        self.max_cols = int(max_cols)
+        self.chip_size = int(chip_size)
+        self.chip_gap = int(chip_gap)
+        self.background = tuple(background)
+        self.num_grid_rows = self.max_rows
+        self.num_grid_cols = self.max_cols // 2
+        self.width = self.num_grid_cols * (self.chip_size + self.chip_gap)
+        self.height = self.num_grid_rows * (self.chip_size + self.chip_gap)
+        self._row_of_y = self._cell_of_pixel(self.height, self.num_grid_rows)
+        self._col_of_x = self._cell_of_pixel(self.width, self.num_grid_cols)
+
+    # return a renderer sized to fit every chip of the given MunsellDataFrame,
+    # from its cached GamutBoundary
+    @classmethod
+    def from_munsell_data_frame(cls, munsell_df, **kwargs):
+        return cls.from_gamut_boundary(munsell_df.get_gamut_boundary(), **kwargs)
+
+    # return a renderer sized to fit every chip within a GamutBoundary, or
+    # only those of one hue page if hue_page_number is given
+    @classmethod
+    def from_gamut_boundary(cls, gamut_boundary, hue_page_number=None, **kwargs):
+        if hue_page_number is None:
+            return cls(gamut_boundary.max_value_row, gamut_boundary.max_chroma_column, **kwargs)
+        return cls(*gamut_boundary.get_hue_page_extent(hue_page_number), **kwargs)
+
+    # return a copy of this renderer with a different chip size
+    def with_chip_size(self, chip_size):
+        return HuePageRenderer(self.max_rows, self.max_cols, chip_size=chip_size, chip_gap=self.chip_gap, background=self.background)
+
+    # return a copy of this renderer with chips and gaps scaled by percent
+    def scaled(self, percent):
+        chip_size = max(1, round(self.chip_size * percent / 100))
+        chip_gap = round(self.chip_gap * percent / 100)
+        return HuePageRenderer(self.max_rows, self.max_cols, chip_size=chip_size, chip_gap=chip_gap, background=self.background)
+
+    # return the grid cell index of each of num_pixels pixels along one axis.
+    # Chip pixels span [start, start + chip_size] inclusive, like
+    # ImageDraw.rectangle, and gap pixels map to num_cells, the background cell
+    def _cell_of_pixel(self, num_pixels, num_cells):
+        pitch = self.chip_size + self.chip_gap
+        offset = np.arange(num_pixels) - self.chip_gap // 2
+        cell = offset // pitch
+        in_chip = (offset >= 0) & (offset % pitch <= self.chip_size) & (cell < num_cells)
+        return np.where(in_chip, cell, num_cells)
+
+    # get the render geometry for the given row/col
+    # returns the inclusive (x1, y1, x2, y2) pixel bounds of the chip
+    def get_chip_geometry(self, value_row, chroma_column):
+        row_idx = int(value_row) - 1
+        col_idx = int(chroma_column) // 2 - 1
+        x1 = self.chip_gap // 2 + col_idx * (self.chip_size + self.chip_gap)
+        y1 = self.chip_gap // 2 + row_idx * (self.chip_size + self.chip_gap)
+        x2 = x1 + self.chip_size
+        y2 = y1 + self.chip_size
+        return (x1, y1, x2, y2)
+
+    # return the (row, column) grid cells of the given chips
+    # raises ValueError if a chip does not fit on the page
+    def _chip_cells(self, value_rows, chroma_columns):
+        row_idx = np.asarray(value_rows, dtype=np.int64) - 1
+        col_idx = np.asarray(chroma_columns, dtype=np.int64) // 2 - 1
+        if len(row_idx) > 0 and (row_idx.min() < 0 or row_idx.max() >= self.num_grid_rows or col_idx.min() < 0 or col_idx.max() >= self.num_grid_cols):
+            raise ValueError("chip out of range of the hue page")
+        return row_idx, col_idx
+
+    # expand a (rows + 1, columns + 1) grid to a (height, width) page
+    def _expand_grid(self, grid):
+        return grid.take(self._col_of_x, axis=1).take(self._row_of_y, axis=0)
+
+    # return a (height, width, 4) uint8 RGBA array of one hue page given
+    # equal-length arrays of value_rows, chroma_columns and (n, 3) rgb colours.
+    # Later chips overwrite earlier chips in the same cell.
+    # raises ValueError if a chip does not fit on the page
+    def render_page_array(self, value_rows, chroma_columns, rgbs):
+        row_idx, col_idx = self._chip_cells(value_rows, chroma_columns)
+
+        # one extra row and column hold the background colour for the gaps
+        grid = np.empty((self.num_grid_rows + 1, self.num_grid_cols + 1, 4), dtype=np.uint8)
+        grid[:] = self.background
+        grid[row_idx, col_idx, :3] = np.asarray(rgbs, dtype=np.uint8).reshape(-1, 3)
+        grid[row_idx, col_idx, 3] = 255
+
+        # expand columns then rows, moving each RGBA pixel as one uint32
+        page_pixels = self._expand_grid(grid.view(np.uint32)[:, :, 0])
+        return page_pixels.view(np.uint8).reshape(self.height, self.width, 4)
+
+    # return a (height, width, 4) uint8 RGBA array of one hue page of a
+    # MunsellGrid given its (rgbs, mask) views, see MunsellGrid.get_hue_page.
+    # Grid cell [value_row, chroma_column // 2] is page cell
+    # [value_row - 1, chroma_column // 2 - 1], so the chips are copied as
+    # one block instead of being scattered one by one
+    # raises ValueError if an occupied cell does not fit on the page
+    def render_grid_page_array(self, page_rgbs, page_mask):
+        cells = page_mask[1:self.num_grid_rows + 1, 1:self.num_grid_cols + 1]
+        if page_mask[0].any() or page_mask[:, 0].any() or cells.sum() != page_mask.sum():
+            raise ValueError("chip out of range of the hue page")
+        num_rows, num_cols = cells.shape
+
+        grid = np.empty((self.num_grid_rows + 1, self.num_grid_cols + 1, 4), dtype=np.uint8)
+        grid[:] = self.background
+        block = grid[:num_rows, :num_cols]
+        block[cells, :3] = page_rgbs[1:num_rows + 1, 1:num_cols + 1][cells]
+        block[cells, 3] = 255
+
+        page_pixels = self._expand_grid(grid.view(np.uint32)[:, :, 0])
+        return page_pixels.view(np.uint8).reshape(self.height, self.width, 4)
+
+    # return a (height, width) uint8 array of palette indices of one hue page
+    # given the chip_indices of each chip and the background_index of the gaps
+    def render_page_indices(self, value_rows, chroma_columns, chip_indices, background_index=255):
+        row_idx, col_idx = self._chip_cells(value_rows, chroma_columns)
+        grid = np.full((self.num_grid_rows + 1, self.num_grid_cols + 1), background_index, dtype=np.uint8)
+        grid[row_idx, col_idx] = chip_indices
+        return self._expand_grid(grid)
+
+    # return a PIL RGBA Image of one hue page, see render_page_array
+    def render_page_image(self, value_rows, chroma_columns, rgbs):
+        from PIL import Image
+        return Image.fromarray(self.render_page_array(value_rows, chroma_columns, rgbs), 'RGBA')
+
+
+# return the image file name of a hue page
+def hue_page_image_file_name(hue_page_number):
+    return f"{hue_page_number:02.1f}-{HUE_PAGE_NAMES[hue_page_number]}.png"
+
+# return a dict of hue_page_number to (value_rows, chroma_columns, rgbs)
+# numpy arrays for every hue page of the MunsellDataFrame, MunsellGrid or
+# ChipTable, decoding 'color_key' first if the dimension columns are missing
+def get_hue_page_arrays(munsell_df):
+    if isinstance(munsell_df, (MunsellGrid, ChipTable)):
+        return munsell_df.get_hue_page_arrays()
+    if not munsell_df.is_color_key_encodeable:
+        munsell_df.decode_color_key()
+    munsell_df.create_index()
+    page_arrays = {}
+    for hue_page_number, hue_page_mdf in munsell_df.iter_hue_pages():
+        df = hue_page_mdf.df
+        page_arrays[hue_page_number] = (
+            df['value_row'].to_numpy(dtype=np.int64),
+            df['chroma_column'].to_numpy(dtype=np.int64),
+            df[['r', 'g', 'b']].to_numpy(dtype=np.uint8),
+        )
+    return page_arrays
+
+# render one hue page and save it as a png file
+# returns (image_path, number of chips)
+def _render_page_file(renderer, hue_page_number, page_arrays, image_path, compress_level):
+    value_rows, chroma_columns, rgbs = page_arrays
+    renderer.render_page_image(value_rows, chroma_columns, rgbs).save(image_path, compress_level=compress_level)
+    return image_path, len(value_rows)
+
+# render an image for every hue page at every chip size and save them as png
+# files in output_image_folder, or in one 'chip_size_<n>' sub-folder
+# per chip size when more than one size is given.
+# Pages are rendered in a pool of num_workers processes (all cores if None,
+# in this process if 1). Most of the time per page is png compression,
+# which a lower compress_level (0-9) trades for larger files.
+# returns a list of (image_path, number of chips) in page order
+def render_hue_pages(page_arrays, output_image_folder, renderer, chip_sizes=None, num_workers=None, compress_level=6):
+    chip_sizes = list(chip_sizes) if chip_sizes else [renderer.chip_size]
+    empty_page = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty((0, 3), dtype=np.uint8))
+    tasks = []
+    for chip_size in chip_sizes:
+        size_renderer = renderer.with_chip_size(chip_size)
+        folder = output_image_folder if len(chip_sizes) == 1 else os.path.join(output_image_folder, f"chip_size_{chip_size}")
+        os.makedirs(folder, exist_ok=True)
+        for hue_page_number in range(len(HUE_PAGE_NAMES)):
+            image_path = os.path.join(folder, hue_page_image_file_name(hue_page_number))
+            tasks.append((size_renderer, hue_page_number, page_arrays.get(hue_page_number, empty_page), image_path, compress_level))
+
+    if num_workers == 1:
+        return [_render_page_file(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(_render_page_file, *task) for task in tasks]
+        return [future.result() for future in futures]
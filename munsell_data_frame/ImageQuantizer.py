@@ -0,0 +1,131 @@
+import numpy as np
+from .ChipLookup import ChipLookup
+from .ChipLookupTable import ChipLookupTable
+from .process_pool import imap_bounded
+
+# the chip lookup of this quantizing process, set by _init_worker
+_worker_lookup = None
+
+# Maps every pixel of an image to its nearest Munsell chip.
+#
+# The image is cut into tile_size square tiles that are looked up in a
+# pool of processes, each with its own ChipLookup, or a shared memory
+# mapped ChipLookupTable if table_file is given. At most 2 tiles per
+# worker are in flight, and each result is reduced to a uint16 chip
+# index tile and per-chip counts as it arrives, so the working memory
+# does not grow with the image. Note that PIL decodes a png or jpeg
+# whole, so the decoded pixels themselves are held once.
+class ImageQuantizer:
+
+    # munsell_df holds the chips as 'color_key', 'r', 'g', 'b' rows.
+    # space is 'rgb' or 'lab', see ChipLookup, and table_bits the bits per
+    # channel of the table, see ChipLookupTable
+    def __init__(self, munsell_df, space='rgb', table_file=None, table_bits=8, tile_size=512, num_workers=None):
+        df = munsell_df.df
+        self.color_keys = df['color_key'].to_numpy()
+        self.chip_rgbs = df[['r', 'g', 'b']].to_numpy(dtype=np.uint8)
+        self.space = space
+        self.table_file = table_file
+        self.table_bits = table_bits
+        self.tile_size = tile_size
+        self.num_workers = num_workers
+        if table_file is not None:
+            # build or refresh the table once, before the workers open it
+            ChipLookupTable.load_or_build(table_file, self.chip_rgbs, self.color_keys, space=space, bits=table_bits, num_workers=num_workers)
+
+    # return the (left, top, right, bottom) boxes of the tiles of an image
+    def get_tile_boxes(self, width, height):
+        return [(left, top, min(left + self.tile_size, width), min(top + self.tile_size, height))
+            for top in range(0, height, self.tile_size)
+            for left in range(0, width, self.tile_size)]
+
+    # return the QuantizedImage of a PIL Image or image file.
+    # chip_index_file, if given, is a .npy file that the chip index raster
+    # is written to through a memory map instead of being held in memory
+    def quantize(self, image, chip_index_file=None):
+        from PIL import Image
+        if not isinstance(image, Image.Image):
+            image = Image.open(image)
+        image = image.convert('RGB')
+        width, height = image.size
+
+        if chip_index_file is None:
+            chip_indices = np.empty((height, width), dtype=np.uint16)
+        else:
+            chip_indices = np.lib.format.open_memmap(chip_index_file, mode='w+', dtype=np.uint16, shape=(height, width))
+        counts = np.zeros(len(self.chip_rgbs), dtype=np.int64)
+
+        boxes = self.get_tile_boxes(width, height)
+        tiles = (np.asarray(image.crop(box)) for box in boxes)
+        for box, tile_indices in zip(boxes, self._iter_tile_indices(tiles)):
+            left, top, right, bottom = box
+            chip_indices[top:bottom, left:right] = tile_indices
+            counts += np.bincount(tile_indices.ravel(), minlength=len(counts))
+
+        if chip_index_file is not None:
+            chip_indices.flush()
+        return QuantizedImage(chip_indices, self.chip_rgbs, self.color_keys, counts)
+
+    # yield the chip indices of each tile in order, looked up in this
+    # process if num_workers is 1, else in a pool with a bounded window
+    def _iter_tile_indices(self, tiles):
+        initargs = (self.chip_rgbs, self.color_keys, self.space, self.table_file, self.table_bits)
+        return imap_bounded(_quantize_tile, ((tile,) for tile in tiles), self.num_workers, initializer=_init_worker, initargs=initargs)
+
+
+# The nearest chip of every pixel of an image
+class QuantizedImage:
+
+    # chip_indices is the (height, width) uint16 raster of chip row positions
+    # and counts the number of pixels of each chip
+    def __init__(self, chip_indices, chip_rgbs, color_keys, counts):
+        self.chip_indices = chip_indices
+        self.chip_rgbs = chip_rgbs
+        self.color_keys = color_keys
+        self.counts = counts
+
+    # return the (height, width) raster of color_keys, or of one
+    # (left, top, right, bottom) box of it
+    def get_color_key_raster(self, box=None):
+        chip_indices = self.chip_indices
+        if box is not None:
+            left, top, right, bottom = box
+            chip_indices = chip_indices[top:bottom, left:right]
+        return self.color_keys[chip_indices]
+
+    # return a PIL RGB Image with every pixel recoloured to its chip
+    def get_recolored_image(self):
+        from PIL import Image
+        return Image.fromarray(self.chip_rgbs[self.chip_indices], 'RGB')
+
+    # return a MunsellDataFrame of the 'color_key', 'r', 'g', 'b' and pixel
+    # 'count' of every chip with at least one pixel, most pixels first
+    def get_counts_munsell_df(self):
+        from .MunsellDataFrame import MunsellDataFrame
+        used = np.flatnonzero(self.counts)
+        used = used[np.argsort(-self.counts[used], kind='stable')]
+        return MunsellDataFrame({
+            'color_key': self.color_keys[used],
+            'r': self.chip_rgbs[used, 0],
+            'g': self.chip_rgbs[used, 1],
+            'b': self.chip_rgbs[used, 2],
+            'count': self.counts[used],
+        })
+
+
+# set up the chip lookup of a quantizing process
+def _init_worker(chip_rgbs, color_keys, space, table_file, table_bits):
+    global _worker_lookup
+    if table_file is None:
+        _worker_lookup = ChipLookup(chip_rgbs, color_keys, space=space)
+    else:
+        _worker_lookup = ChipLookupTable.load_or_build(table_file, chip_rgbs, color_keys, space=space, bits=table_bits)
+
+# return the uint16 chip index of every pixel of an (h, w, 3) tile
+def _quantize_tile(tile):
+    rgbs = tile.reshape(-1, 3)
+    if isinstance(_worker_lookup, ChipLookupTable):
+        indices = _worker_lookup.lookup_indices(rgbs)
+    else:
+        indices = _worker_lookup.query(rgbs, num_workers=1)[1]
+    return indices.astype(np.uint16).reshape(tile.shape[:2])
@@ -0,0 +1,223 @@
+import numpy as np
+from .MunsellDataFrame import MunsellDataFrame, SortOrder
+
+# the columns reduce_by_color_key may read its keys from
+KEY_COLUMNS = ['hue_page_number', 'value_row', 'chroma_column', 'color_key', 'packed_color_key']
+
+# the r/g/b columns
+RGB_COLUMNS = ['r', 'g', 'b']
+
+# A lazy chain of MunsellDataFrame operations, created by
+# MunsellDataFrame.lazy(), e.g.
+#   munsell_df.lazy().filter({'hue_page_number': 3}).project(['color_key', 'r', 'g', 'b']).groupby_key().collect()
+#
+# Each operation only records a step of the plan and checks its columns.
+# collect() optimizes the plan and runs it once:
+#   - the filters before a groupby_key are fused into one mask, evaluated
+#     on the source before anything is copied, as are those after it
+#   - the rows and the columns still needed are taken from the source in
+#     one copy, so later projections never copy dropped columns
+#   - sorts are fused into one stable sort, and a sort is dropped when a
+#     groupby_key reorders its rows anyway or already returns them in
+#     the sorted order
+# explain() returns the optimized plan.
+class LazyMunsellFrame:
+
+    # source is the MunsellDataFrame, plan the tuple of (operation, argument)
+    # steps and columns the columns after the plan
+    def __init__(self, source, plan=(), columns=None):
+        self.source = source
+        self.plan = tuple(plan)
+        self.columns = list(source.columns) if columns is None else list(columns)
+
+    # return a new LazyMunsellFrame with step added to the plan
+    def _then(self, step, columns):
+        return LazyMunsellFrame(self.source, self.plan + (step,), columns)
+
+    # raises KeyError if any of the given columns are not in the plan's columns
+    def _check_columns(self, columns):
+        missing = [column for column in columns if column not in self.columns]
+        if missing:
+            raise KeyError(f"columns {missing} are not in {self.columns}")
+
+    # keep the rows matching all the filter_by_columns filters
+    def filter(self, filters):
+        self._check_columns(filters.keys())
+        return self._then(('filter', dict(filters)), self.columns)
+
+    # keep only the given columns, in the given order
+    def project(self, columns):
+        self._check_columns(columns)
+        return self._then(('project', list(columns)), columns)
+
+    # keep only the columns of MunsellDataFrame.get_color_key_reduced
+    def color_key_reduced(self):
+        return self.project(['color_key', 'r', 'g', 'b'] + (['packed_color_key'] if 'packed_color_key' in self.columns else []))
+
+    # sort by a sort_by_columns dict of column to SortOrder. Sorts are
+    # stable, so a later sort keeps the order of an earlier one for ties
+    def sort(self, sort_orders):
+        self._check_columns(sort_orders.keys())
+        return self._then(('sort', dict(sort_orders)), self.columns)
+
+    # reduce to one row per color_key as MunsellDataFrame.reduce_by_color_key
+    def groupby_key(self, how='mean', weights=None, with_counts=False, round_rgb=True):
+        if how not in ('mean', 'median', 'weighted_mean', 'count'):
+            raise ValueError(f"how must be 'mean', 'median', 'weighted_mean' or 'count', not '{how}'")
+        if isinstance(weights, str):
+            self._check_columns([weights])
+        if how != 'count':
+            self._check_columns(RGB_COLUMNS)
+        arguments = {'how': how, 'weights': weights, 'with_counts': with_counts, 'round_rgb': round_rgb}
+        return self._then(('groupby_key', arguments), _groupby_columns(self.columns, arguments))
+
+    # return (steps, notes), the optimized plan as a list of
+    # (operation, argument) steps and the notes of the steps it removed
+    def _optimize(self):
+        # split the plan into stages that each end with a groupby_key or the plan's end
+        stages = [[]]
+        for step in self.plan:
+            stages[-1].append(step)
+            if step[0] == 'groupby_key':
+                stages.append([])
+
+        steps = []
+        notes = []
+        columns = list(self.source.columns)
+        for stage_number, stage in enumerate(stages):
+            groupby = stage[-1] if stage and stage[-1][0] == 'groupby_key' else None
+            filters = _fuse_filters([argument for operation, argument in stage if operation == 'filter'])
+            sort_orders = _fuse_sorts([argument for operation, argument in stage if operation == 'sort'])
+            projections = [argument for operation, argument in stage if operation == 'project']
+            output_columns = projections[-1] if projections else columns
+
+            if sort_orders and groupby is not None:
+                notes.append(f"sort {_format_sort(sort_orders)} removed: groupby_key reorders the rows")
+                sort_orders = {}
+            if sort_orders and stage_number > 0 and _is_key_order(sort_orders):
+                notes.append(f"sort {_format_sort(sort_orders)} removed: groupby_key returns the rows in that order")
+                sort_orders = {}
+
+            # the columns read by the rest of the stage
+            if groupby is not None:
+                weights = groupby[1]['weights']
+                needed = [column for column in output_columns if column in KEY_COLUMNS + RGB_COLUMNS or column == weights]
+            else:
+                needed = list(output_columns)
+            if sort_orders:
+                needed += [column for column in _sort_columns(sort_orders, columns) if column not in needed]
+
+            if stage_number == 0:
+                steps.append(('scan', {'filters': filters, 'columns': needed}))
+            else:
+                if filters:
+                    steps.append(('filter', filters))
+                if needed != columns:
+                    steps.append(('project', needed))
+            if sort_orders:
+                steps.append(('sort', sort_orders))
+                if needed != output_columns and groupby is None:
+                    steps.append(('project', list(output_columns)))
+            if groupby is not None:
+                steps.append(groupby)
+                columns = _groupby_columns(needed, groupby[1])
+            else:
+                columns = list(output_columns)
+        return steps, notes
+
+    # return the optimized plan, one step per line
+    def explain(self):
+        steps, notes = self._optimize()
+        lines = [f"{self.source.shape[0]} rows of {list(self.source.columns)}"]
+        for operation, argument in steps:
+            if operation == 'scan':
+                lines.append(f"scan filters={argument['filters']} columns={argument['columns']}")
+            elif operation == 'sort':
+                lines.append(f"sort {_format_sort(argument)}")
+            elif operation == 'groupby_key':
+                lines.append("groupby_key " + " ".join(f"{name}={value!r}" for name, value in argument.items()))
+            else:
+                lines.append(f"{operation} {argument}")
+        lines.extend(f"# {note}" for note in notes)
+        return "\n".join(lines)
+
+    # run the optimized plan and return a new MunsellDataFrame
+    def collect(self):
+        steps, _ = self._optimize()
+        munsell_df = self.source
+        for operation, argument in steps:
+            if operation == 'scan':
+                df = munsell_df.df
+                column_positions = [df.columns.get_loc(column) for column in argument['columns']]
+                if argument['filters']:
+                    df = df.iloc[munsell_df._filter_positions(argument['filters']), column_positions]
+                else:
+                    df = df.iloc[:, column_positions].copy()
+                munsell_df = MunsellDataFrame._wrap(df)
+            elif operation == 'filter':
+                munsell_df = MunsellDataFrame._wrap(munsell_df.df.iloc[munsell_df._filter_positions(argument)])
+            elif operation == 'project':
+                munsell_df = MunsellDataFrame._wrap(munsell_df.df[argument])
+            elif operation == 'sort':
+                munsell_df = MunsellDataFrame._wrap(munsell_df.df.sort_values(by=_sort_columns(argument, munsell_df.columns),
+                                                             ascending=[sort_order == SortOrder.ASC for sort_order in argument.values()], kind='stable'))
+            elif operation == 'groupby_key':
+                munsell_df = munsell_df.reduce_by_color_key(**argument)
+        return munsell_df
+
+
+# return the list of values a filter_by_columns filter value matches
+def _filter_values(value):
+    return list(value) if isinstance(value, (list, tuple, set, np.ndarray)) else [value]
+
+# return one filters dict matching the rows that match all the given
+# filters dicts, intersecting the values of a column filtered more than once
+def _fuse_filters(filter_dicts):
+    fused = {}
+    for filters in filter_dicts:
+        for column, value in filters.items():
+            if column in fused:
+                values = _filter_values(value)
+                value = [fused_value for fused_value in _filter_values(fused[column]) if fused_value in values]
+                if len(value) == 1:
+                    value = value[0]
+            fused[column] = value
+    return fused
+
+# return one sort_orders dict ordering rows as the stable sorts in order:
+# by the last sort, then by the columns of the earlier sorts
+def _fuse_sorts(sort_dicts):
+    fused = {}
+    for sort_orders in reversed(sort_dicts):
+        for column, sort_order in sort_orders.items():
+            fused.setdefault(column, sort_order)
+    return fused
+
+# return True if the sort_orders are ascending on a prefix of the key order
+# reduce_by_color_key returns its rows in
+def _is_key_order(sort_orders):
+    if any(sort_order != SortOrder.ASC for sort_order in sort_orders.values()):
+        return False
+    columns = list(sort_orders.keys())
+    return columns in (['color_key'], ['packed_color_key'], ['hue_page_number'], ['hue_page_number', 'value_row'],
+                       ['hue_page_number', 'value_row', 'chroma_column'])
+
+# return the columns sorted on for the sort_orders, as sort_by_columns:
+# 'packed_color_key' in place of 'color_key' when the columns have it
+def _sort_columns(sort_orders, columns):
+    by = list(sort_orders.keys())
+    if 'color_key' in by and 'packed_color_key' in columns and 'packed_color_key' not in by:
+        by[by.index('color_key')] = 'packed_color_key'
+    return by
+
+# return the columns of reduce_by_color_key of a frame of the given columns
+def _groupby_columns(columns, arguments):
+    grouped = ['hue_page_number', 'hue_page_name', 'value_row', 'chroma_column', 'color_key']
+    grouped += [] if arguments['how'] == 'count' else RGB_COLUMNS
+    grouped += ['count'] if arguments['how'] == 'count' or arguments['with_counts'] else []
+    grouped += ['packed_color_key'] if 'packed_color_key' in columns else []
+    return grouped
+
+# return the sort_orders as 'column asc, column desc'
+def _format_sort(sort_orders):
+    return ", ".join(f"{column} {sort_order.value}" for column, sort_order in sort_orders.items())
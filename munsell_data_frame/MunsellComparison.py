@@ -0,0 +1,175 @@
+import json
+import numpy as np
+import pandas as pd
+from .color_science import delta_e_76, delta_e_2000
+
+# the status of each row of a comparison report
+STATUSES = ['matched', 'missing', 'extra']
+
+# the r/g/b columns of the reference, the samples and their differences
+REFERENCE_CHANNELS = ['r_reference', 'g_reference', 'b_reference']
+SAMPLE_CHANNELS = ['r', 'g', 'b']
+DELTA_CHANNELS = ['r_delta', 'g_delta', 'b_delta']
+
+# A comparison of sample chips against reference chips on color_key.
+#
+# The keys of both MunsellDataFrames are packed to integers and every
+# sample is matched to its reference chip with one searchsorted over the
+# sorted reference keys, so any number of samples per key is compared in
+# one vectorized pass. The CIELAB of each reference chip comes from the
+# cached colour space array of the frame and is gathered for its samples.
+#
+# The report holds one row per sample, 'matched' to a reference chip or
+# an 'extra' key the reference does not have, plus one 'missing' row per
+# reference chip without samples.
+class MunsellComparison:
+
+    # report is the DataFrame of compare, num_reference the number of
+    # reference chips and num_samples the number of sample chips
+    def __init__(self, report, num_reference, num_samples):
+        self.report = report
+        self.num_reference = num_reference
+        self.num_samples = num_samples
+
+    # return the comparison of the 'color_key' (or dimension) and 'r', 'g',
+    # 'b' columns of a sample MunsellDataFrame against a reference one
+    # raises ValueError if the reference has duplicate or unpackable keys
+    @classmethod
+    def compare(cls, reference_df, sample_df):
+        reference_keys = _packed_color_keys_of(reference_df)
+        sample_keys = _packed_color_keys_of(sample_df)
+        order = np.argsort(reference_keys, kind='stable')
+        sorted_keys = reference_keys[order]
+        if len(sorted_keys) > 1 and (sorted_keys[1:] == sorted_keys[:-1]).any():
+            raise ValueError("reference color_keys must be unique, see groupby_color_key")
+
+        # the reference row of each sample, -1 for keys the reference does not have
+        positions = np.minimum(np.searchsorted(sorted_keys, sample_keys), max(len(sorted_keys) - 1, 0))
+        matched = (sorted_keys[positions] == sample_keys) if len(sorted_keys) else np.zeros(len(sample_keys), dtype=bool)
+        reference_rows = np.where(matched, order[positions] if len(order) else 0, -1)
+        missing_rows = np.flatnonzero(np.bincount(reference_rows[matched], minlength=len(reference_keys)) == 0)
+
+        reference_rgbs = _rgbs_of(reference_df)
+        sample_rgbs = _rgbs_of(sample_df)
+
+        # sample rows first, then one row per missing reference chip
+        num_samples = len(sample_keys)
+        num_rows = num_samples + len(missing_rows)
+        keys = np.concatenate([sample_keys, reference_keys[missing_rows]])
+        status = np.full(num_rows, STATUSES.index('extra'), dtype=np.int8)
+        status[:num_samples][matched] = STATUSES.index('matched')
+        status[num_samples:] = STATUSES.index('missing')
+        rows_reference_rgbs = np.full((num_rows, 3), np.nan)
+        rows_reference_rgbs[:num_samples][matched] = reference_rgbs[reference_rows[matched]]
+        rows_reference_rgbs[num_samples:] = reference_rgbs[missing_rows]
+        rows_sample_rgbs = np.full((num_rows, 3), np.nan)
+        rows_sample_rgbs[:num_samples] = sample_rgbs
+
+        delta_e_76s = np.full(num_rows, np.nan)
+        delta_e_2000s = np.full(num_rows, np.nan)
+        sample_labs = sample_df.get_color_space_array('lab')[matched]
+        matched_reference_labs = reference_df.get_color_space_array('lab')[reference_rows[matched]]
+        delta_e_76s[:num_samples][matched] = delta_e_76(matched_reference_labs, sample_labs)
+        delta_e_2000s[:num_samples][matched] = delta_e_2000(matched_reference_labs, sample_labs)
+
+        from .MunsellDataFrame import MunsellDataFrame
+        hue_page_numbers, _, _ = MunsellDataFrame.unpack_color_keys(keys)
+        report = pd.DataFrame({
+            'color_key': MunsellDataFrame.packed_to_color_keys(keys),
+            'packed_color_key': keys,
+            'hue_page_number': hue_page_numbers,
+            'status': pd.Categorical.from_codes(status, STATUSES),
+        })
+        for i, channel in enumerate(REFERENCE_CHANNELS):
+            report[channel] = rows_reference_rgbs[:, i]
+        for i, channel in enumerate(SAMPLE_CHANNELS):
+            report[channel] = rows_sample_rgbs[:, i]
+        for i, channel in enumerate(DELTA_CHANNELS):
+            report[channel] = rows_sample_rgbs[:, i] - rows_reference_rgbs[:, i]
+        report['delta_e_76'] = delta_e_76s
+        report['delta_e_2000'] = delta_e_2000s
+        return cls(report, len(reference_keys), num_samples)
+
+    # return the report rows of one status
+    def get_rows(self, status):
+        return self.report[self.report['status'] == status]
+
+    # return the sorted color_keys of the reference chips without samples
+    def get_missing_color_keys(self):
+        return np.sort(self.get_rows('missing')['color_key'].to_numpy())
+
+    # return the sorted distinct color_keys of samples not in the reference
+    def get_extra_color_keys(self):
+        return np.unique(self.get_rows('extra')['color_key'].to_numpy())
+
+    # return a DataFrame of the counts of each status, the mean absolute
+    # r/g/b deltas and the distribution of delta_e_2000 of the matched
+    # samples of each hue page, indexed by hue_page_number
+    def get_hue_page_summary(self):
+        report = self.report
+        counts = pd.crosstab(report['hue_page_number'], report['status'], dropna=False)
+        counts = counts.reindex(columns=STATUSES, fill_value=0).add_prefix('num_')
+        matched = self.get_rows('matched')
+        grouped = matched.groupby('hue_page_number')
+        summary = counts.join(grouped[DELTA_CHANNELS].apply(lambda deltas: deltas.abs().mean()).add_prefix('mean_abs_'))
+        delta_e = grouped['delta_e_2000']
+        summary = summary.join(pd.DataFrame({
+            'delta_e_2000_mean': delta_e.mean(),
+            'delta_e_2000_median': delta_e.median(),
+            'delta_e_2000_p95': delta_e.quantile(0.95),
+            'delta_e_2000_max': delta_e.max(),
+        }))
+        summary.columns.name = None
+        return summary
+
+    # return a dict of the overall counts and delta statistics
+    def get_summary(self):
+        matched = self.get_rows('matched')
+        delta_e = matched['delta_e_2000']
+        return {
+            'num_reference': int(self.num_reference),
+            'num_samples': int(self.num_samples),
+            'num_matched': int(len(matched)),
+            'num_matched_color_keys': int(matched['packed_color_key'].nunique()),
+            'num_missing_color_keys': int(len(self.get_rows('missing'))),
+            'num_extra': int(len(self.get_rows('extra'))),
+            'num_extra_color_keys': int(len(self.get_extra_color_keys())),
+            'max_abs_deltas': {channel: _float_or_none(matched[channel].abs().max()) for channel in DELTA_CHANNELS},
+            'delta_e_76_mean': _float_or_none(matched['delta_e_76'].mean()),
+            'delta_e_2000_mean': _float_or_none(delta_e.mean()),
+            'delta_e_2000_median': _float_or_none(delta_e.median()),
+            'delta_e_2000_p95': _float_or_none(delta_e.quantile(0.95)),
+            'delta_e_2000_max': _float_or_none(delta_e.max()),
+        }
+
+    # write the report rows to a parquet file
+    def to_parquet(self, filename):
+        self.report.to_parquet(filename, index=False)
+
+    # write the summary and the hue page summary records to a json file
+    def summary_to_json(self, filename):
+        hue_pages = self.get_hue_page_summary().reset_index()
+        with open(filename, 'w') as f:
+            json.dump({'summary': self.get_summary(), 'hue_pages': json.loads(hue_pages.to_json(orient='records'))}, f, indent=2)
+
+
+# return the uint32 packed color keys of a MunsellDataFrame, from its
+# 'packed_color_key', 'color_key' or dimension columns
+# raises ValueError if there are none or they cannot be packed
+def _packed_color_keys_of(munsell_df):
+    if munsell_df.has_packed_color_key or munsell_df.has_color_key:
+        packed_color_keys = munsell_df.get_packed_color_keys()
+        if packed_color_keys is not None:
+            return packed_color_keys
+    if munsell_df.is_color_key_encodeable:
+        df = munsell_df.df
+        return munsell_df.pack_color_keys(df['hue_page_number'], df['value_row'], df['chroma_column'])
+    raise ValueError("color_keys cannot be packed")
+
+# return the (n, 3) float64 r/g/b values of a MunsellDataFrame, nan where missing
+def _rgbs_of(munsell_df):
+    return munsell_df.df[SAMPLE_CHANNELS].to_numpy(dtype=np.float64, na_value=np.nan)
+
+# return a float, or None for nan, for json
+def _float_or_none(value):
+    return None if pd.isna(value) else float(value)
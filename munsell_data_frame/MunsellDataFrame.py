@@ -2,7 +2,14 @@ import pandas as pd
 from enum import Enum
 import numpy as np 
 import math
+import zlib
 from .constants import HUE_PAGE_NAMES
+from .MunsellIndex import MunsellIndex
+from .ChipLookup import ChipLookup
+from .MunsellGrid import MunsellGrid
+from .GamutBoundary import GamutBoundary
+from .color_keys import pack_color_keys, unpack_color_keys, encode_color_keys, decode_color_keys
+from .color_science import DELTA_E_METHODS, rgb_to_linear, linear_to_xyz, xyz_to_lab, rgb_to_lab
 
 # used in the sort_orders dict for sort_by_columns
 class SortOrder(Enum):
@@ -23,6 +30,41 @@ class MunsellDataFrame:
         'b': 'UInt8',
     }
 
+    # optional columns that are not created by default
+    # but are coerced to these dtypes when present.
+    # 'packed_color_key' is the integer form of 'color_key',
+    # hue_page_number * 10000 + value_row * 100 + chroma_column
+    _optional_dtypes = {
+        'packed_color_key': 'uint32',
+    }
+
+    # set by create_index, the MunsellIndex itself is built on first use
+    # and discarded whenever the dataframe is replaced or mutated
+    _use_index = False
+    _index = None
+
+    # ChipLookups by colour space, built by get_chip_lookup on first use
+    # and discarded along with the index
+    _chip_lookups = None
+
+    # the GamutBoundary of the chips, built on first use by get_gamut_boundary
+    _gamut_boundary = None
+
+    # the columns of set_color_space_columns by colour space
+    _color_space_columns = {
+        'linear_rgb': ['r_linear', 'g_linear', 'b_linear'],
+        'xyz': ['x', 'y', 'z'],
+        'lab': ['lab_l', 'lab_a', 'lab_b'],
+    }
+
+    # colour space arrays by space, built by get_color_space_array on first
+    # use, with the 'rgb_crc32' fingerprint of the r/g/b columns they came from
+    _color_spaces = None
+
+    # the crc32 fingerprint of the r/g/b columns that the columns written by
+    # set_color_space_columns came from, by colour space
+    _color_space_column_crc32s = None
+
     # called when creating an instance of a MunsellDataFrame 
     # using
     # df = MunsellDataFrame() 
@@ -33,37 +75,171 @@ class MunsellDataFrame:
     #     {'hue_page_number': 2, 'hue_page_name': '7.5R', 'value_row': 6, 'chroma_column': 7, 'color_key': 'change', 'r': 0, 'g': 0, 'b': 255},
     # ]
     # returns None - since self has been altered
+    #
+    # frames derived from another MunsellDataFrame are made by _wrap instead
     def __init__(self, data=None, index=None, columns=None, dtype=None, copy=False):
         if data is None:
             data = pd.DataFrame(columns=self._dtypes.keys())
-        else:
-            data = pd.DataFrame(data=data, index=index, columns=columns, dtype=dtype, copy=copy)
         self.df = pd.DataFrame(data=data, index=index, columns=columns, dtype=dtype, copy=copy)
         self._set_dtypes()
 
-    # used to set dataframe columns in __init__
+    # return a new MunsellDataFrame around df without copying it, for frames
+    # derived from a MunsellDataFrame whose columns already have their dtypes.
+    # Only columns of another dtype are cast; object columns of 'str' dtype
+    # are taken to hold strings already, so they are not converted again.
+    # Projections share their column buffers with the parent when pandas
+    # copy-on-write is enabled (pd.options.mode.copy_on_write = True).
+    # df is wrapped in a shallow copy, which shares its buffers but not the
+    # flag that marks an iloc or df[columns] result as a slice of its
+    # parent, so in-place edits of the wrapped frame do not warn
+    @classmethod
+    def _wrap(cls, df):
+        casts = {col: dtype for col, dtype in {**cls._dtypes, **cls._optional_dtypes}.items()
+                 if col in df.columns and df[col].dtype != dtype and not (dtype == 'str' and df[col].dtype == object)}
+        munsell_df = cls.__new__(cls)
+        munsell_df.df = df.astype(casts, copy=False) if casts else df.copy(deep=False)
+        return munsell_df
+
+    # the wrapped pandas DataFrame
+    @property
+    def df(self):
+        return self._df
+
+    # replacing the wrapped DataFrame invalidates the index, and rewrites
+    # the colour space columns if its r/g/b columns changed
+    @df.setter
+    def df(self, df):
+        self._df = df
+        self._index = None
+        self._chip_lookups = None
+        self._gamut_boundary = None
+        self._color_spaces = None
+        if self._color_space_column_crc32s:
+            self._refresh_color_space_columns()
+
+    # enable the optional dimension index used by filter_by_columns
+    # and iter_hue_pages. The index is built lazily on first use
+    # returns None - since self has been altered
+    def create_index(self):
+        self._use_index = True
+        self._index = None
+
+    # disable and discard the dimension index
     # returns None - since self has been altered
-    def _set_dtypes(self): # pragma: no cover
-        for col, dtype in self._dtypes.items():
-            if col in self.df.columns:
+    def drop_index(self):
+        self._use_index = False
+        self._index = None
+
+    # discard the dimension index, chip lookups, gamut boundary and colour
+    # space arrays so they are rebuilt on
+    # next use, and rewrite stale colour space columns. Needed only after
+    # editing the dimension or r/g/b columns of self.df in place
+    # returns None - since self has been altered
+    def invalidate_index(self):
+        self._index = None
+        self._chip_lookups = None
+        self._gamut_boundary = None
+        self._color_spaces = None
+        if self._color_space_column_crc32s:
+            self._refresh_color_space_columns()
+
+    # return the MunsellIndex if it is enabled and the dimensions
+    # can be indexed, building it if needed, otherwise None
+    def _get_index(self):
+        if not self._use_index:
+            return None
+        if self._index is None or self._index.num_rows != len(self.df):
+            self._index = MunsellIndex.from_munsell_data_frame(self)
+        return self._index
+
+    # used to set dataframe columns in __init__, skipping columns that
+    # already have their dtype and the given skip_columns
+    # returns None - since self has been altered
+    def _set_dtypes(self, skip_columns=()): # pragma: no cover
+        for col, dtype in {**self._dtypes, **self._optional_dtypes}.items():
+            if col in self.df.columns and col not in skip_columns and self.df[col].dtype != dtype:
                 self.df[col] = self.df[col].astype(dtype)
         
-    # append rows to the dataframe where each row
-    # is a MunsellDataFrame-columned dict
+    # append rows to the dataframe where each row is either
+    # - a MunsellDataFrame-columned dict of scalars,
+    # - a tuple or list of values in self.columns order, or
+    # - a dict of equal-length column arrays, which appends a whole chunk of rows
     # returns None - since self has been altered.
     #
-    # Note that any row with an empty dict will 
-    # still be added as a row with empty column values. 
+    # rows are buffered column-wise, converted to a typed chunk every
+    # batch_size rows and concatenated onto the dataframe once at the end,
+    # so only the new rows have their dtypes set.
+    #
+    # Empty dicts and tuples are skipped. Note that any row with a partial dict will 
+    # still be added as a row with empty values for the missing columns. 
     # for example:
     #     hue_page_number hue_page_name  value_row  chroma_column color_key     r     g     b
-    #  0   <NA>           nan            <NA>        <NA>         nan         <NA>  <NA>  <NA>
-    def append_rows(self, rows):
+    #  0   2              nan            <NA>        <NA>         nan         <NA>  <NA>  <NA>
+    def append_rows(self, rows, batch_size=100_000):
         if self.df.empty:
             self.__init__(columns=self._dtypes.keys())
+        columns = list(self.df.columns)
+        chunks = []
+        buffer = {col: [] for col in columns}
+        num_buffered = 0
         for row in rows:
-            if row: # skip empty rows
-                self.df.loc[len(self.df)] = row
-        self._set_dtypes()
+            # a dict of column arrays is recognised by its first value
+            if isinstance(row, dict) and len(row) > 0 and self._is_column_array(next(iter(row.values()))):
+                if num_buffered > 0:
+                    chunks.append(self._typed_chunk(buffer, columns))
+                    buffer = {col: [] for col in columns}
+                    num_buffered = 0
+                chunks.append(self._typed_chunk(row, columns))
+                continue
+            if len(row) == 0: # skip empty rows
+                continue
+            if isinstance(row, dict):
+                for col, column_values in buffer.items():
+                    column_values.append(row.get(col, np.nan))
+            else:
+                if len(row) != len(columns):
+                    raise ValueError(f"row has {len(row)} values but there are {len(columns)} columns")
+                for column_values, val in zip(buffer.values(), row):
+                    column_values.append(val)
+            num_buffered += 1
+            if num_buffered >= batch_size:
+                chunks.append(self._typed_chunk(buffer, columns))
+                buffer = {col: [] for col in columns}
+                num_buffered = 0
+        if num_buffered > 0:
+            chunks.append(self._typed_chunk(buffer, columns))
+        chunks = [chunk for chunk in chunks if len(chunk) > 0]
+        if not chunks:
+            return
+        start = len(self.df)
+        new_df = pd.concat(chunks, ignore_index=True)
+        new_df.index = pd.RangeIndex(start, start + len(new_df))
+        self.df = new_df if start == 0 else pd.concat([self.df, new_df])
+
+    # return True if val is an array of column values rather than a single value
+    @classmethod
+    def _is_column_array(cls, val):
+        return isinstance(val, (list, tuple, np.ndarray, pd.Series, pd.api.extensions.ExtensionArray))
+
+    # return a DataFrame with the given columns built from a dict of column
+    # lists or arrays, with dtypes set only on these rows. Missing columns are empty
+    # and a missing 'packed_color_key' is derived from the new rows' keys
+    def _typed_chunk(self, column_values, columns):
+        chunk = MunsellDataFrame({col: vals for col, vals in column_values.items() if col in columns and col != 'packed_color_key'})
+        if 'packed_color_key' in columns:
+            packed_color_keys = column_values.get('packed_color_key')
+            if packed_color_keys is None or pd.isna(pd.Series(packed_color_keys, dtype=object)).any():
+                chunk.set_packed_color_key()
+            else:
+                chunk.df['packed_color_key'] = np.asarray(packed_color_keys, dtype=np.uint32)
+        chunk_df = chunk.df.reindex(columns=columns)
+        for col in columns:
+            if col not in chunk.df.columns:
+                chunk_df[col] = chunk_df[col].astype(object)
+                dtype = self._dtypes.get(col)
+                if dtype is not None:
+                    chunk_df[col] = chunk_df[col].astype(dtype)
+        return chunk_df
     
     # handle all to_dict options
     def to_dict(self, *args, **kwargs): # pragma: no cover
@@ -83,13 +259,26 @@ class MunsellDataFrame:
 
     @classmethod
     # load the data of the dataframe from a csv file
-    # into a newly created MunsellDataFrame
-    def from_csv(cls, filename):
-        df = pd.read_csv(filename)
-        unnamed = 'Unnamed: 0'
-        if unnamed in df.columns:
-            df = df.drop(columns=[unnamed])
-        return cls(data=df.values, columns=df.columns)
+    # into a newly created MunsellDataFrame.
+    # columns and filters are as in from_parquet, but the filters are
+    # applied to the arrow table after the csv file has been read
+    def from_csv(cls, filename, columns=None, filters=None):
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        arrow_types = {'UInt8': pa.uint8(), 'uint32': pa.uint32(), 'str': pa.string()}
+        column_types = {col: arrow_types[dtype] for col, dtype in {**cls._dtypes, **cls._optional_dtypes}.items()}
+        table = pa_csv.read_csv(filename, convert_options=pa_csv.ConvertOptions(column_types=column_types))
+
+        # drop the unnamed index column written by to_csv
+        for unnamed in ['', 'Unnamed: 0']:
+            if unnamed in table.column_names:
+                table = table.drop_columns([unnamed])
+        expression = cls._arrow_filter(table.column_names, filters)
+        if expression is not None:
+            table = table.filter(expression)
+        if columns is not None:
+            table = table.select(list(columns))
+        return cls._from_arrow_table(table)
 
     # save the dataframe to a parquet file
     def to_parquet(self, filename):
@@ -97,11 +286,70 @@ class MunsellDataFrame:
 
     @classmethod
     # load the dataframe from a parquet file
-    # into a newly created MunsellDataFrame
-    def from_parquet(cls, filename):
+    # into a newly created MunsellDataFrame.
+    # columns lists the only columns to read, e.g. ['color_key', 'r', 'g', 'b'].
+    # filters selects the rows to read and is pushed down to the parquet
+    # reader. It is either a filter_by_columns style dict of column to a
+    # value or a list of values, e.g. {'hue_page_number': [0, 1], 'value_row': 5},
+    # or pyarrow filters (a list of tuples or a pyarrow Expression).
+    def from_parquet(cls, filename, columns=None, filters=None):
+        import pyarrow.parquet as pq
         filename = filename.strip()
-        df = pd.read_parquet(filename, engine='pyarrow')
-        return cls(data=df.values, columns=df.columns)
+        expression = None
+        if filters is not None:
+            expression = cls._arrow_filter(pq.read_schema(filename).names, filters)
+        table = pq.read_table(filename, columns=columns, filters=expression)
+        return cls._from_arrow_table(table)
+
+    @classmethod
+    # return a new MunsellDataFrame of a pyarrow table, converted to pandas
+    # with uint8 columns mapped straight to the 'UInt8' of _dtypes so that
+    # only columns of other types are cast by _set_dtypes
+    def _from_arrow_table(cls, table):
+        import pyarrow as pa
+        df = table.to_pandas(types_mapper={pa.uint8(): pd.UInt8Dtype()}.get)
+        df.index = pd.RangeIndex(len(df))
+
+        # strings without nulls already match the 'str' dtype
+        typed_columns = [field.name for field in table.schema if pa.types.is_string(field.type) and table.column(field.name).null_count == 0]
+
+        munsell_df = cls.__new__(cls)
+        munsell_df.df = df
+        munsell_df._set_dtypes(skip_columns=typed_columns)
+        return munsell_df
+
+    # the characters of 'color_key' holding each dimension
+    _color_key_slices = {'hue_page_number': (0, 2), 'value_row': (3, 5), 'chroma_column': (6, 8)}
+
+    @classmethod
+    # return the pyarrow Expression of the given from_parquet filters on a
+    # table of the given column_names. Dimension filters on a table that
+    # only has 'color_key' compare its digits instead
+    # raises KeyError if a filtered column is missing
+    def _arrow_filter(cls, column_names, filters):
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+        if filters is None:
+            return None
+        if isinstance(filters, pc.Expression):
+            return filters
+        if not isinstance(filters, dict):
+            return pq.filters_to_expression(filters)
+
+        expression = None
+        for column, value in filters.items():
+            values = list(value) if isinstance(value, (list, tuple, set, np.ndarray)) else [value]
+            if column in column_names:
+                field = pc.field(column)
+            elif column in cls._color_key_slices and 'color_key' in column_names:
+                start, stop = cls._color_key_slices[column]
+                field = pc.utf8_slice_codeunits(pc.field('color_key'), start, stop)
+                values = [f"{int(val):02d}" for val in values]
+            else:
+                raise KeyError(f"cannot filter on missing column '{column}'")
+            condition = field == values[0] if len(values) == 1 else field.isin(values)
+            expression = condition if expression is None else expression & condition
+        return expression
 
     # return a list of unique values for the given column
     def unique_values(self, column):
@@ -113,18 +361,75 @@ class MunsellDataFrame:
     def reset_index(self):
         self.df = self.df.reset_index(drop=True)
 
+    # return a LazyMunsellFrame that records a chain of filter, project,
+    # sort and groupby_key operations on self and runs them on collect()
+    def lazy(self):
+        from .LazyMunsellFrame import LazyMunsellFrame
+        return LazyMunsellFrame(self)
+
     # return a MunsellDataFrame that contains all rows 
     # that match all of the given column filters, for example:
     # filters = {
     #     "value_row": 7,
     #     "chroma_column": 2
     # }
+    # a list of values matches any of them, e.g. {"value_row": [6, 7]}
     # so self has not been altered
+    # 
+    # if the packed_color_key column exists, a 'color_key' filter
+    # is answered with an integer comparison instead of a string one
+    #
+    # if create_index has been called, equality filters on hue_page_number
+    # (optionally with value_row and chroma_column) are answered from the
+    # index, so only the matching hue page range is visited
     def filter_by_columns(self, filters):
-        mask = pd.Series([True]*len(self.df))
+        return self._wrap(self.df.iloc[self._filter_positions(filters)])
+
+    # return the ascending row positions of self.df that match all of the
+    # given filter_by_columns filters. Only the filtered columns are read
+    def _filter_positions(self, filters):
+        positions = None
+        index = self._get_index()
+        if index is not None:
+            dimension_filters, remaining_filters = MunsellIndex.split_filters(filters)
+            positions = index.positions(dimension_filters)
+            if positions is not None:
+                filters = remaining_filters
+        mask = np.ones(len(self.df) if positions is None else len(positions), dtype=bool)
         for col, val in filters.items():
-            mask = mask & (self.df[col] == val)
-        return MunsellDataFrame(self.df[mask])
+            is_list = isinstance(val, (list, tuple, set, np.ndarray))
+            if col == 'color_key' and self.has_packed_color_key:
+                column = self.df['packed_color_key']
+                if is_list:
+                    val = [packed for packed in map(self._pack_color_key_or_none, val) if packed is not None]
+                else:
+                    val = self._pack_color_key_or_none(val)
+            else:
+                column = self.df[col]
+            if positions is not None:
+                column = column.iloc[positions]
+            if is_list and pd.api.types.is_integer_dtype(column.dtype) and all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in val):
+                # integer lists by table lookup, which is much faster than
+                # Series.isin on masked columns; missing values match nothing
+                values = np.asarray(list(val), dtype=np.int64)
+                na_value = int(values.min()) - 1 if len(values) else 0
+                mask &= np.isin(column.to_numpy(dtype=np.int64, na_value=na_value), values, kind='table')
+                continue
+            matches = column.isin(list(val)) if is_list else column == val
+            mask &= matches.to_numpy(dtype=bool, na_value=False)
+        return np.flatnonzero(mask) if positions is None else positions[mask]
+
+    # yield (hue_page_number, MunsellDataFrame) for every hue page
+    # that has rows, in hue_page_number order.
+    # Uses the dimension index if create_index has been called
+    def iter_hue_pages(self):
+        index = self._get_index()
+        if index is not None:
+            for hue_page_number, positions in index.hue_page_positions():
+                yield hue_page_number, self._wrap(self.df.iloc[positions])
+        else:
+            for hue_page_number, df in self.df.groupby('hue_page_number', sort=True):
+                yield int(hue_page_number), self._wrap(df)
     
     # Drop columns by their names.
     # Parameters:
@@ -164,8 +469,14 @@ class MunsellDataFrame:
     #     "chroma_column": SortOrder.DESC
     # }
     # returns a new MunsellDataFrame that contains the sorted rows
+    #
+    # if the packed_color_key column exists, sorting by 'color_key' uses it
+    # instead, which gives the same order without string comparisons
     def sort_by_columns(self, sort_orders):
-        return MunsellDataFrame(self.df.sort_values(by=list(sort_orders.keys()), ascending=[sort_order == SortOrder.ASC for sort_order in sort_orders.values()]))
+        by = list(sort_orders.keys())
+        if 'color_key' in by and self.has_packed_color_key and 'packed_color_key' not in by:
+            by[by.index('color_key')] = 'packed_color_key'
+        return self._wrap(self.df.sort_values(by=by, ascending=[sort_order == SortOrder.ASC for sort_order in sort_orders.values()]))
     
     # property return True if the dimension columns required for color_key coding exist
     # note: does not check to see if dimension columns have values
@@ -181,11 +492,20 @@ class MunsellDataFrame:
     def has_color_key(self):
         return 'color_key' in self.columns
 
+    # property returns True if the optional 'packed_color_key' column is found
+    @property
+    def has_packed_color_key(self):
+        return 'packed_color_key' in self.columns
+
     # decode the 'color_key into 'hue_page_number', 'value_row', and 'chroma_column'
     # returns None - since self has been altered
     def decode_color_key(self) -> None:
         if self.has_color_key:
-            self.df[['hue_page_number', 'value_row', 'chroma_column']] = self.df['color_key'].str.split('-', expand=True).astype(int)
+            hue_page_numbers, value_rows, chroma_columns = self.decode_color_keys(self.df['color_key'])
+            self.df['hue_page_number'] = hue_page_numbers.astype(np.int64)
+            self.df['value_row'] = value_rows.astype(np.int64)
+            self.df['chroma_column'] = chroma_columns.astype(np.int64)
+            self.invalidate_index()
         else:
             print(f"'color_key' is undefined")
     
@@ -194,14 +514,210 @@ class MunsellDataFrame:
     def set_color_key(self) -> None:
         if not self.is_color_key_encodeable:
             print(f"'color_key' is not encodeable")
-        else:
+            return
+        dims = self.df[['hue_page_number', 'value_row', 'chroma_column']]
+        if dims.isna().any().any() or (dims.max() > 99).any():
+            # keys that do not fit "HH-VV-CC" keep the original row-wise formatting
             self.df['color_key'] = self.df.apply(lambda row: f"{row['hue_page_number']:02d}-{row['value_row']:02d}-{row['chroma_column']:02d}", axis=1)
+        else:
+            self.df['color_key'] = self.encode_color_keys(dims['hue_page_number'], dims['value_row'], dims['chroma_column'])
+        if self.has_packed_color_key:
+            self.set_packed_color_key()
+
+    # sets the optional uint32 'packed_color_key' column, from the
+    # dimension columns if they exist, otherwise from 'color_key'
+    # returns None since self may be altered
+    def set_packed_color_key(self) -> None:
+        if self.is_color_key_encodeable:
+            self.df['packed_color_key'] = self.pack_color_keys(self.df['hue_page_number'], self.df['value_row'], self.df['chroma_column'])
+        elif self.has_color_key:
+            self.df['packed_color_key'] = self.pack_color_keys(*self.decode_color_keys(self.df['color_key']))
+        else:
+            print(f"'packed_color_key' is not encodeable")
+
+    # return the packed integer form of a single color_key
+    @classmethod
+    def format_packed_color_key(cls, hue_page_number:int, value_row:int, chroma_column:int) -> int:
+        return hue_page_number * 10000 + value_row * 100 + chroma_column
+
+    # return a uint32 array of packed color keys for the given arrays
+    # of hue_page_numbers, value_rows and chroma_columns
+    # raises ValueError if any dimension is outside 0..99
+    @classmethod
+    def pack_color_keys(cls, hue_page_numbers, value_rows, chroma_columns) -> np.ndarray:
+        return pack_color_keys(hue_page_numbers, value_rows, chroma_columns)
+
+    # return (hue_page_numbers, value_rows, chroma_columns) uint8 arrays
+    # unpacked from an array of packed color keys
+    @classmethod
+    def unpack_color_keys(cls, packed_color_keys):
+        return unpack_color_keys(packed_color_keys)
+
+    # return an array of packed color keys from an array of "HH-VV-CC" strings
+    @classmethod
+    def color_keys_to_packed(cls, color_keys) -> np.ndarray:
+        return cls.pack_color_keys(*cls.decode_color_keys(color_keys))
+
+    # return an array of "HH-VV-CC" strings from an array of packed color keys
+    @classmethod
+    def packed_to_color_keys(cls, packed_color_keys) -> np.ndarray:
+        return cls.encode_color_keys(*cls.unpack_color_keys(packed_color_keys))
+
+    # return the packed form of a single color_key string,
+    # or None if it is not a valid "HH-VV-CC" key
+    @classmethod
+    def _pack_color_key_or_none(cls, color_key):
+        try:
+            return int(cls.color_keys_to_packed([color_key])[0])
+        except ValueError:
+            return None
+
+    # return the packed color keys of self as a uint32 array, using the
+    # 'packed_color_key' column if it exists, otherwise decoding 'color_key'.
+    # Each distinct key is decoded once, since samples repeat keys.
+    # returns None if 'color_key' has values that are not "HH-VV-CC" keys,
+    # including variable-width keys such as '1-2-4', which would otherwise
+    # share a packed key with their "HH-VV-CC" form
+    def get_packed_color_keys(self):
+        if self.has_packed_color_key:
+            return self.df['packed_color_key'].to_numpy(dtype=np.uint32)
+        codes, unique_color_keys = pd.factorize(self.df['color_key'])
+        if (codes < 0).any():
+            return None
+        try:
+            return self.pack_color_keys(*decode_color_keys(np.asarray(unique_color_keys, dtype=object), variable_width=False))[codes]
+        except ValueError:
+            return None
     
     # return a single color_key string
     @classmethod
     def format_color_key(cls, hue_page_number:int, value_row:int, chroma_column:int) -> str:
         return f"{hue_page_number:02d}-{value_row:02d}-{chroma_column:02d}"
+
+    # return an array of "HH-VV-CC" color_key strings, one per element of the
+    # given hue_page_number, value_row and chroma_column arrays, see color_keys
+    # raises ValueError if any dimension is outside 0..99
+    @classmethod
+    def encode_color_keys(cls, hue_page_numbers, value_rows, chroma_columns) -> np.ndarray:
+        return encode_color_keys(hue_page_numbers, value_rows, chroma_columns)
+
+    # return (hue_page_numbers, value_rows, chroma_columns) uint8 arrays parsed
+    # from an array or Series of "HH-VV-CC" color_key strings, see color_keys
+    # raises ValueError if any key is not of the form "HH-VV-CC"
+    @classmethod
+    def decode_color_keys(cls, color_keys):
+        return decode_color_keys(color_keys)
     
+    # return the ChipLookup of the chips of this dataframe in the given
+    # space ('rgb' or 'lab'), built once and reused until invalidated
+    def get_chip_lookup(self, space='rgb'):
+        if self._chip_lookups is None:
+            self._chip_lookups = {}
+        if space not in self._chip_lookups:
+            self._chip_lookups[space] = ChipLookup.from_munsell_data_frame(self, space=space)
+        return self._chip_lookups[space]
+
+    # return the color_keys of the k nearest chips of each of an (n, 3)
+    # array of sRGB colours, as an (n,) array if k is 1 otherwise (n, k)
+    def lookup_color_keys(self, rgbs, k=1, space='rgb'):
+        return self.get_chip_lookup(space).lookup(rgbs, k=k)
+
+    # return the (n, 3) r/g/b values, uint8 unless some are missing, then
+    # float64 with nan, and their crc32 fingerprint
+    def _get_rgbs_and_fingerprint(self):
+        rgbs = self.df[['r', 'g', 'b']]
+        if rgbs.isna().any().any():
+            rgbs = rgbs.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            rgbs = rgbs.to_numpy(dtype=np.uint8)
+        return rgbs, zlib.crc32(rgbs.dtype.str.encode() + np.ascontiguousarray(rgbs).tobytes())
+
+    # return the (n, 3) float64 array of the r/g/b colours of this dataframe
+    # in a colour space of color_science: 'linear_rgb' in [0, 1], 'xyz' or
+    # 'lab'. Each space is converted once, from the one before it, and
+    # reused until the r/g/b columns change, which is detected by their
+    # crc32 even when they are edited in place
+    # raises ValueError for other spaces
+    def get_color_space_array(self, space):
+        if space not in self._color_space_columns:
+            raise ValueError(f"space must be one of {list(self._color_space_columns)}, not '{space}'")
+        rgbs, fingerprint = self._get_rgbs_and_fingerprint()
+        if self._color_spaces is None or self._color_spaces['rgb_crc32'] != fingerprint:
+            self._color_spaces = {'rgb_crc32': fingerprint}
+            if self._color_space_column_crc32s:
+                self._refresh_color_space_columns(fingerprint)
+        color_spaces = self._color_spaces
+        if space not in color_spaces:
+            if space == 'linear_rgb':
+                color_spaces[space] = rgb_to_linear(rgbs)
+            elif space == 'xyz':
+                color_spaces[space] = linear_to_xyz(self.get_color_space_array('linear_rgb'))
+            else:
+                color_spaces[space] = xyz_to_lab(self.get_color_space_array('xyz'))
+        return color_spaces[space]
+
+    # sets the float64 columns of a colour space, see get_color_space_array:
+    # 'r_linear', 'g_linear', 'b_linear' or 'x', 'y', 'z' or 'lab_l', 'lab_a', 'lab_b'.
+    # The columns are rewritten when the r/g/b columns change, which is
+    # checked by get_color_space_array, invalidate_index and when self.df is
+    # replaced. Frames derived from this one get copies that are not tracked
+    # returns None - since self has been altered
+    def set_color_space_columns(self, space):
+        values = self.get_color_space_array(space)
+        for i, column in enumerate(self._color_space_columns[space]):
+            self.df[column] = values[:, i]
+        if self._color_space_column_crc32s is None:
+            self._color_space_column_crc32s = {}
+        self._color_space_column_crc32s[space] = self._color_spaces['rgb_crc32']
+
+    # rewrite the columns set by set_color_space_columns that were written
+    # from other r/g/b values than those with the given crc32 fingerprint,
+    # and forget those of spaces whose columns were dropped
+    def _refresh_color_space_columns(self, fingerprint=None):
+        crc32s = self._color_space_column_crc32s
+        for space in list(crc32s):
+            if not all(column in self.df.columns for column in self._color_space_columns[space] + ['r', 'g', 'b']):
+                del crc32s[space]
+        if not crc32s:
+            return
+        if fingerprint is None:
+            fingerprint = self._get_rgbs_and_fingerprint()[1]
+        if self._color_spaces is None or self._color_spaces['rgb_crc32'] != fingerprint:
+            self._color_spaces = {'rgb_crc32': fingerprint}
+        for space in [space for space, crc32 in crc32s.items() if crc32 != fingerprint]:
+            self.set_color_space_columns(space)
+
+    # return the CIE76 ('76') or CIEDE2000 ('2000') colour differences of
+    # the chips of this dataframe and other, which is either a MunsellDataFrame
+    # of the same length or an array of 0-255 sRGB colours of shape (3,) or
+    # (n, 3). With pairwise, other holds m chips and the result is (n, m)
+    # raises ValueError for other methods or frames of different lengths
+    def delta_e(self, other, method='2000', pairwise=False):
+        if method not in DELTA_E_METHODS:
+            raise ValueError(f"method must be one of {list(DELTA_E_METHODS)}, not '{method}'")
+        labs = self.get_color_space_array('lab')
+        if isinstance(other, MunsellDataFrame):
+            if len(other.df) != len(self.df) and not pairwise:
+                raise ValueError(f"cannot compare {len(self.df)} chips with {len(other.df)} chips")
+            other_labs = other.get_color_space_array('lab')
+        else:
+            other_labs = rgb_to_lab(other)
+        if pairwise:
+            labs, other_labs = labs[:, None, :], np.reshape(other_labs, (-1, 3))[None, :, :]
+        return DELTA_E_METHODS[method](labs, other_labs)
+
+    # return the GamutBoundary of the chips of this dataframe, built once
+    # and reused until invalidated
+    def get_gamut_boundary(self):
+        if self._gamut_boundary is None:
+            self._gamut_boundary = GamutBoundary.from_munsell_data_frame(self)
+        return self._gamut_boundary
+
+    # return the dense MunsellGrid of the chips of this dataframe,
+    # see MunsellGrid.from_munsell_data_frame
+    def to_munsell_grid(self):
+        return MunsellGrid.from_munsell_data_frame(self)
+
     # return a list of all (r,g,b) tuples in the dataframe
     def get_rgb_tuples(self):
         # Select the 'r', 'g', 'b' columns and convert them to numpy array
@@ -219,6 +735,10 @@ class MunsellDataFrame:
     def shape(self):
         return self.df.shape
 
+    # the number of rows, as len(ChipTable) counts its chips
+    def __len__(self):
+        return len(self.df)
+
     @property
     def empty(self):
         return self.df.empty
@@ -253,28 +773,180 @@ class MunsellDataFrame:
         # all MunsellDataFrame coluamns
         #['hue_page_number', 'hue_page_name', 'value_row', 'chroma_column', 'color_key', 'r', 'g', 'b']
         
-        # using color_key as the index to group all r,g,b values for all rows with that index
-        reduced_mdf = self.get_color_key_reduced()
-        reduced_df = reduced_mdf.df
-        
-        # replace with average color values for each unique eolor_key index
-        colors_means_df = reduced_df.groupby('color_key').mean()
-        
-        # add the color_key index as a column
-        colors_means_df.reset_index(inplace=True)
+        packed_color_keys = self.get_packed_color_keys()
+        if packed_color_keys is None:
+            # using color_key as the index to group all r,g,b values for all rows with that index
+            reduced_mdf = self.get_color_key_reduced()
+            reduced_df = reduced_mdf.df
+            
+            # replace with average color values for each unique eolor_key index
+            colors_means_df = reduced_df.groupby('color_key').mean()
+            
+            # add the color_key index as a column
+            colors_means_df.reset_index(inplace=True)
+        else:
+            # group on the integer keys, which sort in the same order as the strings
+            colors_means_df = self.df[['r','g','b']].groupby(packed_color_keys).mean()
+            packed_index = colors_means_df.index.to_numpy(dtype=np.uint32)
+            if self.has_packed_color_key and self.has_color_key:
+                # keep the color_key strings as they are, whatever their width
+                color_keys = self.df['color_key'].groupby(packed_color_keys).first().to_numpy()
+            else:
+                color_keys = self.packed_to_color_keys(packed_index)
+            colors_means_df.insert(0, 'color_key', color_keys)
+            if self.has_packed_color_key:
+                colors_means_df['packed_color_key'] = packed_index
+            colors_means_df.reset_index(drop=True, inplace=True)
         
         return MunsellDataFrame(colors_means_df)
 
+    # returns new MunsellDataFrame with one row per unique color_key, in
+    # color_key order, with its 'hue_page_number', 'hue_page_name',
+    # 'value_row', 'chroma_column' and 'color_key' and the r,g,b of its rows
+    # reduced by how:
+    #   'mean'          the mean of each channel
+    #   'median'        the median of each channel
+    #   'weighted_mean' the mean weighted by weights, a column name or array
+    #   'count'         no r,g,b, only the 'count' of rows
+    # with_counts adds the 'count' column to the other reductions too.
+    # Reduced r,g,b are rounded back to UInt8 unless round_rgb is False.
+    # Missing r,g,b values are skipped, and a channel without values is NA.
+    #
+    # Packed keys are below 1000000, so rows are grouped without sorting:
+    # np.bincount over the keys finds the groups, in key order, and sums
+    # each group's channels. 8-bit medians come from per-group histograms
+    # raises ValueError for other reductions, a weighted mean without
+    # weights or keys that cannot be packed
+    def reduce_by_color_key(self, how='mean', weights=None, with_counts=False, round_rgb=True):
+        if how not in ('mean', 'median', 'weighted_mean', 'count'):
+            raise ValueError(f"how must be 'mean', 'median', 'weighted_mean' or 'count', not '{how}'")
+        if (how == 'weighted_mean') != (weights is not None):
+            raise ValueError("weights are needed by, and only by, how='weighted_mean'")
+        if self.is_color_key_encodeable and not self.has_packed_color_key and not self.df[['hue_page_number', 'value_row', 'chroma_column']].isna().any().any():
+            packed_color_keys = self.pack_color_keys(self.df['hue_page_number'], self.df['value_row'], self.df['chroma_column'])
+        elif self.has_color_key or self.has_packed_color_key:
+            packed_color_keys = self.get_packed_color_keys()
+        else:
+            packed_color_keys = None
+        if packed_color_keys is None:
+            raise ValueError("color_keys cannot be packed")
+
+        unique_keys, counts, group_ids = self._group_packed_color_keys(packed_color_keys)
+        reduced_rgbs = None
+        if how != 'count':
+            if how == 'weighted_mean':
+                row_weights = self.df[weights] if isinstance(weights, str) else weights
+                row_weights = np.asarray(row_weights, dtype=np.float64)
+            reduced_rgbs = np.empty((len(counts), 3))
+            for i, channel in enumerate(['r', 'g', 'b']):
+                values = self.df[channel].to_numpy(dtype=np.float64, na_value=np.nan)
+                if how == 'median':
+                    reduced_values = self._reduce_medians(values, group_ids, counts)
+                else:
+                    valid = ~np.isnan(values)
+                    all_valid = valid.all()
+                    if how == 'mean':
+                        sums = np.bincount(group_ids, weights=values if all_valid else np.where(valid, values, 0), minlength=len(counts))
+                        totals = counts if all_valid else np.bincount(group_ids, weights=valid, minlength=len(counts))
+                    else:
+                        channel_weights = row_weights if all_valid else valid * row_weights
+                        sums = np.bincount(group_ids, weights=(values if all_valid else np.where(valid, values, 0)) * channel_weights, minlength=len(counts))
+                        totals = np.bincount(group_ids, weights=channel_weights, minlength=len(counts))
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        reduced_values = np.where(totals > 0, sums / totals, np.nan)
+                reduced_rgbs[:, i] = reduced_values
+        return self._from_color_key_groups(unique_keys, reduced_rgbs, counts if how == 'count' or with_counts else None,
+                                           round_rgb=round_rgb, with_packed_color_key=self.has_packed_color_key)
+
+    # return (unique_keys, counts, group_ids) of an array of packed color
+    # keys: the sorted distinct keys, the number of rows of each and the
+    # group of every row, numbered in key order. Packed keys are below
+    # 1000000, so one np.bincount finds the groups without sorting
+    @classmethod
+    def _group_packed_color_keys(cls, packed_color_keys):
+        key_counts = np.bincount(packed_color_keys)
+        unique_keys = np.flatnonzero(key_counts).astype(np.uint32)
+        counts = key_counts[unique_keys]
+        group_of_key = np.zeros(len(key_counts), dtype=np.intp)
+        group_of_key[unique_keys] = np.arange(len(unique_keys))
+        return unique_keys, counts, group_of_key[packed_color_keys]
+
+    # return a new MunsellDataFrame of one row per sorted unique packed key
+    # with its dimension and 'color_key' columns, the (n, 3) float
+    # reduced_rgbs (None for no r,g,b), rounded to UInt8 unless round_rgb
+    # is False, and a 'count' column of the given counts (None for none)
+    @classmethod
+    def _from_color_key_groups(cls, unique_keys, reduced_rgbs, counts=None, round_rgb=True, with_packed_color_key=False):
+        hue_page_numbers, value_rows, chroma_columns = cls.unpack_color_keys(unique_keys)
+        hue_page_names = np.array(HUE_PAGE_NAMES + [None], dtype=object)[np.minimum(hue_page_numbers, len(HUE_PAGE_NAMES))]
+        reduced = {
+            'hue_page_number': pd.array(hue_page_numbers, dtype='UInt8'),
+            'hue_page_name': hue_page_names,
+            'value_row': pd.array(value_rows, dtype='UInt8'),
+            'chroma_column': pd.array(chroma_columns, dtype='UInt8'),
+            'color_key': cls.encode_color_keys(hue_page_numbers, value_rows, chroma_columns),
+        }
+        if reduced_rgbs is not None:
+            for i, channel in enumerate(['r', 'g', 'b']):
+                if round_rgb:
+                    reduced[channel] = pd.array(np.rint(reduced_rgbs[:, i]), dtype='Float64').astype('UInt8')
+                else:
+                    reduced[channel] = reduced_rgbs[:, i]
+        if counts is not None:
+            reduced['count'] = counts
+        if with_packed_color_key:
+            reduced['packed_color_key'] = np.asarray(unique_keys, dtype=np.uint32)
+
+        # every column already has its dtype, and unrounded r,g,b stay float
+        munsell_df = cls.__new__(cls)
+        munsell_df.df = pd.DataFrame(reduced)
+        munsell_df._set_dtypes(skip_columns=list(reduced))
+        return munsell_df
+
+    # return the float median of the values of each group, skipping nan,
+    # given the group_ids of the values and the counts of each group
+    @classmethod
+    def _reduce_medians(cls, values, group_ids, counts):
+        num_groups = len(counts)
+        valid = ~np.isnan(values)
+        is_8_bit = valid.all() and np.array_equal(values, np.clip(np.rint(values), 0, 255))
+        if is_8_bit and num_groups * 256 <= len(values):
+            # the median levels of each group's 256-level histogram
+            histograms = np.bincount(group_ids * 256 + values.astype(np.intp), minlength=num_groups * 256).reshape(num_groups, 256)
+            cumulative = histograms.cumsum(axis=1)
+            lower = (cumulative > ((counts - 1) // 2)[:, None]).argmax(axis=1)
+            upper = (cumulative > (counts // 2)[:, None]).argmax(axis=1)
+            return (lower + upper) / 2
+
+        # otherwise sort the values within their groups, nan last, as one
+        # integer sort for 8-bit values
+        if is_8_bit:
+            sorted_values = np.sort(group_ids * 256 + values.astype(np.intp)) % 256
+        else:
+            sorted_values = values[np.lexsort((values, group_ids))]
+        starts = np.r_[0, np.cumsum(counts)[:-1]]
+        num_valid = np.bincount(group_ids, weights=valid, minlength=num_groups).astype(np.intp)
+        has_values = num_valid > 0
+        lower = starts + np.maximum(num_valid - 1, 0) // 2
+        upper = starts + num_valid // 2
+        return np.where(has_values, (sorted_values[lower] + sorted_values[upper]) / 2, np.nan)
+
     # return a version of self that has only columns 'color_key','r','g','b'
+    # (plus 'packed_color_key' if self has it)
     def get_color_key_reduced(self):
-        df_reduced = self.df[['color_key','r','g','b']]
-        return MunsellDataFrame(df_reduced)
+        columns = ['color_key','r','g','b']
+        if self.has_packed_color_key:
+            columns.append('packed_color_key')
+        return self._wrap(self.df[columns])
     
     # return an expacted version of self that has all columns - expanded from color_key
     def get_color_key_expanded(self):
         df_copy = self.df.copy(deep=True)
 
-        df_copy[['hue_page_number', 'value_row', 'chroma_column']] = df_copy['color_key'].str.split('-', expand=True).astype(int)
+        hue_page_numbers, value_rows, chroma_columns = self.decode_color_keys(df_copy['color_key'])
+        df_copy['hue_page_number'] = hue_page_numbers
+        df_copy['value_row'] = value_rows
+        df_copy['chroma_column'] = chroma_columns
         mapping = {i: name for i, name in enumerate(HUE_PAGE_NAMES)}
         df_copy['hue_page_name'] = df_copy['hue_page_number'].map(mapping)
         
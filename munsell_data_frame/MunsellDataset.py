@@ -0,0 +1,113 @@
+import numpy as np
+from .MunsellDataFrame import MunsellDataFrame
+from .ColorKeyAccumulator import ColorKeyAccumulator
+
+# the dimension columns of a color_key
+DIMENSION_COLUMNS = ['hue_page_number', 'value_row', 'chroma_column']
+
+# A directory (or list) of Munsell parquet files read in streamed batches,
+# for sample archives larger than memory.
+#
+# The files are opened as one pyarrow dataset, with hive partition
+# directories such as hue_page_number=3/ read as columns. Filters take the
+# same forms as MunsellDataFrame.from_parquet and are applied by the
+# scanner, so files, partitions and row groups whose statistics rule them
+# out are skipped and only matching rows are materialized.
+#
+# reduce_by_color_key streams the batches through a ColorKeyAccumulator, so
+# only the key, r/g/b (and weight) columns of one batch and the per key
+# sums are in memory at a time.
+class MunsellDataset:
+
+    # source is a directory, a parquet file or a list of parquet files
+    def __init__(self, source, partitioning='hive'):
+        import pyarrow.dataset as ds
+        self.dataset = ds.dataset(source, format='parquet', partitioning=partitioning)
+
+    # the column names of the dataset, including partition columns
+    @property
+    def column_names(self):
+        return self.dataset.schema.names
+
+    # return a pyarrow Scanner of the given columns of the rows that match
+    # the filters
+    def _scanner(self, columns=None, filters=None, batch_size=1 << 18):
+        expression = MunsellDataFrame._arrow_filter(self.column_names, filters)
+        return self.dataset.scanner(columns=None if columns is None else list(columns), filter=expression, batch_size=batch_size)
+
+    # return the number of rows that match the filters
+    def count_rows(self, filters=None):
+        return self.dataset.count_rows(filter=MunsellDataFrame._arrow_filter(self.column_names, filters))
+
+    # yield a MunsellDataFrame of at most batch_size rows for every batch
+    # of the rows that match the filters
+    def iter_batches(self, columns=None, filters=None, batch_size=1 << 18):
+        import pyarrow as pa
+        for batch in self._scanner(columns, filters, batch_size).to_batches():
+            if batch.num_rows > 0:
+                yield MunsellDataFrame._from_arrow_table(pa.Table.from_batches([batch]))
+
+    # return a new MunsellDataFrame of the given columns of all the rows
+    # that match the filters, e.g. {'hue_page_number': 3, 'value_row': 5}
+    def filter_by_columns(self, filters, columns=None):
+        return MunsellDataFrame._from_arrow_table(self._scanner(columns, filters).to_table())
+
+    # return the columns the packed color keys are read from: the
+    # 'packed_color_key' column, the 'color_key' column or the dimensions
+    # raises ValueError if there are none of them
+    def _key_columns(self):
+        column_names = self.column_names
+        if 'packed_color_key' in column_names:
+            return ['packed_color_key']
+        if 'color_key' in column_names:
+            return ['color_key']
+        if all(column in column_names for column in DIMENSION_COLUMNS):
+            return DIMENSION_COLUMNS
+        raise ValueError("color_keys cannot be packed")
+
+    # return a ColorKeyAccumulator of the r/g/b of the rows that match the
+    # filters, weighted by the weights column if given
+    # raises ValueError if a batch has keys that cannot be packed
+    def accumulate(self, filters=None, weights=None, batch_size=1 << 18):
+        key_columns = self._key_columns()
+        columns = key_columns + ['r', 'g', 'b'] + ([] if weights is None else [weights])
+        accumulator = ColorKeyAccumulator()
+        for batch in self._scanner(columns, filters, batch_size).to_batches():
+            if batch.num_rows == 0:
+                continue
+            rgbs = np.column_stack([_float_array_of(batch.column(channel)) for channel in ['r', 'g', 'b']])
+            batch_weights = None if weights is None else np.nan_to_num(_float_array_of(batch.column(weights)))
+            accumulator.update(_packed_color_keys_of(batch, key_columns), rgbs, batch_weights)
+        return accumulator
+
+    # returns new MunsellDataFrame with the mean r,g,b of each color_key of
+    # the rows that match the filters, or their mean weighted by the weights
+    # column, in the form of MunsellDataFrame.reduce_by_color_key: one row
+    # per color_key in key order with its dimension columns, r,g,b rounded
+    # to UInt8 unless round_rgb is False and the 'count' of rows if with_counts
+    def reduce_by_color_key(self, filters=None, weights=None, with_counts=False, round_rgb=True, batch_size=1 << 18):
+        accumulator = self.accumulate(filters, weights, batch_size)
+        return accumulator.to_munsell_data_frame(with_counts=with_counts, round_rgb=round_rgb,
+                                                 with_packed_color_key='packed_color_key' in self.column_names)
+
+
+# return the uint32 packed color keys of a pyarrow RecordBatch from its
+# key_columns. 'color_key' strings are dictionary encoded so each distinct
+# key is decoded once
+# raises ValueError if keys are missing or cannot be packed
+def _packed_color_keys_of(batch, key_columns):
+    import pyarrow.compute as pc
+    if any(batch.column(column).null_count > 0 for column in key_columns):
+        raise ValueError("color_keys cannot be packed")
+    if key_columns == ['packed_color_key']:
+        return batch.column('packed_color_key').to_numpy(zero_copy_only=False).astype(np.uint32)
+    if key_columns == ['color_key']:
+        encoded = pc.dictionary_encode(batch.column('color_key'))
+        unique_color_keys = np.asarray(encoded.dictionary.to_pylist(), dtype=object)
+        return MunsellDataFrame.color_keys_to_packed(unique_color_keys)[encoded.indices.to_numpy()]
+    return MunsellDataFrame.pack_color_keys(*(batch.column(column).to_numpy(zero_copy_only=False) for column in key_columns))
+
+# return the float64 values of a pyarrow array, nan where missing
+def _float_array_of(array):
+    import pyarrow as pa
+    return array.cast(pa.float64()).to_numpy(zero_copy_only=False)
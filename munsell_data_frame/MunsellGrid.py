@@ -0,0 +1,209 @@
+import numpy as np
+from .constants import HUE_PAGE_NAMES
+from .color_keys import decode_color_keys, unpack_color_keys
+
+# the status of each interpolated colour, see MunsellGrid.interpolate
+INTERPOLATED = 0
+FALLBACK = 1
+OUT_OF_GAMUT = 2
+
+# A dense hue x value x chroma array of chip colours.
+#
+# rgbs[hue_page_number, value_row, chroma_column // 2] holds the colour of
+# a chip and mask the same cell's occupancy, so hue pages, value rows and
+# chroma columns are O(1) views and looking up many chips is a single
+# fancy-index. Chroma columns must be even.
+class MunsellGrid:
+
+    # rgbs is a (num_hue_pages, num_value_rows, num_chroma_columns, 3) uint8
+    # array and mask the matching bool array of occupied cells
+    def __init__(self, rgbs, mask):
+        self.rgbs = rgbs
+        self.mask = mask
+
+    # return an empty grid with room for value rows up to max_value_row and
+    # chroma columns up to max_chroma_column
+    @classmethod
+    def empty(cls, max_value_row=9, max_chroma_column=38, num_hue_pages=len(HUE_PAGE_NAMES)):
+        shape = (num_hue_pages, max_value_row + 1, max_chroma_column // 2 + 1)
+        return cls(np.zeros(shape + (3,), dtype=np.uint8), np.zeros(shape, dtype=bool))
+
+    # return the grid of the chips of a MunsellDataFrame,
+    # decoding 'color_key' first if the dimension columns are missing.
+    # Later rows overwrite earlier rows of the same chip
+    # raises ValueError if a chroma column is odd
+    @classmethod
+    def from_munsell_data_frame(cls, munsell_df):
+        if not munsell_df.is_color_key_encodeable:
+            munsell_df.decode_color_key()
+        df = munsell_df.df
+        hue_page_numbers = df['hue_page_number'].to_numpy(dtype=np.int64)
+        value_rows = df['value_row'].to_numpy(dtype=np.int64)
+        chroma_columns = df['chroma_column'].to_numpy(dtype=np.int64)
+        if (chroma_columns % 2).any():
+            raise ValueError("chroma columns must be even")
+
+        grid = cls.empty(int(value_rows.max(initial=0)), int(chroma_columns.max(initial=0)))
+        cells = (hue_page_numbers, value_rows, chroma_columns // 2)
+        grid.rgbs[cells] = df[['r', 'g', 'b']].to_numpy(dtype=np.uint8)
+        grid.mask[cells] = True
+        return grid
+
+    # return the occupied (hue_page_numbers, value_rows, chroma_columns)
+    # in hue page, value row, chroma column order
+    def get_chip_dimensions(self):
+        hue_page_numbers, value_rows, chroma_indices = np.nonzero(self.mask)
+        return hue_page_numbers, value_rows, chroma_indices * 2
+
+    # return a MunsellDataFrame of every occupied chip sorted by color_key
+    def to_munsell_data_frame(self):
+        from .MunsellDataFrame import MunsellDataFrame
+        hue_page_numbers, value_rows, chroma_columns = self.get_chip_dimensions()
+        rgbs = self.rgbs[self.mask]
+        return MunsellDataFrame({
+            'hue_page_number': hue_page_numbers,
+            'value_row': value_rows,
+            'chroma_column': chroma_columns,
+            'color_key': MunsellDataFrame.encode_color_keys(hue_page_numbers, value_rows, chroma_columns),
+            'r': rgbs[:, 0],
+            'g': rgbs[:, 1],
+            'b': rgbs[:, 2],
+        })
+
+    # return the GamutBoundary of the occupied cells
+    def get_gamut_boundary(self):
+        from .GamutBoundary import GamutBoundary
+        return GamutBoundary.from_munsell_grid(self)
+
+    @property
+    def num_chips(self):
+        return int(self.mask.sum())
+
+    # return (rgbs, mask) views of one hue page, indexed [value_row, chroma_column // 2]
+    def get_hue_page(self, hue_page_number):
+        return self.rgbs[hue_page_number], self.mask[hue_page_number]
+
+    # return (rgbs, mask) views of one value row, indexed [hue_page_number, chroma_column // 2]
+    def get_value_row(self, value_row):
+        return self.rgbs[:, value_row], self.mask[:, value_row]
+
+    # return (rgbs, mask) views of one chroma column, indexed [hue_page_number, value_row]
+    def get_chroma_column(self, chroma_column):
+        return self.rgbs[:, :, chroma_column // 2], self.mask[:, :, chroma_column // 2]
+
+    # return (rgbs, found) of equal-length arrays of chip dimensions, where
+    # rgbs is (n, 3) uint8 and found is False, with rgb 0, for chips that
+    # are out of the grid or not occupied
+    def gather(self, hue_page_numbers, value_rows, chroma_columns):
+        hue_page_numbers = np.asarray(hue_page_numbers, dtype=np.int64)
+        value_rows = np.asarray(value_rows, dtype=np.int64)
+        chroma_columns = np.asarray(chroma_columns, dtype=np.int64)
+        chroma_indices = chroma_columns // 2
+        num_hue_pages, num_value_rows, num_chroma_indices = self.mask.shape
+        in_grid = ((hue_page_numbers >= 0) & (hue_page_numbers < num_hue_pages)
+            & (value_rows >= 0) & (value_rows < num_value_rows)
+            & (chroma_columns >= 0) & (chroma_columns % 2 == 0) & (chroma_indices < num_chroma_indices))
+
+        # flat cell indices, with cells out of the grid pointed at cell 0
+        cells = np.where(in_grid, (hue_page_numbers * num_value_rows + value_rows) * num_chroma_indices + chroma_indices, 0)
+        found = in_grid & self.mask.reshape(-1)[cells]
+        rgbs = self.rgbs.reshape(-1, 3)[cells]
+        rgbs[~found] = 0
+        return rgbs, found
+
+    # return (rgbs, found) of an array of 'HH-VV-CC' color_keys, see gather
+    def gather_color_keys(self, color_keys):
+        return self.gather(*decode_color_keys(color_keys))
+
+    # return (rgbs, found) of an array of packed color keys, see gather
+    def gather_packed_color_keys(self, packed_color_keys):
+        return self.gather(*unpack_color_keys(packed_color_keys))
+
+    # return the bytes of one uint8 block per 'hue_page_number', 'value_row',
+    # 'chroma_column', 'r', 'g', 'b' column of every occupied chip, the
+    # layout of the typed array javascript exports
+    def get_chip_bytes(self):
+        hue_page_numbers, value_rows, chroma_columns = self.get_chip_dimensions()
+        rgbs = self.rgbs[self.mask]
+        return np.concatenate([hue_page_numbers, value_rows, chroma_columns, rgbs[:, 0], rgbs[:, 1], rgbs[:, 2]]).astype(np.uint8).tobytes()
+
+    # return a dict of hue_page_number to (value_rows, chroma_columns, rgbs)
+    # arrays of every occupied hue page, like HuePageRenderer.get_hue_page_arrays
+    def get_hue_page_arrays(self):
+        hue_page_numbers, value_rows, chroma_columns = self.get_chip_dimensions()
+        rgbs = self.rgbs[self.mask]
+        page_starts = np.searchsorted(hue_page_numbers, np.arange(len(self.mask) + 1))
+        return {
+            hue_page_number: (value_rows[start:stop], chroma_columns[start:stop], rgbs[start:stop])
+            for hue_page_number, (start, stop) in enumerate(zip(page_starts[:-1], page_starts[1:]))
+            if stop > start
+        }
+
+    # return (rgbs, status) of fractional chips given equal-length or
+    # broadcastable arrays of hue page numbers, values and chromas, e.g. from
+    # munsell_notation.parse_munsell_notation. rgbs is (n, 3) uint8 and
+    # status is INTERPOLATED, FALLBACK or OUT_OF_GAMUT for each chip.
+    #
+    # Each chip is trilinearly interpolated in sRGB between the 8 grid
+    # cells around it. Hue page numbers wrap at 40, so chips between
+    # '10.0RP' and '2.5R' blend the two pages. When some of the cells with
+    # weight are not occupied, at the gamut edge, the chip is interpolated
+    # from the occupied cells only and flagged FALLBACK if fallback is True,
+    # otherwise it is OUT_OF_GAMUT. Chips with no occupied cells or outside
+    # the grid are OUT_OF_GAMUT with rgb 0
+    def interpolate(self, hue_page_numbers, values, chromas, fallback=True, chunk_size=1 << 18):
+        hue_page_numbers, values, chromas = (np.ravel(array) for array in np.broadcast_arrays(
+            np.asarray(hue_page_numbers, dtype=np.float64), np.asarray(values, dtype=np.float64), np.asarray(chromas, dtype=np.float64)))
+        rgbs = np.empty((len(values), 3), dtype=np.uint8)
+        status = np.empty(len(values), dtype=np.uint8)
+        cell_rgbs = self.rgbs.reshape(-1, 3).astype(np.float32)
+        for start in range(0, len(values), chunk_size):
+            stop = start + chunk_size
+            rgbs[start:stop], status[start:stop] = self._interpolate_chunk(
+                cell_rgbs, hue_page_numbers[start:stop], values[start:stop], chromas[start:stop], fallback)
+        return rgbs, status
+
+    # return (rgbs, status) of one chunk of chips, see interpolate
+    def _interpolate_chunk(self, cell_rgbs, hue_page_numbers, values, chromas, fallback):
+        num_hue_pages, num_value_rows, num_chroma_indices = self.mask.shape
+        chroma_indices = chromas / 2
+        in_grid = (np.isfinite(hue_page_numbers) & (values >= 0) & (values <= num_value_rows - 1)
+            & (chroma_indices >= 0) & (chroma_indices <= num_chroma_indices - 1))
+
+        # the lower corner cell and fraction along each axis; hue wraps
+        # around, values and chromas at the top edge use the last two cells
+        hues = np.mod(np.where(in_grid, hue_page_numbers, 0), num_hue_pages)
+        hue0 = np.floor(hues).astype(np.intp)
+        hue_fraction = (hues - hue0).astype(np.float32)
+        hue1 = np.where(hue0 + 1 == num_hue_pages, 0, hue0 + 1)
+        values = np.clip(values, 0, num_value_rows - 1)
+        value0 = np.minimum(np.floor(values).astype(np.intp), num_value_rows - 2)
+        value_fraction = (values - value0).astype(np.float32)
+        chroma_indices = np.clip(chroma_indices, 0, num_chroma_indices - 1)
+        chroma0 = np.minimum(np.floor(chroma_indices).astype(np.intp), num_chroma_indices - 2)
+        chroma_fraction = (chroma_indices - chroma0).astype(np.float32)
+
+        cell_mask = self.mask.reshape(-1)
+        totals = np.zeros((len(hues), 3), dtype=np.float32)
+        weights = np.zeros(len(hues), dtype=np.float32)
+        missing = np.zeros(len(hues), dtype=bool)
+        for hue, hue_weight in ((hue0, 1 - hue_fraction), (hue1, hue_fraction)):
+            for value, value_weight in ((value0, 1 - value_fraction), (value0 + 1, value_fraction)):
+                row = (hue * num_value_rows + value) * num_chroma_indices
+                row_weight = hue_weight * value_weight
+                for chroma, chroma_weight in ((chroma0, 1 - chroma_fraction), (chroma0 + 1, chroma_fraction)):
+                    cells = row + chroma
+                    weight = row_weight * chroma_weight
+                    occupied = cell_mask[cells]
+                    missing |= ~occupied & (weight > 0)
+                    weight *= occupied
+                    weights += weight
+                    totals += weight[:, None] * cell_rgbs[cells]
+
+        status = np.where(missing, FALLBACK, INTERPOLATED).astype(np.uint8)
+        if not fallback:
+            status[missing] = OUT_OF_GAMUT
+        status[~in_grid | (weights <= 0)] = OUT_OF_GAMUT
+        rgbs = np.rint(totals / np.maximum(weights, np.float32(1e-12))[:, None]).clip(0, 255).astype(np.uint8)
+        rgbs[status == OUT_OF_GAMUT] = 0
+        return rgbs, status
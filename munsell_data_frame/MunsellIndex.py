@@ -0,0 +1,94 @@
+import numbers
+import numpy as np
+
+# A sorted index over the hue_page_number/value_row/chroma_column dimensions
+# of a MunsellDataFrame.
+#
+# Each row's dimensions are packed into one integer
+# (hue_page_number * 10000 + value_row * 100 + chroma_column) and the row
+# positions are stable-sorted by that key, so all rows of one hue page,
+# one (hue page, value row) or one chip form a contiguous range of the
+# sorted keys that is found with two binary searches.
+class MunsellIndex:
+
+    dimension_columns = ['hue_page_number', 'value_row', 'chroma_column']
+
+    # the packed key range spanned by each level of the index prefix
+    _prefix_spans = [10000, 100, 1]
+
+    # build the index from an array of packed color keys, one per row
+    def __init__(self, packed_color_keys):
+        packed_color_keys = np.asarray(packed_color_keys, dtype=np.uint32)
+        self.num_rows = len(packed_color_keys)
+        self.order = np.argsort(packed_color_keys, kind='stable')
+        self.sorted_keys = packed_color_keys[self.order]
+
+    # return a MunsellIndex for the given MunsellDataFrame
+    # or None if its dimensions are missing or cannot be packed
+    @classmethod
+    def from_munsell_data_frame(cls, mdf):
+        if mdf.is_color_key_encodeable:
+            dims = mdf.df[cls.dimension_columns]
+            if dims.isna().any().any():
+                return None
+            try:
+                return cls(mdf.pack_color_keys(dims['hue_page_number'], dims['value_row'], dims['chroma_column']))
+            except ValueError:
+                return None
+        return None
+
+    # split filters into a dict of the dimension filters this index can answer
+    # and a dict of the remaining filters that must be compared row by row
+    @classmethod
+    def split_filters(cls, filters):
+        indexed = {}
+        remaining = {}
+        for col, val in filters.items():
+            if col in cls.dimension_columns and isinstance(val, numbers.Integral) and not isinstance(val, bool) and 0 <= val <= 99:
+                indexed[col] = int(val)
+            else:
+                remaining[col] = val
+        return indexed, remaining
+
+    # return the (start, stop) range of sorted_keys that matches the longest
+    # prefix of hue_page_number, value_row, chroma_column in dimension_filters,
+    # or None if hue_page_number is not filtered
+    def _prefix_range(self, dimension_filters):
+        low = 0
+        span = None
+        for col, prefix_span in zip(self.dimension_columns, self._prefix_spans):
+            if col not in dimension_filters:
+                break
+            low += dimension_filters[col] * prefix_span
+            span = prefix_span
+        if span is None:
+            return None
+        # search with keys of the same dtype so sorted_keys is not cast
+        start, stop = np.searchsorted(self.sorted_keys, np.array([low, low + span], dtype=np.uint32))
+        return int(start), int(stop)
+
+    # return the ascending row positions that match all of the given
+    # {dimension column: int} filters, or None if hue_page_number is not filtered.
+    # Dimensions that are not part of the filtered prefix are checked
+    # only within the prefix range.
+    def positions(self, dimension_filters):
+        prefix_range = self._prefix_range(dimension_filters)
+        if prefix_range is None:
+            return None
+        start, stop = prefix_range
+        keys = self.sorted_keys[start:stop]
+        positions = self.order[start:stop]
+        if 'value_row' not in dimension_filters and 'chroma_column' in dimension_filters:
+            positions = positions[keys % 100 == dimension_filters['chroma_column']]
+        return np.sort(positions)
+
+    # return a list of (hue_page_number, ascending row positions) for every
+    # hue page that has rows, in hue_page_number order
+    def hue_page_positions(self):
+        if self.num_rows == 0:
+            return []
+        hue_page_numbers = self.sorted_keys // 10000
+        boundaries = np.flatnonzero(np.diff(hue_page_numbers)) + 1
+        starts = np.concatenate([[0], boundaries])
+        stops = np.concatenate([boundaries, [self.num_rows]])
+        return [(int(hue_page_numbers[start]), np.sort(self.order[start:stop])) for start, stop in zip(starts, stops)]
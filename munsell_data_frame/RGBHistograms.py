@@ -0,0 +1,107 @@
+import numpy as np
+
+CHANNELS = ('r', 'g', 'b')
+NUM_LEVELS = 256
+
+# Per-channel and joint histograms of the r/g/b columns of a MunsellDataFrame.
+#
+# cell_counts[hue_page_number, value_row, channel, level] is filled with one
+# np.bincount over all chips, and the hue page, value row and overall
+# histograms are sums of it, so every breakdown comes from a single pass.
+class RGBHistograms:
+
+    # cell_counts is a (num_hue_pages, num_value_rows, 3, 256) int64 array
+    # and joint_counts a (bins, bins, bins) array of r/g/b bins
+    def __init__(self, cell_counts, joint_counts):
+        self.cell_counts = cell_counts
+        self.joint_counts = joint_counts
+
+    # return the histograms of equal-length arrays of hue_page_numbers,
+    # value_rows and (n, 3) rgbs with joint_bins bins per joint axis
+    @classmethod
+    def from_arrays(cls, hue_page_numbers, value_rows, rgbs, num_hue_pages=40, joint_bins=16):
+        hue_page_numbers = np.asarray(hue_page_numbers, dtype=np.int64)
+        value_rows = np.asarray(value_rows, dtype=np.int64)
+        rgbs = np.asarray(rgbs, dtype=np.int64).reshape(-1, 3)
+        num_value_rows = int(value_rows.max()) + 1 if len(value_rows) > 0 else 1
+
+        # one flat bin per (hue page, value row, channel, level)
+        cells = (hue_page_numbers * num_value_rows + value_rows)[:, None] * len(CHANNELS) + np.arange(len(CHANNELS))
+        flat_bins = (cells * NUM_LEVELS + rgbs).ravel()
+        cell_counts = np.bincount(flat_bins, minlength=num_hue_pages * num_value_rows * len(CHANNELS) * NUM_LEVELS)
+        cell_counts = cell_counts.reshape(num_hue_pages, num_value_rows, len(CHANNELS), NUM_LEVELS)
+
+        joint_counts, _ = np.histogramdd(rgbs, bins=joint_bins, range=[(0, NUM_LEVELS)] * len(CHANNELS))
+        return cls(cell_counts, joint_counts.astype(np.int64))
+
+    # return the histograms of a MunsellDataFrame,
+    # decoding 'color_key' first if the dimension columns are missing
+    @classmethod
+    def from_munsell_data_frame(cls, munsell_df, joint_bins=16):
+        if not munsell_df.is_color_key_encodeable:
+            munsell_df.decode_color_key()
+        df = munsell_df.df
+        return cls.from_arrays(
+            df['hue_page_number'].to_numpy(dtype=np.int64),
+            df['value_row'].to_numpy(dtype=np.int64),
+            df[list(CHANNELS)].to_numpy(dtype=np.int64),
+            joint_bins=joint_bins)
+
+    # (3, 256) counts of every chip
+    @property
+    def channel_counts(self):
+        return self.cell_counts.sum(axis=(0, 1))
+
+    # (num_hue_pages, 3, 256) counts of each hue page
+    @property
+    def hue_page_counts(self):
+        return self.cell_counts.sum(axis=1)
+
+    # (num_value_rows, 3, 256) counts of each value row
+    @property
+    def value_row_counts(self):
+        return self.cell_counts.sum(axis=0)
+
+    @property
+    def num_chips(self):
+        return int(self.joint_counts.sum())
+
+    # return a copy of (..., 256) counts summed into num_bins equal ranges of levels
+    @classmethod
+    def rebin(cls, counts, num_bins):
+        edges = np.linspace(0, NUM_LEVELS, num_bins + 1).astype(np.int64)
+        return np.add.reduceat(counts, edges[:-1], axis=-1)
+
+    # return a DataFrame of count, mean, std, min, (lower) median and max
+    # of every channel overall ('all'), of every hue page and of every
+    # value row that has chips
+    def get_stats(self):
+        import pandas as pd
+        groups = [
+            ('all', np.array([-1]), self.channel_counts[None]),
+            ('hue_page_number', np.arange(self.cell_counts.shape[0]), self.hue_page_counts),
+            ('value_row', np.arange(self.cell_counts.shape[1]), self.value_row_counts),
+        ]
+        stats_dfs = []
+        for group, group_values, counts in groups:
+            count = counts.sum(axis=-1)
+            has_chips = count[:, 0] > 0
+            counts, count, group_values = counts[has_chips], count[has_chips], group_values[has_chips]
+
+            levels = np.arange(NUM_LEVELS)
+            mean = (counts * levels).sum(axis=-1) / count
+            std = np.sqrt(np.maximum((counts * levels ** 2).sum(axis=-1) / count - mean ** 2, 0))
+            cumulative = counts.cumsum(axis=-1)
+            nonzero = counts > 0
+            stats_dfs.append(pd.DataFrame({
+                'group': group,
+                'group_value': np.repeat(group_values, len(CHANNELS)),
+                'channel': np.tile(CHANNELS, len(group_values)),
+                'count': count.ravel(),
+                'mean': mean.ravel(),
+                'std': std.ravel(),
+                'min': nonzero.argmax(axis=-1).ravel(),
+                'median': (cumulative < (count[..., None] + 1) // 2).sum(axis=-1).ravel(),
+                'max': (NUM_LEVELS - 1 - nonzero[..., ::-1].argmax(axis=-1)).ravel(),
+            }))
+        return pd.concat(stats_dfs, ignore_index=True)
@@ -1,2 +1,27 @@
-from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+import sys
+import types
 from munsell_data_frame.constants import *
+
+# the classes exported by the package, each imported from the module of the
+# same name on first use, so that importing a pandas-free module such as
+# ChipTable, MunsellGrid or HuePageRenderer does not import pandas
+_lazy_classes = {'MunsellDataFrame', 'MunsellGrid', 'ChipTable'}
+
+def __getattr__(name):
+    if name in _lazy_classes:
+        import importlib
+        return getattr(importlib.import_module(f"{__name__}.{name}"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | _lazy_classes)
+
+# importing a submodule sets the package attribute of its name to the
+# module, which would shadow the class of the same name
+class _Package(types.ModuleType):
+    def __setattr__(self, name, value):
+        if name in _lazy_classes and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,100 @@
+import numpy as np
+
+# Vectorized conversions between the forms of a chip's color key, shared by
+# MunsellDataFrame and the pandas-free ChipTable and MunsellGrid:
+#   - dimension arrays of hue_page_number, value_row and chroma_column
+#   - "HH-VV-CC" color_key strings
+#   - packed uint32 keys, hue_page_number * 10000 + value_row * 100 + chroma_column
+
+# return a uint32 array of packed color keys for the given arrays
+# of hue_page_numbers, value_rows and chroma_columns
+# raises ValueError if any dimension is outside 0..99
+def pack_color_keys(hue_page_numbers, value_rows, chroma_columns):
+    dims = [np.asarray(dim, dtype=np.int64) for dim in (hue_page_numbers, value_rows, chroma_columns)]
+    if any(dim.size > 0 and (dim.min() < 0 or dim.max() > 99) for dim in dims):
+        raise ValueError("color_key dimensions must be in the range 0..99")
+    return (dims[0] * 10000 + dims[1] * 100 + dims[2]).astype(np.uint32)
+
+# return (hue_page_numbers, value_rows, chroma_columns) uint8 arrays
+# unpacked from an array of packed color keys
+def unpack_color_keys(packed_color_keys):
+    packed = np.asarray(packed_color_keys, dtype=np.uint32)
+    return (
+        (packed // 10000).astype(np.uint8),
+        (packed // 100 % 100).astype(np.uint8),
+        (packed % 100).astype(np.uint8)
+    )
+
+# return an array of "HH-VV-CC" color_key strings, one per element of the
+# given hue_page_number, value_row and chroma_column arrays.
+# The keys are assembled as fixed-width ascii bytes with integer arithmetic,
+# so no python string formatting is done per row.
+# raises ValueError if any dimension is outside 0..99
+def encode_color_keys(hue_page_numbers, value_rows, chroma_columns):
+    dims = np.column_stack([
+        np.asarray(hue_page_numbers, dtype=np.int64),
+        np.asarray(value_rows, dtype=np.int64),
+        np.asarray(chroma_columns, dtype=np.int64)
+    ])
+    if dims.size > 0 and (dims.min() < 0 or dims.max() > 99):
+        raise ValueError("color_key dimensions must be in the range 0..99")
+    key_bytes = np.empty((len(dims), 8), dtype=np.uint8)
+    key_bytes[:, 0::3] = dims // 10 + ord('0')
+    key_bytes[:, 1::3] = dims % 10 + ord('0')
+    key_bytes[:, 2::3] = ord('-')
+    return key_bytes.view('S8').ravel().astype(str)
+
+# return (hue_page_numbers, value_rows, chroma_columns) uint8 arrays parsed
+# from an array, list or pandas Series of "HH-VV-CC" color_key strings.
+# The keys are viewed as a fixed-width byte matrix and the digits are
+# decoded column-wise, so no intermediate split columns are created.
+# Keys of other widths, such as '1-2-4' or the '01-100-02' that
+# MunsellDataFrame.set_color_key writes for dimensions above 99, are
+# split on '-' one by one, unless variable_width is False; the arrays are
+# int64 if any value exceeds 255
+# raises ValueError if any key is not three '-' separated integers, or if
+# variable_width is False, not "HH-VV-CC"
+def decode_color_keys(color_keys, variable_width=True):
+    if hasattr(color_keys, 'to_numpy'):
+        color_keys = color_keys.to_numpy()
+    color_keys = np.asarray(color_keys)
+    try:
+        # one extra byte so that over-long keys are detected rather than truncated
+        key_bytes = color_keys.astype('S9').view(np.uint8).reshape(-1, 9)
+    except (UnicodeEncodeError, ValueError, TypeError):
+        if not variable_width:
+            raise ValueError("color_keys are not all \"HH-VV-CC\" keys")
+        values = np.zeros((color_keys.size, 3), dtype=np.uint8)
+        values = _decode_variable_width_keys(color_keys.ravel(), values, np.ones(len(values), dtype=bool))
+        return values[:, 0], values[:, 1], values[:, 2]
+    digits = key_bytes[:, [0, 1, 3, 4, 6, 7]] - ord('0')
+    is_fixed_width = (
+        (key_bytes[:, 2] == ord('-')) & (key_bytes[:, 5] == ord('-')) &
+        (key_bytes[:, 8] == 0) & (digits <= 9).all(axis=1)
+    )
+    values = digits[:, 0::2] * 10 + digits[:, 1::2]
+    if not is_fixed_width.all():
+        if not variable_width:
+            raise ValueError(f"invalid color_key: {color_keys.ravel()[np.argmin(is_fixed_width)]!r}")
+        values = _decode_variable_width_keys(color_keys.ravel(), values, ~is_fixed_width)
+    return values[:, 0], values[:, 1], values[:, 2]
+
+# return the (n, 3) values with the given rows replaced by the integers of
+# their '-' separated color_keys, as int64 if any of them exceeds 255
+# raises ValueError if any of those keys is not three '-' separated integers
+def _decode_variable_width_keys(color_keys, values, rows):
+    parsed = []
+    for color_key in color_keys[rows].tolist():
+        try:
+            text = color_key.decode('ascii') if isinstance(color_key, bytes) else color_key
+            parts = [int(part) for part in text.split('-')]
+        except (AttributeError, ValueError):
+            parts = []
+        if len(parts) != 3:
+            raise ValueError(f"invalid color_key: {color_key!r}")
+        parsed.append(parts)
+    parsed = np.array(parsed, dtype=np.int64)
+    if parsed.max() > 255:
+        values = values.astype(np.int64)
+    values[rows] = parsed
+    return values
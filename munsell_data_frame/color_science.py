@@ -0,0 +1,109 @@
+import numpy as np
+
+# sRGB (D65) colour conversions of (..., 3) arrays of 0-255 sRGB values
+
+# linear sRGB to CIE XYZ, IEC 61966-2-1
+SRGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+
+# CIE XYZ of the D65 reference white
+D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+# return linear sRGB in [0, 1] of 0-255 sRGB values
+def srgb_to_linear(rgbs):
+    c = np.asarray(rgbs, dtype=np.float64) / 255.0
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+# linear sRGB of every 8-bit level, so integer colours are converted by lookup
+_LINEAR_OF_LEVEL = srgb_to_linear(np.arange(256))
+
+# return linear sRGB in [0, 1] of 0-255 sRGB values, by lookup for integers
+def rgb_to_linear(rgbs):
+    rgbs = np.asarray(rgbs)
+    if rgbs.dtype.kind in 'ui':
+        return _LINEAR_OF_LEVEL[rgbs]
+    return srgb_to_linear(rgbs)
+
+# return CIE XYZ of linear sRGB values
+def linear_to_xyz(linears):
+    return np.asarray(linears, dtype=np.float64) @ SRGB_TO_XYZ.T
+
+# return CIE XYZ of 0-255 sRGB values
+def rgb_to_xyz(rgbs):
+    return linear_to_xyz(rgb_to_linear(rgbs))
+
+# return CIELAB (L*, a*, b*) of CIE XYZ values relative to white
+def xyz_to_lab(xyzs, white=D65_WHITE):
+    t = np.asarray(xyzs, dtype=np.float64) / white
+    epsilon = 216 / 24389
+    kappa = 24389 / 27
+    f = np.where(t > epsilon, np.cbrt(t), (kappa * t + 16) / 116)
+    lightness = 116 * f[..., 1] - 16
+    a = 500 * (f[..., 0] - f[..., 1])
+    b = 200 * (f[..., 1] - f[..., 2])
+    return np.stack([lightness, a, b], axis=-1)
+
+# return CIELAB (L*, a*, b*) of 0-255 sRGB values
+def rgb_to_lab(rgbs):
+    return xyz_to_lab(rgb_to_xyz(rgbs))
+
+# return the CIE76 colour difference, the euclidean distance, of
+# broadcastable arrays of CIELAB values
+def delta_e_76(labs1, labs2):
+    differences = np.asarray(labs1, dtype=np.float64) - np.asarray(labs2, dtype=np.float64)
+    return np.sqrt((differences ** 2).sum(axis=-1))
+
+# return the CIEDE2000 colour difference of broadcastable arrays of CIELAB
+# values, with the parametric factors kL, kC and kH of 1 (Sharma et al. 2005)
+def delta_e_2000(labs1, labs2):
+    labs1 = np.asarray(labs1, dtype=np.float64)
+    labs2 = np.asarray(labs2, dtype=np.float64)
+    lightness1, a1, b1 = labs1[..., 0], labs1[..., 1], labs1[..., 2]
+    lightness2, a2, b2 = labs2[..., 0], labs2[..., 1], labs2[..., 2]
+
+    # a* is stretched for near neutral colours
+    mean_chroma7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(mean_chroma7 / (mean_chroma7 + 25.0 ** 7)))
+    a1, a2 = a1 * (1 + g), a2 * (1 + g)
+    chroma1, chroma2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    hue1 = np.degrees(np.arctan2(b1, a1)) % 360
+    hue2 = np.degrees(np.arctan2(b2, a2)) % 360
+
+    # hue differences and means take the short way round the circle,
+    # and are 0 and the sum when either colour is neutral
+    chromatic = (chroma1 * chroma2) != 0
+    hue_difference = hue2 - hue1
+    hue_difference = np.where(hue_difference > 180, hue_difference - 360, np.where(hue_difference < -180, hue_difference + 360, hue_difference))
+    hue_difference = np.where(chromatic, hue_difference, 0)
+    hue_sum = hue1 + hue2
+    mean_hue = np.where(np.abs(hue1 - hue2) <= 180, hue_sum / 2, np.where(hue_sum < 360, (hue_sum + 360) / 2, (hue_sum - 360) / 2))
+    mean_hue = np.where(chromatic, mean_hue, hue_sum)
+
+    lightness_difference = lightness2 - lightness1
+    chroma_difference = chroma2 - chroma1
+    hue_distance = 2 * np.sqrt(chroma1 * chroma2) * np.sin(np.radians(hue_difference) / 2)
+    mean_lightness = (lightness1 + lightness2) / 2
+    mean_chroma = (chroma1 + chroma2) / 2
+
+    t = (1 - 0.17 * np.cos(np.radians(mean_hue - 30)) + 0.24 * np.cos(np.radians(2 * mean_hue))
+        + 0.32 * np.cos(np.radians(3 * mean_hue + 6)) - 0.20 * np.cos(np.radians(4 * mean_hue - 63)))
+    rotation = 30 * np.exp(-((mean_hue - 275) / 25) ** 2)
+    mean_chroma7 = mean_chroma ** 7
+    rotation_term = -2 * np.sqrt(mean_chroma7 / (mean_chroma7 + 25.0 ** 7)) * np.sin(np.radians(2 * rotation))
+    lightness_weight = 1 + 0.015 * (mean_lightness - 50) ** 2 / np.sqrt(20 + (mean_lightness - 50) ** 2)
+    chroma_weight = 1 + 0.045 * mean_chroma
+    hue_weight = 1 + 0.015 * mean_chroma * t
+
+    lightness_term = lightness_difference / lightness_weight
+    chroma_term = chroma_difference / chroma_weight
+    hue_term = hue_distance / hue_weight
+    return np.sqrt(lightness_term ** 2 + chroma_term ** 2 + hue_term ** 2 + rotation_term * chroma_term * hue_term)
+
+# the colour difference functions of CIELAB values by method name
+DELTA_E_METHODS = {
+    '76': delta_e_76,
+    '2000': delta_e_2000,
+}
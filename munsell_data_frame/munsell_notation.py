@@ -0,0 +1,39 @@
+import re
+import numpy as np
+from .constants import HUE_PAGE_NAMES
+
+# Munsell notation of fractional chips, e.g. '3.7YR 5.4/7', in the
+# coordinates of the chip grid: hue page numbers 0-40 wrapping at 40,
+# values and chromas as is
+
+# the hue families in HUE_PAGE_NAMES order, 4 hue pages each
+HUE_FAMILIES = ['R', 'YR', 'Y', 'GY', 'G', 'BG', 'B', 'PB', 'P', 'RP']
+
+# the hue pages between two steps of 2.5 in a family
+HUE_PAGES_PER_FAMILY = len(HUE_PAGE_NAMES) // len(HUE_FAMILIES)
+
+_NOTATION = re.compile(r'^\s*(\d+(?:\.\d*)?)\s*(' + '|'.join(sorted(HUE_FAMILIES, key=len, reverse=True)) + r')\s+(\d+(?:\.\d*)?)\s*/\s*(\d+(?:\.\d*)?)\s*$')
+
+# return the fractional hue page numbers, in [0, 40), of hue steps in
+# (0, 10] and the indices of their families in HUE_FAMILIES.
+# '2.5R' is 0.0, '10.0RP' is 39.0 and 1.25R lies halfway between them at 39.5
+def hue_page_numbers_of(hue_steps, family_indices):
+    hue_steps = np.asarray(hue_steps, dtype=np.float64)
+    family_indices = np.asarray(family_indices, dtype=np.float64)
+    hue_page_numbers = family_indices * HUE_PAGES_PER_FAMILY + hue_steps / 2.5 - 1
+    return np.mod(hue_page_numbers, len(HUE_PAGE_NAMES))
+
+# return (hue_page_numbers, values, chromas) float64 arrays of Munsell
+# notation strings like '3.7YR 5.4/7'
+# raises ValueError for a string that is not chromatic Munsell notation
+def parse_munsell_notation(notations):
+    notations = [notations] if isinstance(notations, str) else list(notations)
+    parsed = np.empty((len(notations), 4))
+    family_of = {family: index for index, family in enumerate(HUE_FAMILIES)}
+    for i, notation in enumerate(notations):
+        match = _NOTATION.match(notation)
+        if match is None:
+            raise ValueError(f"'{notation}' is not Munsell notation")
+        hue_step, family, value, chroma = match.groups()
+        parsed[i] = (float(hue_step), family_of[family], float(value), float(chroma))
+    return hue_page_numbers_of(parsed[:, 0], parsed[:, 1]), parsed[:, 2], parsed[:, 3]
@@ -0,0 +1,27 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# yield function(*args) of each args tuple of tasks in order, computed in a
+# pool of num_workers processes (all cores if None, in this process if 1),
+# each set up by initializer(*initargs) if given.
+# At most window results, 2 per worker by default, are pending at once, so
+# memory stays bounded however many tasks there are and tasks may be a
+# lazy iterator.
+def imap_bounded(function, tasks, num_workers=None, window=None, initializer=None, initargs=()):
+    if num_workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for args in tasks:
+            yield function(*args)
+        return
+    num_workers = num_workers or os.cpu_count() or 1
+    window = window or 2 * num_workers
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=initializer, initargs=initargs) as executor:
+        pending = deque()
+        for args in tasks:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, *args))
+        while pending:
+            yield pending.popleft().result()
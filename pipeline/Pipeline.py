@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# bumped when the fingerprint of a stage changes meaning, so every stage reruns
+PIPELINE_VERSION = 1
+
+# return the sha256 hex digest of the bytes of a file, or of the relative
+# paths and bytes of every file below a folder, or None if path is missing.
+# __pycache__ folders are skipped so that compiling a source folder input
+# does not change its digest
+def path_digest(path):
+    if os.path.isfile(path):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    if os.path.isdir(path):
+        digest = hashlib.sha256()
+        for folder, folder_names, file_names in os.walk(path):
+            folder_names[:] = sorted(name for name in folder_names if name != '__pycache__')
+            for file_name in sorted(file_names):
+                file_path = os.path.join(folder, file_name)
+                digest.update(f"{os.path.relpath(file_path, path)}\0{path_digest(file_path)}\0".encode())
+        return digest.hexdigest()
+    return None
+
+
+# One step of a Pipeline: a command run in a subprocess that reads its
+# input files or folders and writes its output files or folders.
+# Paths are relative to the root folder of the Pipeline. The params are
+# any json values that change the outputs without being in the command.
+# The run_args are appended to the command but not fingerprinted, for
+# arguments that cannot change the outputs, such as a worker count.
+class Stage:
+
+    def __init__(self, name, command, inputs, outputs, params=None, run_args=None):
+        self.name = name
+        self.command = list(command)
+        self.inputs = [os.path.normpath(path) for path in inputs]
+        self.outputs = [os.path.normpath(path) for path in outputs]
+        self.params = params or {}
+        self.run_args = list(run_args or [])
+
+    # return True if path is one of the outputs of the stage or below one
+    def produces(self, path):
+        return any(path == output or path.startswith(output + os.sep) for output in self.outputs)
+
+    # return the sha256 hex digest of the command, params and the current
+    # contents of the inputs of the stage
+    def fingerprint(self, root):
+        digest = hashlib.sha256(json.dumps([PIPELINE_VERSION, self.command, self.params], sort_keys=True).encode())
+        for path in self.inputs:
+            digest.update(f"{path}\0{path_digest(os.path.join(root, path))}\0".encode())
+        return digest.hexdigest()
+
+    # return {output path: digest} of the current outputs of the stage
+    def output_digests(self, root):
+        return {path: path_digest(os.path.join(root, path)) for path in self.outputs}
+
+    # run the command and run_args in root with the root on PYTHONPATH
+    # returns (returncode, combined stdout and stderr)
+    def run(self, root):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+        result = subprocess.run(self.command + self.run_args, cwd=root, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        return result.returncode, result.stdout
+
+
+# A DAG of Stages, where a stage depends on every stage that produces one
+# of its inputs, that reruns only the stages whose outputs are out of date.
+#
+# A stage is up to date if its fingerprint matches the one saved in the
+# cache file after its last successful run and its outputs still have
+# the digests saved with it. Since fingerprints hash the contents of the
+# inputs, a rerun stage that rewrites identical outputs leaves its
+# dependents up to date.
+class Pipeline:
+
+    # raises ValueError on duplicate stage names, two stages producing the
+    # same output, or a dependency cycle
+    def __init__(self, stages, root, cache_file):
+        self.stages = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"duplicate stage name {stage.name!r}")
+            self.stages[stage.name] = stage
+        self.root = root
+        self.cache_file = cache_file
+        self.dependencies = {name: self._get_dependencies(stage) for name, stage in self.stages.items()}
+        self.order = self._get_order()
+
+    # return the names of the stages producing the inputs of a stage
+    def _get_dependencies(self, stage):
+        dependencies = set()
+        for path in stage.inputs:
+            producers = [other.name for other in self.stages.values() if other is not stage and other.produces(path)]
+            if len(producers) > 1:
+                raise ValueError(f"{path!r} is produced by {' and '.join(producers)}")
+            dependencies.update(producers)
+        return dependencies
+
+    # return the stage names in a topological order
+    def _get_order(self):
+        order = []
+        visiting = set()
+        def visit(name):
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"dependency cycle through stage {name!r}")
+            visiting.add(name)
+            for dependency in sorted(self.dependencies[name]):
+                visit(dependency)
+            visiting.discard(name)
+            order.append(name)
+        for name in self.stages:
+            visit(name)
+        return order
+
+    # return the names of the given stages and every stage they depend on,
+    # in topological order, or of every stage if targets is None
+    # raises KeyError for an unknown stage name
+    def get_needed(self, targets=None):
+        if targets is None:
+            return list(self.order)
+        needed = set()
+        pending = [self.stages[name].name for name in targets]
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.dependencies[name])
+        return [name for name in self.order if name in needed]
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache):
+        temp_file = self.cache_file + '.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(temp_file, self.cache_file)
+
+    # return True if the stage was last run with this fingerprint and its
+    # outputs are unchanged since
+    def _is_up_to_date(self, stage, fingerprint, cache_entry):
+        return cache_entry is not None and cache_entry.get('fingerprint') == fingerprint and cache_entry.get('outputs') == stage.output_digests(self.root)
+
+    # fingerprint, and unless it is up to date, run one stage
+    # returns (name, status, seconds, output, cache entry or None) with
+    # status 'ran', 'failed', 'skipped' or, if dry_run, 'stale'
+    def _build(self, stage, cache_entry, force, dry_run):
+        start = time.perf_counter()
+        fingerprint = stage.fingerprint(self.root)
+        if not force and self._is_up_to_date(stage, fingerprint, cache_entry):
+            return stage.name, 'skipped', time.perf_counter() - start, '', None
+        if dry_run:
+            return stage.name, 'stale', time.perf_counter() - start, '', None
+        returncode, output = stage.run(self.root)
+        seconds = time.perf_counter() - start
+        if returncode != 0:
+            return stage.name, 'failed', seconds, output, None
+        return stage.name, 'ran', seconds, output, {'fingerprint': fingerprint, 'outputs': stage.output_digests(self.root), 'seconds': round(seconds, 3)}
+
+    # build the targets and the stages they depend on, or every stage if
+    # targets is None, running up to num_jobs independent stages at once.
+    # force reruns the stages even if they are up to date, dry_run only
+    # reports them as 'stale', along with every stage that depends on a
+    # stale one, since running it could change the inputs of those.
+    # yields (name, status, seconds, output) as each stage finishes, with
+    # status 'ran', 'skipped', 'stale', 'failed', or 'blocked' for the
+    # stages that depend on a failed one. The cache file is saved after
+    # every stage that ran
+    def run(self, targets=None, num_jobs=None, force=False, dry_run=False):
+        needed = self.get_needed(targets)
+        cache = self._load_cache()
+        waiting = {name: self.dependencies[name] & set(needed) for name in needed}
+        finished = set()
+        failed = set()
+        stale = set()
+        running = {}
+        with ThreadPoolExecutor(max_workers=num_jobs or os.cpu_count() or 1) as executor:
+            while waiting or running:
+                for name in [name for name in needed if name in waiting and waiting[name] <= finished]:
+                    del waiting[name]
+                    failed_dependencies = self.dependencies[name] & failed
+                    if failed_dependencies:
+                        finished.add(name)
+                        failed.add(name)
+                        yield name, 'blocked', 0.0, f"depends on failed {' '.join(sorted(failed_dependencies))}"
+                        continue
+                    stale_dependencies = self.dependencies[name] & stale
+                    if stale_dependencies:
+                        finished.add(name)
+                        stale.add(name)
+                        yield name, 'stale', 0.0, f"depends on stale {' '.join(sorted(stale_dependencies))}"
+                        continue
+                    running[executor.submit(self._build, self.stages[name], cache.get(name), force, dry_run)] = name
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+                    name, status, seconds, output, cache_entry = future.result()
+                    finished.add(name)
+                    if status == 'failed':
+                        failed.add(name)
+                    elif status == 'stale':
+                        stale.add(name)
+                    if cache_entry is not None:
+                        cache[name] = cache_entry
+                        self._save_cache(cache)
+                    yield name, status, seconds, output
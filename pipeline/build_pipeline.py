@@ -0,0 +1,111 @@
+import argparse
+import os
+import sys
+import time
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# the spreadsheet and converter script of each dataset folder
+DATASETS = {
+    'long': ('Munsell_to_RGB_long.xlsx', 'excel_file_long/parquet_file_long_from_excel_file_long.py'),
+    'macro': ('Munsell-to-RGB-Tables.xlsm', 'excel_file_macro/parquet_file_macro_from_excel_file_macro.py'),
+}
+
+# the package every stage script imports, an input of every stage
+PACKAGE_DIR = 'munsell_data_frame'
+
+# return the stages of one dataset, all paths relative to the repo:
+#   <dataset>_parquet    spreadsheet -> parquet_file_<dataset>.parquet
+#   <dataset>_js         parquet -> js_file_<dataset>.js (and .bin)
+#   <dataset>_hue_pages  parquet -> hue_page_images/*.png
+#   <dataset>_gif        hue_page_images -> hue_pages_animated.gif
+# so the js and hue_pages stages of a dataset run concurrently
+def get_dataset_stages(dataset, js_format='json', engine='chiptable', num_workers=None, bg=128, scale=50):
+    from Pipeline import Stage
+
+    spreadsheet_name, converter_script = DATASETS[dataset]
+    folder = f"excel_file_{dataset}"
+    parquet_name = f"parquet_file_{dataset}.parquet"
+    parquet_file = f"{folder}/{parquet_name}"
+    js_name = f"js_file_{dataset}.js"
+    image_folder = f"{folder}/hue_page_images"
+    gif_file = f"{folder}/hue_pages_animated.gif"
+    python = sys.executable
+    workers = [] if num_workers is None else ['--workers', str(num_workers)]
+
+    js_script = 'javascript/js_file_from_parquet_file.py'
+    hue_pages_script = 'hue_pages/hue_page_images_from_parquet_file.py'
+    animate_script = 'animate/animate_hue_page_images.py'
+    js_outputs = [f"{folder}/{js_name}"] + ([f"{folder}/js_file_{dataset}.bin"] if js_format == 'bin' else [])
+    return [
+        Stage(f"{dataset}_parquet", [python, converter_script, '--dir', folder],
+              [f"{folder}/{spreadsheet_name}", converter_script, PACKAGE_DIR], [parquet_file]),
+        Stage(f"{dataset}_js", [python, js_script, '--dir', folder, '--p', parquet_name, '--j', js_name, '--format', js_format, '--engine', engine],
+              [parquet_file, js_script, PACKAGE_DIR], js_outputs),
+        Stage(f"{dataset}_hue_pages", [python, hue_pages_script, '--o', image_folder, '--p', parquet_file, '--engine', engine],
+              [parquet_file, hue_pages_script, PACKAGE_DIR], [image_folder], run_args=workers),
+        Stage(f"{dataset}_gif", [python, animate_script, image_folder, gif_file, '--bg', str(bg), '--scale', str(scale)],
+              [image_folder, animate_script], [gif_file]),
+    ]
+
+# return the dependencies, inputs and outputs of a stage, for --list
+def format_stage(pipeline, name):
+    stage = pipeline.stages[name]
+    dependencies = ' '.join(sorted(pipeline.dependencies[name])) or '-'
+    return f"{name:>16}  after: {dependencies}\n{'':>16}  inputs: {' '.join(stage.inputs)}\n{'':>16}  outputs: {' '.join(stage.outputs)}"
+
+# build the stages of the datasets, or only the target stages and the
+# stages they depend on, printing the status and seconds of each stage
+# as it finishes. returns the number of failed or blocked stages
+def main(datasets, cache_file, targets=None, num_jobs=None, force=False, dry_run=False, list_only=False, **stage_options):
+    from Pipeline import Pipeline
+
+    stages = [stage for dataset in datasets for stage in get_dataset_stages(dataset, **stage_options)]
+    pipeline = Pipeline(stages, REPO_DIR, cache_file)
+
+    if list_only:
+        for name in pipeline.get_needed(targets):
+            print(format_stage(pipeline, name))
+        return 0
+
+    start = time.perf_counter()
+    stage_seconds = 0.0
+    num_failed = 0
+    for name, status, seconds, output in pipeline.run(targets, num_jobs=num_jobs, force=force, dry_run=dry_run):
+        stage_seconds += seconds
+        print(f"{name:>16} {status:>8} {seconds:>8.2f}s")
+        if status in ('failed', 'blocked'):
+            num_failed += 1
+            for line in output.rstrip().splitlines()[-20:]:
+                print(f"{'':>16} | {line}")
+    print(f"pipeline wall:{time.perf_counter() - start:.2f}s stages:{stage_seconds:.2f}s failed:{num_failed}")
+    return num_failed
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Build the parquet, js, hue page png and animated gif files of the Munsell spreadsheets, rerunning only the out of date stages.')
+    parser.add_argument('--datasets', nargs='+', choices=list(DATASETS), default=list(DATASETS), help='dataset folders to build (default: all)')
+    parser.add_argument('--stages', nargs='+', default=None, help='build only these stages and the stages they depend on, e.g. long_js')
+    parser.add_argument('--jobs', type=int, default=None, help='number of stages run at once (default: all cores)')
+    parser.add_argument('--workers', type=int, default=None, help='number of rendering processes of each hue_pages stage (default: all cores)')
+    parser.add_argument('--format', choices=['json', 'base64', 'bin'], default='json', help='format of the js files (default: json)')
+    parser.add_argument('--engine', choices=['pandas', 'chiptable'], default='chiptable', help='engine of the js and hue_pages stages (default: chiptable)')
+    parser.add_argument('--cache', default=os.path.join(REPO_DIR, 'pipeline', 'pipeline_cache.json'), help='fingerprint cache file (default: pipeline/pipeline_cache.json)')
+    parser.add_argument('--force', action='store_true', help='rerun the stages even if they are up to date')
+    parser.add_argument('--dry-run', action='store_true', help='only report which stages are stale')
+    parser.add_argument('--list', action='store_true', help='list the stages with their dependencies, inputs and outputs')
+
+    args = parser.parse_args()
+
+    try:
+        num_failed = main(args.datasets, args.cache, targets=args.stages, num_jobs=args.jobs, force=args.force, dry_run=args.dry_run,
+                          list_only=args.list, js_format=args.format, engine=args.engine, num_workers=args.workers)
+    except KeyError as e:
+        print(f"Error: unknown stage {e}")
+        exit(1)
+
+    if num_failed:
+        exit(1)
+
+    print("done")
@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.ChipLookup import ChipLookup
+from munsell_data_frame.color_science import rgb_to_lab
+
+
+class TestChipLookup(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.chip_rgbs = rng.integers(0, 256, (300, 3))
+        self.color_keys = np.array([f"{i % 40:02d}-{i % 9 + 1:02d}-{i % 20 * 2:02d}" for i in range(300)])
+        self.query_rgbs = rng.integers(0, 256, (2000, 3)).astype(np.uint8)
+        self.query_rgbs[1000:] = self.query_rgbs[:1000]
+
+    # the index of the nearest chip of every query, compared one at a time
+    def nearest(self, chip_points, query_points):
+        return np.array([np.argmin(((chip_points - point) ** 2).sum(axis=1)) for point in query_points])
+
+    def test_query_rgb(self):
+        expected = self.nearest(self.chip_rgbs.astype(float), self.query_rgbs.astype(float))
+        for use_kdtree in [True, False]:
+            lookup = ChipLookup(self.chip_rgbs, self.color_keys, use_kdtree=use_kdtree)
+            distances, indices = lookup.query(self.query_rgbs, chunk_size=300)
+            self.assertEqual(indices.shape, (2000,))
+            self.assertTrue((indices == expected).all())
+            self.assertTrue(np.allclose(distances, np.linalg.norm(self.chip_rgbs[indices] - self.query_rgbs, axis=1)))
+
+    def test_query_lab(self):
+        expected = self.nearest(rgb_to_lab(self.chip_rgbs), rgb_to_lab(self.query_rgbs))
+        for use_kdtree in [True, False]:
+            lookup = ChipLookup(self.chip_rgbs, self.color_keys, space='lab', use_kdtree=use_kdtree)
+            self.assertTrue((lookup.query(self.query_rgbs)[1] == expected).all())
+
+    def test_query_k(self):
+        kdtree_lookup = ChipLookup(self.chip_rgbs, self.color_keys)
+        brute_force_lookup = ChipLookup(self.chip_rgbs, self.color_keys, use_kdtree=False)
+        float_rgbs = self.query_rgbs[:50] + 0.25
+        kdtree_distances, kdtree_indices = kdtree_lookup.query(float_rgbs, k=4)
+        brute_force_distances, brute_force_indices = brute_force_lookup.query(float_rgbs, k=4, chunk_size=7)
+        self.assertEqual(kdtree_indices.shape, (50, 4))
+        self.assertTrue((np.diff(kdtree_distances, axis=1) >= 0).all())
+        self.assertTrue(np.allclose(kdtree_distances, brute_force_distances))
+        self.assertTrue((kdtree_indices == brute_force_indices).all())
+
+    def test_lookup(self):
+        lookup = ChipLookup(self.chip_rgbs, self.color_keys)
+        self.assertEqual(lookup.lookup(self.chip_rgbs[:10]).tolist(), self.color_keys[:10].tolist())
+        with self.assertRaises(ValueError):
+            ChipLookup(self.chip_rgbs).lookup(self.query_rgbs)
+        with self.assertRaises(ValueError):
+            ChipLookup(self.chip_rgbs, space='hsv')
+
+    def test_munsell_data_frame_lookup(self):
+        mdf = MunsellDataFrame({'color_key': ['05-03-04', '05-03-06', '12-07-02'], 'r': [250, 10, 128], 'g': [0, 10, 128], 'b': [0, 200, 128]})
+        result = mdf.lookup_color_keys([(255, 10, 10), (120, 130, 125), (0, 0, 255)])
+        self.assertEqual(result.tolist(), ['05-03-04', '12-07-02', '05-03-06'])
+        self.assertIs(mdf.get_chip_lookup(), mdf.get_chip_lookup())
+        self.assertEqual(mdf.lookup_color_keys([(0, 0, 255)], k=2, space='lab').shape, (1, 2))
+        mdf.invalidate_index()
+        self.assertIsNone(mdf._chip_lookups)
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
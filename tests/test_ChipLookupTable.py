@@ -0,0 +1,63 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.ChipLookup import ChipLookup
+from munsell_data_frame.ChipLookupTable import ChipLookupTable
+
+
+class TestChipLookupTable(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.chip_rgbs = rng.integers(0, 256, (50, 3), dtype=np.uint8)
+        self.color_keys = [f"{i:02d}-01-02" for i in range(50)]
+        self.folder = tempfile.TemporaryDirectory()
+        self.table_file = os.path.join(self.folder.name, 'table.npy')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_build_matches_chip_lookup(self):
+        for space, num_workers in [('rgb', 1), ('lab', 2)]:
+            table = ChipLookupTable.load_or_build(self.table_file, self.chip_rgbs, self.color_keys, space=space, bits=4, num_workers=num_workers)
+            self.assertEqual(table.table.shape, (16 ** 3,))
+            self.assertEqual(table.table.dtype, np.uint16)
+
+            # every colour maps to the nearest chip of its level's centre
+            rgbs = np.random.default_rng(4).integers(0, 256, (1000, 3), dtype=np.uint8)
+            centres = (rgbs >> 4).astype(np.float64) * 16 + 7.5
+            _, expected = ChipLookup(self.chip_rgbs, space=space).query(centres)
+            self.assertTrue((table.lookup_indices(rgbs) == expected).all())
+            self.assertEqual(table.lookup(rgbs[:3]).tolist(), [self.color_keys[i] for i in expected[:3]])
+
+    def test_full_table_index(self):
+        table = ChipLookupTable(np.arange(256 ** 3, dtype=np.uint32), [])
+        self.assertEqual(table.table_indices([(1, 2, 3)]).tolist(), [(1 << 16) | (2 << 8) | 3])
+
+    def test_rebuild_when_chips_change(self):
+        ChipLookupTable.load_or_build(self.table_file, self.chip_rgbs, self.color_keys, bits=3, num_workers=1)
+        built_time = os.path.getmtime(self.table_file)
+        os.utime(self.table_file, (built_time - 100, built_time - 100))
+
+        # unchanged chips load the saved table
+        table = ChipLookupTable.load_or_build(self.table_file, self.chip_rgbs, self.color_keys, bits=3, num_workers=1)
+        self.assertEqual(os.path.getmtime(self.table_file), built_time - 100)
+        self.assertIsInstance(table.table, np.memmap)
+
+        # changed chips rebuild it
+        chip_rgbs = self.chip_rgbs.copy()
+        chip_rgbs[0] = (15, 15, 15)
+        table = ChipLookupTable.load_or_build(self.table_file, chip_rgbs, self.color_keys, bits=3, num_workers=1)
+        self.assertNotEqual(os.path.getmtime(self.table_file), built_time - 100)
+        self.assertEqual(table.lookup_indices([(0, 0, 0)])[0], 0)
+
+    def test_from_munsell_data_frame(self):
+        mdf = MunsellDataFrame({'color_key': ['05-03-04', '05-03-06'], 'r': [250, 10], 'g': [0, 10], 'b': [0, 200]})
+        table = ChipLookupTable.from_munsell_data_frame(mdf, self.table_file, bits=2, num_workers=1)
+        self.assertEqual(table.lookup([(255, 10, 10), (0, 0, 255)]).tolist(), ['05-03-04', '05-03-06'])
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
@@ -0,0 +1,93 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from munsell_data_frame.ChipTable import ChipTable, ColorChip
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+
+
+class TestChipTable(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        self.table = ChipTable.from_color_keys(
+            ['00-01-02', '03-05-06', '00-01-02', '39-09-38'],
+            [[10, 1, 0], [30, 2, 0], [21, 3, 0], [50, 5, 9]])
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_color_chips(self):
+        chip = self.table[1]
+        self.assertEqual(chip, ColorChip(3, 5, 6, 30, 2, 0))
+        self.assertEqual(chip.color_key, '03-05-06')
+        self.assertEqual(chip.hue_page_name, '10.0R')
+        self.assertEqual(chip.rgb, (30, 2, 0))
+        self.assertFalse(hasattr(chip, '__dict__'))
+        self.assertEqual([chip.color_key for chip in self.table], list(self.table.color_keys))
+        self.assertEqual(len({chip for chip in self.table}), 4)
+
+    def test_lookup_color_keys(self):
+        rgbs, found = self.table.lookup_color_keys(['39-09-38', '00-01-02', '01-01-02'])
+        self.assertEqual(found.tolist(), [True, True, False])
+        self.assertEqual(rgbs.tolist(), [[50, 5, 9], [10, 1, 0], [0, 0, 0]])
+        self.assertEqual(self.table.get_rgb('03-05-06'), (30, 2, 0))
+        self.assertIsNone(self.table.get_rgb('03-05-08'))
+        self.assertIsNone(self.table.get_rgb('bad'))
+        with self.assertRaises(ValueError):
+            self.table.lookup_color_keys(['bad'])
+
+    def test_groupby_color_key(self):
+        grouped = self.table.groupby_color_key()
+        self.assertEqual(list(grouped.color_keys), ['00-01-02', '03-05-06', '39-09-38'])
+        self.assertEqual(grouped.rgbs[0].tolist(), [15, 2, 0])
+        expected = MunsellDataFrame(self.table.to_munsell_data_frame().df[['color_key', 'r', 'g', 'b']]).groupby_color_key()
+        self.assertEqual(grouped.rgbs.tolist(), expected.df[['r', 'g', 'b']].to_numpy().tolist())
+
+    def test_iter_hue_pages(self):
+        pages = dict(self.table.iter_hue_pages())
+        self.assertEqual(list(pages), [0, 3, 39])
+        self.assertEqual(pages[0].rgbs[:, 0].tolist(), [10, 21])
+        value_rows, chroma_columns, rgbs = self.table.get_hue_page_arrays()[39]
+        self.assertEqual((value_rows.tolist(), chroma_columns.tolist(), rgbs.tolist()), ([9], [38], [[50, 5, 9]]))
+
+    def test_round_trips(self):
+        parquet_file = os.path.join(self.temp_dir.name, 'chips.parquet')
+        csv_file = os.path.join(self.temp_dir.name, 'chips.csv')
+        self.table.to_parquet(parquet_file)
+        self.table.to_csv(csv_file)
+        for table in [ChipTable.from_parquet(parquet_file), ChipTable.from_csv(csv_file),
+                      ChipTable.from_chip_bytes(self.table.get_chip_bytes()),
+                      ChipTable.from_munsell_data_frame(self.table.to_munsell_data_frame())]:
+            self.assertEqual(list(table), list(self.table))
+        munsell_df = MunsellDataFrame.from_parquet(parquet_file)
+        self.assertEqual(list(munsell_df.df['hue_page_name']), ['2.5R', '10.0R', '2.5R', '10.0RP'])
+        self.assertEqual(list(ChipTable.from_munsell_data_frame(munsell_df)), list(self.table))
+
+    def test_missing_values(self):
+        with self.assertRaises(ValueError):
+            ChipTable._from_columns({'color_key': ['00-01-02'], 'r': [None], 'g': [1], 'b': [2]})
+        with self.assertRaises(ValueError):
+            ChipTable._from_columns({'r': [1], 'g': [1], 'b': [2]})
+        table = ChipTable._from_columns({'page_hue_number': [None], 'value_row': [1], 'chroma_column': [2],
+                                         'color_key': ['04-01-02'], 'r': [1], 'g': [1], 'b': [2]})
+        self.assertEqual(table[0].color_key, '04-01-02')
+
+    def test_no_pandas(self):
+        parquet_file = os.path.join(self.temp_dir.name, 'chips.parquet')
+        self.table.to_parquet(parquet_file)
+        code = ("import sys\n"
+                "from munsell_data_frame import ChipTable\n"
+                "from munsell_data_frame.HuePageRenderer import HuePageRenderer, get_hue_page_arrays\n"
+                f"table = ChipTable.from_parquet({parquet_file!r}).groupby_color_key()\n"
+                "get_hue_page_arrays(table)\n"
+                "HuePageRenderer.from_munsell_data_frame(table)\n"
+                f"table.to_parquet({parquet_file!r})\n"
+                "print('pandas' in sys.modules)\n")
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.GamutBoundary import GamutBoundary
+from munsell_data_frame.HuePageRenderer import HuePageRenderer
+
+
+class TestGamutBoundary(unittest.TestCase): # pragma: no cover
+
+    # hue page 0 has value 4 up to chroma 6 and value 5 up to chroma 4,
+    # hue page 39 has value 4 and 5 up to chroma 8, hue page 1 value 9 chroma 2
+    def setUp(self):
+        color_keys = ['00-04-02', '00-04-04', '00-04-06', '00-05-02', '00-05-04', '01-09-02']
+        color_keys += [f"39-{value_row:02d}-{chroma_column:02d}" for value_row in [4, 5] for chroma_column in [2, 4, 6, 8]]
+        self.mdf = MunsellDataFrame({'color_key': color_keys, 'r': 0, 'g': 0, 'b': 0})
+        self.boundary = GamutBoundary.from_munsell_data_frame(self.mdf)
+
+    def test_from_munsell_data_frame(self):
+        self.assertEqual(self.boundary.max_chroma_columns.shape, (40, 10))
+        self.assertEqual(self.boundary.max_chroma_columns.dtype, np.uint8)
+        self.assertEqual(self.boundary.max_chroma_columns[0, 4:6].tolist(), [6, 4])
+        self.assertEqual(self.boundary.min_chroma_columns[0, 4:6].tolist(), [2, 2])
+        self.assertEqual(self.boundary.max_chroma_columns[2].tolist(), [0] * 10)
+
+    def test_from_munsell_grid(self):
+        boundary = GamutBoundary.from_munsell_grid(self.mdf.to_munsell_grid())
+        self.assertTrue((boundary.min_chroma_columns == self.boundary.min_chroma_columns).all())
+        self.assertTrue((boundary.max_chroma_columns == self.boundary.max_chroma_columns).all())
+
+    def test_extent(self):
+        self.assertEqual(self.boundary.max_value_row, 9)
+        self.assertEqual(self.boundary.max_chroma_column, 8)
+        self.assertEqual(self.boundary.get_hue_page_extent(0), (5, 6))
+        self.assertEqual(self.boundary.get_hue_page_extent(2), (0, 0))
+
+    def test_max_chroma(self):
+        max_chromas = self.boundary.max_chroma([0, 0, 0, 39.5, 39, 2, 0], [4, 5, 4.5, 4, 4.5, 4, 10])
+        self.assertEqual(max_chromas[:5].tolist(), [6, 4, 4, 6, 8])
+        self.assertTrue(np.isnan(max_chromas[5:]).all())
+
+    def test_is_in_gamut(self):
+        in_gamut = self.boundary.is_in_gamut([0, 0, 0, 0, 79.9, 0.5], [4, 4, 5, 4.5, 4, 5], [6, 6.5, 4, 5, 3, 1])
+        self.assertEqual(in_gamut.tolist(), [True, False, True, False, True, False])
+
+    def test_clip_to_gamut(self):
+        chromas = self.boundary.clip_to_gamut([0, 0, 0, 2], [4, 5, 4, 4], [10, 3, 0, 2])
+        self.assertEqual(chromas[:3].tolist(), [6, 3, 2])
+        self.assertTrue(np.isnan(chromas[3]))
+
+    def test_cached_on_munsell_data_frame(self):
+        boundary = self.mdf.get_gamut_boundary()
+        self.assertIs(self.mdf.get_gamut_boundary(), boundary)
+        self.mdf.invalidate_index()
+        self.assertIsNot(self.mdf.get_gamut_boundary(), boundary)
+
+    def test_renderer_sizing(self):
+        renderer = HuePageRenderer.from_munsell_data_frame(self.mdf)
+        self.assertEqual((renderer.max_rows, renderer.max_cols), (9, 8))
+        renderer = HuePageRenderer.from_gamut_boundary(self.boundary, hue_page_number=0)
+        self.assertEqual((renderer.max_rows, renderer.max_cols), (5, 6))
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
@@ -0,0 +1,98 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+import numpy as np
+from PIL import Image, GifImagePlugin
+from munsell_data_frame.HuePageRenderer import HuePageRenderer
+from munsell_data_frame.HuePageAnimator import animate_hue_pages, build_global_palette, build_local_palettes, BACKGROUND_INDEX
+
+
+class TestHuePageAnimator(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        # every hue page differs from the previous one, since webp
+        # merges identical frames, and the last page has two chips
+        self.page_arrays = {n: (np.array([1 + n % 2]), np.array([2 + 2 * (n % 2)]), np.array([(6 * n, 255 - 6 * n, n % 3)], dtype=np.uint8)) for n in range(39)}
+        self.page_arrays[39] = (np.array([1, 2]), np.array([2, 4]), np.array([(255, 0, 0), (0, 255, 0)], dtype=np.uint8))
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def expected_frames(self, renderer):
+        return [renderer.render_page_array(*self.page_arrays[n]) for n in range(40)]
+
+    def assert_frames_equal(self, animation_file, renderer):
+        image = Image.open(animation_file)
+        self.assertEqual(image.n_frames, 40)
+        for frame_number, expected in enumerate(self.expected_frames(renderer)):
+            image.seek(frame_number)
+            frame = np.asarray(image.convert('RGBA'))
+            opaque = expected[:, :, 3] == 255
+            self.assertTrue((frame[opaque] == expected[opaque]).all(), f"frame {frame_number} differs")
+            self.assertTrue((frame[~opaque][:, 3] == 0).all() or renderer.background[3] == 255)
+
+    def test_build_global_palette(self):
+        palette, page_chip_indices = build_global_palette(self.page_arrays, background=(7, 8, 9, 255))
+        self.assertEqual(palette.shape, (256, 3))
+        self.assertEqual(tuple(palette[BACKGROUND_INDEX]), (7, 8, 9))
+        for hue_page_number, (_, _, rgbs) in self.page_arrays.items():
+            self.assertTrue((palette[page_chip_indices[hue_page_number]] == rgbs).all())
+
+    def test_build_global_palette_quantized(self):
+        rng = np.random.default_rng(0)
+        rgbs = rng.integers(0, 256, size=(1000, 3), dtype=np.uint8)
+        page_arrays = {0: (np.ones(1000), np.full(1000, 2), rgbs)}
+        palette, page_chip_indices = build_global_palette(page_arrays, max_colors=16)
+        self.assertLess(page_chip_indices[0].max(), 16)
+        self.assertLess(np.abs(palette[page_chip_indices[0]].astype(int) - rgbs).mean(), 64)
+
+    def test_build_local_palettes(self):
+        local_palettes = build_local_palettes(self.page_arrays)
+        for hue_page_number, (palette, chip_indices) in local_palettes.items():
+            self.assertTrue((palette[chip_indices] == self.page_arrays[hue_page_number][2]).all())
+        with self.assertRaises(ValueError):
+            build_local_palettes(self.page_arrays, max_colors=1)
+
+    def test_animate_hue_pages(self):
+        for background in [(0, 0, 0, 0), (128, 128, 128, 255)]:
+            renderer = HuePageRenderer(2, 4, chip_size=6, chip_gap=2, background=background)
+            for file_name, local_palettes in [('a.gif', False), ('b.gif', True), ('c.png', False), ('d.webp', False)]:
+                animation_file = os.path.join(self.folder.name, file_name)
+                num_frames = animate_hue_pages(self.page_arrays, renderer, animation_file, num_workers=1, local_palettes=local_palettes)
+                self.assertEqual(num_frames, 40)
+                self.assert_frames_equal(animation_file, renderer)
+
+    def test_animate_hue_pages_gif_without_plugin_helpers(self):
+        # the undocumented GifImagePlugin helpers may be gone or changed
+        for name, replacement in [('getheader', None), ('getdata', lambda im: [])]:
+            for background in [(0, 0, 0, 0), (128, 128, 128, 255)]:
+                renderer = HuePageRenderer(2, 4, chip_size=6, chip_gap=2, background=background)
+                for local_palettes in [False, True]:
+                    animation_file = os.path.join(self.folder.name, 'a.gif')
+                    with mock.patch.object(GifImagePlugin, name, replacement):
+                        num_frames = animate_hue_pages(self.page_arrays, renderer, animation_file, num_workers=1, local_palettes=local_palettes)
+                    self.assertEqual(num_frames, 40)
+                    self.assert_frames_equal(animation_file, renderer)
+
+    def test_animate_hue_pages_gif_errors_propagate(self):
+        renderer = HuePageRenderer(2, 4, chip_size=6, chip_gap=2, background=(128, 128, 128, 255))
+        with mock.patch('munsell_data_frame.HuePageAnimator._changed_box', side_effect=TypeError('bug')):
+            with self.assertRaises(TypeError):
+                animate_hue_pages(self.page_arrays, renderer, os.path.join(self.folder.name, 'a.gif'), num_workers=1)
+
+    def test_animate_hue_pages_workers(self):
+        renderer = HuePageRenderer(2, 4, chip_size=6, chip_gap=2)
+        animation_file = os.path.join(self.folder.name, 'a.png')
+        animate_hue_pages(self.page_arrays, renderer, animation_file, num_workers=2)
+        self.assert_frames_equal(animation_file, renderer)
+
+    def test_animate_hue_pages_bad_extension(self):
+        renderer = HuePageRenderer(2, 4)
+        with self.assertRaises(ValueError):
+            animate_hue_pages(self.page_arrays, renderer, os.path.join(self.folder.name, 'a.bmp'))
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
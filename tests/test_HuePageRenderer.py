@@ -0,0 +1,53 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from PIL import Image, ImageDraw
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.HuePageRenderer import HuePageRenderer, get_hue_page_arrays, render_hue_pages, hue_page_image_file_name
+
+
+class TestHuePageRenderer(unittest.TestCase): # pragma: no cover
+    
+    def setUp(self):
+        self.value_rows = [1, 3, 2, 3]
+        self.chroma_columns = [2, 6, 4, 2]
+        self.rgbs = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (10, 20, 30)]
+        self.renderer = HuePageRenderer(max_rows=3, max_cols=6, chip_size=7, chip_gap=4)
+
+    # draw the page one rectangle at a time, the way the renderer replaced
+    def draw_page(self, renderer):
+        image = Image.new('RGBA', (renderer.width, renderer.height), renderer.background)
+        draw = ImageDraw.Draw(image)
+        for value_row, chroma_column, rgb in zip(self.value_rows, self.chroma_columns, self.rgbs):
+            draw.rectangle(renderer.get_chip_geometry(value_row, chroma_column), fill=tuple(rgb) + (255,))
+        return np.asarray(image)
+
+    def test_render_page_array_matches_rectangles(self):
+        for renderer in [self.renderer, self.renderer.with_chip_size(12), HuePageRenderer(3, 6, chip_size=5, chip_gap=3, background=(32, 32, 32, 255))]:
+            page = renderer.render_page_array(self.value_rows, self.chroma_columns, self.rgbs)
+            self.assertEqual(page.shape, (renderer.height, renderer.width, 4))
+            self.assertTrue((page == self.draw_page(renderer)).all(), f"chip_size {renderer.chip_size} differs from ImageDraw")
+
+    def test_render_page_array_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self.renderer.render_page_array([4], [2], [(1, 2, 3)])
+        with self.assertRaises(ValueError):
+            self.renderer.render_page_array([1], [8], [(1, 2, 3)])
+
+    def test_render_hue_pages(self):
+        mdf = MunsellDataFrame({'color_key': ['00-01-02', '00-03-06', '02-02-04'], 'r': [1, 2, 3], 'g': [4, 5, 6], 'b': [7, 8, 9]})
+        page_arrays = get_hue_page_arrays(mdf)
+        self.assertListEqual(sorted(page_arrays.keys()), [0, 2])
+        renderer = HuePageRenderer.from_munsell_data_frame(mdf, chip_size=5, chip_gap=2)
+        with tempfile.TemporaryDirectory() as folder:
+            results = render_hue_pages(page_arrays, folder, renderer, chip_sizes=[5, 9], num_workers=1)
+            self.assertEqual(len(results), 80)
+            self.assertEqual(sum(num_chips for _, num_chips in results), 6)
+            image = Image.open(os.path.join(folder, 'chip_size_9', hue_page_image_file_name(2)))
+            self.assertEqual(image.size, (3 * 11, 3 * 11))
+            self.assertEqual(image.getpixel((1 + 11, 1 + 11)), (3, 6, 9, 255))
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
@@ -0,0 +1,73 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from PIL import Image
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.ChipLookup import ChipLookup
+from munsell_data_frame.ImageQuantizer import ImageQuantizer
+
+
+class TestImageQuantizer(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        chip_rgbs = rng.integers(0, 256, (30, 3))
+        self.munsell_df = MunsellDataFrame({
+            'color_key': [f"{i:02d}-05-04" for i in range(30)],
+            'r': chip_rgbs[:, 0], 'g': chip_rgbs[:, 1], 'b': chip_rgbs[:, 2],
+        })
+        self.pixels = rng.integers(0, 256, (13, 20, 3), dtype=np.uint8)
+        self.image = Image.fromarray(self.pixels, 'RGB')
+        _, nearest = ChipLookup(chip_rgbs).query(self.pixels.reshape(-1, 3))
+        self.expected = nearest.reshape(13, 20)
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_get_tile_boxes(self):
+        quantizer = ImageQuantizer(self.munsell_df, tile_size=8)
+        boxes = quantizer.get_tile_boxes(20, 13)
+        self.assertEqual(len(boxes), 6)
+        self.assertEqual(boxes[-1], (16, 8, 20, 13))
+
+    def test_quantize(self):
+        for num_workers in [1, 2]:
+            quantizer = ImageQuantizer(self.munsell_df, tile_size=7, num_workers=num_workers)
+            quantized = quantizer.quantize(self.image)
+            self.assertEqual(quantized.chip_indices.dtype, np.uint16)
+            self.assertTrue((quantized.chip_indices == self.expected).all())
+            self.assertTrue((quantized.counts == np.bincount(self.expected.ravel(), minlength=30)).all())
+
+    def test_quantize_with_table_and_index_file(self):
+        table_file = os.path.join(self.folder.name, 'table.npy')
+        chip_index_file = os.path.join(self.folder.name, 'chip_indices.npy')
+        quantizer = ImageQuantizer(self.munsell_df, table_file=table_file, table_bits=4, tile_size=6, num_workers=1)
+        image_file = os.path.join(self.folder.name, 'image.png')
+        self.image.save(image_file)
+        quantized = quantizer.quantize(image_file, chip_index_file=chip_index_file)
+
+        # a 4 bit table maps each pixel to the nearest chip of its level's centre
+        centres = (self.pixels.reshape(-1, 3) >> 4).astype(np.float64) * 16 + 7.5
+        expected = ChipLookup(quantizer.chip_rgbs).query(centres)[1].reshape(13, 20)
+        self.assertTrue((quantized.chip_indices == expected).all())
+        self.assertTrue((np.load(chip_index_file) == expected).all())
+
+    def test_quantized_image_outputs(self):
+        quantized = ImageQuantizer(self.munsell_df, num_workers=1).quantize(self.image)
+        recolored = np.asarray(quantized.get_recolored_image())
+        self.assertTrue((recolored == quantized.chip_rgbs[self.expected]).all())
+
+        raster = quantized.get_color_key_raster(box=(2, 3, 5, 4))
+        self.assertEqual(raster.shape, (1, 3))
+        self.assertEqual(raster[0, 0], f"{self.expected[3, 2]:02d}-05-04")
+
+        counts_mdf = quantized.get_counts_munsell_df()
+        self.assertEqual(counts_mdf.df['count'].sum(), 13 * 20)
+        self.assertTrue(counts_mdf.df['count'].is_monotonic_decreasing)
+        self.assertEqual(len(counts_mdf.groupby_color_key().df), len(counts_mdf.df))
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
@@ -0,0 +1,73 @@
+import unittest
+import pandas as pd
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame, SortOrder
+
+
+class TestLazyMunsellFrame(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        self.munsell_df = MunsellDataFrame(pd.DataFrame({
+            'color_key': ['00-01-02', '03-05-06', '00-01-02', '03-05-06', '03-05-08', '00-01-04'],
+            'r': [10, 30, 20, 31, 50, 10],
+            'g': [1, 2, 3, 4, 5, 6],
+            'b': [0, 0, 0, 0, 0, 9],
+        }))
+        self.munsell_df.decode_color_key()
+
+    def test_filters_are_fused(self):
+        lazy = self.munsell_df.lazy().filter({'hue_page_number': [0, 3]}).filter({'hue_page_number': 3}).filter({'chroma_column': 6})
+        self.assertIn("scan filters={'hue_page_number': 3, 'chroma_column': 6}", lazy.explain())
+        self.assertEqual(list(lazy.collect().df['r']), [30, 31])
+        self.assertEqual(len(self.munsell_df.lazy().filter({'value_row': 1}).filter({'value_row': 5}).collect().df), 0)
+
+    def test_projection_pushdown(self):
+        lazy = self.munsell_df.lazy().sort({'g': SortOrder.DESC}).filter({'value_row': 1}).project(['color_key', 'r'])
+        self.assertIn("columns=['color_key', 'r', 'g']", lazy.explain())
+        collected = lazy.collect()
+        self.assertEqual(list(collected.df.columns), ['color_key', 'r'])
+        self.assertEqual(list(collected.df['color_key']), ['00-01-04', '00-01-02', '00-01-02'])
+        self.assertEqual(str(collected.df['r'].dtype), 'UInt8')
+        with self.assertRaises(KeyError):
+            self.munsell_df.lazy().project(['color_key', 'r']).filter({'value_row': 1})
+
+    def test_stable_sorts(self):
+        collected = self.munsell_df.lazy().sort({'g': SortOrder.ASC}).sort({'r': SortOrder.ASC}).collect()
+        self.assertEqual(list(collected.df['g']), [1, 6, 3, 2, 4, 5])
+        self.assertIn("sort r asc, g asc", self.munsell_df.lazy().sort({'g': SortOrder.ASC}).sort({'r': SortOrder.ASC}).explain())
+
+    def test_groupby_key(self):
+        lazy = (self.munsell_df.lazy().sort({'r': SortOrder.DESC}).color_key_reduced().groupby_key(with_counts=True)
+                .filter({'count': 2}).sort({'color_key': SortOrder.ASC}))
+        explained = lazy.explain()
+        self.assertIn("columns=['color_key', 'r', 'g', 'b']", explained)
+        self.assertIn("# sort r desc removed", explained)
+        self.assertIn("# sort color_key asc removed", explained)
+        collected = lazy.collect()
+        expected = self.munsell_df.get_color_key_reduced().reduce_by_color_key(with_counts=True)
+        self.assertTrue(collected.df.reset_index(drop=True).equals(expected.df[expected.df['count'] == 2].reset_index(drop=True)))
+        self.assertEqual(list(collected.df['color_key']), ['00-01-02', '03-05-06'])
+        descending = self.munsell_df.lazy().groupby_key().sort({'color_key': SortOrder.DESC}).collect()
+        self.assertEqual(list(descending.df['color_key']), ['03-05-08', '03-05-06', '00-01-04', '00-01-02'])
+        with self.assertRaises(ValueError):
+            self.munsell_df.lazy().groupby_key('mode')
+
+    def test_collect_copies(self):
+        # a source whose dtypes are already canonical is collected unchanged
+        source = MunsellDataFrame._wrap(self.munsell_df.df)
+        collected = source.lazy().collect()
+        self.assertTrue(collected.df.equals(source.df))
+        collected.df.loc[0, 'r'] = 99
+        self.assertEqual(source.df['r'][0], 10)
+
+    def test_collect_normalises_dtypes(self):
+        # decode_color_key leaves int64 dimensions, collect casts them
+        self.assertEqual(str(self.munsell_df.df['value_row'].dtype), 'int64')
+        collected = self.munsell_df.lazy().collect()
+        for column in ['hue_page_number', 'value_row', 'chroma_column', 'r', 'g', 'b']:
+            self.assertEqual(str(collected.df[column].dtype), 'UInt8', column)
+        self.assertEqual(collected.df['value_row'].tolist(), self.munsell_df.df['value_row'].tolist())
+        self.assertTrue(collected.df.equals(MunsellDataFrame._wrap(self.munsell_df.df).df))
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
@@ -0,0 +1,78 @@
+import unittest
+import os
+import json
+import tempfile
+import numpy as np
+import pandas as pd
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.MunsellComparison import MunsellComparison
+
+
+class TestMunsellComparison(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        self.reference_df = MunsellDataFrame({
+            'color_key': ['00-01-02', '00-01-04', '02-05-06', '39-09-02'],
+            'r': [10, 20, 30, 40], 'g': [50, 60, 70, 80], 'b': [90, 100, 110, 120]})
+        # two samples of 00-01-02, one of 02-05-06, none of the other two,
+        # and one of a key the reference does not have
+        self.sample_df = MunsellDataFrame({
+            'color_key': ['02-05-06', '00-01-02', '05-05-05', '00-01-02'],
+            'r': [30, 12, 1, 10], 'g': [70, 50, 2, 45], 'b': [100, 90, 3, 90]})
+        self.comparison = MunsellComparison.compare(self.reference_df, self.sample_df)
+
+    def test_statuses(self):
+        report = self.comparison.report
+        self.assertEqual(list(report['status']), ['matched', 'matched', 'extra', 'matched', 'missing', 'missing'])
+        self.assertEqual(list(self.comparison.get_missing_color_keys()), ['00-01-04', '39-09-02'])
+        self.assertEqual(list(self.comparison.get_extra_color_keys()), ['05-05-05'])
+
+    def test_deltas(self):
+        report = self.comparison.report
+        self.assertEqual(report['r_delta'][:2].tolist(), [0, 2])
+        self.assertEqual(report['b_delta'][0], -10)
+        self.assertEqual(report['g_delta'][3], -5)
+        self.assertTrue(report['r_delta'][[2, 4, 5]].isna().all())
+        self.assertTrue(report['delta_e_2000'][[2, 4, 5]].isna().all())
+        self.assertGreater(report['delta_e_2000'][0], 0)
+        self.assertEqual(report['r_reference'][4], 20)
+
+    def test_dimension_columns(self):
+        sample_df = MunsellDataFrame({'hue_page_number': [2], 'value_row': [5], 'chroma_column': [6], 'r': [30], 'g': [70], 'b': [110]})
+        comparison = MunsellComparison.compare(self.reference_df, sample_df)
+        self.assertEqual(comparison.report['delta_e_2000'][0], 0)
+
+    def test_duplicate_reference_keys(self):
+        with self.assertRaises(ValueError):
+            MunsellComparison.compare(self.sample_df, self.reference_df)
+
+    def test_summary(self):
+        summary = self.comparison.get_summary()
+        self.assertEqual((summary['num_reference'], summary['num_samples'], summary['num_matched']), (4, 4, 3))
+        self.assertEqual((summary['num_matched_color_keys'], summary['num_missing_color_keys'], summary['num_extra_color_keys']), (2, 2, 1))
+        self.assertEqual(summary['max_abs_deltas'], {'r_delta': 2, 'g_delta': 5, 'b_delta': 10})
+
+    def test_hue_page_summary(self):
+        summary = self.comparison.get_hue_page_summary()
+        self.assertEqual(list(summary.index), [0, 2, 5, 39])
+        self.assertEqual(summary.loc[0, ['num_matched', 'num_missing', 'num_extra']].tolist(), [2, 1, 0])
+        self.assertEqual(summary.loc[5, 'num_extra'], 1)
+        self.assertEqual(summary.loc[0, 'mean_abs_r_delta'], 1)
+        self.assertTrue(np.isnan(summary.loc[39, 'delta_e_2000_mean']))
+
+    def test_write_report(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_file = os.path.join(temp_dir, 'report.parquet')
+            summary_file = os.path.join(temp_dir, 'summary.json')
+            self.comparison.to_parquet(report_file)
+            self.comparison.summary_to_json(summary_file)
+            report = pd.read_parquet(report_file)
+            self.assertEqual(list(report['color_key']), list(self.comparison.report['color_key']))
+            with open(summary_file) as f:
+                written = json.load(f)
+            self.assertEqual(written['summary']['num_extra'], 1)
+            self.assertEqual(len(written['hue_pages']), 4)
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
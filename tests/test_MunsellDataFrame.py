@@ -1,9 +1,11 @@
 import unittest
+import warnings
 from munsell_data_frame.MunsellDataFrame import MunsellDataFrame, SortOrder
 import pandas as pd
 from munsell_data_frame.constants import *
 import numpy as np
 import math
+from munsell_data_frame.color_science import delta_e_2000
 
 
 class TestMunsellDataFrame(unittest.TestCase): # pragma: no cover
@@ -28,7 +30,14 @@ class TestMunsellDataFrame(unittest.TestCase): # pragma: no cover
         
         self.assertEqual(filtered_df.shape[0], 1, "wrong number of rows")
         # print('done')
-        
+
+    def test_filter_by_columns_list_values(self):
+        self.munsell_df.df.loc[3, 'value_row'] = pd.NA
+        filtered_df = self.munsell_df.filter_by_columns({'value_row': [6, 9]})
+        self.assertEqual(list(filtered_df.df['r']), [255, 0])
+        self.assertEqual(filtered_df.shape[0], len(self.munsell_df.filter_by_columns({'value_row': [6, 9, 'x']}).df))
+        self.assertTrue(self.munsell_df.filter_by_columns({'value_row': []}).empty)
+
     def test_filter_by_invalid_column_value(self):
         self.munsell_df.set_color_key()
         filters = {
@@ -57,6 +66,126 @@ class TestMunsellDataFrame(unittest.TestCase): # pragma: no cover
             actual = mdf.df.loc[idx, 'color_key']
             self.assertEqual( actual, expected, f"Expected {expected}, but got {actual}")
 
+    def test_encode_color_keys(self):
+        result = MunsellDataFrame.encode_color_keys([1, 10, 99, 3], [2, 20, 5, 0], [3, 30, 8, 1])
+        self.assertListEqual(list(result), ['01-02-03', '10-20-30', '99-05-08', '03-00-01'])
+        
+        # every key matches format_color_key
+        for hue_page_number in range(len(HUE_PAGE_NAMES)):
+            key = MunsellDataFrame.encode_color_keys([hue_page_number], [9], [38])[0]
+            self.assertEqual(key, MunsellDataFrame.format_color_key(hue_page_number, 9, 38))
+        
+        self.assertEqual(len(MunsellDataFrame.encode_color_keys([], [], [])), 0)
+        with self.assertRaises(ValueError):
+            MunsellDataFrame.encode_color_keys([100], [1], [2])
+
+    def test_decode_color_keys(self):
+        hue_page_numbers, value_rows, chroma_columns = MunsellDataFrame.decode_color_keys(pd.Series(['01-02-03', '39-09-38']))
+        self.assertListEqual(hue_page_numbers.tolist(), [1, 39])
+        self.assertListEqual(value_rows.tolist(), [2, 9])
+        self.assertListEqual(chroma_columns.tolist(), [3, 38])
+        
+        # keys of other widths are split on '-', values above 255 widen the arrays
+        hue_page_numbers, value_rows, chroma_columns = MunsellDataFrame.decode_color_keys(['01-02-03', '1-2-4', '01-100-02'])
+        self.assertListEqual(hue_page_numbers.tolist(), [1, 1, 1])
+        self.assertListEqual(value_rows.tolist(), [2, 2, 100])
+        self.assertListEqual(chroma_columns.tolist(), [3, 4, 2])
+        self.assertEqual(MunsellDataFrame.decode_color_keys(['01-300-02'])[1].tolist(), [300])
+        
+        for bad_key in ['change', '1-02', '1--2-3', '01-02-0a', '0a-02-03', None]:
+            with self.assertRaises(ValueError, msg=f"{bad_key!r} should not decode"):
+                MunsellDataFrame.decode_color_keys(pd.Series(['01-02-03', bad_key]))
+
+    def test_decode_color_key(self):
+        mdf = MunsellDataFrame({'color_key': ['01-02-03', '10-20-30'], 'r': [1, 2], 'g': [3, 4], 'b': [5, 6]})
+        mdf.decode_color_key()
+        self.assertListEqual(mdf.df['hue_page_number'].tolist(), [1, 10])
+        self.assertListEqual(mdf.df['value_row'].tolist(), [2, 20])
+        self.assertListEqual(mdf.df['chroma_column'].tolist(), [3, 30])
+        
+        # decode then encode round trip
+        mdf.df['color_key'] = None
+        mdf.set_color_key()
+        self.assertListEqual(mdf.df['color_key'].tolist(), ['01-02-03', '10-20-30'])
+
+    def test_color_key_round_trip_beyond_two_digits(self):
+        mdf = MunsellDataFrame({'hue_page_number': [1, 2], 'value_row': [100, 9], 'chroma_column': [2, 38], 'r': [1, 2], 'g': [3, 4], 'b': [5, 6]})
+        mdf.set_color_key()
+        self.assertListEqual(mdf.df['color_key'].tolist(), ['01-100-02', '02-09-38'])
+        mdf.decode_color_key()
+        self.assertListEqual(mdf.df['hue_page_number'].tolist(), [1, 2])
+        self.assertListEqual(mdf.df['value_row'].tolist(), [100, 9])
+        self.assertListEqual(mdf.df['chroma_column'].tolist(), [2, 38])
+        
+        expanded_mdf = MunsellDataFrame({'color_key': ['1-2-4', '01-100-02'], 'r': [1, 2], 'g': [3, 4], 'b': [5, 6]}).get_color_key_expanded()
+        self.assertListEqual(expanded_mdf.df['value_row'].tolist(), [2, 100])
+        self.assertListEqual(expanded_mdf.df['chroma_column'].tolist(), [4, 2])
+
+    def test_pack_unpack_color_keys(self):
+        packed = MunsellDataFrame.pack_color_keys([0, 39, 12], [1, 9, 5], [2, 38, 10])
+        self.assertEqual(packed.dtype, np.uint32)
+        self.assertListEqual(packed.tolist(), [102, 390938, 120510])
+        self.assertEqual(MunsellDataFrame.format_packed_color_key(39, 9, 38), 390938)
+        
+        hue_page_numbers, value_rows, chroma_columns = MunsellDataFrame.unpack_color_keys(packed)
+        self.assertListEqual(hue_page_numbers.tolist(), [0, 39, 12])
+        self.assertListEqual(value_rows.tolist(), [1, 9, 5])
+        self.assertListEqual(chroma_columns.tolist(), [2, 38, 10])
+        
+        color_keys = ['00-01-02', '39-09-38', '12-05-10']
+        self.assertListEqual(MunsellDataFrame.color_keys_to_packed(color_keys).tolist(), packed.tolist())
+        self.assertListEqual(list(MunsellDataFrame.packed_to_color_keys(packed)), color_keys)
+
+    def test_get_packed_color_keys(self):
+        mdf = MunsellDataFrame({'color_key': ['39-09-38', '00-01-02', '39-09-38'], 'r': [1, 2, 3], 'g': [1, 2, 3], 'b': [1, 2, 3]})
+        self.assertListEqual(mdf.get_packed_color_keys().tolist(), [390938, 102, 390938])
+        mdf.df['packed_color_key'] = np.array([1, 2, 3], dtype=np.uint32)
+        self.assertListEqual(mdf.get_packed_color_keys().tolist(), [1, 2, 3])
+        self.assertIsNone(MunsellDataFrame({'color_key': ['1-2-4'], 'r': [1], 'g': [1], 'b': [1]}).get_packed_color_keys())
+
+    def test_packed_color_key_operations(self):
+        self.munsell_df.set_color_key()
+        self.munsell_df.set_packed_color_key()
+        self.assertTrue(self.munsell_df.has_packed_color_key)
+        self.assertListEqual(self.munsell_df.df['packed_color_key'].tolist(), [905, 10803, 20607, 20608])
+        
+        filtered_mdf = self.munsell_df.filter_by_columns({'color_key': '02-06-07'})
+        self.assertListEqual(filtered_mdf.df['hue_page_name'].tolist(), ['7.5R'])
+        self.assertTrue(self.munsell_df.filter_by_columns({'color_key': 'change'}).empty)
+        
+        sorted_mdf = self.munsell_df.sort_by_columns({'color_key': SortOrder.DESC})
+        self.assertListEqual(sorted_mdf.df['color_key'].tolist(), ['02-06-08', '02-06-07', '01-08-03', '00-09-05'])
+
+    def test_groupby_color_key_packed(self):
+        input_mdf = MunsellDataFrame([
+            {'color_key': '02-06-07', 'r': 0, 'g': 0, 'b': 255},
+            {'color_key': '00-09-05', 'r': 255, 'g': 0, 'b': 0},
+            {'color_key': '02-06-07', 'r': 255, 'g': 0, 'b': 255},
+            {'color_key': '00-09-05', 'r': 0, 'g': 255, 'b': 0},
+        ])
+        input_mdf.set_packed_color_key()
+        
+        expected_mdf = MunsellDataFrame([
+            {'color_key': '00-09-05', 'r': 127, 'g': 127, 'b': 0, 'packed_color_key': 905},
+            {'color_key': '02-06-07', 'r': 127, 'g': 0, 'b': 255, 'packed_color_key': 20607}
+        ])
+        
+        result_mdf = input_mdf.groupby_color_key()
+        self.assertTrue(result_mdf.equals(expected_mdf), "MunsellDataFrames are not equal")
+
+    def test_groupby_color_key_variable_width(self):
+        input_mdf = MunsellDataFrame({'color_key': ['1-2-4', '1-2-4', '01-02-04', '00-09-05'], 'r': [1, 3, 10, 7], 'g': [2, 2, 2, 2], 'b': [0, 1, 0, 0]})
+        result_mdf = input_mdf.groupby_color_key()
+        self.assertListEqual(result_mdf.df['color_key'].tolist(), ['00-09-05', '01-02-04', '1-2-4'])
+        self.assertListEqual(result_mdf.df['r'].tolist(), [7, 10, 2])
+        
+        # a packed column groups on its keys but keeps the color_key strings
+        input_mdf = MunsellDataFrame({'color_key': ['1-2-4', '1-2-4', '00-09-05'], 'r': [1, 3, 7], 'g': [2, 2, 2], 'b': [0, 1, 0]})
+        input_mdf.set_packed_color_key()
+        result_mdf = input_mdf.groupby_color_key()
+        self.assertListEqual(result_mdf.df['color_key'].tolist(), ['00-09-05', '1-2-4'])
+        self.assertListEqual(result_mdf.df['packed_color_key'].tolist(), [905, 10204])
+
     def test_sort_by_columns(self):
         sort_orders = {
             'chroma_column': SortOrder.ASC
@@ -110,6 +239,11 @@ class TestMunsellDataFrame(unittest.TestCase): # pragma: no cover
         mdf.append_rows([dict1])
         self.assertEqual(mdf.shape, (1,8))
         
+    def test_len(self):
+        self.assertEqual(len(self.munsell_df), 4)
+        self.assertEqual(len(MunsellDataFrame()), 0)
+        self.assertEqual(len(self.munsell_df.filter_by_columns({'value_row': 6})), 2)
+
     def test_append_rows_one_partial_dict(self):
         mdf = MunsellDataFrame()
         self.assertEqual(mdf.shape, (0,8))
@@ -124,6 +258,65 @@ class TestMunsellDataFrame(unittest.TestCase): # pragma: no cover
         new_rows = mdf.shape[0]
         self.assertEqual(new_rows, initial_rows, "append empty dict should not add a new row ")
 
+    def test_append_rows_tuples_and_column_arrays(self):
+        mdf = MunsellDataFrame()
+        mdf.append_rows([
+            (0, '2.5R', 9, 6, '00-09-06', 255, 0, 0),
+            {'hue_page_number': [1, 2], 'hue_page_name': ['5.0R', '7.5R'], 'value_row': [8, 6], 'chroma_column': [4, 2],
+             'color_key': ['01-08-04', '02-06-02'], 'r': [0, 0], 'g': [255, 0], 'b': [0, 255]},
+            (),
+            {'hue_page_number': 3, 'hue_page_name': '10.0R', 'value_row': 5, 'chroma_column': 2, 'color_key': '03-05-02', 'r': 1, 'g': 2, 'b': 3},
+        ], batch_size=1)
+        self.assertEqual(mdf.shape, (4,8))
+        self.assertListEqual(mdf.df['hue_page_number'].tolist(), [0, 1, 2, 3])
+        self.assertListEqual(mdf.df['color_key'].tolist(), ['00-09-06', '01-08-04', '02-06-02', '03-05-02'])
+        self.assertListEqual(list(mdf.df.index), [0, 1, 2, 3])
+        for col, dtype in MunsellDataFrame._dtypes.items():
+            self.assertEqual(mdf.df[col].dtype, pd.Series([], dtype=dtype).dtype, f"wrong dtype for {col}")
+        
+        # appending to a non-empty frame keeps the existing rows and continues the index
+        mdf.append_rows([(4, '2.5YR', 4, 2, '04-04-02', 7, 8, 9)])
+        self.assertEqual(mdf.shape, (5,8))
+        self.assertEqual(mdf.df.loc[4, 'hue_page_name'], '2.5YR')
+        self.assertEqual(mdf.df.loc[0, 'hue_page_name'], '2.5R')
+        
+        with self.assertRaises(ValueError):
+            mdf.append_rows([(1, 2, 3)])
+
+    def test_append_rows_packed_color_key(self):
+        mdf = MunsellDataFrame([{'color_key': '00-09-06', 'r': 255, 'g': 0, 'b': 0}])
+        mdf.set_packed_color_key()
+        mdf.append_rows([{'color_key': '02-06-02', 'r': 0, 'g': 0, 'b': 255}])
+        self.assertListEqual(mdf.df['packed_color_key'].tolist(), [906, 20602])
+        self.assertEqual(mdf.df['packed_color_key'].dtype, np.uint32)
+
+    def test_wrap(self):
+        df = self.munsell_df.df.assign(value_row=self.munsell_df.df['value_row'].astype(np.int64))
+        wrapped = MunsellDataFrame._wrap(df)
+        self.assertEqual(str(wrapped.df['value_row'].dtype), 'UInt8')
+        self.assertIs(wrapped.df['color_key'].dtype, df['color_key'].dtype)
+        # a frame of the right dtypes is wrapped without copying its columns
+        wrapped = MunsellDataFrame._wrap(self.munsell_df.df)
+        self.assertTrue(np.shares_memory(wrapped.df['color_key'].to_numpy(), self.munsell_df.df['color_key'].to_numpy()))
+        sorted_df = self.munsell_df.sort_by_columns({'r': SortOrder.ASC})
+        sorted_df.df.loc[0, 'r'] = 7
+        self.assertEqual(self.munsell_df.df['r'][0], 255)
+
+    def test_derived_frames_edit_without_warnings(self):
+        self.munsell_df.set_color_key()
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            filtered_mdf = self.munsell_df.filter_by_columns({'hue_page_number': 2})
+            filtered_mdf.set_color_key()
+            filtered_mdf.set_packed_color_key()
+            filtered_mdf.df['r'] = 7
+            reduced_mdf = self.munsell_df.get_color_key_reduced()
+            reduced_mdf.decode_color_key()
+            reduced_mdf.df['r'] = 7
+        self.assertListEqual(filtered_mdf.df['color_key'].tolist(), ['02-06-07', '02-06-08'])
+        self.assertListEqual(reduced_mdf.df['value_row'].tolist(), [9, 8, 6, 6])
+        self.assertListEqual(self.munsell_df.df['r'].tolist(), [255, 0, 0, 255])
+
     def test_sort_by_columns_empty_df(self):
         df = MunsellDataFrame()
         with self.assertRaises(KeyError):
@@ -145,6 +338,33 @@ class TestMunsellDataFrame(unittest.TestCase): # pragma: no cover
         df2 = MunsellDataFrame.from_csv(test_filename)
         self.assertEqual(df2.shape, self.munsell_df.shape, 'shapes failure')
 
+    def test_from_parquet_columns_and_filters(self):
+        test_filename = '/tmp/test_filters.parquet'
+        mdf = MunsellDataFrame({'color_key': ['05-03-04', '05-04-04', '06-03-02'], 'r': [1, 2, 3], 'g': [4, 5, 6], 'b': [7, 8, 9]})
+        mdf.to_parquet(test_filename)
+
+        projected = MunsellDataFrame.from_parquet(test_filename, columns=['color_key', 'r'])
+        self.assertEqual(list(projected.columns), ['color_key', 'r'])
+        self.assertEqual(str(projected.df['r'].dtype), 'UInt8')
+
+        # dimension filters match the digits of 'color_key'
+        filtered = MunsellDataFrame.from_parquet(test_filename, filters={'hue_page_number': 5, 'value_row': [3, 9]})
+        self.assertEqual(filtered.df['color_key'].tolist(), ['05-03-04'])
+        self.assertEqual(list(filtered.df.index), [0])
+
+        filtered = MunsellDataFrame.from_parquet(test_filename, columns=['color_key'], filters=[('r', '>=', 2)])
+        self.assertEqual(filtered.df['color_key'].tolist(), ['05-04-04', '06-03-02'])
+
+        with self.assertRaises(KeyError):
+            MunsellDataFrame.from_parquet(test_filename, filters={'hue_page_name': '2.5R'})
+
+    def test_from_csv_columns_and_filters(self):
+        test_filename = "/tmp/test_filters.csv"
+        self.munsell_df.to_csv(test_filename)
+        mdf = MunsellDataFrame.from_csv(test_filename, columns=['hue_page_name', 'r'], filters={'hue_page_number': 1})
+        self.assertEqual(mdf.df['hue_page_name'].tolist(), ['5.0R'])
+        self.assertEqual(str(mdf.df['r'].dtype), 'UInt8')
+
     def test_to_list_of_dicts_positive(self):
         input = [
             {'hue_page_number': 0, 'hue_page_name': '2.5R', 'value_row': 9, 'chroma_column': 5, 'color_key': 'change', 'r': 255, 'g': 0, 'b': 0}
@@ -403,7 +623,107 @@ class TestMunsellDataFrame(unittest.TestCase): # pragma: no cover
         expected = (None, None) 
         self.assertEqual(result, expected, f"Failed when both value_row and chroma_column are None. Got: {result}, Expected: {expected}")
 
+    def test_get_color_space_array(self):
+        labs = self.munsell_df.get_color_space_array('lab')
+        self.assertEqual(labs.shape, (4, 3))
+        self.assertTrue(np.allclose(labs[0], [53.2408, 80.0925, 67.2032], atol=1e-2))
+        self.assertIs(self.munsell_df.get_color_space_array('lab'), labs)
+        self.assertTrue(np.allclose(self.munsell_df.get_color_space_array('linear_rgb')[1], [0, 1, 0]))
+        with self.assertRaises(ValueError):
+            self.munsell_df.get_color_space_array('hsv')
+
+    def test_color_space_cache_invalidated_by_rgb_edits(self):
+        labs = self.munsell_df.get_color_space_array('lab')
+        self.munsell_df.df.loc[0, 'g'] = 255
+        edited_labs = self.munsell_df.get_color_space_array('lab')
+        self.assertIsNot(edited_labs, labs)
+        self.assertTrue(np.allclose(edited_labs[0], [97.1393, -21.5537, 94.4780], atol=1e-2))
+        self.munsell_df.df.loc[1, 'r'] = pd.NA
+        self.assertTrue(np.isnan(self.munsell_df.get_color_space_array('lab')[1]).all())
+
+    def test_set_color_space_columns(self):
+        self.munsell_df.set_color_space_columns('xyz')
+        self.assertTrue(np.allclose(self.munsell_df.df['y'], [0.2126729, 0.7151522, 0.072175, 0.2848479]))
+        self.assertIn('lab_l', MunsellDataFrame._color_space_columns['lab'])
+
+    def test_set_color_space_columns_follow_rgb_edits(self):
+        self.munsell_df.set_color_space_columns('lab')
+        self.munsell_df.set_color_space_columns('xyz')
+        self.munsell_df.df.loc[0, ['r', 'g', 'b']] = 0
+        self.munsell_df.invalidate_index()
+        self.assertEqual(list(self.munsell_df.df.loc[0, ['lab_l', 'lab_a', 'lab_b', 'y']]), [0, 0, 0, 0])
+
+        df = self.munsell_df.df.copy()
+        df.loc[1, ['r', 'g', 'b']] = 0
+        self.munsell_df.df = df
+        self.assertTrue(np.allclose(self.munsell_df.df.loc[1, ['lab_l', 'lab_a', 'lab_b']].astype(float), 0))
+
+        self.munsell_df.df.loc[2, ['r', 'g', 'b']] = 0
+        self.assertTrue(np.allclose(self.munsell_df.get_color_space_array('lab')[2], 0))
+        self.assertTrue(np.allclose(self.munsell_df.df.loc[2, ['lab_l', 'lab_a', 'lab_b']].astype(float), 0))
+        self.assertTrue(np.allclose(self.munsell_df.df[['lab_l', 'lab_a', 'lab_b']], self.munsell_df.get_color_space_array('lab')))
+
+        self.munsell_df.df = self.munsell_df.df.drop(columns=['x', 'y', 'z'])
+        self.munsell_df.df.loc[3, ['r', 'g', 'b']] = 0
+        self.munsell_df.invalidate_index()
+        self.assertNotIn('y', self.munsell_df.df.columns)
+        self.assertTrue(np.allclose(self.munsell_df.df.loc[3, ['lab_l', 'lab_a', 'lab_b']].astype(float), 0))
+
+    def test_delta_e(self):
+        other = MunsellDataFrame(data=self.df.assign(r=self.df['r'].where(self.df['r'] > 0, 10)))
+        self.assertTrue(np.allclose(self.munsell_df.delta_e(self.munsell_df), 0))
+        delta_es = self.munsell_df.delta_e(other, method='76')
+        self.assertEqual(list(delta_es == 0), [True, False, False, True])
+        self.assertTrue(np.allclose(self.munsell_df.delta_e(other), delta_e_2000(self.munsell_df.get_color_space_array('lab'), other.get_color_space_array('lab'))))
+        red_delta_es = self.munsell_df.delta_e([255, 0, 0])
+        self.assertEqual(red_delta_es.shape, (4,))
+        self.assertAlmostEqual(red_delta_es[0], 0)
+        self.assertEqual(self.munsell_df.delta_e(np.zeros((5, 3), dtype=np.uint8), pairwise=True).shape, (4, 5))
+        with self.assertRaises(ValueError):
+            self.munsell_df.delta_e(other, method='94')
+        with self.assertRaises(ValueError):
+            self.munsell_df.delta_e(MunsellDataFrame(data=self.df.iloc[:2]))
+
+    def test_reduce_by_color_key(self):
+        samples = MunsellDataFrame(data=pd.DataFrame({
+            'color_key': ['02-06-08', '00-09-06', '02-06-08', '02-06-08', '00-09-06'],
+            'r': [10, 200, 20, 31, 201],
+            'g': [0, 0, 0, 0, 0],
+            'b': [5, 5, 5, 5, 5],
+        }))
+        reduced = samples.reduce_by_color_key(with_counts=True)
+        self.assertEqual(list(reduced.df['color_key']), ['00-09-06', '02-06-08'])
+        self.assertEqual(list(reduced.df['hue_page_name']), ['2.5R', '7.5R'])
+        self.assertEqual(list(reduced.df['value_row']), [9, 6])
+        self.assertEqual(str(reduced.df['chroma_column'].dtype), 'UInt8')
+        self.assertEqual(list(reduced.df['count']), [2, 3])
+        # means are rounded, not truncated
+        self.assertEqual(list(reduced.df['r']), [200, 20])
+        self.assertEqual(str(reduced.df['r'].dtype), 'UInt8')
+        self.assertTrue(np.allclose(samples.reduce_by_color_key(round_rgb=False).df['r'], [200.5, 61 / 3]))
+        self.assertEqual(list(samples.reduce_by_color_key('median').df['r']), [200, 20])
+        self.assertEqual(list(samples.reduce_by_color_key('count').df['count']), [2, 3])
+
+    def test_reduce_by_color_key_weighted_and_missing(self):
+        samples = MunsellDataFrame(data=pd.DataFrame({
+            'color_key': ['01-08-02', '01-08-02', '01-08-02', '01-08-02'],
+            'r': pd.array([10, 20, 30, None], dtype='UInt8'),
+            'g': [0, 0, 0, 0],
+            'b': [0, 0, 0, 0],
+            'weight': [1.0, 1.0, 2.0, 5.0],
+        }))
+        self.assertEqual(samples.reduce_by_color_key('median').df['r'][0], 20)
+        self.assertEqual(samples.reduce_by_color_key('median').df['g'][0], 0)
+        self.assertEqual(samples.reduce_by_color_key('mean', round_rgb=False).df['r'][0], 20)
+        weighted = samples.reduce_by_color_key('weighted_mean', weights='weight', round_rgb=False)
+        self.assertAlmostEqual(weighted.df['r'][0], 22.5)
+        with self.assertRaises(ValueError):
+            samples.reduce_by_color_key('mode')
+        with self.assertRaises(ValueError):
+            samples.reduce_by_color_key('weighted_mean')
+        with self.assertRaises(ValueError):
+            MunsellDataFrame(data=pd.DataFrame({'color_key': ['bad'], 'r': [0], 'g': [0], 'b': [0]})).reduce_by_color_key()
+
 
-    
 if __name__ == '__main__':
     unittest.main() # pragma: no cover
@@ -0,0 +1,92 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.MunsellDataset import MunsellDataset
+from munsell_data_frame.ColorKeyAccumulator import ColorKeyAccumulator
+
+
+class TestMunsellDataset(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.samples = pd.DataFrame({
+            'color_key': ['00-01-02', '03-05-06', '00-01-02', '03-05-06', '03-05-08', '00-01-02'],
+            'r': pd.array([10, 30, 20, 31, 50, None], dtype='UInt8'),
+            'g': pd.array([1, 2, 3, 4, 5, 6], dtype='UInt8'),
+            'b': pd.array([0, 0, 0, 0, 0, 0], dtype='UInt8'),
+            'weight': [1.0, 1.0, 3.0, 1.0, 1.0, 1.0],
+        })
+        # two files of three rows in row groups of two
+        for i in range(2):
+            self.samples.iloc[i * 3:(i + 1) * 3].to_parquet(os.path.join(self.temp_dir.name, f"part-{i}.parquet"), row_group_size=2)
+        self.dataset = MunsellDataset(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_count_and_filter(self):
+        self.assertEqual(self.dataset.count_rows(), 6)
+        self.assertEqual(self.dataset.count_rows({'hue_page_number': 3}), 3)
+        filtered = self.dataset.filter_by_columns({'hue_page_number': 3, 'chroma_column': 6}, columns=['color_key', 'r'])
+        self.assertEqual(list(filtered.df['r']), [30, 31])
+        self.assertEqual(list(filtered.df.columns), ['color_key', 'r'])
+        self.assertEqual(str(filtered.df['r'].dtype), 'UInt8')
+
+    def test_iter_batches(self):
+        batches = list(self.dataset.iter_batches(batch_size=2, filters={'value_row': 1}))
+        self.assertTrue(all(isinstance(batch, MunsellDataFrame) for batch in batches))
+        self.assertEqual(sum(len(batch.df) for batch in batches), 3)
+
+    def test_reduce_by_color_key(self):
+        grouped = self.dataset.reduce_by_color_key(with_counts=True, batch_size=2)
+        expected = MunsellDataFrame(self.samples).reduce_by_color_key(with_counts=True)
+        self.assertTrue(grouped.df.equals(expected.df))
+        self.assertEqual(list(grouped.df['count']), [3, 2, 1])
+        self.assertEqual(list(grouped.df['r']), [15, 30, 50])
+        filtered = self.dataset.reduce_by_color_key({'hue_page_number': 3}, round_rgb=False)
+        self.assertEqual(list(filtered.df['color_key']), ['03-05-06', '03-05-08'])
+        self.assertEqual(list(filtered.df['r']), [30.5, 50])
+        weighted = self.dataset.reduce_by_color_key(weights='weight', round_rgb=False)
+        self.assertEqual(weighted.df['r'][0], 17.5)
+        self.assertAlmostEqual(weighted.df['g'][0], 3.2)
+
+    def test_hive_partitions(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            munsell_df = MunsellDataFrame(self.samples.drop(columns='weight'))
+            munsell_df.decode_color_key()
+            munsell_df.df.to_parquet(temp_dir, partition_cols=['hue_page_number'])
+            dataset = MunsellDataset(temp_dir)
+            self.assertIn('hue_page_number', dataset.column_names)
+            self.assertEqual(dataset.count_rows({'hue_page_number': 0}), 3)
+            grouped = dataset.reduce_by_color_key({'hue_page_number': 0})
+            self.assertEqual(list(grouped.df['color_key']), ['00-01-02'])
+
+    def test_unpackable_keys(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pd.DataFrame({'color_key': ['bad'], 'r': [0], 'g': [0], 'b': [0]}).to_parquet(os.path.join(temp_dir, 'bad.parquet'))
+            with self.assertRaises(ValueError):
+                MunsellDataset(temp_dir).reduce_by_color_key()
+
+
+class TestColorKeyAccumulator(unittest.TestCase): # pragma: no cover
+
+    def test_update_and_merge(self):
+        accumulator = ColorKeyAccumulator()
+        accumulator.update([10203, 102], np.array([[10, 20, 30], [0, 0, np.nan]]))
+        accumulator.update([102, 50000], np.array([[4, 4, 4], [1, 1, 1]]))
+        self.assertEqual(list(accumulator.packed_color_keys), [102, 10203, 50000])
+        self.assertEqual(list(accumulator.counts), [2, 1, 1])
+        self.assertTrue(np.array_equal(accumulator.get_means()[0], [2, 2, 4]))
+        other = ColorKeyAccumulator()
+        other.update([5], np.array([[7, 7, 7]]))
+        other.merge(accumulator)
+        self.assertEqual(other.num_color_keys, 4)
+        self.assertEqual(other.num_rows, 5)
+        self.assertEqual(list(other.to_munsell_data_frame().df['color_key']), ['00-00-05', '00-01-02', '01-02-03', '05-00-00'])
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
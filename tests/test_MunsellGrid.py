@@ -0,0 +1,118 @@
+import unittest
+import numpy as np
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.MunsellGrid import MunsellGrid, INTERPOLATED, FALLBACK, OUT_OF_GAMUT
+from munsell_data_frame.HuePageRenderer import HuePageRenderer, get_hue_page_arrays
+
+
+class TestMunsellGrid(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        self.mdf = MunsellDataFrame({
+            'color_key': ['00-01-02', '00-03-06', '02-02-04', '39-09-38'],
+            'r': [1, 2, 3, 4], 'g': [5, 6, 7, 8], 'b': [9, 10, 11, 12]})
+        self.grid = MunsellGrid.from_munsell_data_frame(self.mdf)
+
+    def test_from_munsell_data_frame(self):
+        self.assertEqual(self.grid.rgbs.shape, (40, 10, 20, 3))
+        self.assertEqual(self.grid.rgbs.dtype, np.uint8)
+        self.assertEqual(self.grid.num_chips, 4)
+        self.assertTrue(self.grid.mask[2, 2, 2])
+        self.assertEqual(tuple(self.grid.rgbs[2, 2, 2]), (3, 7, 11))
+        self.assertFalse(self.grid.mask[2, 2, 1])
+
+    def test_round_trip(self):
+        mdf = self.grid.to_munsell_data_frame()
+        self.assertEqual(list(mdf.df['color_key']), list(self.mdf.df['color_key']))
+        self.assertEqual(list(mdf.df['r']), [1, 2, 3, 4])
+        self.assertEqual(list(mdf.df['value_row']), [1, 3, 2, 9])
+        self.assertEqual(list(mdf.df['chroma_column']), [2, 6, 4, 38])
+        self.assertTrue((MunsellGrid.from_munsell_data_frame(mdf).rgbs == self.grid.rgbs).all())
+
+    def test_odd_chroma_column(self):
+        mdf = MunsellDataFrame({'color_key': ['00-01-03'], 'r': [1], 'g': [2], 'b': [3]})
+        with self.assertRaises(ValueError):
+            MunsellGrid.from_munsell_data_frame(mdf)
+
+    def test_slices_are_views(self):
+        page_rgbs, page_mask = self.grid.get_hue_page(0)
+        self.assertTrue(np.shares_memory(page_rgbs, self.grid.rgbs))
+        self.assertEqual(page_mask.sum(), 2)
+        row_rgbs, row_mask = self.grid.get_value_row(2)
+        self.assertTrue(np.shares_memory(row_rgbs, self.grid.rgbs))
+        self.assertEqual(tuple(row_rgbs[2, 2]), (3, 7, 11))
+        column_rgbs, column_mask = self.grid.get_chroma_column(6)
+        self.assertTrue(np.shares_memory(column_rgbs, self.grid.rgbs))
+        self.assertTrue(column_mask[0, 3])
+
+    def test_gather(self):
+        rgbs, found = self.grid.gather([0, 2, 2, 40, 0], [3, 2, 2, 1, 1], [6, 4, 2, 2, 3])
+        self.assertEqual(list(found), [True, True, False, False, False])
+        self.assertEqual(rgbs.tolist(), [[2, 6, 10], [3, 7, 11], [0, 0, 0], [0, 0, 0], [0, 0, 0]])
+
+    def test_gather_color_keys(self):
+        rgbs, found = self.grid.gather_color_keys(np.array(['39-09-38', '01-01-02']))
+        self.assertEqual(list(found), [True, False])
+        self.assertEqual(rgbs[0].tolist(), [4, 8, 12])
+        rgbs, found = self.grid.gather_packed_color_keys(MunsellDataFrame.color_keys_to_packed(['00-01-02']))
+        self.assertEqual(rgbs.tolist(), [[1, 5, 9]])
+
+    def test_get_hue_page_arrays(self):
+        expected = get_hue_page_arrays(self.mdf)
+        page_arrays = get_hue_page_arrays(self.grid)
+        self.assertEqual(sorted(page_arrays), sorted(expected))
+        for hue_page_number, arrays in page_arrays.items():
+            for array, expected_array in zip(arrays, expected[hue_page_number]):
+                self.assertTrue((np.asarray(array) == np.asarray(expected_array)).all())
+
+    def test_render_grid_page_array(self):
+        renderer = HuePageRenderer(max_rows=3, max_cols=6, chip_size=7, chip_gap=4)
+        value_rows, chroma_columns, rgbs = self.grid.get_hue_page_arrays()[0]
+        expected = renderer.render_page_array(value_rows, chroma_columns, rgbs)
+        self.assertTrue((renderer.render_grid_page_array(*self.grid.get_hue_page(0)) == expected).all())
+        with self.assertRaises(ValueError):
+            renderer.render_grid_page_array(*self.grid.get_hue_page(39))
+
+    def test_get_chip_bytes(self):
+        chip_bytes = np.frombuffer(self.grid.get_chip_bytes(), dtype=np.uint8).reshape(6, -1)
+        self.assertEqual(chip_bytes[:, 3].tolist(), [39, 9, 38, 4, 8, 12])
+
+    # a 2x2x2 block of chips around hue page 39 and 0, values 4-5, chromas 2-4,
+    # in a grid stretched to value 9 and chroma 10 by a chip of hue page 20
+    def interpolation_grid(self):
+        color_keys, rgbs = ['20-09-10'], [(0, 0, 0)]
+        for hue_page_number in [39, 0]:
+            for value_row in [4, 5]:
+                for chroma_column in [2, 4]:
+                    color_keys.append(MunsellDataFrame.format_color_key(hue_page_number, value_row, chroma_column))
+                    rgbs.append((100 * (hue_page_number == 0), 100 * (value_row - 4), 100 * (chroma_column - 2) // 2))
+        rgbs = np.array(rgbs)
+        return MunsellGrid.from_munsell_data_frame(MunsellDataFrame({'color_key': color_keys, 'r': rgbs[:, 0], 'g': rgbs[:, 1], 'b': rgbs[:, 2]}))
+
+    def test_interpolate(self):
+        grid = self.interpolation_grid()
+        rgbs, status = grid.interpolate([39.25, 0, 79.5], [4.5, 4, 4.25], [3, 2, 2.5])
+        self.assertEqual(rgbs.tolist(), [[25, 50, 50], [100, 0, 0], [50, 25, 25]])
+        self.assertEqual(status.tolist(), [INTERPOLATED] * 3)
+
+    def test_interpolate_gamut_edge(self):
+        grid = self.interpolation_grid()
+        rgbs, status = grid.interpolate([0, 0, 0, 0], [5, 5, 4, 5.5], [4, 5, 3, 3])
+        self.assertEqual(status.tolist(), [INTERPOLATED, FALLBACK, INTERPOLATED, FALLBACK])
+        self.assertEqual(rgbs[1].tolist(), [100, 100, 100])
+        self.assertEqual(rgbs[3].tolist(), [100, 100, 50])
+        rgbs, status = grid.interpolate([0, 0, 10, np.nan], [5.5, 11, 5, 5], [3, 3, 3, 3], fallback=False)
+        self.assertEqual(status.tolist(), [OUT_OF_GAMUT] * 4)
+        self.assertEqual(rgbs.tolist(), [[0, 0, 0]] * 4)
+
+    def test_interpolate_chunks(self):
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0, 40, 1000), rng.uniform(1, 9, 1000), rng.uniform(2, 38, 1000)
+        rgbs, status = self.grid.interpolate(*points)
+        chunked_rgbs, chunked_status = self.grid.interpolate(*points, chunk_size=7)
+        self.assertTrue((rgbs == chunked_rgbs).all())
+        self.assertTrue((status == chunked_status).all())
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
@@ -0,0 +1,71 @@
+import unittest
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.MunsellIndex import MunsellIndex
+import numpy as np
+
+
+class TestMunsellIndex(unittest.TestCase): # pragma: no cover
+    
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        num_rows = 500
+        self.mdf = MunsellDataFrame({
+            'hue_page_number': rng.integers(0, 5, num_rows),
+            'value_row': rng.integers(1, 4, num_rows),
+            'chroma_column': rng.integers(1, 4, num_rows) * 2,
+            'r': rng.integers(0, 256, num_rows),
+            'g': rng.integers(0, 256, num_rows),
+            'b': rng.integers(0, 256, num_rows),
+        })
+        self.indexed_mdf = MunsellDataFrame(self.mdf.df)
+        self.indexed_mdf.create_index()
+
+    def test_filter_by_columns_matches_scan(self):
+        filters_list = [
+            {'hue_page_number': 3},
+            {'hue_page_number': 3, 'value_row': 2},
+            {'hue_page_number': 3, 'value_row': 2, 'chroma_column': 4},
+            {'hue_page_number': 3, 'chroma_column': 6},
+            {'value_row': 2, 'chroma_column': 4},
+            {'hue_page_number': 1, 'r': 10},
+            {'hue_page_number': 9},
+        ]
+        for filters in filters_list:
+            expected = self.mdf.filter_by_columns(filters)
+            result = self.indexed_mdf.filter_by_columns(filters)
+            self.assertTrue(result.equals(expected), f"indexed filter differs for {filters}")
+        self.assertIsNotNone(self.indexed_mdf._index, "index should have been built lazily")
+
+    def test_index_invalidated_on_mutation(self):
+        self.indexed_mdf.filter_by_columns({'hue_page_number': 0})
+        self.assertIsNotNone(self.indexed_mdf._index)
+        
+        self.indexed_mdf.remove_by_columns({'hue_page_number': 0})
+        self.assertIsNone(self.indexed_mdf._index, "remove_by_columns should invalidate the index")
+        self.assertTrue(self.indexed_mdf.filter_by_columns({'hue_page_number': 0}).empty)
+        
+        self.indexed_mdf.append_rows([{'hue_page_number': 0, 'value_row': 1, 'chroma_column': 2, 'r': 1, 'g': 2, 'b': 3}])
+        self.assertEqual(self.indexed_mdf.filter_by_columns({'hue_page_number': 0}).shape[0], 1)
+
+    def test_iter_hue_pages(self):
+        indexed_pages = list(self.indexed_mdf.iter_hue_pages())
+        scanned_pages = list(self.mdf.iter_hue_pages())
+        self.assertListEqual([number for number, _ in indexed_pages], [0, 1, 2, 3, 4])
+        for (indexed_number, indexed_page), (scanned_number, scanned_page) in zip(indexed_pages, scanned_pages):
+            self.assertEqual(indexed_number, scanned_number)
+            self.assertTrue(indexed_page.equals(scanned_page))
+
+    def test_unindexable_dimensions(self):
+        mdf = MunsellDataFrame({'hue_page_number': [1, None], 'value_row': [1, 2], 'chroma_column': [2, 4]})
+        self.assertIsNone(MunsellIndex.from_munsell_data_frame(mdf))
+        mdf.create_index()
+        self.assertEqual(mdf.filter_by_columns({'hue_page_number': 1}).shape[0], 1)
+
+    def test_split_filters(self):
+        indexed, remaining = MunsellIndex.split_filters({'hue_page_number': np.uint8(2), 'value_row': '3', 'r': 4})
+        self.assertDictEqual(indexed, {'hue_page_number': 2})
+        self.assertDictEqual(remaining, {'value_row': '3', 'r': 4})
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
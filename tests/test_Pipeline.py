@@ -0,0 +1,116 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pipeline'))
+from Pipeline import Pipeline, Stage, path_digest
+
+# copies the upper-cased text of argv[1] to argv[2]
+UPPER = "import sys; open(sys.argv[2], 'w').write(open(sys.argv[1]).read().upper())"
+
+# waits for the file argv[1] to exist, then writes argv[2]
+AWAIT = "import os, sys, time\nfor _ in range(200):\n    if os.path.exists(sys.argv[1]): break\n    time.sleep(0.05)\nopen(sys.argv[2], 'w').write(str(os.path.exists(sys.argv[1])))"
+
+
+class TestPipeline(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        self.cache_file = os.path.join(self.root, 'cache.json')
+        self.write('a.txt', 'a')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name, text):
+        with open(os.path.join(self.root, name), 'w') as f:
+            f.write(text)
+
+    def read(self, name):
+        with open(os.path.join(self.root, name)) as f:
+            return f.read()
+
+    def get_pipeline(self, stages=None):
+        stages = stages or [
+            Stage('c', [sys.executable, '-c', UPPER, 'b.txt', 'c.txt'], ['b.txt'], ['c.txt']),
+            Stage('b', [sys.executable, '-c', UPPER, 'a.txt', 'b.txt'], ['a.txt'], ['b.txt']),
+        ]
+        return Pipeline(stages, self.root, self.cache_file)
+
+    def run_pipeline(self, pipeline=None, **kwargs):
+        return {name: status for name, status, _, _ in (pipeline or self.get_pipeline()).run(**kwargs)}
+
+    def test_dependencies(self):
+        pipeline = self.get_pipeline()
+        self.assertEqual(pipeline.dependencies, {'b': set(), 'c': {'b'}})
+        self.assertEqual(pipeline.order, ['b', 'c'])
+        self.assertEqual(pipeline.get_needed(['b']), ['b'])
+        self.assertEqual(pipeline.get_needed(['c']), ['b', 'c'])
+        with self.assertRaises(KeyError):
+            pipeline.get_needed(['d'])
+        with self.assertRaises(ValueError):
+            self.get_pipeline([Stage('x', [], ['y'], ['x']), Stage('y', [], ['x'], ['y'])])
+        with self.assertRaises(ValueError):
+            self.get_pipeline([Stage('x', [], [], ['out']), Stage('y', [], [], ['out/file']), Stage('z', [], ['out/file'], [])])
+
+    def test_incremental(self):
+        self.assertEqual(self.run_pipeline(), {'b': 'ran', 'c': 'ran'})
+        self.assertEqual(self.read('c.txt'), 'A')
+        self.assertEqual(self.run_pipeline(), {'b': 'skipped', 'c': 'skipped'})
+
+        # a changed input reruns its stage and, if the outputs change, the dependents
+        self.write('a.txt', 'aa')
+        self.assertEqual(self.run_pipeline(dry_run=True), {'b': 'stale', 'c': 'stale'})
+        self.assertEqual(self.run_pipeline(), {'b': 'ran', 'c': 'ran'})
+        self.assertEqual(self.read('c.txt'), 'AA')
+
+        # identical outputs of a forced stage leave its dependents up to date
+        self.assertEqual(self.run_pipeline(targets=['b'], force=True), {'b': 'ran'})
+        self.assertEqual(self.run_pipeline(), {'b': 'skipped', 'c': 'skipped'})
+
+        # a changed or missing output reruns its stage
+        self.write('c.txt', 'x')
+        self.assertEqual(self.run_pipeline(), {'b': 'skipped', 'c': 'ran'})
+        os.remove(os.path.join(self.root, 'b.txt'))
+        self.assertEqual(self.run_pipeline(), {'b': 'ran', 'c': 'skipped'})
+
+    def test_run_args_are_not_fingerprinted(self):
+        stage = Stage('b', [sys.executable, '-c', UPPER, 'a.txt'], ['a.txt'], ['b.txt'], run_args=['b.txt'])
+        self.assertEqual(stage.fingerprint(self.root), Stage('b', stage.command, ['a.txt'], ['b.txt'], run_args=['x']).fingerprint(self.root))
+        self.assertEqual(self.run_pipeline(self.get_pipeline([stage])), {'b': 'ran'})
+        self.assertEqual(self.read('b.txt'), 'A')
+        stage.run_args = ['b.txt', '--other']
+        self.assertEqual(self.run_pipeline(self.get_pipeline([stage])), {'b': 'skipped'})
+
+    def test_failed_stage(self):
+        stages = [
+            Stage('b', [sys.executable, '-c', 'import sys; sys.exit(3)'], ['a.txt'], ['b.txt']),
+            Stage('c', [sys.executable, '-c', UPPER, 'b.txt', 'c.txt'], ['b.txt'], ['c.txt']),
+        ]
+        results = list(self.get_pipeline(stages).run())
+        self.assertEqual([(name, status) for name, status, _, _ in results], [('b', 'failed'), ('c', 'blocked')])
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_concurrent_stages(self):
+        stages = [
+            Stage('x', [sys.executable, '-c', AWAIT, 'y.txt', 'x.txt'], ['a.txt'], ['x.txt']),
+            Stage('y', [sys.executable, '-c', UPPER, 'a.txt', 'y.txt'], ['a.txt'], ['y.txt']),
+        ]
+        self.assertEqual(self.run_pipeline(self.get_pipeline(stages), num_jobs=2), {'x': 'ran', 'y': 'ran'})
+        self.assertEqual(self.read('x.txt'), 'True')
+
+    def test_path_digest(self):
+        os.makedirs(os.path.join(self.root, 'folder', '__pycache__'))
+        self.write('folder/f.txt', 'f')
+        digest = path_digest(os.path.join(self.root, 'folder'))
+        self.write('folder/__pycache__/f.pyc', 'compiled')
+        self.assertEqual(path_digest(os.path.join(self.root, 'folder')), digest)
+        self.write('folder/g.txt', 'g')
+        self.assertNotEqual(path_digest(os.path.join(self.root, 'folder')), digest)
+        self.assertIsNone(path_digest(os.path.join(self.root, 'missing')))
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
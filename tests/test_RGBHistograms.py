@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+from munsell_data_frame.RGBHistograms import RGBHistograms
+
+
+class TestRGBHistograms(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.num_chips = 500
+        self.hue_page_numbers = rng.integers(0, 40, self.num_chips)
+        self.value_rows = rng.integers(1, 10, self.num_chips)
+        self.rgbs = rng.integers(0, 256, (self.num_chips, 3))
+        self.histograms = RGBHistograms.from_arrays(self.hue_page_numbers, self.value_rows, self.rgbs, joint_bins=8)
+
+    def test_channel_counts(self):
+        for channel in range(3):
+            expected = np.bincount(self.rgbs[:, channel], minlength=256)
+            self.assertTrue((self.histograms.channel_counts[channel] == expected).all())
+        self.assertEqual(self.histograms.num_chips, self.num_chips)
+
+    def test_group_counts(self):
+        for hue_page_number in [0, 17, 39]:
+            rgbs = self.rgbs[self.hue_page_numbers == hue_page_number]
+            expected = np.bincount(rgbs[:, 1], minlength=256)
+            self.assertTrue((self.histograms.hue_page_counts[hue_page_number, 1] == expected).all())
+        for value_row in [1, 9]:
+            rgbs = self.rgbs[self.value_rows == value_row]
+            expected = np.bincount(rgbs[:, 2], minlength=256)
+            self.assertTrue((self.histograms.value_row_counts[value_row, 2] == expected).all())
+
+    def test_joint_counts(self):
+        expected, _ = np.histogramdd(self.rgbs, bins=8, range=[(0, 256)] * 3)
+        self.assertTrue((self.histograms.joint_counts == expected).all())
+
+    def test_rebin(self):
+        binned = RGBHistograms.rebin(self.histograms.channel_counts, 20)
+        self.assertEqual(binned.shape, (3, 20))
+        self.assertTrue((binned.sum(axis=-1) == self.num_chips).all())
+
+    def test_get_stats(self):
+        stats_df = self.histograms.get_stats()
+        all_r = stats_df[(stats_df['group'] == 'all') & (stats_df['channel'] == 'r')].iloc[0]
+        r = self.rgbs[:, 0]
+        self.assertEqual(all_r['count'], self.num_chips)
+        self.assertAlmostEqual(all_r['mean'], r.mean())
+        self.assertAlmostEqual(all_r['std'], r.std())
+        self.assertEqual(all_r['min'], r.min())
+        self.assertEqual(all_r['max'], r.max())
+        self.assertEqual(all_r['median'], np.sort(r)[(self.num_chips - 1) // 2])
+
+        value_row_g = stats_df[(stats_df['group'] == 'value_row') & (stats_df['group_value'] == 3) & (stats_df['channel'] == 'g')].iloc[0]
+        g = self.rgbs[self.value_rows == 3, 1]
+        self.assertAlmostEqual(value_row_g['mean'], g.mean())
+
+        # empty value row 0 has no stats
+        self.assertEqual(len(stats_df[(stats_df['group'] == 'value_row') & (stats_df['group_value'] == 0)]), 0)
+
+    def test_from_munsell_data_frame(self):
+        mdf = MunsellDataFrame({'color_key': ['05-03-04', '05-03-06', '12-07-02'], 'r': [10, 20, 30], 'g': [1, 2, 3], 'b': [255, 0, 128]})
+        histograms = RGBHistograms.from_munsell_data_frame(mdf)
+        self.assertEqual(histograms.num_chips, 3)
+        self.assertEqual(histograms.hue_page_counts[5, 0, 20], 1)
+        self.assertEqual(histograms.value_row_counts[7, 2, 128], 1)
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
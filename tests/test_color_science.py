@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from munsell_data_frame.color_science import rgb_to_xyz, rgb_to_lab, srgb_to_linear, delta_e_76, delta_e_2000
+
+
+class TestColorScience(unittest.TestCase): # pragma: no cover
+
+    def test_srgb_to_linear(self):
+        self.assertTrue(np.allclose(srgb_to_linear([0, 255]), [0, 1]))
+        self.assertAlmostEqual(srgb_to_linear(128), 0.2158605, places=6)
+
+    def test_rgb_to_xyz(self):
+        self.assertTrue(np.allclose(rgb_to_xyz([255, 255, 255]), [0.95047, 1.0, 1.08883], atol=1e-4))
+        # integer and float input agree
+        self.assertTrue(np.allclose(rgb_to_xyz(np.array([[12, 130, 250]])), rgb_to_xyz(np.array([[12.0, 130.0, 250.0]]))))
+
+    def test_rgb_to_lab(self):
+        self.assertTrue(np.allclose(rgb_to_lab([255, 255, 255]), [100, 0, 0], atol=1e-3))
+        self.assertTrue(np.allclose(rgb_to_lab([0, 0, 0]), [0, 0, 0]))
+        self.assertTrue(np.allclose(rgb_to_lab([255, 0, 0]), [53.2408, 80.0925, 67.2032], atol=1e-2))
+        self.assertEqual(rgb_to_lab(np.zeros((4, 5, 3), dtype=np.uint8)).shape, (4, 5, 3))
+
+    def test_delta_e_76(self):
+        self.assertAlmostEqual(delta_e_76([50, 0, 0], [53, 4, 0]), 5)
+        self.assertEqual(delta_e_76(np.zeros((4, 3)), [1, 2, 2]).tolist(), [3] * 4)
+
+    # pairs of the CIEDE2000 test data of Sharma, Wu and Dalal (2005),
+    # including the hue wrap-around cases 13 to 16
+    def test_delta_e_2000(self):
+        pairs = [
+            ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+            ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+            ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0009), 7.1792),
+            ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0012), 7.2195),
+            ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+            ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+            ((2.0776, 0.0795, -1.135), (0.9033, -0.0636, -0.5514), 0.9082),
+        ]
+        labs1, labs2, expected = (np.array(column) for column in zip(*pairs))
+        self.assertTrue(np.allclose(delta_e_2000(labs1, labs2), expected, atol=1e-4))
+        self.assertTrue(np.allclose(delta_e_2000(labs2, labs1), expected, atol=1e-4))
+        self.assertEqual(delta_e_2000(labs1, labs1).tolist(), [0] * len(pairs))
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
@@ -0,0 +1,92 @@
+import base64
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import unittest
+import numpy as np
+from munsell_data_frame.MunsellDataFrame import MunsellDataFrame
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'javascript'))
+import js_file_from_parquet_file as js_export
+
+# the json module the script wrote before the typed array formats, for
+# the chips of setUp grouped by color_key
+EXPECTED_JSON_SOURCE = (
+    'export const flatColorChips = [\n'
+    '{"color_key": "00-09-05", "r": 255, "g": 15, "b": 0},\n'
+    '{"color_key": "02-06-07", "r": 0, "g": 0, "b": 255},\n'
+    '{"color_key": "39-01-38", "r": 1, "g": 2, "b": 3},\n'
+    '\n];\n'
+)
+
+# the TYPED_COLUMNS rows of the same chips
+EXPECTED_COLUMNS = [
+    [0, 2, 39],
+    [9, 6, 1],
+    [5, 7, 38],
+    [255, 0, 1],
+    [15, 0, 2],
+    [0, 255, 3],
+]
+
+
+class TestJsFileFromParquetFile(unittest.TestCase): # pragma: no cover
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.parquet_file = os.path.join(self.folder.name, 'chips.parquet')
+        MunsellDataFrame({
+            'hue_page_number': [2, 0, 39, 0], 'hue_page_name': ['7.5R', '2.5R', '10.0RP', '2.5R'],
+            'value_row': [6, 9, 1, 9], 'chroma_column': [7, 5, 38, 5], 'color_key': ['x'] * 4,
+            'r': [0, 255, 1, 255], 'g': [0, 10, 2, 20], 'b': [255, 0, 3, 0],
+        }).to_parquet(self.parquet_file)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    # return the source of the js file written in the format by the engine
+    def export(self, js_format, engine):
+        js_file = os.path.join(self.folder.name, f"chips_{engine}.js")
+        with contextlib.redirect_stdout(io.StringIO()):
+            js_export.main(js_file, self.parquet_file, js_format, engine)
+        with open(js_file) as f:
+            return f.read()
+
+    # assert that the chip bytes, as (len(TYPED_COLUMNS), num_chips) uint8
+    # columns, are the chips of setUp
+    def assert_chip_bytes(self, chip_bytes):
+        columns = np.frombuffer(chip_bytes, dtype=np.uint8).reshape(len(js_export.TYPED_COLUMNS), -1)
+        self.assertListEqual(columns.tolist(), EXPECTED_COLUMNS)
+
+    def test_json(self):
+        for engine in ['pandas', 'chiptable']:
+            self.assertEqual(self.export('json', engine), EXPECTED_JSON_SOURCE, engine)
+
+    def test_base64(self):
+        for engine in ['pandas', 'chiptable']:
+            js_source = self.export('base64', engine)
+            self.assertIn('export const numChips = 3;', js_source)
+            self.assert_chip_bytes(base64.b64decode(re.search(r'const chipBase64 = "([^"]*)";', js_source).group(1)))
+
+    def test_bin(self):
+        for engine in ['pandas', 'chiptable']:
+            js_source = self.export('bin', engine)
+            self.assertIn(f'new URL("./chips_{engine}.bin", import.meta.url)', js_source)
+            self.assertIn('export const numChips = 3;', js_source)
+            with open(os.path.join(self.folder.name, f"chips_{engine}.bin"), 'rb') as f:
+                self.assert_chip_bytes(f.read())
+
+    def test_get_chip_bytes(self):
+        munsell_df = js_export.get_munsell_df(self.parquet_file)
+        self.assert_chip_bytes(js_export.get_chip_bytes(munsell_df))
+        self.assert_chip_bytes(js_export.get_chip_bytes(js_export.get_munsell_df(self.parquet_file, 'chiptable')))
+        typed_source = js_export.get_typed_source(3, '')
+        self.assertIn(json.dumps(js_export.TYPED_COLUMNS), typed_source)
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
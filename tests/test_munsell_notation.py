@@ -0,0 +1,28 @@
+import unittest
+import numpy as np
+from munsell_data_frame.munsell_notation import parse_munsell_notation, hue_page_numbers_of
+
+
+class TestMunsellNotation(unittest.TestCase): # pragma: no cover
+
+    def test_parse_munsell_notation(self):
+        hue_page_numbers, values, chromas = parse_munsell_notation(['3.7YR 5.4/7', '2.5R 5/6', '10RP 9/2', '1.25R 1/2', '10.0YR 3 / 4'])
+        self.assertTrue(np.allclose(hue_page_numbers, [4.48, 0, 39, 39.5, 7]))
+        self.assertEqual(values.tolist(), [5.4, 5, 9, 1, 3])
+        self.assertEqual(chromas.tolist(), [7, 6, 2, 2, 4])
+
+    def test_parse_one_notation(self):
+        hue_page_numbers, values, chromas = parse_munsell_notation('5.0PB 4/10')
+        self.assertEqual(hue_page_numbers.tolist(), [29])
+
+    def test_parse_bad_notation(self):
+        for notation in ['N 5/', '5XY 4/2', '5R 4']:
+            with self.assertRaises(ValueError):
+                parse_munsell_notation([notation])
+
+    def test_hue_page_numbers_wrap(self):
+        self.assertEqual(hue_page_numbers_of([0, 10], [0, 9]).tolist(), [39, 39])
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
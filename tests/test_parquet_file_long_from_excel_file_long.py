@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'excel_file_long'))
+import parquet_file_long_from_excel_file_long as long_parser
+
+# two pages of the 'munsell2rgb' sheet: each table's quintets precede its
+# 'Table N' line and each page's tables precede its footer, in either
+# footer layout, among headers, blank and noise lines
+LINES = [
+    'CONVERSIONS FROM MUNSELL TO sRGB',
+    'PAUL CENTORE',
+    'V C sRGB V C sRGB',
+    '1 2 [45,21,31] 4 6 [144,76,88]',
+    '',
+    '  2 4 [80,40,50]  ',
+    'Munsell chips in this table are within the sRGB gamut',
+    'Table 1: Munsell to sRGB Conversions for Hue 2.5R',
+    'c 2012 Paul Centore 1',
+    'V C sRGB V C sRGB',
+    '3 2 [90,70,72] noise',
+    'Table 2: Munsell to sRGB Conversions for Hue 5.0R',
+    '5 6 [200,100,110] 9 2 [250,230,231]',
+    'Table 3: Munsell to sRGB Conversions for Hue 7.5R',
+    '2 c 2013 Paul Centore',
+    # never closed by a table line and a footer, so dropped
+    '8 1 [1,2,3]',
+]
+
+
+class TestParseLongExcel(unittest.TestCase): # pragma: no cover
+
+    def test_parse_quintets(self):
+        self.assertListEqual(list(long_parser.parse_quintets('1 2 [45,21,31] 4 6 [144,76,88]')), [(1, 2, 45, 21, 31), (4, 6, 144, 76, 88)])
+        self.assertListEqual(list(long_parser.parse_quintets('V C sRGB')), [])
+
+    def test_parse_pages(self):
+        df = long_parser.parse_pages(iter(LINES))
+        self.assertListEqual(list(df.columns), ['V', 'C', 'R', 'G', 'B', 'Table Number', 'Hue Name', 'Author Name', 'Copyright Year', 'Page Number'])
+        for column in ['V', 'C', 'R', 'G', 'B', 'Table Number', 'Copyright Year', 'Page Number']:
+            self.assertEqual(df[column].dtype, np.int64, f"wrong dtype for {column}")
+        for column in ['Hue Name', 'Author Name']:
+            self.assertEqual(df[column].dtype, object, f"wrong dtype for {column}")
+        self.assertEqual(len(df), 6)
+
+        self.assertListEqual(df[['V', 'C', 'R', 'G', 'B']].values.tolist(), [
+            [1, 2, 45, 21, 31], [4, 6, 144, 76, 88], [2, 4, 80, 40, 50],
+            [3, 2, 90, 70, 72],
+            [5, 6, 200, 100, 110], [9, 2, 250, 230, 231],
+        ])
+        self.assertListEqual(df['Hue Name'].tolist(), ['2.5R'] * 3 + ['5.0R'] + ['7.5R'] * 2)
+        self.assertListEqual(df['Page Number'].tolist(), [1] * 3 + [2] * 3)
+        self.assertListEqual(df['Copyright Year'].tolist(), [2012] * 3 + [2013] * 3)
+        self.assertTrue((df['Author Name'] == 'Paul Centore').all())
+
+    def test_parse_pages_keeps_tables_after_a_footer_apart(self):
+        # the old parser rebound its table dataframe to the last table of a
+        # page at the footer, so the first quintets of the next page were
+        # appended to that table and the whole of it relabelled as table 2
+        df = long_parser.parse_pages(iter(LINES))
+        tables = df.groupby(['Table Number', 'Hue Name', 'Page Number'], sort=False).size()
+        self.assertDictEqual(tables.to_dict(), {(1, '2.5R', 1): 3, (2, '5.0R', 2): 1, (3, '7.5R', 2): 2})
+
+    def test_parse_pages_empty(self):
+        df = long_parser.parse_pages(iter(['CONVERSIONS', '1 2 [3,4,5]', 'Table 1: Munsell to sRGB Conversions for Hue 2.5R']))
+        self.assertEqual(len(df), 0)
+        self.assertListEqual(list(df.columns), long_parser.QUINTET_COLUMNS + long_parser.TABLE_COLUMNS + long_parser.PAGE_COLUMNS)
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover
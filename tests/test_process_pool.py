@@ -0,0 +1,39 @@
+import itertools
+import unittest
+from munsell_data_frame.process_pool import imap_bounded
+
+# the offset of this process, set by _init_offset
+_offset = 0
+
+def _init_offset(offset):
+    global _offset
+    _offset = offset
+
+def _add_offset(a, b):
+    return a + b + _offset
+
+
+class TestProcessPool(unittest.TestCase): # pragma: no cover
+
+    def test_in_process(self):
+        results = imap_bounded(_add_offset, ((i, 1) for i in range(5)), num_workers=1, initializer=_init_offset, initargs=(10,))
+        self.assertListEqual(list(results), [11, 12, 13, 14, 15])
+        _init_offset(0)
+
+    def test_pool_keeps_order(self):
+        for window in [None, 1, 3]:
+            results = imap_bounded(_add_offset, ((i, i) for i in range(20)), num_workers=2, window=window, initializer=_init_offset, initargs=(1,))
+            self.assertListEqual(list(results), [2 * i + 1 for i in range(20)])
+
+    def test_window_bounds_pending_tasks(self):
+        # a lazy iterator of tasks is consumed at most window ahead of the results
+        consumed = itertools.count()
+        tasks = ((next(consumed), 0) for _ in range(10))
+        results = imap_bounded(_add_offset, tasks, num_workers=2, window=3)
+        self.assertEqual(next(results), 0)
+        self.assertLessEqual(next(consumed), 4)
+        results.close()
+
+
+if __name__ == '__main__':
+    unittest.main() # pragma: no cover